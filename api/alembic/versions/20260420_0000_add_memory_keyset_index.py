@@ -0,0 +1,27 @@
+"""add (created_at, id) keyset pagination index on memories
+
+Revision ID: 20260420_0000
+Revises: 20260410_0000
+Create Date: 2026-04-20
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260420_0000"
+down_revision = "20260410_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pages resume with (created_at, id) < (:c, :i) ORDER BY created_at DESC, id DESC
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_memories_created_id_live
+        ON memories(created_at DESC, id DESC)
+        WHERE deleted_at IS NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_memories_created_id_live")
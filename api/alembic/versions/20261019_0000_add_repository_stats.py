@@ -0,0 +1,48 @@
+"""add repository_stats materialised code-intelligence statistics
+
+Revision ID: 20261019_0000
+Revises: 20260420_0000
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261019_0000"
+down_revision = "20260420_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per repository ('' = chunks without a repository), refreshed by
+    # the indexing and graph pipelines (services/repository_stats_service.py)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS repository_stats (
+            repository            TEXT PRIMARY KEY,
+            file_count            INTEGER NOT NULL DEFAULT 0,
+            chunk_count           INTEGER NOT NULL DEFAULT 0,
+            function_count        INTEGER NOT NULL DEFAULT 0,
+            chunks_by_language    JSONB NOT NULL DEFAULT '{}'::jsonb,
+            chunks_by_type        JSONB NOT NULL DEFAULT '{}'::jsonb,
+            complexity_sum        DOUBLE PRECISION NOT NULL DEFAULT 0,
+            complexity_count      INTEGER NOT NULL DEFAULT 0,
+            complexity_histogram  JSONB NOT NULL DEFAULT '{}'::jsonb,
+            top_complex           JSONB NOT NULL DEFAULT '[]'::jsonb,
+            lsp_with_return_type  INTEGER NOT NULL DEFAULT 0,
+            lsp_with_signature    INTEGER NOT NULL DEFAULT 0,
+            lsp_with_params       INTEGER NOT NULL DEFAULT 0,
+            first_indexed_at      TIMESTAMPTZ,
+            last_indexed_at       TIMESTAMPTZ,
+            node_count            INTEGER NOT NULL DEFAULT 0,
+            edge_count            INTEGER NOT NULL DEFAULT 0,
+            nodes_by_type         JSONB NOT NULL DEFAULT '{}'::jsonb,
+            edges_by_type         JSONB NOT NULL DEFAULT '{}'::jsonb,
+            chunks_refreshed_at   TIMESTAMPTZ,
+            graph_refreshed_at    TIMESTAMPTZ
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS repository_stats")
@@ -0,0 +1,43 @@
+"""add hnsw_index_builds history of HNSW index (re)builds
+
+Revision ID: 20261020_0000
+Revises: 20261019_0000
+Create Date: 2026-10-20
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261020_0000"
+down_revision = "20261019_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per index build by services/hnsw_index_maintenance.py
+    # (deferred bulk-load builds, concurrent swaps, manual rebuilds)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS hnsw_index_builds (
+            id                    BIGSERIAL PRIMARY KEY,
+            table_name            TEXT NOT NULL,
+            index_name            TEXT NOT NULL,
+            operation             TEXT NOT NULL,
+            status                TEXT NOT NULL,
+            table_rows            BIGINT,
+            size_bytes            BIGINT,
+            duration_ms           INTEGER NOT NULL DEFAULT 0,
+            maintenance_work_mem  TEXT,
+            parallel_workers      INTEGER,
+            error                 TEXT,
+            started_at            TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_hnsw_index_builds_index
+        ON hnsw_index_builds (index_name, started_at DESC)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS hnsw_index_builds")
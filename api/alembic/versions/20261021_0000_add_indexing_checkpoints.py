@@ -0,0 +1,55 @@
+"""add indexing_checkpoints and indexing_runs for resumable indexing
+
+Revision ID: 20261021_0000
+Revises: 20261020_0000
+Create Date: 2026-10-21
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261021_0000"
+down_revision = "20261020_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per indexed file: content hash + outcome, written by every
+    # indexing entry point (services/indexing_checkpoint_service.py)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS indexing_checkpoints (
+            repository    TEXT NOT NULL,
+            file_path     TEXT NOT NULL,
+            content_hash  TEXT NOT NULL,
+            status        TEXT NOT NULL,
+            chunks        INTEGER NOT NULL DEFAULT 0,
+            error         TEXT,
+            updated_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (repository, file_path)
+        )
+    """)
+    # Current (or last) run per repository; counters survive restarts
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS indexing_runs (
+            repository       TEXT PRIMARY KEY,
+            run_id           TEXT NOT NULL,
+            source           TEXT NOT NULL,
+            status           TEXT NOT NULL,
+            total_files      INTEGER NOT NULL DEFAULT 0,
+            processed_files  INTEGER NOT NULL DEFAULT 0,
+            failed_files     INTEGER NOT NULL DEFAULT 0,
+            skipped_files    INTEGER NOT NULL DEFAULT 0,
+            chunks           BIGINT NOT NULL DEFAULT 0,
+            active_seconds   DOUBLE PRECISION NOT NULL DEFAULT 0,
+            resumes          INTEGER NOT NULL DEFAULT 0,
+            started_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            completed_at     TIMESTAMPTZ
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS indexing_runs")
+    op.execute("DROP TABLE IF EXISTS indexing_checkpoints")
@@ -0,0 +1,44 @@
+"""add repository_file_stats per-file aggregates behind repository_stats
+
+Revision ID: 20261022_0000
+Revises: 20261021_0000
+Create Date: 2026-10-22
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261022_0000"
+down_revision = "20261021_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per indexed file: an incremental refresh recomputes the files
+    # it wrote and rolls repository_stats up from these rows
+    # (services/repository_stats_service.py). Filled on the next API start.
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS repository_file_stats (
+            repository            TEXT NOT NULL,
+            file_path             TEXT NOT NULL,
+            chunk_count           INTEGER NOT NULL DEFAULT 0,
+            function_count        INTEGER NOT NULL DEFAULT 0,
+            chunks_by_language    JSONB NOT NULL DEFAULT '{}'::jsonb,
+            chunks_by_type        JSONB NOT NULL DEFAULT '{}'::jsonb,
+            complexity_sum        DOUBLE PRECISION NOT NULL DEFAULT 0,
+            complexity_count      INTEGER NOT NULL DEFAULT 0,
+            complexity_histogram  JSONB NOT NULL DEFAULT '{}'::jsonb,
+            top_complex           JSONB NOT NULL DEFAULT '[]'::jsonb,
+            lsp_with_return_type  INTEGER NOT NULL DEFAULT 0,
+            lsp_with_signature    INTEGER NOT NULL DEFAULT 0,
+            lsp_with_params       INTEGER NOT NULL DEFAULT 0,
+            first_indexed_at      TIMESTAMPTZ,
+            last_indexed_at       TIMESTAMPTZ,
+            PRIMARY KEY (repository, file_path)
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS repository_file_stats")
@@ -0,0 +1,44 @@
+"""add repository_deletion_jobs for durable background repository deletions
+
+Revision ID: 20261023_0000
+Revises: 20261022_0000
+Create Date: 2026-10-23
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261023_0000"
+down_revision = "20261022_0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per deletion job, progress written with every batch
+    # (services/repository_deletion_service.py); visible to every process
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS repository_deletion_jobs (
+            job_id       TEXT PRIMARY KEY,
+            repository   TEXT NOT NULL,
+            status       TEXT NOT NULL DEFAULT 'pending',
+            phase        TEXT NOT NULL DEFAULT 'pending',
+            totals       JSONB NOT NULL DEFAULT '{}'::jsonb,
+            deleted      JSONB NOT NULL DEFAULT '{}'::jsonb,
+            batches      INTEGER NOT NULL DEFAULT 0,
+            error        TEXT,
+            created_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            finished_at  TIMESTAMPTZ
+        )
+    """)
+    # At most one unfinished job per repository, across API workers
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_repository_deletion_jobs_active
+        ON repository_deletion_jobs (repository)
+        WHERE status IN ('pending', 'running')
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS repository_deletion_jobs")
@@ -0,0 +1,83 @@
+"""
+Batched DELETE: bounded statements, one short transaction per batch.
+
+An unbounded DELETE of a whole repository holds its row locks until every
+HNSW / GIN / trigram index entry is removed and leaves autovacuum all the
+dead tuples at once. delete_in_batches() repeats an index-driven
+
+    DELETE FROM t WHERE pk IN (SELECT pk FROM t WHERE ... LIMIT :batch_size)
+
+until a batch comes back short, each batch in its own transaction with an
+optional pause in between (services/repository_deletion_service.py,
+CodeChunkRepository.delete_by_repository).
+
+Configuration (environment):
+    REPOSITORY_DELETE_BATCH_SIZE   rows per transaction       (default: 2000)
+    REPOSITORY_DELETE_PAUSE_MS     pause between batches      (default: 20)
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# Called after each batch with (rows deleted, connection of the batch), inside
+# the batch transaction: progress written there commits with the batch
+OnBatch = Callable[[int, AsyncConnection], Awaitable[None]]
+
+
+def batch_size_from_env() -> int:
+    return max(1, int(os.getenv("REPOSITORY_DELETE_BATCH_SIZE", "2000")))
+
+
+def pause_seconds_from_env() -> float:
+    return int(os.getenv("REPOSITORY_DELETE_PAUSE_MS", "20")) / 1000
+
+
+async def delete_in_batches(
+    engine: AsyncEngine,
+    delete_sql: str,
+    params: Dict[str, Any],
+    batch_size: int,
+    pause_seconds: float = 0.0,
+    on_batch: Optional[OnBatch] = None,
+    connection: Optional[AsyncConnection] = None,
+) -> int:
+    """
+    Run a `LIMIT :batch_size` DELETE until a batch deletes fewer rows.
+
+    Args:
+        engine: Database async engine (one transaction per batch)
+        delete_sql: DELETE statement with a :batch_size bounded subquery
+        params: Statement parameters (batch_size is added)
+        batch_size: Rows per batch
+        pause_seconds: Pause between full batches
+        on_batch: Progress callback, run in the batch transaction
+        connection: External connection (caller manages the transaction;
+            statements stay bounded but locks are held until its commit)
+
+    Returns:
+        Number of rows deleted
+    """
+    statement = text(delete_sql)
+    params = {**params, "batch_size": batch_size}
+    total = 0
+    while True:
+        if connection is not None:
+            result = await connection.execute(statement, params)
+            deleted = result.rowcount or 0
+            if on_batch is not None:
+                await on_batch(deleted, connection)
+        else:
+            async with engine.begin() as conn:
+                result = await conn.execute(statement, params)
+                deleted = result.rowcount or 0
+                if on_batch is not None:
+                    await on_batch(deleted, conn)
+        total += deleted
+        if deleted < batch_size:
+            return total
+        if pause_seconds and connection is None:
+            await asyncio.sleep(pause_seconds)
@@ -18,11 +18,21 @@ from sqlalchemy.sql import delete, insert, select, text, update
 from sqlalchemy.sql.elements import TextClause
 from pgvector.sqlalchemy import Vector
 
+from db.batched_delete import batch_size_from_env, delete_in_batches, pause_seconds_from_env
 from db.repositories.base import RepositoryError
 from models.code_chunk_models import CodeChunkCreate, CodeChunkModel, CodeChunkUpdate
 
 logger = logging.getLogger(__name__)
 
+# One batch of a repository's chunks (delete_by_repository, repository deletion jobs)
+DELETE_CHUNKS_BATCH_SQL = """
+    DELETE FROM code_chunks WHERE id IN (
+        SELECT id FROM code_chunks
+        WHERE repository = :repository
+        LIMIT :batch_size
+    )
+"""
+
 # Define code_chunks table for SQLAlchemy Core
 metadata_obj = MetaData()
 code_chunks_table = Table(
@@ -556,29 +566,33 @@ class CodeChunkRepository:
         self,
         repository: str,
         connection: Optional[AsyncConnection] = None,
+        batch_size: Optional[int] = None,
     ) -> int:
         """
         Delete all code chunks for a repository.
 
         EPIC-12 Story 12.2: New bulk delete method for atomic multi-step operations.
+        Runs in batches (db/batched_delete.py): one short transaction per
+        batch, or bounded statements inside the caller's transaction.
 
         Args:
             repository: Repository name to delete chunks for
             connection: Optional external connection for transaction support
+            batch_size: Rows per batch (REPOSITORY_DELETE_BATCH_SIZE)
 
         Returns:
             Number of deleted chunks
         """
-        query = text("""
-            DELETE FROM code_chunks
-            WHERE repository = :repository
-        """)
-        params = {"repository": repository}
-
         try:
             self.logger.info(f"Deleting all chunks for repository: {repository}")
-            db_result = await self._execute_query(query, params, is_mutation=True, connection=connection)
-            rows_affected = db_result.rowcount
+            rows_affected = await delete_in_batches(
+                self.engine,
+                DELETE_CHUNKS_BATCH_SQL,
+                {"repository": repository},
+                batch_size=batch_size or batch_size_from_env(),
+                pause_seconds=pause_seconds_from_env(),
+                connection=connection or self._connection,
+            )
             self.logger.info(f"Deleted {rows_affected} chunks for repository {repository}")
             return rows_affected
         except Exception as e:
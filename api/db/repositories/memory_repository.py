@@ -15,6 +15,12 @@ from sqlalchemy.sql import text
 import structlog
 
 from db.repositories.base import RepositoryError
+from utils.keyset_pagination import (
+    COUNT_MODES,
+    encode_cursor,
+    estimate_count,
+    keyset_condition,
+)
 from mnemo_mcp.models.memory_models import (
     Memory,
     MemoryCreate,
@@ -327,6 +333,45 @@ class MemoryRepository:
         except Exception as e:
             raise RepositoryError(f"Failed to permanently delete memory: {e}") from e
 
+    def _list_where_clauses(
+        self, filters: Optional[MemoryFilters], params: Dict[str, Any]
+    ) -> List[str]:
+        """WHERE clauses for list_memories / list_memories_page (fills params)."""
+        where_clauses = []
+
+        if not filters or not filters.include_deleted:
+            where_clauses.append("deleted_at IS NULL")
+
+        if filters:
+            if filters.project_id:
+                where_clauses.append("project_id = :project_id")
+                params["project_id"] = str(filters.project_id)
+
+            if filters.memory_type:
+                where_clauses.append("memory_type = :memory_type")
+                params["memory_type"] = filters.memory_type.value
+
+            if filters.tags:
+                # tags array contains all specified tags (AND logic)
+                tag_conditions = [f":tag{i} = ANY(tags)" for i in range(len(filters.tags))]
+                where_clauses.append(f"({' AND '.join(tag_conditions)})")
+                for i, tag in enumerate(filters.tags):
+                    params[f"tag{i}"] = tag
+
+            if filters.author:
+                where_clauses.append("author = :author")
+                params["author"] = filters.author
+
+            if filters.created_after:
+                where_clauses.append("created_at >= :created_after")
+                params["created_after"] = filters.created_after
+
+            if filters.created_before:
+                where_clauses.append("created_at <= :created_before")
+                params["created_before"] = filters.created_before
+
+        return where_clauses
+
     async def list_memories(
         self,
         filters: Optional[MemoryFilters] = None,
@@ -348,40 +393,8 @@ class MemoryRepository:
             RepositoryError: If query fails
         """
         try:
-            # Build WHERE clauses
-            where_clauses = []
             params: Dict[str, Any] = {"limit": limit, "offset": offset}
-
-            if not filters or not filters.include_deleted:
-                where_clauses.append("deleted_at IS NULL")
-
-            if filters:
-                if filters.project_id:
-                    where_clauses.append("project_id = :project_id")
-                    params["project_id"] = str(filters.project_id)
-
-                if filters.memory_type:
-                    where_clauses.append("memory_type = :memory_type")
-                    params["memory_type"] = filters.memory_type.value
-
-                if filters.tags:
-                    # tags array contains all specified tags (AND logic)
-                    tag_conditions = [f":tag{i} = ANY(tags)" for i in range(len(filters.tags))]
-                    where_clauses.append(f"({' AND '.join(tag_conditions)})")
-                    for i, tag in enumerate(filters.tags):
-                        params[f"tag{i}"] = tag
-
-                if filters.author:
-                    where_clauses.append("author = :author")
-                    params["author"] = filters.author
-
-                if filters.created_after:
-                    where_clauses.append("created_at >= :created_after")
-                    params["created_after"] = filters.created_after
-
-                if filters.created_before:
-                    where_clauses.append("created_at <= :created_before")
-                    params["created_before"] = filters.created_before
+            where_clauses = self._list_where_clauses(filters, params)
 
             where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
@@ -401,7 +414,7 @@ class MemoryRepository:
                     deleted_at
                 FROM memories
                 {where_sql}
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT :limit OFFSET :offset
             """)
 
@@ -430,6 +443,122 @@ class MemoryRepository:
         except Exception as e:
             raise RepositoryError(f"Failed to list memories: {e}") from e
 
+    async def list_memories_page(
+        self,
+        filters: Optional[MemoryFilters] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+    ) -> Tuple[List[Memory], Optional[str], Optional[int]]:
+        """
+        List memories with keyset (cursor) pagination.
+
+        Constant cost per page regardless of depth, unlike list_memories
+        whose OFFSET re-reads every skipped row.
+
+        Args:
+            filters: Optional filters (project_id, memory_type, tags, etc.)
+            limit: Max results to return (1-100)
+            cursor: Cursor returned by the previous page (None = first page)
+            count_mode: "exact", "estimated" (planner statistics) or "none"
+
+        Returns:
+            Tuple of (memories, next_cursor or None, total or None)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+            RepositoryError: If query fails
+        """
+        params: Dict[str, Any] = {}
+        where_clauses = self._list_where_clauses(filters, params)
+        columns = """
+                    id, title, content, created_at, updated_at,
+                    memory_type, tags, author, project_id,
+                    embedding_model, related_chunks, resource_links,
+                    deleted_at"""
+        try:
+            return await self._keyset_page(
+                columns, where_clauses, params, limit, cursor, count_mode,
+                exclude_embedding=True,
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Failed to list memories: {e}") from e
+
+    async def _keyset_page(
+        self,
+        columns: str,
+        where_clauses: List[str],
+        params: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str],
+        count_mode: str,
+        exclude_embedding: bool = False,
+    ) -> Tuple[List[Memory], Optional[str], Optional[int]]:
+        """
+        Fetch one (created_at DESC, id DESC) keyset page.
+
+        Fetches limit + 1 rows: the extra row only signals that a next page
+        exists. The count (if any) ignores the cursor so it describes the
+        whole filtered set, as with offset pagination.
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count_mode: {count_mode} (expected one of {COUNT_MODES})")
+
+        count_where = " AND ".join(where_clauses)
+        count_params = dict(params)
+
+        page_clauses = list(where_clauses)
+        if cursor:
+            page_clauses.append(keyset_condition(cursor, params))
+        page_where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
+        params["limit_plus_one"] = limit + 1
+
+        query = text(f"""
+                SELECT {columns}
+                FROM memories
+                {page_where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT :limit_plus_one
+            """)
+
+        total: Optional[int] = None
+        async with self.engine.begin() as conn:
+            if count_mode == "exact":
+                count_sql = f"WHERE {count_where}" if count_where else ""
+                count_result = await conn.execute(
+                    text(f"SELECT COUNT(*) as total FROM memories {count_sql}"),
+                    count_params,
+                )
+                total_row = count_result.fetchone()
+                total = total_row[0] if total_row else 0
+            elif count_mode == "estimated":
+                total = await estimate_count(conn, "memories", count_where, count_params)
+
+            result = await conn.execute(query, params)
+            rows = result.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        memories = [self._row_to_memory(row, exclude_embedding=exclude_embedding) for row in rows]
+
+        next_cursor = None
+        if has_more and memories:
+            last = memories[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        self.logger.info(
+            "Memories page fetched",
+            count=len(memories),
+            total=total,
+            count_mode=count_mode,
+            has_cursor=cursor is not None,
+            has_more=has_more,
+        )
+
+        return memories, next_cursor, total
+
     async def search_by_vector(
         self,
         vector: List[float],
@@ -570,6 +699,61 @@ class MemoryRepository:
         except Exception as e:
             raise RepositoryError(f"Failed to search memories by vector: {e}") from e
 
+    def _tag_where_clauses(
+        self, filters: Optional[MemoryFilters], params: Dict[str, Any]
+    ) -> List[str]:
+        """WHERE clauses for search_by_tags / search_by_tags_page (fills params)."""
+        where_clauses = ["deleted_at IS NULL"]
+
+        if filters:
+            if filters.project_id:
+                where_clauses.append("project_id = :project_id")
+                params["project_id"] = str(filters.project_id)
+
+            if filters.memory_type:
+                where_clauses.append("memory_type = :memory_type")
+                params["memory_type"] = filters.memory_type.value
+
+            if filters.tags:
+                # EPIC-32 Story 32.10: Support AND and OR tag matching
+                tag_mode = getattr(filters, 'tag_mode', 'and') or 'and'
+                if tag_mode == 'or':
+                    # PostgreSQL array overlap: tags && ARRAY[...]
+                    tag_placeholders = ", ".join([f":tag{i}" for i in range(len(filters.tags))])
+                    where_clauses.append(f"tags && ARRAY[{tag_placeholders}]")
+                    for i, tag in enumerate(filters.tags):
+                        params[f"tag{i}"] = tag
+                else:
+                    # AND mode (default): all tags must match
+                    tag_conditions = [f":tag{i} = ANY(tags)" for i in range(len(filters.tags))]
+                    where_clauses.append(f"({' AND '.join(tag_conditions)})")
+                    for i, tag in enumerate(filters.tags):
+                        params[f"tag{i}"] = tag
+
+            if filters.consumed is not None:
+                if filters.consumed:
+                    where_clauses.append("consumed_at IS NOT NULL")
+                else:
+                    where_clauses.append("consumed_at IS NULL")
+
+            if filters.lifecycle_state:
+                if filters.lifecycle_state == "sealed":
+                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_candidate)")
+                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_doubt)")
+                    params["lc_candidate"] = "%:candidate"
+                    params["lc_doubt"] = "%:doubt"
+                elif filters.lifecycle_state == "candidate":
+                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_candidate)")
+                    params["lc_candidate"] = "%:candidate"
+                elif filters.lifecycle_state == "doubt":
+                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_doubt)")
+                    params["lc_doubt"] = "%:doubt"
+                elif filters.lifecycle_state == "summary":
+                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_summary)")
+                    params["lc_summary"] = "%:summary"
+
+        return where_clauses
+
     async def search_by_tags(
         self,
         filters: Optional[MemoryFilters] = None,
@@ -591,55 +775,8 @@ class MemoryRepository:
             Tuple of (list of Memory objects, total count)
         """
         try:
-            where_clauses = ["deleted_at IS NULL"]
             params: Dict[str, Any] = {"limit": limit, "offset": offset}
-
-            if filters:
-                if filters.project_id:
-                    where_clauses.append("project_id = :project_id")
-                    params["project_id"] = str(filters.project_id)
-
-                if filters.memory_type:
-                    where_clauses.append("memory_type = :memory_type")
-                    params["memory_type"] = filters.memory_type.value
-
-                if filters.tags:
-                    # EPIC-32 Story 32.10: Support AND and OR tag matching
-                    tag_mode = getattr(filters, 'tag_mode', 'and') or 'and'
-                    if tag_mode == 'or':
-                        # PostgreSQL array overlap: tags && ARRAY[...]
-                        tag_placeholders = ", ".join([f":tag{i}" for i in range(len(filters.tags))])
-                        where_clauses.append(f"tags && ARRAY[{tag_placeholders}]")
-                        for i, tag in enumerate(filters.tags):
-                            params[f"tag{i}"] = tag
-                    else:
-                        # AND mode (default): all tags must match
-                        tag_conditions = [f":tag{i} = ANY(tags)" for i in range(len(filters.tags))]
-                        where_clauses.append(f"({' AND '.join(tag_conditions)})")
-                        for i, tag in enumerate(filters.tags):
-                            params[f"tag{i}"] = tag
-
-                if filters.consumed is not None:
-                    if filters.consumed:
-                        where_clauses.append("consumed_at IS NOT NULL")
-                    else:
-                        where_clauses.append("consumed_at IS NULL")
-
-                if filters.lifecycle_state:
-                    if filters.lifecycle_state == "sealed":
-                        where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_candidate)")
-                        where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_doubt)")
-                        params["lc_candidate"] = "%:candidate"
-                        params["lc_doubt"] = "%:doubt"
-                    elif filters.lifecycle_state == "candidate":
-                        where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_candidate)")
-                        params["lc_candidate"] = "%:candidate"
-                    elif filters.lifecycle_state == "doubt":
-                        where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_doubt)")
-                        params["lc_doubt"] = "%:doubt"
-                    elif filters.lifecycle_state == "summary":
-                        where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE :lc_summary)")
-                        params["lc_summary"] = "%:summary"
+            where_clauses = self._tag_where_clauses(filters, params)
 
             where_sql = " AND ".join(where_clauses)
 
@@ -652,7 +789,7 @@ class MemoryRepository:
                     outcome_positive, outcome_negative, outcome_score, last_outcome_at
                 FROM memories
                 WHERE {where_sql}
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT :limit OFFSET :offset
             """)
 
@@ -684,6 +821,43 @@ class MemoryRepository:
         except Exception as e:
             raise RepositoryError(f"Failed to search memories by tags: {e}") from e
 
+    async def search_by_tags_page(
+        self,
+        filters: Optional[MemoryFilters] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+    ) -> Tuple[List[Memory], Optional[str], Optional[int]]:
+        """
+        Tag-only search with keyset (cursor) pagination.
+
+        Same filters as search_by_tags; see list_memories_page for the
+        cursor and count_mode semantics.
+
+        Returns:
+            Tuple of (memories, next_cursor or None, total or None)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+            RepositoryError: If query fails
+        """
+        params: Dict[str, Any] = {}
+        where_clauses = self._tag_where_clauses(filters, params)
+        columns = """
+                    id, title, content, created_at, updated_at,
+                    memory_type, tags, author, project_id,
+                    embedding, embedding_model, related_chunks, resource_links,
+                    deleted_at,
+                    outcome_positive, outcome_negative, outcome_score, last_outcome_at"""
+        try:
+            return await self._keyset_page(
+                columns, where_clauses, params, limit, cursor, count_mode,
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Failed to search memories by tags: {e}") from e
+
     async def rate_memory(
         self,
         memory_id: str,
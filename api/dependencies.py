@@ -24,11 +24,12 @@ from db.repositories.event_repository import EventRepository
 from services.embedding_service import MockEmbeddingService
 from services.sentence_transformer_embedding_service import SentenceTransformerEmbeddingService
 from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
+from services.remote_embedding_service import create_dual_embedding_service
 from services.memory_search_service import MemorySearchService
 from services.event_processor import EventProcessor
 from services.notification_service import NotificationService
 from services.event_service import EventService
-from services.caches import CodeChunkCache, RedisCache, CascadeCache
+from services.caches import CodeChunkCache, RedisCache, CascadeCache, get_invalidation_bus
 
 logger = structlog.get_logger()
 
@@ -265,7 +266,10 @@ async def get_embedding_service(request: Request) -> EmbeddingServiceProtocol:
         )
 
         # Create DualEmbeddingService (supports TEXT + CODE domains)
-        dual_service = DualEmbeddingService(
+        # EMBEDDING_SIDECAR_URL set: models live in the embedding sidecar
+        dual_service = create_dual_embedding_service(
+            priority="interactive",
+            client_name="api",
             text_model_name=os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-text-v1.5"),
             code_model_name=os.getenv("CODE_EMBEDDING_MODEL", "jinaai/jina-embeddings-v2-base-code"),
             dimension=int(os.getenv("EMBEDDING_DIMENSION", "768")),
@@ -362,7 +366,7 @@ async def get_code_chunk_cache(request: Request) -> CodeChunkCache:
 
     # Create cache singleton
     cache_size_mb = int(os.getenv("L1_CACHE_SIZE_MB", "100"))
-    code_chunk_cache = CodeChunkCache(max_size_mb=cache_size_mb)
+    code_chunk_cache = CodeChunkCache(max_size_mb=cache_size_mb, invalidation_bus=get_invalidation_bus())
 
     # Store in app.state for singleton pattern
     request.app.state.code_chunk_cache = code_chunk_cache
@@ -103,6 +103,17 @@ async def lifespan(app: FastAPI):
             )
             app.state.db_engine = None  # Set to None on failure
 
+    # 1b. Dashboard statistics: one-off rebuild after the repository_stats
+    # migrations (advisory lock; never on the read path, never for a
+    # repository being deleted)
+    app.state.repository_stats_task = None
+    if app.state.db_engine is not None:
+        from services.repository_stats_service import RepositoryStatsService
+
+        app.state.repository_stats_task = asyncio.create_task(
+            RepositoryStatsService(app.state.db_engine).ensure_built()
+        )
+
     # 2. Pre-load embedding model (si mode=real)
     embedding_mode = os.getenv("EMBEDDING_MODE", "real").lower()
     if embedding_mode == "real":
@@ -110,10 +121,13 @@ async def lifespan(app: FastAPI):
             logger.info("⏳ Pre-loading embedding model during startup...")
 
             # Create DualEmbeddingService directly (can't use dependency injection here)
-            from services.dual_embedding_service import DualEmbeddingService
+            from services.remote_embedding_service import create_dual_embedding_service
             from dependencies import DualEmbeddingServiceAdapter
 
-            dual_service = DualEmbeddingService(
+            # EMBEDDING_SIDECAR_URL set: models live in the embedding sidecar
+            dual_service = create_dual_embedding_service(
+                priority="interactive",
+                client_name="api",
                 text_model_name=os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-text-v1.5"),
                 code_model_name=os.getenv("CODE_EMBEDDING_MODEL", "jinaai/jina-embeddings-v2-base-code"),
                 dimension=int(os.getenv("EMBEDDING_DIMENSION", "768")),
@@ -158,6 +172,18 @@ async def lifespan(app: FastAPI):
 
         app.state.redis_cache = redis_cache
         logger.info("✅ Redis L2 cache connected successfully")
+
+        # Memory writes from the API must invalidate MCP memory search caches
+        from services.caches.memory_search_cache import get_memory_search_cache
+        get_memory_search_cache().bind_redis(redis_cache.client)
+        # Indexing by the MCP server / batch consumer must invalidate code search caches here
+        from services.caches.repository_generations import get_repository_generations
+        get_repository_generations().bind_redis(redis_cache.client)
+        # Invalidations of this process's L1 caches reach the other processes and back
+        from services.caches.invalidation_bus import get_invalidation_bus
+        invalidation_bus = get_invalidation_bus()
+        invalidation_bus.bind_redis(redis_cache.client)
+        await invalidation_bus.start()
     except Exception as e:
         logger.warning(
             "Redis L2 cache connection failed - continuing with graceful degradation",
@@ -316,6 +342,13 @@ async def lifespan(app: FastAPI):
     shutdown_otel()
     await log_processor.shutdown()
 
+    if getattr(app.state, "repository_stats_task", None):
+        app.state.repository_stats_task.cancel()
+        try:
+            await app.state.repository_stats_task
+        except asyncio.CancelledError:
+            pass
+
     if hasattr(app.state, "db_engine") and app.state.db_engine:
         await app.state.db_engine.dispose()
         logger.info("Database engine disposed.")
@@ -328,6 +361,8 @@ async def lifespan(app: FastAPI):
     # Cleanup Redis L2 cache (EPIC-10 Story 10.2)
     if hasattr(app.state, "redis_cache") and app.state.redis_cache:
         try:
+            from services.caches.invalidation_bus import get_invalidation_bus
+            await get_invalidation_bus().stop()
             await app.state.redis_cache.disconnect()
             logger.info("Redis L2 cache disconnected.")
         except Exception as e:
@@ -426,6 +461,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # EPIC-22 Story 22.1: Metrics middleware for observability
@@ -282,14 +282,22 @@ class PaginationMetadata(BaseModel):
         ...,
         description="Current offset"
     )
-    total: int = Field(
+    total: Optional[int] = Field(
         ...,
-        description="Total results available"
+        description="Total results available (None when counting was skipped)"
     )
     has_more: bool = Field(
         ...,
         description="Whether more results are available"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page (keyset pagination)"
+    )
+    total_is_estimate: bool = Field(
+        False,
+        description="Whether total is a planner estimate rather than an exact count"
+    )
 
 
 class MemoryListResponse(BaseModel):
@@ -4,7 +4,6 @@ MCP Indexing Resources (EPIC-23 Story 23.5).
 Resources for querying indexing status and statistics.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Optional
@@ -15,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 from mnemo_mcp.base import BaseMCPComponent
 from mnemo_mcp.models.indexing_models import IndexStatus
 from models.code_chunk_models import CodeChunk
+from services.indexing_job_queue import read_indexing_status
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +66,12 @@ class IndexStatusResource(BaseMCPComponent):
 
             if redis:
                 try:
-                    status_key = f"indexing:status:{repository}"
-                    status_data = await redis.get(status_key)
+                    status_info = await read_indexing_status(redis, repository)
 
-                    if status_data:
-                        status_info = json.loads(status_data)
+                    if status_info:
                         current_status = status_info.get("status", "unknown")
+                        if current_status == "queued":
+                            current_status = "in_progress"
                         total_files_progress = status_info.get("total_files", 0)
                         indexed_files_progress = status_info.get("indexed_files", 0)
 
@@ -29,6 +29,7 @@ from mnemo_mcp.models.memory_models import (
 )
 from db.repositories.memory_repository import MemoryRepository
 from services.embedding_service import EmbeddingServiceInterface
+from utils.keyset_pagination import encode_cursor
 
 logger = structlog.get_logger()
 
@@ -123,11 +124,20 @@ class ListMemoriesResource(BaseMCPComponent):
         - author: string (optional)
         - limit: 1-100 (default 10)
         - offset: pagination offset (default 0)
+        - cursor: keyset cursor from pagination.next_cursor (optional)
+        - count: exact|estimated|none (optional, default exact on offset
+          pages and estimated on cursor pages)
         - include_deleted: true|false (default false)
 
     Usage in Claude Desktop:
         Access "memories://list?tags=python&limit=5" to list Python-tagged memories
 
+    Pagination:
+        Every page returns pagination.next_cursor when more results exist.
+        Passing it back as ?cursor=... resumes after the last row seen with
+        an index range scan, so page cost does not grow with depth (OFFSET
+        re-reads every skipped row).
+
     Returns:
         MemoryListResponse with memories list and pagination metadata
         (Embeddings excluded for bandwidth savings)
@@ -184,13 +194,32 @@ class ListMemoriesResource(BaseMCPComponent):
 
             limit = min(int(params.get("limit", 10)), 100)
             offset = int(params.get("offset", 0))
+            cursor = params.get("cursor")
+            count_mode = params.get("count")
 
-            # Query database
-            memories, total_count = await self.memory_repository.list_memories(
-                filters=filters,
-                limit=limit,
-                offset=offset
-            )
+            if cursor or count_mode:
+                # Keyset pagination
+                count_mode = count_mode or ("estimated" if cursor else "exact")
+                memories, next_cursor, total_count = await self.memory_repository.list_memories_page(
+                    filters=filters,
+                    limit=limit,
+                    cursor=cursor,
+                    count_mode=count_mode,
+                )
+                offset = 0
+                has_more = next_cursor is not None
+            else:
+                memories, total_count = await self.memory_repository.list_memories(
+                    filters=filters,
+                    limit=limit,
+                    offset=offset
+                )
+                has_more = offset + len(memories) < total_count
+                # Hand out a cursor so the next page can switch to keyset
+                next_cursor = (
+                    encode_cursor(memories[-1].created_at, memories[-1].id)
+                    if has_more and memories else None
+                )
 
             # Build response
             response = MemoryListResponse(
@@ -199,7 +228,9 @@ class ListMemoriesResource(BaseMCPComponent):
                     limit=limit,
                     offset=offset,
                     total=total_count,
-                    has_more=offset + len(memories) < total_count
+                    has_more=has_more,
+                    next_cursor=next_cursor,
+                    total_is_estimate=count_mode == "estimated",
                 )
             )
 
@@ -154,6 +154,17 @@ async def _initialize_services() -> dict:
 
         services["redis"] = redis_client
 
+        # Code cache generations are shared with the API: indexing through
+        # MCP tools invalidates API search caches and vice versa
+        from services.caches.repository_generations import get_repository_generations
+        get_repository_generations().bind_redis(redis_client)
+
+        # L1 invalidations are exchanged with the API over Redis pub/sub
+        from services.caches.invalidation_bus import get_invalidation_bus
+        invalidation_bus = get_invalidation_bus()
+        invalidation_bus.bind_redis(redis_client)
+        await invalidation_bus.start()
+
     except Exception as e:
         logger.warning("mcp.redis.connection_failed", error=str(e))
         services["redis"] = None
@@ -165,7 +176,16 @@ async def _initialize_services() -> dict:
     # write_memory and search_memory no longer use embeddings to avoid
     # the 10-50s cold start that triggers MCP client timeouts.
     # Embeddings can be generated via the API REST endpoint if needed.
+    # With EMBEDDING_SIDECAR_URL set, embeddings come from the shared
+    # embedding sidecar instead: no model is loaded in this process.
     services["embedding_service"] = None
+    if os.getenv("EMBEDDING_SIDECAR_URL"):
+        from services.remote_embedding_service import RemoteDualEmbeddingService
+
+        services["embedding_service"] = RemoteDualEmbeddingService(
+            client_name="mcp", priority="interactive"
+        )
+        logger.info("mcp.embedding_service.sidecar", url=os.getenv("EMBEDDING_SIDECAR_URL"))
 
     # Create SQLAlchemy engine FIRST (needed by multiple services)
     sqlalchemy_engine = None
@@ -185,6 +205,18 @@ async def _initialize_services() -> dict:
         logger.warning("mcp.sqlalchemy_engine.initialization_failed", error=str(e))
         services["engine"] = None
 
+    # index_project / index_markdown_workspace enqueue into the Redis Stream
+    # batch pipeline: no bulk indexing on this event loop
+    services["indexing_jobs"] = None
+    if services.get("redis"):
+        from services.indexing_job_queue import IndexingJobQueue
+
+        services["indexing_jobs"] = IndexingJobQueue(
+            services["redis"],
+            redis_url=config.redis_url,
+            db_url=config.database_url.replace("postgresql://", "postgresql+asyncpg://"),
+        )
+
     # --------------------------------------------------------------------
     # 4. Initialize CodeIndexingService
     # --------------------------------------------------------------------
@@ -198,7 +230,9 @@ async def _initialize_services() -> dict:
         from services.caches.code_chunk_cache import CodeChunkCache
         from services.caches.redis_cache import RedisCache
 
-        l1_cache = CodeChunkCache(max_size_mb=100)
+        from services.caches.invalidation_bus import get_invalidation_bus
+
+        l1_cache = CodeChunkCache(max_size_mb=100, invalidation_bus=get_invalidation_bus())
 
         l2_cache = None
         if services.get("redis"):
@@ -271,12 +305,19 @@ async def _initialize_services() -> dict:
         from services.hybrid_memory_search_service import HybridMemorySearchService
         from services.rrf_fusion_service import RRFFusionService
 
+        from services.caches.memory_search_cache import get_memory_search_cache
+
         if sqlalchemy_engine:
+            # Generations shared through Redis: the API process writes memories too
+            memory_search_cache = get_memory_search_cache()
+            memory_search_cache.bind_redis(services.get("redis"))
+
             hybrid_memory_search_service = HybridMemorySearchService(
                 engine=sqlalchemy_engine,
                 fusion_service=RRFFusionService(k=60),
                 default_lexical_weight=0.5,
                 default_vector_weight=0.5,
+                result_cache=memory_search_cache,
             )
             services["hybrid_memory_search_service"] = hybrid_memory_search_service
             logger.info("mcp.hybrid_memory_search_service.initialized")
@@ -425,6 +466,8 @@ async def _cleanup_services():
     # Cleanup: Close Connections
     if _services_cache.get("redis"):
         try:
+            from services.caches.invalidation_bus import get_invalidation_bus
+            await get_invalidation_bus().stop()
             await _services_cache["redis"].close()
             logger.info("mcp.redis.closed")
         except Exception as e:
@@ -1117,6 +1160,7 @@ def register_memory_components(mcp: FastMCP):
         consumed: bool | None = None,
         lifecycle_state: str | None = None,
         include_outcome: bool = False,
+        cursor: str | None = None,
     ) -> dict:
         """
         Search memories using semantic vector search.
@@ -1132,6 +1176,7 @@ def register_memory_components(mcp: FastMCP):
             tags: Filter by tags (optional)
             consumed: Filter by consumption status (None=all, True=consumed, False=fresh)
             lifecycle_state: Filter by lifecycle (None=all, "sealed", "candidate", "doubt", "summary")
+            cursor: next_cursor from a previous page (constant-time deep paging, overrides offset)
 
         Returns:
             MemorySearchResponse with results, scores, and pagination
@@ -1155,6 +1200,7 @@ def register_memory_components(mcp: FastMCP):
             consumed=consumed,
             lifecycle_state=lifecycle_state,
             include_outcome=include_outcome,
+            cursor=cursor,
         )
         return response
 
@@ -1695,7 +1741,7 @@ def register_indexing_components(mcp: FastMCP) -> None:
     Register indexing tools and resources (EPIC-23 Story 23.5).
 
     Tools:
-        - index_project: Index entire project directory with progress reporting
+        - index_project: Queue a background indexing job for a project directory
         - reindex_file: Reindex single file after modifications
 
     Resources:
@@ -1727,9 +1773,10 @@ def register_indexing_components(mcp: FastMCP) -> None:
         """
         Index an entire project directory.
 
-        Scans project for code files, generates embeddings, builds dependency graph.
-        Shows real-time progress with throttled updates. Uses distributed lock to
-        prevent concurrent indexing. Respects .gitignore by default.
+        Scans project for code files and queues a background indexing job
+        (embeddings, dependency graph) in the batch pipeline. Returns the job
+        id immediately; the indexing itself does not run in this call.
+        Respects .gitignore by default.
 
         Args:
             project_path: Path to project root directory
@@ -1737,21 +1784,17 @@ def register_indexing_components(mcp: FastMCP) -> None:
             include_gitignored: If True, index files even if gitignored (default: False)
 
         Returns:
-            IndexResult with indexed_files, indexed_chunks, indexed_nodes, indexed_edges,
-            failed_files, processing_time_ms, errors, message
-
-        Elicitation:
-            - Confirms with user if >100 files detected
+            Job info: job_id, status ("queued"), total_files, total_batches, message
 
         Examples:
             - index_project(project_path="/home/user/myproject")
             - index_project(project_path="/src", repository="frontend", include_gitignored=True)
 
         Progress Reporting:
-            Uses ctx.report_progress() for real-time status updates (max 1/sec)
+            get_indexing_status(repository=..., follow_seconds=20)
 
         Concurrency:
-            Uses Redis distributed lock - only one indexing operation per repository
+            One job per repository: a running job is reported, not duplicated
         """
         response = await index_project_tool.execute(
             project_path=project_path,
@@ -1852,7 +1895,8 @@ def register_indexing_components(mcp: FastMCP) -> None:
         Specialized for Expanse: skip tree-sitter, LSP, metadata, graph.
         Just: scan .md → split by ## → embed TEXT → store halfvec.
 
-        10x faster than index_project for markdown-only repos.
+        Queued as a background job like index_project; returns the job id
+        immediately. Follow it with get_indexing_status.
 
         Args:
             root_path: Path to project root
@@ -1860,7 +1904,7 @@ def register_indexing_components(mcp: FastMCP) -> None:
             max_file_size_kb: Skip files larger than this (default: 50)
 
         Returns:
-            Dict with: scanned, indexed, chunks_created, time_ms
+            Dict with: job_id, status, scanned, skipped_large, message
 
         Example:
             index_markdown_workspace(root_path="/home/giak/projects/expanse")
@@ -1922,24 +1966,31 @@ def register_indexing_components(mcp: FastMCP) -> None:
     async def get_indexing_status(
         ctx: Context,
         repository: str = "default",
+        follow_seconds: int = 0,
     ) -> dict:
         """
         Get current indexing status for a repository.
 
-        Returns status (idle, in_progress, completed, failed),
-        progress info, and last completion time.
+        Returns status (queued, in_progress, completed, failed),
+        job id, progress info, and last completion time.
 
         Args:
             repository: Repository name (default: "default")
+            follow_seconds: Stream progress of a running job for up to this
+                many seconds (max 25) before returning (default: 0)
 
         Returns:
-            Dict with status, total_files, indexed_files, started_at, completed_at, error
+            Dict with job_id, status, total_files, indexed_files, failed_files,
+            progress, started_at, completed_at, error, run (durable counters)
 
         Examples:
             - get_indexing_status(repository="mnemolite")
+            - get_indexing_status(repository="mnemolite", follow_seconds=20)
             - get_indexing_status()  # default repository
         """
-        return await get_indexing_status_tool.execute(repository=repository, ctx=ctx)
+        return await get_indexing_status_tool.execute(
+            repository=repository, follow_seconds=follow_seconds, ctx=ctx
+        )
 
     @mcp.tool()
     async def get_indexing_errors(
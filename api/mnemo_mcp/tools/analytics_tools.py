@@ -4,13 +4,13 @@ MCP Analytics Tools (EPIC-23 Story 23.6 + EPIC-31 Story 31.2).
 Tools for cache management, indexing stats, and memory health observability.
 """
 import structlog
-import json
 from typing import Optional
 
 from mcp.server.fastmcp import Context
 
 from mnemo_mcp.base import BaseMCPComponent
 from mnemo_mcp.models.cache_models import ClearCacheRequest, ClearCacheResponse
+from services.indexing_job_queue import read_indexing_status
 
 logger = structlog.get_logger()
 
@@ -226,12 +226,7 @@ class GetIndexingStatsTool(BaseMCPComponent):
 
             indexing_status = None
             if redis:
-                try:
-                    status_data = await redis.get(f"indexing:status:{repository}")
-                    if status_data:
-                        indexing_status = json.loads(status_data)
-                except Exception:
-                    pass
+                indexing_status = await read_indexing_status(redis, repository)
 
             return {
                 "success": True,
@@ -5,10 +5,9 @@ Tools for project indexing, incremental re-indexing, file re-indexing, and statu
 """
 
 import asyncio
-import json
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -21,7 +20,10 @@ from mnemo_mcp.models.indexing_models import (
     IndexingOptions,
 )
 from mnemo_mcp.utils.project_scanner import ProjectScanner
+from services.caches.repository_generations import get_repository_generations
 from services.code_indexing_service import FileInput, IndexingOptions as ServiceIndexingOptions
+from services.indexing_checkpoint_service import IndexingCheckpointService
+from services.indexing_job_queue import read_indexing_status
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +35,11 @@ class IndexProjectTool(BaseMCPComponent):
     Features:
     - Scans project directory for code files
     - Respects .gitignore by default
-    - Real-time progress reporting via MCP Context
-    - Distributed lock (Redis) to prevent concurrent indexing
-    - Elicitation for confirmation if >100 files
-    - Graceful degradation if Redis unavailable
+    - Enqueues an indexing job into the Redis Stream batch pipeline and
+      returns its job id immediately (services/indexing_job_queue.py):
+      no indexing runs inside the tool call or on the MCP event loop
+    - One job per repository at a time
+    - Progress via get_indexing_status
     """
 
     def get_name(self) -> str:
@@ -44,8 +47,9 @@ class IndexProjectTool(BaseMCPComponent):
 
     def get_description(self) -> str:
         return (
-            "Index an entire project directory. Scans for code files, "
-            "generates embeddings, builds dependency graph. "
+            "Index an entire project directory. Scans for code files and queues "
+            "a background job (embeddings, dependency graph); returns a job id "
+            "right away. Follow progress with get_indexing_status. "
             "Use for initial indexing or complete re-indexing."
         )
 
@@ -57,41 +61,35 @@ class IndexProjectTool(BaseMCPComponent):
         ctx: Optional[Context] = None,
     ) -> dict:
         """
-        Index project with progress reporting and concurrency control.
+        Queue a project indexing job.
 
         Args:
             project_path: Path to project root directory
             repository: Repository name for organization
             include_gitignored: If True, index files even if gitignored
-            ctx: MCP Context for progress reporting and elicitation
+            ctx: MCP Context (unused: progress is reported by get_indexing_status)
 
         Returns:
-            IndexResult with statistics
+            Job info: job_id, total_files, total_batches, status
         """
-        start_time = datetime.now(timezone.utc)
-
-        # Check services availability
-        if not self._services.get("code_indexing_service"):
-            return {"success": False, "message": "CodeIndexingService not available"}
-
-        indexing_service = self._services["code_indexing_service"]
-        redis = self._services.get("redis")  # May be None (graceful degradation)
+        jobs = self._services.get("indexing_jobs")
+        if not jobs:
+            return {
+                "success": False,
+                "message": "Indexing job queue not available (requires Redis)",
+            }
 
         try:
             # P0-6 FIX: Validate project path (prevent path traversal)
-            import os
             project_path = os.path.realpath(project_path)
             if not project_path.startswith("/"):
                 return {"success": False, "message": "Invalid project path", "error": "SecurityError"}
 
-            # Step 1: Scan project directory
-            logger.info(f"Scanning project: {project_path}")
-
+            # List files in a thread: large trees must not block the event loop
             scanner = ProjectScanner()
             try:
-                files = await scanner.scan(
-                    project_path=project_path,
-                    respect_gitignore=not include_gitignored
+                files = await asyncio.to_thread(
+                    scanner.scan_paths, project_path, not include_gitignored
                 )
             except FileNotFoundError as e:
                 return {
@@ -106,190 +104,14 @@ class IndexProjectTool(BaseMCPComponent):
                     "error": "Project validation failed"
                 }
 
-            logger.info(f"Found {len(files)} code files in {project_path}")
-
-            # Step 2: Log if many files (elicitation skipped — FastMCP API changed)
-            if len(files) > 100:
-                logger.warning(f"Indexing {len(files)} files — large project, proceeding without confirmation")
-
-            # Step 3: Acquire distributed lock (prevent concurrent indexing)
-            lock_key = f"indexing:lock:{repository}"
-            lock_acquired = False
-
-            if redis:
-                try:
-                    # Try to acquire lock (10-minute TTL for large projects)
-                    lock_acquired = await redis.set(
-                        lock_key,
-                        "1",
-                        nx=True,  # Only set if doesn't exist
-                        ex=600    # Expire after 10 minutes
-                    )
-
-                    if not lock_acquired:
-                        return {
-                            "success": False,
-                            "message": (
-                                f"Indexing already in progress for repository '{repository}'. "
-                                "Please wait for the current operation to complete."
-                            )
-                        }
-
-                    logger.info(f"Acquired distributed lock for {repository}")
-
-                except Exception as redis_error:
-                    # Redis unavailable - log warning but continue without lock
-                    logger.warning(
-                        f"Failed to acquire distributed lock (Redis error): {redis_error}. "
-                        "Continuing without concurrency protection."
-                    )
-
-            try:
-                # Step 4: Update status in Redis (if available)
-                if redis:
-                    try:
-                        await redis.set(
-                            f"indexing:status:{repository}",
-                            json.dumps({
-                                "status": "in_progress",
-                                "total_files": len(files),
-                                "indexed_files": 0,
-                                "started_at": start_time.isoformat(),
-                                "repository": repository
-                            }),
-                            ex=3600  # 1 hour TTL
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to update Redis status: {e}")
-
-                # Step 5: Progress callback with throttling
-                last_progress_time = 0.0
-                progress_interval = 1.0  # Max 1 update per second
-
-                async def progress_callback(current: int, total: int, message: str):
-                    """Report progress to MCP client (throttled)."""
-                    nonlocal last_progress_time
-
-                    if not ctx:
-                        return
-
-                    # Throttle updates to max 1/second
-                    current_time = asyncio.get_event_loop().time()
-                    if current_time - last_progress_time < progress_interval:
-                        # Skip this update (too soon)
-                        return
-
-                    last_progress_time = current_time
-
-                    try:
-                        progress_pct = (current / total) * 100
-                        await ctx.report_progress(
-                            progress=current / total,  # 0.0 to 1.0
-                            message=f"{message} ({current}/{total}, {progress_pct:.1f}%)"
-                        )
-
-                        # Also update Redis status (if available)
-                        if redis:
-                            try:
-                                await redis.set(
-                                    f"indexing:status:{repository}",
-                                    json.dumps({
-                                        "status": "in_progress",
-                                        "total_files": total,
-                                        "indexed_files": current,
-                                        "started_at": start_time.isoformat(),
-                                        "repository": repository
-                                    }),
-                                    ex=3600
-                                )
-                            except Exception:
-                                pass  # Ignore Redis errors during progress updates
-
-                    except Exception as e:
-                        # Progress reporting failure should not break indexing
-                        logger.warning(f"Progress reporting failed: {e}")
-
-                # Step 6: Index repository
-                logger.info(f"Starting indexing of {len(files)} files for {repository}")
-
-                result = await indexing_service.index_repository(
-                    files=files,
-                    options=ServiceIndexingOptions(
-                        extract_metadata=True,
-                        generate_embeddings=True,
-                        build_graph=True,
-                        repository=repository,
-                        repository_root=project_path
-                    ),
-                    progress_callback=progress_callback
-                )
-
-                # Step 7: Update final status in Redis
-                if redis:
-                    try:
-                        await redis.set(
-                            f"indexing:status:{repository}",
-                            json.dumps({
-                                "status": "completed" if result.failed_files == 0 else "failed",
-                                "total_files": len(files),
-                                "indexed_files": result.indexed_files,
-                                "started_at": start_time.isoformat(),
-                                "completed_at": datetime.now(timezone.utc).isoformat(),
-                                "repository": repository,
-                                "errors": result.errors if result.errors else []
-                            }),
-                            ex=3600
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to update final Redis status: {e}")
-
-                # Step 8: Return result
-                return {
-                    "success": True,
-                    "repository": result.repository,
-                    "indexed_files": result.indexed_files,
-                    "indexed_chunks": result.indexed_chunks,
-                    "indexed_nodes": result.indexed_nodes,
-                    "indexed_edges": result.indexed_edges,
-                    "failed_files": result.failed_files,
-                    "processing_time_ms": result.processing_time_ms,
-                    "errors": result.errors,
-                    "message": (
-                        f"Successfully indexed {result.indexed_files} files "
-                        f"({result.indexed_chunks} chunks, {result.indexed_nodes} nodes, "
-                        f"{result.indexed_edges} edges) in {result.processing_time_ms:.0f}ms"
-                    )
-                }
+            if not files:
+                return {"success": False, "message": f"No code files found in {project_path}"}
 
-            finally:
-                # Step 9: Release lock (always, even if indexing failed)
-                if redis and lock_acquired:
-                    try:
-                        await redis.delete(lock_key)
-                        logger.info(f"Released distributed lock for {repository}")
-                    except Exception as e:
-                        logger.error(f"Failed to release lock: {e}")
+            job = await jobs.submit(repository, files, kind="code")
+            return _job_response(repository, job)
 
         except Exception as e:
-            logger.error(f"Unexpected error during project indexing: {e}", exc_info=True)
-
-            # Update Redis status to failed
-            if redis:
-                try:
-                    await redis.set(
-                        f"indexing:status:{repository}",
-                        json.dumps({
-                            "status": "failed",
-                            "started_at": start_time.isoformat(),
-                            "completed_at": datetime.now(timezone.utc).isoformat(),
-                            "repository": repository,
-                            "error": str(e)
-                        }),
-                        ex=3600
-                    )
-                except Exception:
-                    pass
-
+            logger.error(f"Failed to queue project indexing: {e}", exc_info=True)
             return {
                 "success": False,
                 "message": f"Indexing failed: {str(e)}",
@@ -297,6 +119,33 @@ class IndexProjectTool(BaseMCPComponent):
             }
 
 
+def _job_response(repository: str, job: dict) -> dict:
+    """Tool result for a submitted (or already running) indexing job."""
+    if job.get("status") == "already_running":
+        return {
+            "success": False,
+            "repository": repository,
+            "job_id": job.get("job_id"),
+            "status": "already_running",
+            "message": (
+                f"Indexing already in progress for repository '{repository}'. "
+                "Follow it with get_indexing_status."
+            ),
+        }
+    return {
+        "success": True,
+        "repository": repository,
+        "job_id": job["job_id"],
+        "status": "queued",
+        "total_files": job["total_files"],
+        "total_batches": job["total_batches"],
+        "message": (
+            f"Queued {job['total_files']} files ({job['total_batches']} batches) for indexing. "
+            f"Follow progress with get_indexing_status(repository=\"{repository}\")."
+        ),
+    }
+
+
 class ReindexFileTool(BaseMCPComponent):
     """
     Tool: reindex_file - Reindex a single file.
@@ -380,24 +229,6 @@ class ReindexFileTool(BaseMCPComponent):
                 except Exception as e:
                     logger.warning(f"Failed to invalidate cache: {e}")
 
-            # P2-4 FIX: Invalidate search code cache (Redis keys search:v1:*)
-            redis = self._services.get("redis")
-            if redis:
-                try:
-                    cursor = 0
-                    deleted = 0
-                    while True:
-                        cursor, keys = await redis.scan(cursor, match="search:v1:*", count=100)
-                        if keys:
-                            await redis.delete(*keys)
-                            deleted += len(keys)
-                        if cursor == 0:
-                            break
-                    if deleted:
-                        logger.info(f"Invalidated {deleted} search cache keys after reindex")
-                except Exception as e:
-                    logger.warning(f"Failed to invalidate search cache: {e}")
-
             # Reindex file
             logger.info(f"Reindexing file: {file_path}")
 
@@ -418,6 +249,11 @@ class ReindexFileTool(BaseMCPComponent):
                 )
             )
 
+            # Invalidate cached searches/traversals of this repository
+            # (O(1) generation bump, shared through Redis)
+            await get_repository_generations().bump(repository)
+            await indexing_service.repository_stats.refresh_chunks(repository, [file_path])
+
             return {
                 "success": result.success,
                 "file_path": result.file_path,
@@ -678,7 +514,8 @@ class IndexMarkdownWorkspaceTool(BaseMCPComponent):
     Specialized for Expanse: skip tree-sitter, LSP, metadata, graph.
     Just: scan .md → split by ## → embed TEXT → store halfvec.
 
-    Performance: 10x faster than index_project for markdown-only repos.
+    Runs as a "markdown" job of the batch pipeline, like index_project:
+    returns a job id immediately, progress via get_indexing_status.
     """
 
     def get_name(self) -> str:
@@ -686,130 +523,64 @@ class IndexMarkdownWorkspaceTool(BaseMCPComponent):
 
     async def execute(self, ctx: Context, **params) -> dict:
         """
-        Index markdown workspace.
+        Queue a markdown workspace indexing job.
 
         Args:
             root_path: Path to project root
             repository: Repository name (default: "expanse")
             max_file_size_kb: Skip files larger than this (default: 50)
-            skip_patterns: Additional directories to skip
         """
         root_path = params.get("root_path", ".")
         repository = params.get("repository", "expanse")
         max_file_size_kb = params.get("max_file_size_kb", 50)
-        skip_patterns = params.get("skip_patterns", [])
 
-        start_time = datetime.now()
+        jobs = self._services.get("indexing_jobs")
+        if not jobs:
+            return {
+                "success": False,
+                "scanned": 0,
+                "message": "Indexing job queue not available (requires Redis)",
+            }
 
         try:
-            services = self._services
-            engine = services.get("engine")
-            embedding_service = services.get("embedding_service")
-
-            if not engine:
-                raise RuntimeError("Database engine not available")
-
-            # 1. Scan for .md files only
-            from mnemo_mcp.utils.project_scanner import ProjectScanner
-            scanner = ProjectScanner()
-            all_files = await scanner.scan(
-                project_path=root_path,
-                respect_gitignore=True
+            md_files, skipped_large = await asyncio.to_thread(
+                _list_markdown_files, root_path, max_file_size_kb
             )
-
-            # Filter to .md only and skip large files
-            md_files = []
-            skipped_large = 0
-            for f in all_files:
-                if not f.path.endswith('.md'):
-                    continue
-                try:
-                    size_kb = os.path.getsize(f.path) / 1024
-                    if size_kb > max_file_size_kb:
-                        skipped_large += 1
-                        continue
-                except OSError:
-                    continue
-                md_files.append(f)
-
             if not md_files:
-                return {"success": True, "scanned": 0, "indexed": 0, "message": "No .md files found"}
-
-            # 2. Chunk all files using MarkdownChunker
-            from services.code_chunking_service import CodeChunkingService
-            chunker = CodeChunkingService(max_workers=1)
-
-            all_chunks = []
-            for file_input in md_files:
-                try:
-                    chunks = await chunker._chunk_markdown(
-                        source_code=file_input.content,
-                        file_path=file_input.path,
-                    )
-                    for chunk in chunks:
-                        chunk.repository = repository
-                    all_chunks.extend(chunks)
-                except Exception as e:
-                    logger.warning(f"Failed to chunk {file_input.path}: {e}")
-
-            if not all_chunks:
-                return {"success": True, "scanned": len(md_files), "indexed": 0, "message": "No chunks generated"}
-
-            # 3. Generate TEXT embeddings only (skip CODE)
-            if embedding_service:
-                try:
-                    texts = [f"{c.name}\n{c.source_code[:500]}" for c in all_chunks]
-                    # P0-1 FIX: correct method name is generate_embeddings_batch
-                    embeddings = await embedding_service.generate_embeddings_batch(texts)
-                    for chunk, emb in zip(all_chunks, embeddings):
-                        if isinstance(emb, dict):
-                            chunk.embedding_text = emb.get("text")
-                        elif isinstance(emb, list):
-                            chunk.embedding_text = emb
-                except Exception as e:
-                    logger.warning(f"Embedding generation failed: {e}")
-
-            # 4. Store in DB
-            from db.repositories.code_chunk_repository import CodeChunkRepository
-            chunk_repo = CodeChunkRepository(engine=engine)
+                return {"success": True, "scanned": 0, "message": "No .md files found"}
 
-            async with engine.begin() as conn:
-                # Delete existing chunks for this repository
-                await conn.execute(
-                    text("DELETE FROM code_chunks WHERE repository = :repo"),
-                    {"repo": repository}
-                )
-
-                # Insert new chunks
-                inserted = await chunk_repo.add_batch(
-                    chunks_data=[c.to_db_dict() for c in all_chunks],
-                    connection=conn,
-                )
+            # The workspace is replaced: the job also drops the sections of
+            # files that are gone (the workers replace those of queued files)
+            job = await jobs.submit(repository, md_files, kind="markdown", replace=True)
 
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
-
-            return {
-                "success": True,
-                "scanned": len(md_files),
-                "indexed": len(md_files),
-                "chunks_created": inserted,
-                "skipped_large": skipped_large,
-                "time_ms": elapsed,
-                "message": f"Indexed {len(md_files)} .md files → {inserted} chunks in {elapsed:.0f}ms",
-            }
+            return {**_job_response(repository, job), "scanned": len(md_files), "skipped_large": skipped_large}
 
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
             return {
                 "success": False,
                 "scanned": 0,
-                "indexed": 0,
-                "time_ms": elapsed,
                 "error": str(e),
                 "message": f"Markdown indexing failed: {e}",
             }
 
 
+def _list_markdown_files(root_path: str, max_file_size_kb: int) -> tuple:
+    """.md files of a workspace (gitignore respected), without the large ones."""
+    md_files = []
+    skipped_large = 0
+    for path in ProjectScanner().scan_paths(root_path, respect_gitignore=True):
+        if path.suffix != ".md":
+            continue
+        try:
+            if path.stat().st_size / 1024 > max_file_size_kb:
+                skipped_large += 1
+                continue
+        except OSError:
+            continue
+        md_files.append(path)
+    return md_files, skipped_large
+
+
 # Singleton instances for registration
 index_project_tool = IndexProjectTool()
 reindex_file_tool = ReindexFileTool()
@@ -820,25 +591,44 @@ index_markdown_workspace_tool = IndexMarkdownWorkspaceTool()
 # EPIC-31 Story 31.3: Indexing Observability Tools
 # ============================================================================
 
+async def _report_job_progress(ctx: Optional[Context], status: dict) -> None:
+    """Report the progress of an indexing job to the MCP client (best-effort)."""
+    if not ctx:
+        return
+    done = status.get("indexed_files", 0) + status.get("failed_files", 0)
+    try:
+        await ctx.report_progress(
+            progress=status.get("progress") or 0.0,
+            message=f"{status.get('status')}: {done}/{status.get('total_files', 0)} files",
+        )
+    except Exception as e:
+        logger.warning(f"Progress reporting failed: {e}")
+
+
 class GetIndexingStatusTool(BaseMCPComponent):
     """Tool: get_indexing_status — Get current indexing status for a repository."""
 
+    # Longest follow: stays under the 30s MCP client timeout
+    MAX_FOLLOW_SECONDS = 25
+
     def get_name(self) -> str:
         return "get_indexing_status"
 
     def get_description(self) -> str:
         return (
             "Get current indexing status for a repository. "
-            "Returns status (idle, in_progress, completed, failed), "
-            "progress info, and last completion time."
+            "Returns status (queued, in_progress, completed, failed), "
+            "job id, progress info, and last completion time. "
+            "With follow_seconds, streams progress until the job ends."
         )
 
     async def execute(
         self,
         repository: str = "default",
+        follow_seconds: int = 0,
         ctx: Optional[Context] = None,
     ) -> dict:
-        """Get indexing status from Redis."""
+        """Get indexing status from Redis, optionally following a running job."""
         redis = self._services.get("redis") if self._services else None
         engine = self._services.get("engine") if self._services else None
 
@@ -848,24 +638,37 @@ class GetIndexingStatusTool(BaseMCPComponent):
         try:
             status_data = None
             if redis:
-                try:
-                    raw = await redis.get(f"indexing:status:{repository}")
-                    if raw:
-                        status_data = json.loads(raw) if isinstance(raw, str) else raw
-                except Exception:
-                    pass
+                status_data = await read_indexing_status(redis, repository)
+                deadline = asyncio.get_running_loop().time() + min(follow_seconds, self.MAX_FOLLOW_SECONDS)
+                while (
+                    status_data
+                    and status_data.get("status") in ("queued", "in_progress")
+                    and asyncio.get_running_loop().time() < deadline
+                ):
+                    await _report_job_progress(ctx, status_data)
+                    await asyncio.sleep(1.0)
+                    status_data = await read_indexing_status(redis, repository)
 
             if status_data:
-                return {
+                result = {
                     "success": True,
                     "repository": repository,
+                    "job_id": status_data.get("job_id"),
                     "status": status_data.get("status", "unknown"),
                     "total_files": status_data.get("total_files", 0),
                     "indexed_files": status_data.get("indexed_files", 0),
+                    "failed_files": status_data.get("failed_files", 0),
+                    "progress": status_data.get("progress"),
                     "started_at": status_data.get("started_at"),
                     "completed_at": status_data.get("completed_at"),
                     "error": status_data.get("error"),
                 }
+                if engine:
+                    # Durable counters: throughput and files left across restarts
+                    run = await IndexingCheckpointService(engine).get_run(repository)
+                    if run:
+                        result["run"] = run.to_dict()
+                return result
 
             # Fallback: check DB for last indexed time
             if engine:
@@ -926,9 +729,8 @@ class GetIndexingErrorsTool(BaseMCPComponent):
 
         if redis:
             try:
-                raw = await redis.get(f"indexing:status:{repository}")
-                if raw:
-                    sd = json.loads(raw) if isinstance(raw, str) else raw
+                sd = await read_indexing_status(redis, repository)
+                if sd:
                     if sd.get("error"):
                         errors.append({"timestamp": sd.get("completed_at"), "error": sd["error"], "source": "redis"})
                     for err in sd.get("errors", []):
@@ -978,7 +780,6 @@ class RetryIndexingTool(BaseMCPComponent):
 
         indexing_service = self._services.get("code_indexing_service")
         chunk_cache = self._services.get("chunk_cache")
-        redis = self._services.get("redis")
 
         if not indexing_service:
             return {"success": False, "message": "CodeIndexingService not available"}
@@ -1008,13 +809,8 @@ class RetryIndexingTool(BaseMCPComponent):
             except Exception as e:
                 results.append({"file_path": file_path, "success": False, "error": str(e)})
 
-        if redis:
-            try:
-                cursor, keys = await redis.scan(0, match="search:v1:*", count=100)
-                if keys:
-                    await redis.delete(*keys)
-            except Exception:
-                pass
+        await get_repository_generations().bump(repository)
+        await indexing_service.repository_stats.refresh_chunks(repository, file_paths)
 
         successful = sum(1 for r in results if r.get("success"))
         return {
@@ -32,8 +32,10 @@ from mnemo_mcp.models.memory_models import (
     DeleteMemoryResponse,
 )
 from db.repositories.memory_repository import MemoryRepository
+from services.caches.memory_search_cache import get_memory_search_cache
 from services.embedding_service import EmbeddingServiceInterface
 from mnemo_mcp.tools.project_tools import resolve_project_id
+from utils.keyset_pagination import encode_cursor
 
 logger = structlog.get_logger()
 
@@ -168,6 +170,7 @@ class WriteMemoryTool(BaseMCPComponent):
 
             # Save to database
             memory = await self.memory_repository.create(memory_create, embedding)
+            await get_memory_search_cache().invalidate(memory.project_id)
 
             # EPIC-28: Trigger async entity extraction (non-blocking)
             self._trigger_entity_extraction(memory)
@@ -399,6 +402,7 @@ class UpdateMemoryTool(BaseMCPComponent):
 
             if not updated_memory:
                 raise RuntimeError(f"Memory {id} not found or already deleted")
+            await get_memory_search_cache().invalidate(updated_memory.project_id)
 
             elapsed_ms = (time.time() - start_time) * 1000
 
@@ -496,6 +500,7 @@ class DeleteMemoryTool(BaseMCPComponent):
 
                 if not success:
                     raise RuntimeError(f"Failed to soft delete memory {id}")
+                await get_memory_search_cache().invalidate(existing_memory.project_id)
 
                 elapsed_ms = (time.time() - start_time) * 1000
 
@@ -559,6 +564,7 @@ class DeleteMemoryTool(BaseMCPComponent):
 
             if not success:
                 raise RuntimeError(f"Failed to permanently delete memory {id}")
+            await get_memory_search_cache().invalidate(existing_memory.project_id)
 
             elapsed_ms = (time.time() - start_time) * 1000
 
@@ -581,6 +587,7 @@ class DeleteMemoryTool(BaseMCPComponent):
 
             if not success:
                 raise RuntimeError(f"Failed to permanently delete memory {id}")
+            await get_memory_search_cache().invalidate(existing_memory.project_id)
 
             elapsed_ms = (time.time() - start_time) * 1000
 
@@ -635,6 +642,7 @@ class SearchMemoryTool(BaseMCPComponent):
         limit: int = 10,
         offset: int = 0,
         include_outcome: bool = False,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Semantic search on memories.
@@ -649,6 +657,9 @@ class SearchMemoryTool(BaseMCPComponent):
             limit: Max results (1-50, default: 10)
             offset: Pagination offset (default: 0)
             include_outcome: Include outcome fields in results (default: False)
+            cursor: Keyset cursor from a previous next_cursor (tag-only listing).
+                Takes precedence over offset; total is then a planner estimate.
+                Rejected for ranked (hybrid / vector) searches.
 
         Returns:
             Dict with memories list, pagination, and search metadata
@@ -701,12 +712,18 @@ class SearchMemoryTool(BaseMCPComponent):
             query_embedding = None
             is_tag_only = True  # Force tag-only/lexical search path
 
-            # EPIC-32 Story 32.2: Check Redis cache for memory search
+            # EPIC-32 Story 32.2: Check Redis cache for memory search.
+            # Keyed on the MemorySearchCache write generation (search_memory
+            # has no project filter: the global scope), so any memory write
+            # makes older entries unreachable. No generation → no caching.
             redis = self._services.get("redis") if self._services else None
-            if redis:
+            cache_key = None
+            generation = await get_memory_search_cache().generation() if redis else None
+            if generation is not None:
                 try:
                     import hashlib as _hashlib
                     cache_params = {
+                        "gen": generation,
                         "q": query_stripped,
                         "t": memory_type,
                         "tags": sorted(tags) if tags else [],
@@ -714,6 +731,8 @@ class SearchMemoryTool(BaseMCPComponent):
                         "ls": lifecycle_state,
                         "l": limit,
                         "o": offset,
+                        "cur": cursor,
+                        "io": include_outcome,
                     }
                     cache_key = f"memsearch:{_hashlib.sha256(json.dumps(cache_params, sort_keys=True).encode()).hexdigest()[:16]}"
                     cached = await redis.get(cache_key)
@@ -731,6 +750,13 @@ class SearchMemoryTool(BaseMCPComponent):
                 except Exception as e:
                     logger.warning(f"Embedding generation failed, falling back to tag-only search: {e}")
 
+            # Keyset cursors follow (created_at, id): ranked searches page with offset
+            if cursor and query_embedding:
+                raise ValueError(
+                    "cursor pagination applies to tag listing only; "
+                    "page ranked searches with offset"
+                )
+
             embedding_ms = (time.time() - start_time) * 1000
 
             # Try hybrid search if available AND embedding exists
@@ -757,13 +783,14 @@ class SearchMemoryTool(BaseMCPComponent):
                     filters=filters,
                     limit=limit,
                     offset=offset,
+                    include_content=True,  # Full content for the page only (highlights)
                 )
 
                 # Convert HybridResult to memory format
                 memories = []
                 from services.highlight_service import highlight_matches
                 for m in response.results:
-                    content_text = getattr(m, 'content', m.content_preview)
+                    content_text = getattr(m, 'content', None) or m.content_preview
                     content_preview = content_text[:300] + "..." if len(content_text) > 300 else content_text
                     # EPIC-35 Story 35.1: Add highlighting snippets
                     highlights = highlight_matches(content_text, query, max_snippets=2) if query else []
@@ -797,6 +824,7 @@ class SearchMemoryTool(BaseMCPComponent):
                     "limit": limit,
                     "offset": offset,
                     "has_more": offset + len(memories) < response.metadata.total_results,
+                    "next_cursor": None,
                     "metadata": {
                         "search_mode": "hybrid",
                         "embedding_time_ms": round(embedding_ms, 2),
@@ -823,6 +851,16 @@ class SearchMemoryTool(BaseMCPComponent):
                         distance_threshold=0.7,
                     )
                     search_mode = "vector_only"
+                elif cursor:
+                    # Keyset page: no OFFSET scan, no COUNT(*) re-scan
+                    memories_list, next_cursor, total_count = await self.memory_repository.search_by_tags_page(
+                        filters=fallback_filters,
+                        limit=limit,
+                        cursor=cursor,
+                        count_mode="estimated",
+                    )
+                    offset = 0
+                    search_mode = "tag_only"
                 else:
                     memories_list, total_count = await self.memory_repository.search_by_tags(
                         filters=fallback_filters,
@@ -860,13 +898,23 @@ class SearchMemoryTool(BaseMCPComponent):
                                         memory_dict[field] = val
                     memories.append(memory_dict)
 
+                if search_mode == "tag_only" and cursor:
+                    has_more = next_cursor is not None
+                else:
+                    has_more = offset + len(memories) < total_count
+                    # Cursor for the following page so callers can switch to keyset
+                    next_cursor = None
+                    if has_more and search_mode == "tag_only" and memories_list:
+                        next_cursor = encode_cursor(memories_list[-1].created_at, memories_list[-1].id)
+
                 result = {
                     "query": query,
                     "memories": memories,
                     "total": total_count,
                     "limit": limit,
                     "offset": offset,
-                    "has_more": offset + len(memories) < total_count,
+                    "has_more": has_more,
+                    "next_cursor": next_cursor,
                     "metadata": {
                         "search_mode": search_mode,
                         "embedding_time_ms": round(embedding_ms, 2),
@@ -876,7 +924,7 @@ class SearchMemoryTool(BaseMCPComponent):
             elapsed_ms = (time.time() - start_time) * 1000
 
             # EPIC-32 Story 32.2: Write to Redis cache
-            if redis:
+            if cache_key:
                 try:
                     # TTL depends on query type: tag-only=5min, natural=1min
                     ttl = 300 if is_tag_only else 60
@@ -1095,6 +1143,9 @@ class ConsolidateMemoryTool(BaseMCPComponent):
                         error=str(e)
                     )
 
+            # Sources may span projects that were not fetched: bump every scope
+            await get_memory_search_cache().invalidate(unknown_scope=True)
+
             result = {
                 "consolidated_memory": {
                     "id": str(consolidated.id),
@@ -1184,10 +1235,16 @@ class MarkConsumedTool(BaseMCPComponent):
                         WHERE id = ANY(:ids)
                           AND consumed_at IS NULL
                           AND deleted_at IS NULL
+                        RETURNING project_id
                     """),
                     {"consumed_by": consumed_by.strip(), "ids": memory_ids}
                 )
-                marked = result.rowcount
+                project_ids = [row[0] for row in result.fetchall()]
+                marked = len(project_ids)
+
+            # consumed= is a search filter: drop cached results of touched projects
+            if project_ids:
+                await get_memory_search_cache().invalidate_many(project_ids)
 
             already_consumed = len(memory_ids) - marked
 
@@ -1264,6 +1321,8 @@ class RateMemoryTool(BaseMCPComponent):
                 helpful=helpful,
                 score=score,
             )
+            # Outcome fields are returned by search_memory(include_outcome=True)
+            await get_memory_search_cache().invalidate()
 
             logger.info(
                 "memories.rate_memory",
@@ -86,6 +86,57 @@ class ProjectScanner:
             PermissionError: If project_path is not readable
             ValueError: If project has >10,000 files
         """
+        files: List[FileInput] = []
+        skipped_error = 0
+
+        for file_path in self.scan_paths(project_path, respect_gitignore):
+            # Read file content
+            try:
+                # Resolve symlinks
+                resolved_path = file_path.resolve()
+
+                # Read as UTF-8 (code files should be text)
+                content = resolved_path.read_text(encoding='utf-8')
+
+                files.append(FileInput(
+                    path=str(file_path),
+                    content=content,
+                    language=None  # Auto-detect in indexing service
+                ))
+
+            except (UnicodeDecodeError, PermissionError) as e:
+                # Skip binary files or permission-denied files
+                self.logger.debug(f"Skipped {file_path}: {e}")
+                skipped_error += 1
+                continue
+
+            except Exception as e:
+                # Unexpected error - log but continue
+                self.logger.warning(f"Error reading {file_path}: {e}")
+                skipped_error += 1
+                continue
+
+        if skipped_error:
+            self.logger.info(f"Read {len(files)} files ({skipped_error} unreadable skipped)")
+
+        return files
+
+    def scan_paths(
+        self,
+        project_path: str,
+        respect_gitignore: bool = True
+    ) -> List[Path]:
+        """
+        List the code files of a project without reading them.
+
+        Synchronous: callers that must not block an event loop (MCP
+        indexing tools) run it in a thread. Same filters and limits as
+        scan(); unreadable files are left to the indexer.
+
+        Raises:
+            FileNotFoundError: If project_path doesn't exist
+            ValueError: If project_path is not a directory or has >10,000 files
+        """
         project_root = Path(project_path)
 
         # Validate project path
@@ -101,11 +152,10 @@ class ProjectScanner:
             gitignore_spec = self._load_gitignore(project_root)
 
         # Scan for files
-        files: List[FileInput] = []
+        files: List[Path] = []
         scanned_count = 0
         skipped_gitignore = 0
         skipped_extension = 0
-        skipped_error = 0
 
         self.logger.info(f"Scanning project: {project_path}")
 
@@ -145,31 +195,7 @@ class ProjectScanner:
                     skipped_extension += 1
                     continue
 
-                # Read file content
-                try:
-                    # Resolve symlinks
-                    resolved_path = file_path.resolve()
-
-                    # Read as UTF-8 (code files should be text)
-                    content = resolved_path.read_text(encoding='utf-8')
-
-                    files.append(FileInput(
-                        path=str(file_path),
-                        content=content,
-                        language=None  # Auto-detect in indexing service
-                    ))
-
-                except (UnicodeDecodeError, PermissionError) as e:
-                    # Skip binary files or permission-denied files
-                    self.logger.debug(f"Skipped {file_path}: {e}")
-                    skipped_error += 1
-                    continue
-
-                except Exception as e:
-                    # Unexpected error - log but continue
-                    self.logger.warning(f"Error reading {file_path}: {e}")
-                    skipped_error += 1
-                    continue
+                files.append(file_path)
 
         except RecursionError:
             # Circular symlink or very deep directory structure
@@ -182,8 +208,7 @@ class ProjectScanner:
             f"Scan complete: {len(files)} files found "
             f"(scanned: {scanned_count}, "
             f"gitignored: {skipped_gitignore}, "
-            f"unsupported: {skipped_extension}, "
-            f"errors: {skipped_error})"
+            f"unsupported: {skipped_extension})"
         )
 
         return files
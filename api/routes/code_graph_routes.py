@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from dependencies import get_db_engine
 from services.graph_construction_service import GraphConstructionService
 from services.graph_traversal_service import GraphTraversalService
+from services.repository_stats_service import RepositoryStatsService
 from models.graph_models import GraphStats, GraphTraversal
 
 logger = logging.getLogger(__name__)
@@ -258,45 +259,18 @@ async def get_graph_stats(
         }
     """
     try:
-        from sqlalchemy.sql import text
-
-        async with engine.connect() as conn:
-            # Count nodes by type
-            nodes_query = text("""
-                SELECT
-                    node_type,
-                    COUNT(*) as count
-                FROM nodes
-                WHERE properties->>'repository' = :repository
-                GROUP BY node_type
-            """)
-
-            nodes_result = await conn.execute(
-                nodes_query,
-                {"repository": repository}
-            )
-            nodes_rows = nodes_result.fetchall()
-            nodes_by_type = {row[0]: row[1] for row in nodes_rows}
-            total_nodes = sum(nodes_by_type.values())
-
-            # Count edges by type
-            edges_query = text("""
-                SELECT
-                    e.relation_type,
-                    COUNT(*) as count
-                FROM edges e
-                JOIN nodes n ON e.source_node_id = n.node_id
-                WHERE n.properties->>'repository' = :repository
-                GROUP BY e.relation_type
-            """)
-
-            edges_result = await conn.execute(
-                edges_query,
-                {"repository": repository}
-            )
-            edges_rows = edges_result.fetchall()
-            edges_by_type = {row[0]: row[1] for row in edges_rows}
-            total_edges = sum(edges_by_type.values())
+        # Materialised by the graph pipeline (repository_stats); computed
+        # once here for graphs built before the table existed
+        stats = RepositoryStatsService(engine)
+        row = await stats.get(repository)
+        if row is None or row["graph_refreshed_at"] is None:
+            await stats.refresh_graph(repository)
+            row = await stats.get(repository)
+
+        nodes_by_type = row["nodes_by_type"] if row else {}
+        edges_by_type = row["edges_by_type"] if row else {}
+        total_nodes = row["node_count"] if row else 0
+        total_edges = row["edge_count"] if row else 0
 
         return {
             "repository": repository,
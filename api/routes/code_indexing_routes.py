@@ -9,21 +9,17 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from db.repositories.code_chunk_repository import CodeChunkRepository
-from db.repositories.node_repository import NodeRepository  # EPIC-12 Story 12.2
-from db.repositories.edge_repository import EdgeRepository  # EPIC-12 Story 12.2
 from dependencies import (
     get_db_engine,
     get_code_chunk_cache,
     get_redis_cache,  # EPIC-13 Story 13.4
-    get_chunk_repository,  # EPIC-12 Story 12.2
-    get_node_repository,   # EPIC-12 Story 12.2
-    get_edge_repository,   # EPIC-12 Story 12.2
 )
 from services.caches import CodeChunkCache, RedisCache
 from services.code_chunking_service import CodeChunkingService
@@ -32,11 +28,13 @@ from services.code_indexing_service import (
     FileInput,
     IndexingOptions,
 )
-from services.dual_embedding_service import DualEmbeddingService
+from services.remote_embedding_service import create_dual_embedding_service
 from services.graph_construction_service import GraphConstructionService
 from services.lsp import PyrightLSPClient, TypeExtractorService  # EPIC-13 Story 13.2
 from services.lsp.typescript_lsp_client import TypeScriptLSPClient  # EPIC-16 Story 16.3
+from services.lsp.lsp_process_pool import LSPProcessPool, PooledLSPClient
 from services.metadata_extractor_service import MetadataExtractorService
+from services.repository_deletion_service import get_repository_deletion_service
 from services.symbol_path_service import SymbolPathService  # EPIC-11
 
 logger = logging.getLogger(__name__)
@@ -48,53 +46,72 @@ router = APIRouter(prefix="/v1/code/index", tags=["code-indexing"])
 # EPIC-16 Story 16.4: Global Singleton LSP Clients
 # ============================================================================
 
-# Global singleton LSP clients (reused across all requests to prevent process leak)
-_global_pyright_lsp: Optional[PyrightLSPClient] = None
-_global_typescript_lsp: Optional[TypeScriptLSPClient] = None
+# Global LSP process pools (reused across all requests to prevent process leak)
+_global_pyright_pool: Optional[LSPProcessPool] = None
+_global_typescript_pool: Optional[LSPProcessPool] = None
 _lsp_lock = asyncio.Lock()
 
 
+def _create_typescript_client() -> TypeScriptLSPClient:
+    ts_workspace_root = "/tmp/lsp_workspace"
+    Path(ts_workspace_root).mkdir(parents=True, exist_ok=True)
+    return TypeScriptLSPClient(workspace_root=ts_workspace_root)
+
+
 async def get_or_create_global_lsp():
     """
-    Get or create singleton LSP clients (reused across all requests).
+    Get or create the global LSP clients (reused across all requests).
 
     EPIC-16 Story 16.4 Critical Fix: Previously, new LSP processes were created
     for EVERY request, leading to process leak (20+ processes after 10 requests).
-    This singleton pattern ensures only 2 LSP processes total (Pyright + TypeScript),
-    preventing resource exhaustion and API crashes.
+    The clients are now bounded process pools (LSP_POOL_SIZE servers each,
+    least-loaded dispatch with repository affinity, recycled on crash or
+    when over LSP_POOL_MAX_RSS_MB), so type extraction of concurrent
+    indexing operations runs on several servers without leaking processes.
 
     Returns:
-        Tuple[PyrightLSPClient, Optional[TypeScriptLSPClient]]: Singleton LSP clients
+        Tuple[PooledLSPClient, Optional[PooledLSPClient]]: Pyright and TypeScript clients
 
     Thread-safe: Uses asyncio.Lock to prevent race conditions during initialization.
     """
-    global _global_pyright_lsp, _global_typescript_lsp
+    global _global_pyright_pool, _global_typescript_pool
 
     async with _lsp_lock:
-        # Initialize Pyright LSP (singleton)
-        if _global_pyright_lsp is None or not _global_pyright_lsp.is_alive():
-            logger.info("🔧 Creating global Pyright LSP client (singleton)")
-            _global_pyright_lsp = PyrightLSPClient()
-            await _global_pyright_lsp.start()
-            logger.info("✅ Global Pyright LSP client initialized")
-
-        # Initialize TypeScript LSP (singleton)
-        if _global_typescript_lsp is None or not _global_typescript_lsp.is_alive():
+        # Initialize Pyright pool (one server started eagerly)
+        if _global_pyright_pool is None or not _global_pyright_pool.is_alive():
+            logger.info("🔧 Creating global Pyright LSP pool")
+            pool = LSPProcessPool(PyrightLSPClient, name="pyright")
+            await pool.start()
+            _global_pyright_pool = pool
+            logger.info(f"✅ Global Pyright LSP pool initialized (max_size={pool.max_size})")
+
+        # Initialize TypeScript pool
+        if _global_typescript_pool is None or not _global_typescript_pool.is_alive():
             try:
-                logger.info("🔧 Creating global TypeScript LSP client (singleton)")
-                ts_workspace_root = "/tmp/lsp_workspace"
-                Path(ts_workspace_root).mkdir(parents=True, exist_ok=True)
-
-                _global_typescript_lsp = TypeScriptLSPClient(workspace_root=ts_workspace_root)
-                await _global_typescript_lsp.start()
-                logger.info("✅ Global TypeScript LSP client initialized")
+                logger.info("🔧 Creating global TypeScript LSP pool")
+                pool = LSPProcessPool(_create_typescript_client, name="typescript")
+                await pool.start()
+                _global_typescript_pool = pool
+                logger.info(f"✅ Global TypeScript LSP pool initialized (max_size={pool.max_size})")
             except Exception as ts_error:
                 logger.warning(
                     f"TypeScript LSP initialization failed (graceful degradation): {ts_error}"
                 )
-                _global_typescript_lsp = None
+                _global_typescript_pool = None
+
+    return (
+        PooledLSPClient(_global_pyright_pool),
+        PooledLSPClient(_global_typescript_pool) if _global_typescript_pool else None,
+    )
 
-    return _global_pyright_lsp, _global_typescript_lsp
+
+def get_lsp_pool_stats() -> Dict[str, Any]:
+    """Statistics of the global LSP pools (empty until first indexing request)."""
+    return {
+        name: pool.get_stats()
+        for name, pool in (("pyright", _global_pyright_pool), ("typescript", _global_typescript_pool))
+        if pool is not None
+    }
 
 
 # ============================================================================
@@ -267,7 +284,7 @@ async def get_indexing_service(
     # EPIC-26: Inject metadata_service into CodeChunkingService for TypeScript/JavaScript support
     chunking_service = CodeChunkingService(metadata_service=metadata_service)
 
-    embedding_service = DualEmbeddingService()
+    embedding_service = create_dual_embedding_service(priority="bulk", client_name="code-indexing")
     graph_service = GraphConstructionService(engine)
     chunk_repository = CodeChunkRepository(engine)
     symbol_path_service = SymbolPathService()  # EPIC-11 Story 11.1
@@ -279,20 +296,20 @@ async def get_indexing_service(
     # Story 16.4: Singleton LSP clients to prevent process leak
     type_extractor = None
     try:
-        # Get or create SINGLETON LSP clients (reused across all requests)
+        # Get or create the global LSP pools (reused across all requests)
         # EPIC-16 Story 16.4: This prevents creating 2 new processes per request,
         # which caused process leak and API crashes after ~10 requests
         lsp_client, typescript_lsp_client = await get_or_create_global_lsp()
 
         # Create TypeExtractorService with SINGLETON LSP clients and Redis cache
         type_extractor = TypeExtractorService(
-            lsp_client=lsp_client,  # SINGLETON Python LSP (Pyright)
-            typescript_lsp_client=typescript_lsp_client,  # SINGLETON TypeScript LSP (EPIC-16)
+            lsp_client=lsp_client,  # Pooled Python LSP (Pyright)
+            typescript_lsp_client=typescript_lsp_client,  # Pooled TypeScript LSP (EPIC-16)
             redis_cache=redis_cache  # Story 13.4: L2 cache for LSP results
         )
 
         lsp_status = "Pyright + TypeScript LSP" if typescript_lsp_client else "Pyright only"
-        logger.debug(f"TypeExtractorService using singleton LSP clients: {lsp_status}")
+        logger.debug(f"TypeExtractorService using pooled LSP clients: {lsp_status}")
     except Exception as e:
         # Graceful degradation: LSP unavailable, continue without type extraction
         logger.warning(f"Failed to initialize LSP client, type extraction disabled: {e}")
@@ -485,85 +502,83 @@ async def list_repositories(
     Delete all indexed data for a repository.
 
     Deletes:
-    - All code chunks for the repository
-    - All nodes associated with the repository
-    - All orphaned edges (edges without source/target nodes)
+    - All edges from/to the repository's graph nodes
+    - All nodes of the repository
+    - All code chunks of the repository
 
-    **Warning**: This operation is irreversible.
+    Runs as a background job in short batched transactions. With
+    `wait=false` the call returns 202 and the job (poll
+    `/deletions/{job_id}`); by default it waits for the job and returns
+    the deletion statistics.
 
-    EPIC-12 Story 12.2: Atomic transaction ensures all-or-nothing deletion.
+    **Warning**: This operation is irreversible.
     """,
 )
 async def delete_repository(
     repository: str,
+    wait: bool = Query(True, description="Wait for the deletion job to finish"),
     engine: AsyncEngine = Depends(get_db_engine),
-    chunk_repo: CodeChunkRepository = Depends(get_chunk_repository),
-    node_repo: NodeRepository = Depends(get_node_repository),
-    edge_repo: EdgeRepository = Depends(get_edge_repository),
-) -> DeleteRepositoryResponse:
+):
     """
     Delete all indexed data for a repository.
 
-    EPIC-12 Story 12.2: Uses repository bulk delete methods with transaction support
-    for atomic all-or-nothing deletion with cache invalidation coordination.
-
     Args:
         repository: Repository name
+        wait: Wait for the job (False: 202 + job progress)
         engine: Database engine (injected)
-        chunk_repo: Code chunk repository (injected)
-        node_repo: Node repository (injected)
-        edge_repo: Edge repository (injected)
 
     Returns:
-        DeleteRepositoryResponse with deletion statistics
+        DeleteRepositoryResponse with deletion statistics, or the job (202)
     """
-    try:
-        # EPIC-12 Story 12.2: Wrap all deletions in transaction
-        # If any deletion fails, entire operation is rolled back (atomic operation)
-        async with engine.begin() as conn:
-            logger.info(
-                f"EPIC-12: Starting atomic repository deletion transaction for '{repository}'"
-            )
+    service = get_repository_deletion_service(engine)
+    job = await service.start(repository)
+    if not wait:
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job.to_dict())
+
+    job = await service.wait(job.job_id)
+    if job.status != "completed":
+        logger.error(f"Repository deletion failed for '{repository}': {job.error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete repository. Please check logs for details.",
+        )
 
-            # Delete code chunks using repository method
-            deleted_chunks = await chunk_repo.delete_by_repository(repository, connection=conn)
+    return DeleteRepositoryResponse(
+        repository=repository,
+        deleted_chunks=job.deleted["chunks"],
+        deleted_nodes=job.deleted["nodes"],
+        deleted_edges=job.deleted["edges"],
+    )
 
-            # Delete nodes using repository method
-            deleted_nodes = await node_repo.delete_by_repository(repository, connection=conn)
 
-            # Delete orphaned edges (edges without source/target nodes)
-            delete_edges_query = text("""
-                DELETE FROM edges
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM nodes WHERE nodes.node_id = edges.source_node_id
-                )
-            """)
-            result3 = await conn.execute(delete_edges_query)
-            deleted_edges = result3.rowcount
-
-            # Transaction auto-commits on successful context exit
-            logger.info(
-                f"✅ EPIC-12: Repository deletion transaction committed - "
-                f"{deleted_chunks} chunks, {deleted_nodes} nodes, {deleted_edges} edges deleted atomically"
-            )
+@router.get(
+    "/deletions",
+    summary="Repository deletion jobs",
+    description="Progress of repository deletion jobs (most recent first)",
+)
+async def list_deletions(
+    active: bool = Query(False, description="Only jobs still running"),
+    engine: AsyncEngine = Depends(get_db_engine),
+) -> Dict[str, Any]:
+    """List repository deletion jobs (every API worker and the MCP server)."""
+    jobs = await get_repository_deletion_service(engine).list_jobs(active_only=active)
+    return {"jobs": [job.to_dict() for job in jobs]}
 
-        return DeleteRepositoryResponse(
-            repository=repository,
-            deleted_chunks=deleted_chunks,
-            deleted_nodes=deleted_nodes,
-            deleted_edges=deleted_edges,
-        )
 
-    except Exception as e:
-        # Transaction auto-rolled back on exception
-        logger.error(
-            f"EPIC-12: Repository deletion transaction rolled back: {e}",
-            exc_info=True
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete repository. Please check logs for details.",
-        )
+@router.get(
+    "/deletions/{job_id}",
+    summary="Repository deletion progress",
+    description="Phase, rows deleted per table and percentage of a deletion job",
+)
+async def get_deletion(
+    job_id: str,
+    engine: AsyncEngine = Depends(get_db_engine),
+) -> Dict[str, Any]:
+    """Progress of one repository deletion job."""
+    job = await get_repository_deletion_service(engine).get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown deletion job: {job_id}")
+    return job.to_dict()
 
 
 @router.get(
@@ -170,6 +170,13 @@ async def metrics():
     return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
+@router.get("/metrics/scheduler")
+async def scheduler_metrics():
+    """Queue depth, waits and background throttling per resource and work class."""
+    from services.resource_scheduler import get_resource_scheduler
+    return get_resource_scheduler().get_metrics()
+
+
 @router.get("/api/v1/autosave/health")
 async def autosave_health_check(db_engine: AsyncEngine = Depends(get_db_engine)):
     """
@@ -198,3 +198,24 @@ async def restart_lsp_server():
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Restart failed",
         )
+
+
+@router.get(
+    "/pool",
+    summary="LSP process pool statistics",
+    description="""
+    Servers of the Pyright and TypeScript LSP pools used for type extraction
+    during indexing: in-flight leases, requests served, RSS and recycling.
+    Pools are created on the first indexing request.
+    """,
+)
+async def lsp_pool_stats():
+    """
+    Get LSP process pool statistics.
+
+    Returns:
+        Dict of pool name -> pool statistics
+    """
+    from routes.code_indexing_routes import get_lsp_pool_stats
+
+    return get_lsp_pool_stats()
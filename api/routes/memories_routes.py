@@ -7,13 +7,14 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from dependencies import get_db_engine, get_embedding_service
 from interfaces.services import EmbeddingServiceProtocol
+from utils.keyset_pagination import InvalidCursorError, encode_cursor, keyset_condition
 
 logger = logging.getLogger(__name__)
 
@@ -90,8 +91,10 @@ async def get_memories_stats(engine: AsyncEngine = Depends(get_db_engine)) -> Di
 
 @router.get("/recent")
 async def get_recent_memories(
+    response: Response,
     limit: int = Query(default=10, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor value of the previous page"),
     engine: AsyncEngine = Depends(get_db_engine)
 ) -> List[Dict[str, Any]]:
     """
@@ -100,14 +103,27 @@ async def get_recent_memories(
     Args:
         limit: Number of recent items to return (1-100, default 10)
         offset: Number of memories to skip (for infinite scroll pagination)
+        cursor: Keyset cursor; resumes after the last row of the previous
+            page in constant time (overrides offset)
 
     Returns:
-        List of memory objects with: id, title, created_at, memory_type, tags, has_embedding
+        List of memory objects with: id, title, created_at, memory_type, tags, has_embedding.
+        The X-Next-Cursor response header carries the cursor of the next page
+        (absent on the last page).
     """
+    params: Dict[str, Any] = {"limit_plus_one": limit + 1, "offset": offset}
+    keyset_sql = ""
+    if cursor:
+        try:
+            keyset_sql = "AND " + keyset_condition(cursor, params, "m.created_at", "m.id")
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        params["offset"] = 0
+
     try:
         async with engine.begin() as conn:
             result = await conn.execute(
-                text("""
+                text(f"""
                     SELECT
                         m.id,
                         m.title,
@@ -122,14 +138,20 @@ async def get_recent_memories(
                     LEFT JOIN projects p ON m.project_id = p.id
                     WHERE m.deleted_at IS NULL
                     AND m.memory_type = 'conversation'
-                    ORDER BY m.created_at DESC
-                    LIMIT :limit
+                    {keyset_sql}
+                    ORDER BY m.created_at DESC, m.id DESC
+                    LIMIT :limit_plus_one
                     OFFSET :offset
                 """),
-                {"limit": limit, "offset": offset}
+                params
             )
             rows = result.fetchall()
 
+            # One extra row tells whether a next page exists
+            if len(rows) > limit:
+                rows = rows[:limit]
+                response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
+
             memories = []
             for row in rows:
                 memories.append({
@@ -267,6 +289,7 @@ async def create_memory(
     from datetime import datetime, timezone
     from mnemo_mcp.models.memory_models import MemoryCreate, MemoryType
     from db.repositories.memory_repository import MemoryRepository
+    from services.caches.memory_search_cache import get_memory_search_cache
     from services.sentence_transformer_embedding_service import SentenceTransformerEmbeddingService
 
     try:
@@ -301,6 +324,7 @@ async def create_memory(
         )
 
         memory = await memory_repo.create(memory_create, embedding=embedding)
+        await get_memory_search_cache().invalidate(memory.project_id)
 
         return MemoryCreateResponse(
             id=str(memory.id),
@@ -341,6 +365,7 @@ async def update_memory_endpoint(
     from datetime import timezone
     from mnemo_mcp.models.memory_models import MemoryUpdate, MemoryType
     from db.repositories.memory_repository import MemoryRepository
+    from services.caches.memory_search_cache import get_memory_search_cache
     from services.sentence_transformer_embedding_service import SentenceTransformerEmbeddingService
 
     try:
@@ -383,6 +408,7 @@ async def update_memory_endpoint(
 
         if not result:
             raise HTTPException(status_code=404, detail="Memory not found or deleted.")
+        await get_memory_search_cache().invalidate(result.project_id)
 
         return {
             "id": str(result.id),
@@ -408,6 +434,7 @@ async def delete_memory_endpoint(
     """Delete a memory (soft by default, hard with ?permanent=true)."""
     from datetime import timezone
     from db.repositories.memory_repository import MemoryRepository
+    from services.caches.memory_search_cache import get_memory_search_cache
 
     try:
         memory_repo = MemoryRepository(engine)
@@ -419,6 +446,8 @@ async def delete_memory_endpoint(
 
         if not success:
             raise HTTPException(status_code=404, detail="Memory not found.")
+        # The deleted memory's project is not fetched: bump every scope
+        await get_memory_search_cache().invalidate(unknown_scope=True)
 
         result = {"id": memory_id, "deleted": True, "permanent": permanent}
         if not permanent:
@@ -609,6 +638,7 @@ async def search_memories(
     """
     import time
     from services.hybrid_memory_search_service import HybridMemorySearchService
+    from services.caches.memory_search_cache import get_memory_search_cache
     from mnemo_mcp.models.memory_models import MemoryFilters, MemoryType
 
     start_time = time.time()
@@ -636,7 +666,7 @@ async def search_memories(
         )
 
         # Search using hybrid service
-        search_service = HybridMemorySearchService(engine)
+        search_service = HybridMemorySearchService(engine, result_cache=get_memory_search_cache())
         response = await search_service.search(
             query=request.query,
             embedding=query_embedding,
@@ -745,11 +775,12 @@ async def extract_entities_endpoint(
         Extraction result with entities, concepts, and auto_tags
     """
     try:
-        from services.lm_studio_client import LMStudioClient
+        from services.gliner_service import get_gliner_service
         from services.entity_extraction_service import EntityExtractionService
 
-        lm_client = LMStudioClient()
-        extraction_service = EntityExtractionService(engine=engine, lm_client=lm_client)
+        extraction_service = EntityExtractionService(
+            engine=engine, gliner_service=get_gliner_service()
+        )
 
         success = await extraction_service.extract_entities(
             memory_id=memory_id,
@@ -187,6 +187,7 @@ async def consolidate_memories(
     try:
         from db.repositories.memory_repository import MemoryRepository
         from mnemo_mcp.models.memory_models import MemoryCreate, MemoryType
+        from services.caches.memory_search_cache import get_memory_search_cache
 
         repo = MemoryRepository(engine)
 
@@ -230,6 +231,9 @@ async def consolidate_memories(
             except Exception as e:
                 logger.warning(f"Failed to soft-delete {source_id}: {e}")
 
+        # Sources may span projects that were not fetched: bump every scope
+        await get_memory_search_cache().invalidate(unknown_scope=True)
+
         return {
             "consolidated_memory": {
                 "id": str(consolidated.id),
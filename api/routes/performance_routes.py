@@ -55,6 +55,20 @@ async def get_cache_stats(request: Request) -> Dict[str, Any]:
     return stats
 
 
+@router.get("/entity-extraction")
+async def get_entity_extraction_stats() -> Dict[str, Any]:
+    """
+    Get GLiNER entity extraction engine stats.
+
+    Returns queue depth, batch sizes and throughput of the off-loop
+    extraction engine.
+    """
+    from services.entity_extraction_engine import get_entity_extraction_engine
+    from services.gliner_service import get_gliner_service
+
+    return get_entity_extraction_engine(get_gliner_service()).get_stats()
+
+
 @router.post("/cache/clear")
 async def clear_caches(request: Request) -> Dict[str, str]:
     """
@@ -13,6 +13,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from dependencies import get_db_engine
+from services.indexing_checkpoint_service import IndexingCheckpointService
 
 logger = logging.getLogger(__name__)
 
@@ -326,6 +327,9 @@ async def delete_project(
                     detail=f"Project '{repository}' not found or already deleted."
                 )
 
+        # Resumed indexing runs must not skip files whose chunks are gone
+        await IndexingCheckpointService(engine).clear(repository)
+
         logger.info(f"Deleted project {repository}: {deleted_chunks} chunks, {deleted_nodes} nodes")
 
         return {
@@ -15,6 +15,8 @@ from typing import Optional, List
 
 from dependencies import get_event_repository, get_embedding_service, get_db_engine
 from db.repositories.event_repository import EventRepository
+from services.repository_deletion_service import get_repository_deletion_service
+from services.repository_stats_service import RepositoryStatsService
 from services.sentence_transformer_embedding_service import SentenceTransformerEmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -437,168 +439,38 @@ async def code_dashboard_data(engine = Depends(get_db_engine)):
     - Complexity distribution
     - Top 10 complex functions
     - Recent indexing activity
-    """
-    from sqlalchemy import text
-    from collections import defaultdict
 
+    Reads the materialised per-repository statistics (repository_stats)
+    instead of aggregating code_chunks on every load.
+    """
     try:
-        # ========== KPIs ==========
-        # Total repositories
-        repos_query = text("""
-            SELECT COUNT(DISTINCT repository) as total_repos
-            FROM code_chunks
-            WHERE repository IS NOT NULL
-        """)
-
-        # Total files
-        files_query = text("""
-            SELECT COUNT(DISTINCT file_path) as total_files
-            FROM code_chunks
-        """)
-
-        # Total functions/classes (chunk_type = function, method, class)
-        functions_query = text("""
-            SELECT COUNT(*) as total_functions
-            FROM code_chunks
-            WHERE chunk_type IN ('function', 'method', 'class')
-        """)
-
-        # Average complexity
-        complexity_query = text(r"""
-            SELECT AVG(((metadata->>'complexity')::jsonb->>'cyclomatic')::float) as avg_complexity
-            FROM code_chunks
-            WHERE metadata->>'complexity' IS NOT NULL
-              AND metadata->>'complexity' != 'null'
-              AND (metadata->>'complexity')::jsonb->>'cyclomatic' IS NOT NULL
-              AND (metadata->>'complexity')::jsonb->>'cyclomatic' ~ '^[0-9]+\.?[0-9]*$'
-        """)
-
-        async with engine.connect() as conn:
-            repos_result = await conn.execute(repos_query)
-            files_result = await conn.execute(files_query)
-            functions_result = await conn.execute(functions_query)
-            complexity_result = await conn.execute(complexity_query)
-
-            total_repos = repos_result.scalar() or 0
-            total_files = files_result.scalar() or 0
-            total_functions = functions_result.scalar() or 0
-            avg_complexity = complexity_result.scalar() or 0.0
+        rows = await RepositoryStatsService(engine).list_stats()
+        summary = RepositoryStatsService.summarise(rows)
 
         kpis = {
-            "total_repositories": total_repos,
-            "total_files": total_files,
-            "total_functions": total_functions,
-            "avg_complexity": avg_complexity
+            "total_repositories": summary["total_repositories"],
+            "total_files": summary["total_files"],
+            "total_functions": summary["total_functions"],
+            "avg_complexity": summary["avg_complexity"]
         }
 
-        # ========== Language Distribution ==========
-        language_query = text("""
-            SELECT
-                language,
-                COUNT(*) as count
-            FROM code_chunks
-            WHERE language IS NOT NULL
-            GROUP BY language
-            ORDER BY count DESC
-        """)
-
-        async with engine.connect() as conn:
-            language_result = await conn.execute(language_query)
-            language_rows = language_result.fetchall()
-
-        language_distribution = [
-            {"language": row[0], "count": row[1]}
-            for row in language_rows
-        ]
-
-        # ========== Complexity Distribution ==========
-        complexity_dist_query = text("""
-            SELECT
-                CAST((metadata->>'complexity')::jsonb->>'cyclomatic' AS INTEGER) as complexity,
-                COUNT(*) as count
-            FROM code_chunks
-            WHERE metadata->>'complexity' IS NOT NULL
-              AND metadata->>'complexity' != 'null'
-              AND (metadata->>'complexity')::jsonb->>'cyclomatic' IS NOT NULL
-            GROUP BY complexity
-            ORDER BY complexity
-        """)
-
-        async with engine.connect() as conn:
-            complexity_dist_result = await conn.execute(complexity_dist_query)
-            complexity_rows = complexity_dist_result.fetchall()
-
-        complexity_distribution = [
-            {"complexity": row[0] or 0, "count": row[1]}
-            for row in complexity_rows
-        ]
-
-        # ========== Top 10 Complex Functions ==========
-        top_complex_query = text("""
-            SELECT
-                name,
-                file_path,
-                language,
-                CAST((metadata->>'complexity')::jsonb->>'cyclomatic' AS INTEGER) as complexity,
-                CAST((metadata->>'complexity')::jsonb->>'lines_of_code' AS INTEGER) as lines
-            FROM code_chunks
-            WHERE metadata->>'complexity' IS NOT NULL
-              AND metadata->>'complexity' != 'null'
-              AND (metadata->>'complexity')::jsonb->>'cyclomatic' IS NOT NULL
-              AND chunk_type IN ('function', 'method', 'class')
-            ORDER BY complexity DESC
-            LIMIT 10
-        """)
-
-        async with engine.connect() as conn:
-            top_complex_result = await conn.execute(top_complex_query)
-            top_complex_rows = top_complex_result.fetchall()
-
         top_complex_functions = [
             {
-                "name": row[0] or "Unnamed",
-                "file_path": row[1],
-                "language": row[2],
-                "complexity": row[3] or 0,
-                "lines": row[4] or 0
-            }
-            for row in top_complex_rows
-        ]
-
-        # ========== Recent Activity ==========
-        recent_activity_query = text("""
-            SELECT
-                repository,
-                COUNT(DISTINCT file_path) as file_count,
-                COUNT(*) as chunk_count,
-                MAX(indexed_at) as last_indexed
-            FROM code_chunks
-            WHERE repository IS NOT NULL
-            GROUP BY repository
-            ORDER BY last_indexed DESC
-            LIMIT 10
-        """)
-
-        async with engine.connect() as conn:
-            recent_activity_result = await conn.execute(recent_activity_query)
-            recent_activity_rows = recent_activity_result.fetchall()
-
-        recent_activity = [
-            {
-                "repository": row[0],
-                "file_count": row[1],
-                "chunk_count": row[2],
-                "last_indexed": row[3].isoformat() if row[3] else None
+                "name": function.get("name") or "Unnamed",
+                "file_path": function.get("file_path"),
+                "language": function.get("language"),
+                "complexity": function.get("complexity") or 0,
+                "lines": function.get("lines") or 0
             }
-            for row in recent_activity_rows
+            for function in summary["top_complex_functions"]
         ]
 
         return {
             "kpis": kpis,
-            "language_distribution": language_distribution,
-            "complexity_distribution": complexity_distribution,
+            "language_distribution": summary["language_distribution"],
+            "complexity_distribution": summary["complexity_distribution"],
             "top_complex_functions": top_complex_functions,
-            "recent_activity": recent_activity
+            "recent_activity": RepositoryStatsService.repositories(rows)[:10]
         }
 
     except Exception as e:
@@ -631,35 +503,20 @@ async def lsp_stats(engine = Depends(get_db_engine)):
 
     Used by lsp_monitor.js for Chart.js visualization.
     """
-    from sqlalchemy import text
     import redis
     import os
 
     try:
         # ========== Type Coverage & Query Count ==========
-        # Count chunks with LSP metadata (return_type, signature, or param_types)
-        lsp_metadata_query = text("""
-            SELECT
-                COUNT(*) FILTER (WHERE metadata->>'return_type' IS NOT NULL) as chunks_with_return_type,
-                COUNT(*) FILTER (WHERE metadata->>'signature' IS NOT NULL) as chunks_with_signature,
-                COUNT(*) FILTER (WHERE metadata->>'param_types' IS NOT NULL) as chunks_with_params,
-                COUNT(*) as total_chunks,
-                MIN(indexed_at) as first_indexed,
-                MAX(indexed_at) as last_indexed
-            FROM code_chunks
-            WHERE chunk_type IN ('function', 'method', 'class')
-        """)
+        # LSP metadata counters of function/method/class chunks (repository_stats)
+        summary = RepositoryStatsService.summarise(await RepositoryStatsService(engine).list_stats())
 
-        async with engine.connect() as conn:
-            result = await conn.execute(lsp_metadata_query)
-            row = result.fetchone()
-
-        chunks_with_return_type = row[0] or 0
-        chunks_with_signature = row[1] or 0
-        chunks_with_params = row[2] or 0
-        total_chunks = row[3] or 0
-        first_indexed = row[4]
-        last_indexed = row[5]
+        chunks_with_return_type = summary["lsp_with_return_type"]
+        chunks_with_signature = summary["lsp_with_signature"]
+        chunks_with_params = summary["lsp_with_params"]
+        total_chunks = summary["total_functions"]
+        first_indexed = summary["first_indexed_at"]
+        last_indexed = summary["last_indexed_at"]
 
         # Calculate type coverage percentage
         type_coverage = round((chunks_with_return_type / total_chunks * 100), 2) if total_chunks > 0 else 0
@@ -773,6 +630,22 @@ async def code_repositories(request: Request):
     )
 
 
+async def _repository_list_context(engine) -> dict:
+    """Repositories (from repository_stats) and deletion jobs for the repo list partial."""
+    deletion_service = get_repository_deletion_service(engine)
+    deleting = await deletion_service.deleting()
+    repositories = [
+        repo for repo in RepositoryStatsService.repositories(await RepositoryStatsService(engine).list_stats())
+        if repo["repository"] not in deleting
+    ]
+    deletions = [job.to_dict() for job in (await deletion_service.list_jobs())[:5]]
+    return {
+        "repositories": repositories,
+        "deletions": deletions,
+        "deletions_active": bool(deleting),
+    }
+
+
 @router.get("/code/repos/list", response_class=HTMLResponse)
 async def code_repositories_list(
     request: Request,
@@ -781,44 +654,12 @@ async def code_repositories_list(
     """
     Repository list partial (HTMX target).
 
-    Fetches all indexed repositories from database.
+    Fetches all indexed repositories from repository_stats.
     """
-    from sqlalchemy import text
-
     try:
-        # Query code_chunks grouped by repository (same as EPIC-06 API)
-        query = text("""
-            SELECT
-                repository,
-                COUNT(DISTINCT file_path) as file_count,
-                COUNT(*) as chunk_count,
-                MAX(indexed_at) as last_indexed
-            FROM code_chunks
-            WHERE repository IS NOT NULL
-            GROUP BY repository
-            ORDER BY last_indexed DESC
-        """)
-
-        async with engine.connect() as conn:
-            result = await conn.execute(query)
-            rows = result.fetchall()
-
-        repositories = [
-            {
-                "repository": row[0],
-                "file_count": row[1],
-                "chunk_count": row[2],
-                "last_indexed": row[3].isoformat() if row[3] else None,
-            }
-            for row in rows
-        ]
-
         return templates.TemplateResponse(
             "partials/repo_list.html",
-            {
-                "request": request,
-                "repositories": repositories
-            }
+            {"request": request, **await _repository_list_context(engine)}
         )
 
     except Exception as e:
@@ -839,80 +680,15 @@ async def code_repository_delete(
     """
     Delete repository (HTMX target).
 
-    Deletes repository from database and returns updated list.
+    Schedules a background deletion job and returns the updated list,
+    which shows the job's progress until it finishes.
     """
-    from sqlalchemy import text
-
     try:
-        # Delete code chunks, nodes, and edges for this repository
-        # Order: edges first (to avoid FK issues), then nodes, then chunks
-
-        # Step 1: Delete edges connected to nodes of this repository
-        delete_edges = text("""
-            DELETE FROM edges
-            WHERE source_node_id IN (
-                SELECT node_id FROM nodes WHERE properties->>'repository' = :repository
-            )
-            OR target_node_id IN (
-                SELECT node_id FROM nodes WHERE properties->>'repository' = :repository
-            )
-        """)
-
-        # Step 2: Delete nodes of this repository
-        delete_nodes = text("""
-            DELETE FROM nodes
-            WHERE properties->>'repository' = :repository
-        """)
-
-        # Step 3: Delete code chunks of this repository
-        delete_chunks = text("""
-            DELETE FROM code_chunks
-            WHERE repository = :repository
-        """)
-
-        async with engine.begin() as conn:
-            result_edges = await conn.execute(delete_edges, {"repository": repository})
-            result_nodes = await conn.execute(delete_nodes, {"repository": repository})
-            result_chunks = await conn.execute(delete_chunks, {"repository": repository})
-
-        logger.info(
-            f"Deleted repository '{repository}': "
-            f"{result_chunks.rowcount} chunks, {result_nodes.rowcount} nodes, {result_edges.rowcount} edges"
-        )
-
-        # Fetch updated repository list
-        query = text("""
-            SELECT
-                repository,
-                COUNT(DISTINCT file_path) as file_count,
-                COUNT(*) as chunk_count,
-                MAX(indexed_at) as last_indexed
-            FROM code_chunks
-            WHERE repository IS NOT NULL
-            GROUP BY repository
-            ORDER BY last_indexed DESC
-        """)
-
-        async with engine.connect() as conn:
-            result = await conn.execute(query)
-            rows = result.fetchall()
-
-        repositories = [
-            {
-                "repository": row[0],
-                "file_count": row[1],
-                "chunk_count": row[2],
-                "last_indexed": row[3].isoformat() if row[3] else None,
-            }
-            for row in rows
-        ]
+        await get_repository_deletion_service(engine).start(repository)
 
         return templates.TemplateResponse(
             "partials/repo_list.html",
-            {
-                "request": request,
-                "repositories": repositories
-            }
+            {"request": request, **await _repository_list_context(engine)}
         )
 
     except Exception as e:
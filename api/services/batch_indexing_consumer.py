@@ -11,12 +11,16 @@ import sys
 import json
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 import redis.asyncio as redis
 from datetime import datetime
 
 from services.batch_indexing_errors import ErrorType, ErrorHandler
+from services.caches.invalidation_bus import get_invalidation_bus
+from services.caches.repository_generations import get_repository_generations
 from services.graph_construction_service import GraphConstructionService
+from services.indexing_checkpoint_service import IndexingCheckpointService
+from services.repository_stats_service import RepositoryStatsService
 
 
 class BatchIndexingConsumer:
@@ -27,7 +31,16 @@ class BatchIndexingConsumer:
         1. Create consumer group (if not exists)
         2. XREADGROUP to read batches
         3. For each batch: spawn subprocess → process → update status → XACK
-        4. Check completion → trigger graph construction
+           (the "prune" message ending a replacing job deletes the chunks
+           and checkpoints of files no longer in the repository)
+        4. Check completion → trigger graph construction (code jobs),
+           bump the repository generation
+
+    Durable progress:
+        - Workers checkpoint every file (hash + status) in PostgreSQL and
+          skip files already indexed with the same content
+        - The run counters (indexing_runs) continue across consumer
+          restarts for the same job
 
     Isolation:
         - subprocess = separate Python process
@@ -37,6 +50,9 @@ class BatchIndexingConsumer:
 
     STREAM_KEY_TEMPLATE = "indexing:jobs:{repository}"
     STATUS_KEY_TEMPLATE = "indexing:status:{repository}"
+    CONSUMER_LOCK_KEY_TEMPLATE = "indexing:consumer:{repository}"
+    CONSUMER_LOCK_TTL = 60  # Lock expires if the consumer dies
+    HEARTBEAT_INTERVAL = 20  # Refresh the lock every 20s
     CONSUMER_GROUP = "indexing-workers"
     CONSUMER_NAME = "worker-1"  # TODO: Generate unique ID per container
     READ_BLOCK_MS = 5000  # Block 5s if stream empty
@@ -60,6 +76,10 @@ class BatchIndexingConsumer:
                 self.redis_url,
                 decode_responses=True
             )
+            # Graph builds bump repository generations shared with the API
+            get_repository_generations().bind_redis(self.redis_client)
+            # Publish-only: the consumer keeps no L1 caches of its own
+            get_invalidation_bus().bind_redis(self.redis_client)
 
     async def close(self):
         """Close Redis connection."""
@@ -93,7 +113,8 @@ class BatchIndexingConsumer:
         self,
         repository: str,
         files: List[str],
-        timeout: int = 300  # 5min per batch (40 files × 7.5s = 300s)
+        timeout: int = 300,  # 5min per batch (40 files × 7.5s = 300s)
+        kind: str = "code"
     ) -> Dict:
         """
         Execute subprocess worker for 1 batch.
@@ -102,6 +123,7 @@ class BatchIndexingConsumer:
             repository: Repository name
             files: List of file paths to process
             timeout: Timeout in seconds (default: 5min)
+            kind: Job kind from the stream message ("code" or "markdown")
 
         Returns:
             Dict with keys:
@@ -120,6 +142,7 @@ class BatchIndexingConsumer:
             "--repository", repository,
             "--db-url", self.db_url,
             "--files", ",".join(files),
+            "--kind", kind,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
@@ -250,7 +273,9 @@ class BatchIndexingConsumer:
         self,
         stream_key: str,
         message_id: str,
-        repository: str
+        repository: str,
+        touched: Optional[Set[str]] = None,
+        engine=None
     ):
         """
         Claim abandoned message and retry processing.
@@ -259,6 +284,8 @@ class BatchIndexingConsumer:
             stream_key: Redis Stream key
             message_id: Message ID to claim
             repository: Repository name
+            touched: Files handed to workers (dashboard statistics refresh)
+            engine: SQLAlchemy AsyncEngine (prune messages)
         """
         # Claim message
         try:
@@ -276,9 +303,15 @@ class BatchIndexingConsumer:
 
             # Parse message data
             message_data = claimed[0][1]
+            if message_data.get("action") == "prune":
+                await self._prune_message(stream_key, message_id, repository, message_data, engine, touched)
+                return
+
             files_str = message_data["files"]
             files = files_str.split(",")
             batch_number = message_data["batch_number"]
+            if touched is not None:
+                touched.update(files)
 
             # Update status to show retry
             await self._update_status(
@@ -288,7 +321,9 @@ class BatchIndexingConsumer:
 
             # Retry subprocess
             try:
-                result = await self._run_subprocess_worker(repository, files)
+                result = await self._run_subprocess_worker(
+                    repository, files, kind=message_data.get("kind", "code")
+                )
 
                 # Update status with results
                 await self._update_status(
@@ -322,6 +357,62 @@ class BatchIndexingConsumer:
             # Claim failed - message may have been claimed by another consumer
             pass
 
+    async def _prune_removed_files(self, repository: str, files: List[str], engine) -> List[str]:
+        """
+        Delete the chunks and checkpoints of files that are not in files.
+
+        Both in one transaction: a checkpoint left behind would make a file
+        restored unchanged later look already indexed.
+
+        Returns:
+            Paths whose chunks were deleted
+        """
+        from sqlalchemy import text
+
+        params = {"repo": repository, "paths": files}
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text("""
+                    DELETE FROM code_chunks
+                    WHERE repository = :repo AND NOT (file_path = ANY(:paths))
+                    RETURNING file_path
+                """),
+                params
+            )
+            removed = sorted({row.file_path for row in result})
+            await conn.execute(
+                text("""
+                    DELETE FROM indexing_checkpoints
+                    WHERE repository = :repo AND NOT (file_path = ANY(:paths))
+                """),
+                params
+            )
+        return removed
+
+    async def _prune_message(
+        self,
+        stream_key: str,
+        message_id: str,
+        repository: str,
+        message_data: Dict,
+        engine,
+        touched: Optional[Set[str]] = None
+    ):
+        """Run a "prune" message (last of a replacing job); left pending on failure."""
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        try:
+            removed = await self._prune_removed_files(repository, message_data["files"].split(","), engine)
+        except Exception as e:
+            logger.error(f"Pruning removed files failed for repository '{repository}': {e}", exc_info=True)
+            return
+        if touched is not None:
+            touched.update(removed)
+        logger.info(f"Pruned {len(removed)} removed files from repository '{repository}'")
+        await self.redis_client.xack(stream_key, self.CONSUMER_GROUP, message_id)
+
     async def _trigger_graph_construction(self, repository: str, engine):
         """
         Trigger graph construction after all batches complete.
@@ -389,6 +480,15 @@ class BatchIndexingConsumer:
                 }
             )
 
+    async def _heartbeat(self, lock_key: str, owner: str):
+        """Refresh the consumer lock until cancelled."""
+        while True:
+            try:
+                await self.redis_client.set(lock_key, owner, ex=self.CONSUMER_LOCK_TTL)
+            except redis.RedisError:
+                pass  # Retried next interval; the TTL covers short outages
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+
     async def process_repository(
         self,
         repository: str,
@@ -407,7 +507,10 @@ class BatchIndexingConsumer:
                - XACK message
                - Check stop_event
             3. Check pending messages every 60s
-            4. Trigger graph construction when complete
+            4. Trigger graph construction when complete (code jobs)
+
+        The consumer lock of the repository is held (heartbeat) while it
+        runs, so the MCP job queue does not start a second consumer.
 
         Args:
             repository: Repository name
@@ -419,9 +522,35 @@ class BatchIndexingConsumer:
             - failed_files: int
             - status: str
             - completed_at: str
+            - run: durable run counters (None if unavailable)
         """
         stream_key = self.STREAM_KEY_TEMPLATE.format(repository=repository)
         status_key = self.STATUS_KEY_TEMPLATE.format(repository=repository)
+        lock_key = self.CONSUMER_LOCK_KEY_TEMPLATE.format(repository=repository)
+        owner = f"consumer:{os.getpid()}"
+
+        heartbeat = asyncio.create_task(self._heartbeat(lock_key, owner))
+        try:
+            return await self._process_locked(repository, stream_key, status_key, stop_event)
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+            # Release unless it expired and another consumer took it over
+            if await self.redis_client.get(lock_key) == owner:
+                await self.redis_client.delete(lock_key)
+
+    async def _process_locked(
+        self,
+        repository: str,
+        stream_key: str,
+        status_key: str,
+        stop_event: asyncio.Event
+    ) -> Dict:
+        """Steps of process_repository(), run while holding the consumer lock."""
+        from sqlalchemy.ext.asyncio import create_async_engine
 
         # Step 1: Ensure consumer group exists
         await self._ensure_consumer_group(stream_key)
@@ -429,7 +558,37 @@ class BatchIndexingConsumer:
         # Update status to processing
         await self._update_status(repository, {"status": "processing"})
 
+        # Durable run counters: a restarted consumer continues the same job
+        engine = create_async_engine(self.db_url)
+        checkpoints = IndexingCheckpointService(engine)
+        job = await self.redis_client.hgetall(status_key)
+        await checkpoints.start_run(
+            repository,
+            int(job.get("total_files") or 0),
+            source="batch",
+            run_id=job.get("job_id")
+        )
+        try:
+            return await self._consume(repository, stream_key, status_key, stop_event, engine, checkpoints)
+        except Exception:
+            await checkpoints.finish_run(repository, "failed")
+            raise
+        finally:
+            await engine.dispose()
+
+    async def _consume(
+        self,
+        repository: str,
+        stream_key: str,
+        status_key: str,
+        stop_event: asyncio.Event,
+        engine,
+        checkpoints: IndexingCheckpointService
+    ) -> Dict:
+        """Consumer loop of process_repository() (steps 2-4)."""
+
         last_pending_check = datetime.now()
+        touched: Set[str] = set()  # files handed to workers (failed ones may have lost chunks)
 
         # Step 2: Main processing loop
         while True:
@@ -445,7 +604,9 @@ class BatchIndexingConsumer:
                     await self._retry_pending_batch(
                         stream_key,
                         msg["message_id"],
-                        repository
+                        repository,
+                        touched,
+                        engine
                     )
                 last_pending_check = now
 
@@ -474,10 +635,16 @@ class BatchIndexingConsumer:
 
             message_id, message_data = message_list[0]
 
+            # Last message of a replacing job: files gone from the repository
+            if message_data.get("action") == "prune":
+                await self._prune_message(stream_key, message_id, repository, message_data, engine, touched)
+                continue
+
             # Extract fields
             batch_number = message_data["batch_number"]
             files_str = message_data["files"]
             files = files_str.split(",")
+            touched.update(files)
 
             # Update status
             await self._update_status(
@@ -487,7 +654,9 @@ class BatchIndexingConsumer:
 
             # Process batch
             try:
-                result = await self._run_subprocess_worker(repository, files)
+                result = await self._run_subprocess_worker(
+                    repository, files, kind=message_data.get("kind", "code")
+                )
 
                 # Update status with results
                 await self._update_status(
@@ -521,13 +690,22 @@ class BatchIndexingConsumer:
             await self._retry_pending_batch(
                 stream_key,
                 msg["message_id"],
-                repository
+                repository,
+                touched,
+                engine
             )
 
+        # Workers wrote the chunks (prune deleted some): refresh the dashboard
+        # statistics of those files once (also when stopped early, the chunks
+        # are written)
+        if touched:
+            await RepositoryStatsService(engine).refresh_chunks(repository, touched)
+
         # Step 4: Get final status
         status = await self.redis_client.hgetall(status_key)
 
         # If not stopped early, trigger graph construction
+        run_status = "interrupted"
         if not (stop_event and stop_event.is_set()):
             # Check if there are any pending (unprocessed) messages
             # XLEN returns total messages, but we need to check XPENDING for unacknowledged messages
@@ -535,19 +713,36 @@ class BatchIndexingConsumer:
 
             # Only trigger graph if NO pending messages
             if len(pending_messages) == 0:
-                # Trigger graph construction
-                from sqlalchemy.ext.asyncio import create_async_engine
-                engine = create_async_engine(self.db_url)
-                await self._trigger_graph_construction(repository, engine)
-                await engine.dispose()
+                if status.get("kind", "code") == "markdown":
+                    # Markdown chunks are not part of the code graph
+                    await self._update_status(
+                        repository,
+                        {
+                            "status": "completed",
+                            "completed_at": datetime.now().isoformat()
+                        }
+                    )
+                else:
+                    # Trigger graph construction
+                    await self._trigger_graph_construction(repository, engine)
+                run_status = "completed"
 
                 # Refresh status after graph construction
                 status = await self.redis_client.hgetall(status_key)
 
+        # Chunks changed: drop cached search / graph results of the
+        # repository in every process (the graph build bumps code jobs too)
+        if run_status == "completed" or touched:
+            await get_repository_generations().bump(repository)
+
+        await checkpoints.finish_run(repository, run_status)
+        run = await checkpoints.get_run(repository)
+
         # Return final stats
         return {
             "processed_files": int(status.get("processed_files", 0)),
             "failed_files": int(status.get("failed_files", 0)),
             "status": status.get("status", "unknown"),
-            "completed_at": status.get("completed_at", "")
+            "completed_at": status.get("completed_at", ""),
+            "run": run.to_dict() if run else None
         }
@@ -29,10 +29,16 @@ class BatchIndexingProducer:
     STATUS_KEY_TEMPLATE = "indexing:status:{repository}"
     STREAM_MAX_LEN = 1000
     STATUS_TTL = 86400  # 24h auto-cleanup
+    # Held while a consumer processes the repository (claimed by the MCP job
+    # queue, refreshed by the consumer's heartbeat, expires if it dies)
+    CONSUMER_LOCK_KEY_TEMPLATE = "indexing:consumer:{repository}"
+    CONSUMER_LOCK_TTL = 60
 
-    def __init__(self, redis_url: str = "redis://redis:6379/0"):
+    def __init__(self, redis_url: str = "redis://redis:6379/0", redis_client: redis.Redis | None = None):
         self.redis_url = redis_url
-        self.redis_client: redis.Redis | None = None
+        # An injected client is shared (e.g. the MCP server's): close() keeps it open
+        self.redis_client: redis.Redis | None = redis_client
+        self._owns_client = redis_client is None
 
     async def connect(self):
         """Initialize Redis connection."""
@@ -44,7 +50,7 @@ class BatchIndexingProducer:
 
     async def close(self):
         """Close Redis connection."""
-        if self.redis_client:
+        if self.redis_client and self._owns_client:
             await self.redis_client.aclose()
 
     def scan_files(
@@ -125,10 +131,35 @@ class BatchIndexingProducer:
                 "status": "pending"
             }
         """
-        await self.connect()
-
         # 1. Scan files (with include_tests parameter)
         files = self.scan_files(directory, extensions, include_tests=include_tests)
+
+        # 2-4. Batch, initialize status, enqueue
+        return await self.enqueue_files(repository, files)
+
+    async def enqueue_files(
+        self,
+        repository: str,
+        files: List[Path],
+        kind: str = "code",
+        replace: bool = False
+    ) -> Dict:
+        """
+        Divide an already scanned file list into batches and enqueue them.
+
+        Args:
+            repository: Repository name
+            files: Files to index
+            kind: "code" (chunk + CODE embeddings) or "markdown"
+                  (sections + TEXT embeddings), passed to the batch workers
+            replace: The files are the whole repository: a last "prune"
+                     message removes the chunks and checkpoints of the others
+
+        Returns:
+            Same as scan_and_enqueue()
+        """
+        await self.connect()
+
         total_files = len(files)
 
         # 2. Divide into batches
@@ -137,7 +168,7 @@ class BatchIndexingProducer:
 
         # 3. Initialize status hash
         job_id = str(uuid.uuid4())
-        await self._init_status(repository, job_id, total_files, total_batches)
+        await self._init_status(repository, job_id, total_files, total_batches, kind)
 
         # 4. Enqueue batches into Redis Stream
         stream_key = self.STREAM_KEY_TEMPLATE.format(repository=repository)
@@ -146,6 +177,7 @@ class BatchIndexingProducer:
             message = {
                 "job_id": job_id,
                 "repository": repository,
+                "kind": kind,
                 "batch_number": str(batch_num),
                 "total_batches": str(total_batches),
                 "files": ",".join(str(f) for f in batch_files),  # Serialize paths
@@ -159,6 +191,21 @@ class BatchIndexingProducer:
                 approximate=True
             )
 
+        if replace:
+            await self.redis_client.xadd(
+                stream_key,
+                {
+                    "job_id": job_id,
+                    "repository": repository,
+                    "kind": kind,
+                    "action": "prune",
+                    "files": ",".join(str(f) for f in files),  # Files to keep
+                    "created_at": datetime.now(timezone.utc).isoformat()
+                },
+                maxlen=self.STREAM_MAX_LEN,
+                approximate=True
+            )
+
         return {
             "job_id": job_id,
             "total_files": total_files,
@@ -171,15 +218,19 @@ class BatchIndexingProducer:
         repository: str,
         job_id: str,
         total_files: int,
-        total_batches: int
+        total_batches: int,
+        kind: str = "code"
     ):
         """Initialize Redis Hash for status tracking."""
         status_key = self.STATUS_KEY_TEMPLATE.format(repository=repository)
 
+        # Replaces the previous job's hash (or a legacy JSON string status)
+        await self.redis_client.delete(status_key)
         await self.redis_client.hset(
             status_key,
             mapping={
                 "job_id": job_id,
+                "kind": kind,
                 "total_files": str(total_files),
                 "total_batches": str(total_batches),
                 "processed_files": "0",
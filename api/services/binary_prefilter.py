@@ -0,0 +1,133 @@
+"""
+Binary-quantised prefilter for vector search — Hamming ANN, exact rescoring.
+
+pgvector's binary_quantize() keeps one bit per dimension (sign), so a 768D
+halfvec (1.5 KB) becomes a 96-byte bit(768). An HNSW index over that
+expression with Hamming distance (<~>) is ~16x smaller than the halfvec
+index and fits in shared_buffers on corpora where the full graph does not.
+It serves as the coarse stage of two-stage search
+(services/two_stage_search.py); the full halfvec rescores the candidates.
+
+Sign bits lose most of the ranking information, so the candidate pool must
+be much wider than for Matryoshka truncation (default oversample 10).
+Indexes are created by scripts/binary_prefilter_indexes.py (CREATE INDEX
+CONCURRENTLY); without them stage 1 is a sequential scan over bit vectors.
+
+Configuration (environment):
+    VECTOR_SEARCH_PREFILTER           off | binary                  (default: off)
+    VECTOR_BINARY_OVERSAMPLE          candidate multiplier          (default: 10)
+    VECTOR_BINARY_MIN_CANDIDATES                                    (default: 100)
+
+When enabled, the binary prefilter takes precedence over Matryoshka
+two-stage search (EMBEDDING_MRL_DIM). Filtered queries that the filtered
+ANN planner resolves with an exact scan skip the prefilter.
+
+Usage:
+    prefilter = get_binary_prefilter()
+    if prefilter.enabled:
+        coarse = prefilter.coarse_candidates_sql("memories", "embedding_half", embedding, where_sql)
+        params["bq_candidate_limit"] = prefilter.candidate_limit(limit)
+        ... JOIN ({coarse}) bq_c USING (id) ORDER BY <full distance> LIMIT :limit
+        prefilter.record(limit, params["bq_candidate_limit"], [row.coarse_rank for row in rows])
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from services.two_stage_search import EMBEDDING_COLUMNS, FULL_DIMENSION, TwoStageConfig, TwoStageSearch
+from utils.sql_vector import format_halfvec_for_sql
+
+logger = structlog.get_logger()
+
+PREFILTER_MODES = ("off", "binary")
+BINARY_DIMENSION = FULL_DIMENSION
+
+# (table, halfvec column) with a binary prefilter index
+BINARY_COLUMNS = tuple(EMBEDDING_COLUMNS)
+
+
+def binary_expression(column: str) -> str:
+    """SQL expression of the bit vector (matches the index expression)."""
+    return f"(binary_quantize({column})::bit({BINARY_DIMENSION}))"
+
+
+def binary_index_name(table: str, column: str) -> str:
+    """Name of the binary prefilter HNSW index for a column."""
+    return f"idx_{table}_{column}_bq"
+
+
+@dataclass
+class BinaryPrefilterConfig(TwoStageConfig):
+    """Binary prefilter settings."""
+    mode: str = "off"
+    oversample: float = 10.0
+    min_candidates: int = 100
+
+    @classmethod
+    def from_env(cls) -> "BinaryPrefilterConfig":
+        """Build config from VECTOR_SEARCH_PREFILTER / VECTOR_BINARY_* variables."""
+        mode = os.getenv("VECTOR_SEARCH_PREFILTER", "off").lower()
+        if mode not in PREFILTER_MODES:
+            logger.warning("binary_prefilter.unknown_mode", mode=mode, fallback="off")
+            mode = "off"
+        return cls(mode=mode, **cls._pool_from_env("VECTOR_BINARY"))
+
+
+class BinaryPrefilter(TwoStageSearch):
+    """Builds Hamming prefilter subqueries and tracks candidate depth."""
+
+    config: BinaryPrefilterConfig
+
+    def __init__(self, config: Optional[BinaryPrefilterConfig] = None):
+        """
+        Initialize the prefilter.
+
+        Args:
+            config: Settings (read from environment if not provided)
+        """
+        super().__init__(config or BinaryPrefilterConfig.from_env())
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.mode == "binary"
+
+    def coarse_candidates_sql(
+        self,
+        table: str,
+        column: str,
+        embedding: List[float],
+        where_sql: str,
+    ) -> str:
+        """
+        Stage-1 subquery: ids and Hamming ranks of the nearest bit vectors.
+
+        Uses the :bq_candidate_limit bind parameter. The ORDER BY expression
+        matches the index created by scripts/binary_prefilter_indexes.py.
+
+        Raises:
+            ValueError: If (table, column) is not a known embedding column
+        """
+        if (table, column) not in BINARY_COLUMNS:
+            raise ValueError(f"No binary prefilter index for {table}.{column}")
+
+        query_bits = f"binary_quantize('{format_halfvec_for_sql(embedding)}'::halfvec)"
+        distance = f"{binary_expression(column)} <~> {query_bits}"
+        return self._coarse_sql(table, where_sql, distance, "bq_candidate_limit")
+
+    def stats(self) -> Dict[str, Any]:
+        """Current settings and depth telemetry."""
+        return {"mode": self.config.mode, **super().stats()}
+
+
+_binary_prefilter: Optional[BinaryPrefilter] = None
+
+
+def get_binary_prefilter() -> BinaryPrefilter:
+    """Process-wide binary prefilter settings shared by vector search paths."""
+    global _binary_prefilter
+    if _binary_prefilter is None:
+        _binary_prefilter = BinaryPrefilter()
+    return _binary_prefilter
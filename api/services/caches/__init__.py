@@ -5,13 +5,19 @@ Provides:
 - L1 In-Memory Cache (CodeChunkCache) - LRU eviction with MD5 validation
 - L2 Redis Cache (RedisCache) - Shared cache with async operations
 - L1/L2 Cascade (CascadeCache) - Automatic promotion with intelligent layering
+- Memory search result cache (MemorySearchCache) - Write-generation keyed L1
+- Repository generations (RepositoryGenerations) - O(1) invalidation of code cache keys
+- Invalidation bus (InvalidationBus) - Cross-process L1 coherence over Redis pub/sub
 - Cache Metrics Collector (CacheMetricsCollector) - Historical metrics tracking
 - Cache key management utilities
 """
 
+from .invalidation_bus import InvalidationBus, LocalInvalidationHub, get_invalidation_bus
 from .code_chunk_cache import CodeChunkCache, CachedChunkEntry
 from .redis_cache import RedisCache
 from .cascade_cache import CascadeCache
+from .memory_search_cache import MemorySearchCache, get_memory_search_cache
+from .repository_generations import RepositoryGenerations, get_repository_generations
 from .cache_metrics import CacheMetricsCollector, CacheMetricSnapshot, get_metrics_collector
 from . import cache_keys
 
@@ -20,6 +26,13 @@ __all__ = [
     "CachedChunkEntry",
     "RedisCache",
     "CascadeCache",
+    "MemorySearchCache",
+    "get_memory_search_cache",
+    "RepositoryGenerations",
+    "get_repository_generations",
+    "InvalidationBus",
+    "LocalInvalidationHub",
+    "get_invalidation_bus",
     "CacheMetricsCollector",
     "CacheMetricSnapshot",
     "get_metrics_collector",
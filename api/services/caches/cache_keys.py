@@ -19,6 +19,7 @@ def search_result_key(
     enable_vector: bool = True,
     lexical_weight: float = 0.5,
     vector_weight: float = 0.5,
+    generation: Optional[str] = None,
 ) -> str:
     """
     Generate cache key for search results — includes ALL parameters.
@@ -26,6 +27,9 @@ def search_result_key(
     EPIC-32 Story 32.1: Fixed to include filters, offset, weights, and
     enable flags to prevent returning wrong cached results.
 
+    The repository generation (see RepositoryGenerations) is part of the
+    key, so re-indexing the repository makes every older entry unreachable.
+
     Args:
         query: Search query text
         repository: Optional repository filter
@@ -36,9 +40,10 @@ def search_result_key(
         enable_vector: Whether vector search is enabled
         lexical_weight: Weight for lexical results in RRF
         vector_weight: Weight for vector results in RRF
+        generation: Generation token of the searched repository scope
 
     Returns:
-        Cache key in format: search:v2:{sha256_hash}
+        Cache key in format: search:v3:{generation}:{sha256_hash}
     """
     params = {
         "q": query,
@@ -53,13 +58,14 @@ def search_result_key(
     }
     param_str = json.dumps(params, sort_keys=True)
     key_hash = hashlib.sha256(param_str.encode()).hexdigest()[:16]
-    return f"search:v2:{key_hash}"
+    return f"search:v3:{generation or 'none'}:{key_hash}"
 
 
 def graph_traversal_key(
     node_id: str,
     max_hops: int = 3,
     relation_types: Optional[List[str]] = None,
+    generation: Optional[str] = None,
 ) -> str:
     """
     Generate cache key for graph traversal results.
@@ -68,17 +74,18 @@ def graph_traversal_key(
         node_id: Starting node UUID
         max_hops: Maximum traversal depth
         relation_types: List of relation types to follow (e.g., ["calls", "imports"])
+        generation: Generation token of the node's repository
 
     Returns:
-        Cache key in format: graph:{node_id}:hops{N}:{relations}
+        Cache key in format: graph:{generation}:{node_id}:hops{N}:{relations}
 
     Example:
-        graph:123e4567-e89b:hops3:calls,imports
+        graph:0.4:123e4567-e89b:hops3:calls,imports
     """
     relations = ",".join(sorted(relation_types)) if relation_types else "all"
     # Truncate node_id for readability (first 12 chars)
     node_short = node_id[:12] if len(node_id) > 12 else node_id
-    return f"graph:{node_short}:hops{max_hops}:{relations}"
+    return f"graph:{generation or 'none'}:{node_short}:hops{max_hops}:{relations}"
 
 
 def embedding_key(text_hash: str) -> str:
@@ -117,6 +124,9 @@ def code_chunk_key(file_path: str, content_hash: str) -> str:
     """
     Generate cache key for code chunks.
 
+    Content-addressed: a changed file gets a new key, so entries need no
+    repository generation.
+
     Args:
         file_path: File path
         content_hash: MD5 hash of file content
@@ -148,3 +158,22 @@ def repository_pattern(repo_name: str) -> str:
         *:my-project:* matches search, graph, and chunk keys for my-project
     """
     return f"*:{repo_name}:*"
+
+
+def memory_search_key(generation: str, params: Dict[str, Any]) -> str:
+    """
+    Generate cache key for hybrid memory search results.
+
+    The generation token (see MemorySearchCache) is part of the key, so a
+    write to the searched scope makes every older entry unreachable.
+
+    Args:
+        generation: Generation token of the searched scope
+        params: All result-affecting search parameters (JSON-serialisable)
+
+    Returns:
+        Cache key in format: memsearch:{generation}:{sha256_hash}
+    """
+    param_str = json.dumps(params, sort_keys=True, default=str)
+    key_hash = hashlib.sha256(param_str.encode()).hexdigest()[:24]
+    return f"memsearch:{generation}:{key_hash}"
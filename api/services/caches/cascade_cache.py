@@ -14,8 +14,10 @@ import structlog
 from typing import List, Optional
 
 from models.code_chunk_models import CodeChunkModel
+from services.caches import cache_keys
 from services.caches.code_chunk_cache import CodeChunkCache
 from services.caches.redis_cache import RedisCache
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
 
 logger = structlog.get_logger()
 
@@ -32,19 +34,30 @@ class CascadeCache:
     Promotion Strategy:
     - L2 hit → auto-promote to L1 (warm → hot migration)
     - Write-through: populate both L1 and L2 on cache miss
-    - Invalidation: clear both layers together
+    - Invalidation: L2 keys are content-addressed (file path + content
+      hash), so a changed file never hits an older entry; repository
+      invalidation evicts L1 and bumps the repository generation, which
+      retires the repository's search and graph cache entries
     """
 
-    def __init__(self, l1_cache: CodeChunkCache, l2_cache: RedisCache):
+    def __init__(
+        self,
+        l1_cache: CodeChunkCache,
+        l2_cache: RedisCache,
+        generations: Optional[RepositoryGenerations] = None,
+    ):
         """
         Initialize cascade cache with L1 and L2 instances.
 
         Args:
             l1_cache: In-memory code chunk cache (Story 10.1)
             l2_cache: Redis distributed cache (Story 10.2)
+            generations: Optional repository generation counters bumped by
+                         invalidate_repository (process-wide default)
         """
         self.l1 = l1_cache
         self.l2 = l2_cache
+        self.generations = generations or get_repository_generations()
         self.l1_promotions = 0  # Track L2→L1 promotions
 
         logger.info(
@@ -56,7 +69,7 @@ class CascadeCache:
     async def get_chunks(
         self,
         file_path: str,
-        source_code: str
+        source_code: str,
     ) -> Optional[List[CodeChunkModel]]:
         """
         Get chunks with L1→L2→L3 cascade logic.
@@ -87,9 +100,7 @@ class CascadeCache:
             return chunks
 
         # LAYER 2: Redis Cache (fast, shared across instances)
-        content_hash = self._compute_hash(source_code)
-        cache_key = f"chunks:{file_path}:{content_hash}"
-
+        cache_key = self._l2_key(file_path, source_code)
         cached_data = await self.l2.get(cache_key)
         if cached_data:
             logger.info(
@@ -158,8 +169,7 @@ class CascadeCache:
         self.l1.put(file_path, source_code, chunks)
 
         # POPULATE L2: Store in Redis with TTL
-        content_hash = self._compute_hash(source_code)
-        cache_key = f"chunks:{file_path}:{content_hash}"
+        cache_key = self._l2_key(file_path, source_code)
 
         # Serialize for Redis storage
         try:
@@ -212,6 +222,10 @@ class CascadeCache:
         clearing the entire cache. Only evicts entries matching the
         repository prefix, preserving other repos' cached data.
 
+        L2 chunk entries are content-addressed and need no flush; the
+        generation bump retires the repository's search and graph cache
+        entries without a SCAN.
+
         Use case: Repository re-indexed → flush repo-specific data
 
         Args:
@@ -222,18 +236,20 @@ class CascadeCache:
         # File paths are typically "repository/path/to/file.ext"
         l1_count = self.l1.invalidate_by_prefix(repository)
 
-        # L2: Flush only this repository's keys
-        pattern = f"chunks:{repository}:*"
-        l2_count = await self.l2.flush_pattern(pattern)
+        # Search/graph caches: O(1) generation bump
+        await self.generations.bump(repository)
 
         logger.info(
             "Repository cache invalidated (L1+L2)",
             repository=repository,
             l1_entries_removed=l1_count,
-            l2_keys_removed=l2_count,
-            strategy="per_repository_prefix",
+            strategy="per_repository_prefix+generation",
         )
 
+    def _l2_key(self, file_path: str, source_code: str) -> str:
+        """L2 key of a file version."""
+        return cache_keys.code_chunk_key(file_path, self._compute_hash(source_code))
+
     async def stats(self) -> dict:
         """
         Get combined statistics across L1 and L2.
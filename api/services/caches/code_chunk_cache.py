@@ -12,6 +12,8 @@ from collections import OrderedDict
 import hashlib
 import structlog
 
+from services.caches.invalidation_bus import InvalidationBus
+
 logger = structlog.get_logger()
 
 
@@ -30,12 +32,21 @@ class CachedChunkEntry:
 class CodeChunkCache:
     """L1 in-memory cache with LRU eviction and MD5 validation."""
 
-    def __init__(self, max_size_mb: int = 100):
+    def __init__(
+        self,
+        max_size_mb: int = 100,
+        invalidation_bus: Optional[InvalidationBus] = None,
+        cache_name: str = "code_chunks",
+    ):
         """
         Initialize cache with maximum size limit.
 
         Args:
             max_size_mb: Maximum cache size in megabytes (default: 100MB)
+            invalidation_bus: Optional bus keeping L1 caches of other
+                              processes coherent (invalidations are broadcast
+                              and received under cache_name)
+            cache_name: Bus name shared by the caches to keep coherent
         """
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.current_size = 0
@@ -43,6 +54,10 @@ class CodeChunkCache:
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.invalidation_bus = invalidation_bus
+        self.cache_name = cache_name
+        if invalidation_bus is not None:
+            invalidation_bus.register(cache_name, self._on_invalidation)
 
         logger.info(
             "L1 cache initialized",
@@ -144,41 +159,21 @@ class CodeChunkCache:
             cache_size_mb=self.current_size / (1024 * 1024),
         )
 
-    def invalidate(self, file_path: str):
+    def invalidate(self, file_path: str, broadcast: bool = True):
         """
         Manually invalidate entry.
 
         Args:
             file_path: Path to the file to invalidate
+            broadcast: Also invalidate the L1 caches of other processes
         """
         if file_path in self.cache:
             self._evict(file_path)
             logger.info("L1 cache invalidated", file_path=file_path)
+        if broadcast:
+            self._broadcast("key", file_path)
 
-    def invalidate_by_prefix(self, prefix: str) -> int:
-        """
-        Invalidate all entries whose file_path starts with prefix.
-
-        EPIC-32 Story 32.5: Per-repository L1 invalidation instead of
-        clearing the entire cache.
-
-        Args:
-            prefix: File path prefix to match (e.g., "repo_name/" or "/path/to/repo")
-
-        Returns:
-            Number of entries invalidated
-        """
-        keys_to_remove = [k for k in self.cache if k.startswith(prefix)]
-        for key in keys_to_remove:
-            self._evict(key)
-        logger.info(
-            "L1 cache invalidated by prefix",
-            prefix=prefix,
-            entries_removed=len(keys_to_remove),
-        )
-        return len(keys_to_remove)
-
-    def invalidate_by_prefix(self, prefix: str) -> int:
+    def invalidate_by_prefix(self, prefix: str, broadcast: bool = True) -> int:
         """
         Invalidate all entries whose file_path starts with prefix.
 
@@ -187,6 +182,7 @@ class CodeChunkCache:
 
         Args:
             prefix: File path prefix to match (e.g., "repo_name/" or "/path/to/repo")
+            broadcast: Also invalidate the L1 caches of other processes
 
         Returns:
             Number of entries invalidated
@@ -199,14 +195,31 @@ class CodeChunkCache:
             prefix=prefix,
             entries_removed=len(keys_to_remove),
         )
+        if broadcast:
+            self._broadcast("prefix", prefix)
         return len(keys_to_remove)
 
-    def clear(self):
+    def clear(self, broadcast: bool = True):
         """Clear entire cache."""
         count = len(self.cache)
         self.cache.clear()
         self.current_size = 0
         logger.info("L1 cache cleared", entries_removed=count)
+        if broadcast:
+            self._broadcast("clear")
+
+    def _broadcast(self, kind: str, value: Optional[str] = None):
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish_nowait(self.cache_name, kind, value)
+
+    def _on_invalidation(self, kind: str, value: Optional[str]):
+        """Apply an invalidation received from another process."""
+        if kind == "key":
+            self.invalidate(value, broadcast=False)
+        elif kind == "prefix":
+            self.invalidate_by_prefix(value, broadcast=False)
+        elif kind == "clear":
+            self.clear(broadcast=False)
 
     def stats(self) -> dict:
         """
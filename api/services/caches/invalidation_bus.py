@@ -0,0 +1,249 @@
+"""
+Cross-process invalidation bus for in-process (L1) caches.
+
+The API, MCP server and batch consumer each keep their own L1 caches
+(CodeChunkCache, SimpleMemoryCache, the local generation counters of
+MemorySearchCache / RepositoryGenerations). An invalidation in one process
+used to stay in that process; the bus broadcasts it to every other one:
+
+    key         drop one entry             (CodeChunkCache.invalidate)
+    prefix      drop entries by prefix     (CodeChunkCache.invalidate_by_prefix)
+    clear       drop everything            (cache clear / flush)
+    generation  bump generation scopes     (MemorySearchCache, RepositoryGenerations)
+
+Messages travel over a Redis pub/sub channel when a client is bound, and
+over a LocalInvalidationHub in tests. Each cache registers a handler under
+its name; handlers apply the invalidation locally without re-publishing,
+and a process ignores its own messages.
+
+Pub/sub is at-most-once: messages published while the listener is
+disconnected are lost. Whenever the listener (re)subscribes after a
+failure, every registered cache receives a "clear", so a gap costs a cold
+L1 rather than stale reads.
+
+Usage:
+    bus = get_invalidation_bus()
+    cache = CodeChunkCache(invalidation_bus=bus)   # registers a handler
+    bus.bind_redis(redis_client)
+    await bus.start()                              # listen (API / MCP)
+    ...
+    await bus.stop()
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import structlog
+
+logger = structlog.get_logger()
+
+INVALIDATION_CHANNEL = "mnemo:l1:invalidate"
+INVALIDATION_KINDS = ("key", "prefix", "clear", "generation")
+
+# handler(kind, value)
+InvalidationHandler = Callable[[str, Any], None]
+
+
+class LocalInvalidationHub:
+    """In-process stand-in for the Redis channel: connects several buses."""
+
+    def __init__(self):
+        self.buses: List["InvalidationBus"] = []
+
+    def deliver(self, payload: str) -> None:
+        for bus in list(self.buses):
+            bus._dispatch(payload)
+
+
+class InvalidationBus:
+    """Broadcasts L1 cache invalidations to the other processes."""
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        hub: Optional[LocalInvalidationHub] = None,
+        channel: str = INVALIDATION_CHANNEL,
+        reconnect_delay: float = 1.0,
+    ):
+        """
+        Initialize the bus.
+
+        Args:
+            redis_client: Optional redis.asyncio client (publish + listen)
+            hub: Optional in-process hub (tests)
+            channel: Redis pub/sub channel
+            reconnect_delay: Seconds between listener reconnect attempts
+        """
+        self.origin = uuid.uuid4().hex
+        self.redis = redis_client
+        self.hub = hub
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+        if hub is not None:
+            hub.buses.append(self)
+
+        self.published = 0
+        self.received = 0
+        self.publish_failures = 0
+        self.resyncs = 0
+
+    def bind_redis(self, redis_client: Optional[Any]) -> None:
+        """Publish through Redis (None = process-local only)."""
+        self.redis = redis_client
+
+    def register(self, cache_name: str, handler: InvalidationHandler) -> None:
+        """Apply remote invalidations for cache_name with handler(kind, value)."""
+        self._handlers.setdefault(cache_name, []).append(handler)
+
+    async def publish(self, cache_name: str, kind: str, value: Any = None) -> None:
+        """
+        Broadcast an invalidation already applied locally.
+
+        Args:
+            cache_name: Name the target caches registered under
+            kind: One of INVALIDATION_KINDS
+            value: Key, prefix or generation scopes (None for clear)
+        """
+        payload = self._encode(cache_name, kind, value)
+        if payload is None:
+            return
+        if self.hub is not None:
+            self.hub.deliver(payload)
+        await self._send(payload)
+
+    def publish_nowait(self, cache_name: str, kind: str, value: Any = None) -> None:
+        """publish() for synchronous callers; the Redis send runs as a task."""
+        payload = self._encode(cache_name, kind, value)
+        if payload is None:
+            return
+        if self.hub is not None:
+            self.hub.deliver(payload)
+        if self.redis is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.publish_failures += 1
+            logger.warning("invalidation_bus.no_event_loop", cache=cache_name, kind=kind)
+            return
+        task = loop.create_task(self._send(payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _encode(self, cache_name: str, kind: str, value: Any) -> Optional[str]:
+        if kind not in INVALIDATION_KINDS:
+            raise ValueError(f"Unknown invalidation kind: {kind}")
+        if self.redis is None and self.hub is None:
+            return None
+        self.published += 1
+        return json.dumps({"origin": self.origin, "cache": cache_name, "kind": kind, "value": value})
+
+    async def _send(self, payload: str) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.publish(self.channel, payload)
+        except Exception as e:
+            # Other processes keep their L1 entries until LRU/TTL/hash checks evict them
+            self.publish_failures += 1
+            logger.warning("invalidation_bus.publish_failed", error=str(e))
+
+    def _dispatch(self, payload: Any) -> None:
+        """Apply a received message to the registered caches."""
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        try:
+            message = json.loads(payload)
+        except (TypeError, ValueError):
+            logger.warning("invalidation_bus.bad_message")
+            return
+        if message.get("origin") == self.origin:
+            return
+
+        self.received += 1
+        for handler in self._handlers.get(message.get("cache"), []):
+            try:
+                handler(message.get("kind"), message.get("value"))
+            except Exception as e:
+                logger.warning("invalidation_bus.handler_failed", cache=message.get("cache"), error=str(e))
+
+    def _resync(self) -> None:
+        """Messages may have been missed: clear every registered cache."""
+        self.resyncs += 1
+        for cache_name, handlers in self._handlers.items():
+            for handler in handlers:
+                try:
+                    handler("clear", None)
+                except Exception as e:
+                    logger.warning("invalidation_bus.handler_failed", cache=cache_name, error=str(e))
+
+    async def start(self) -> None:
+        """Start listening on the Redis channel (no-op without a client)."""
+        if self.redis is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and flush pending publishes."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if reconnecting:
+                    self._resync()
+                    logger.info("invalidation_bus.resubscribed", channel=self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("invalidation_bus.listener_failed", error=str(e))
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            reconnecting = True
+            await asyncio.sleep(self.reconnect_delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bus statistics."""
+        return {
+            "published": self.published,
+            "received": self.received,
+            "publish_failures": self.publish_failures,
+            "resyncs": self.resyncs,
+            "caches": sorted(self._handlers),
+            "listening": self._listener is not None,
+        }
+
+
+_invalidation_bus: Optional[InvalidationBus] = None
+
+
+def get_invalidation_bus() -> InvalidationBus:
+    """Process-wide bus shared by every L1 cache."""
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        _invalidation_bus = InvalidationBus()
+    return _invalidation_bus
@@ -0,0 +1,247 @@
+"""
+L1 result cache for hybrid memory search with write-aware invalidation.
+
+Agents repeat identical memory searches within a session; each one re-runs
+lexical, vector, entity and tag retrieval, RRF fusion, reranking and decay.
+This cache memoises the final HybridMemorySearchResponse.
+
+Invalidation uses generation counters instead of TTL guessing:
+
+    epoch            bumped when the written scope is unknown (invalidates all)
+    gen["*"]         bumped on every write (unscoped searches)
+    gen[project_id]  bumped on writes to that project (project-scoped searches)
+
+The searched scope's generation is part of the cache key, so once a write
+bumps it, older entries are unreachable and age out through LRU/TTL. A
+search that races with a write stores under the old generation and is
+never served afterwards.
+
+Generations live in Redis when a client is bound (MCP server and API are
+separate processes that both write memories), with a process-local
+fallback. If Redis cannot be read, the cache is bypassed rather than
+risking a stale hit. Bumps are also broadcast on the invalidation bus so
+the local counters of other processes follow.
+
+Memory writers live in the service layer and call invalidate() once the
+write is committed: the MCP memory tools, the memory REST routes, entity
+extraction, and the conversation worker (a separate image, which bumps the
+Redis counters under GENERATION_KEY_PREFIX directly). MemoryRepository
+itself stays cache-agnostic.
+
+Usage:
+    cache = get_memory_search_cache()
+    generation = await cache.generation(project_id)
+    key = cache_keys.memory_search_key(generation, params)
+    response = cache.get(key)
+    ...
+    await cache.invalidate(project_id)  # after a memory write
+"""
+
+import copy
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+import structlog
+
+from services.caches.invalidation_bus import InvalidationBus, get_invalidation_bus
+
+logger = structlog.get_logger()
+
+GENERATION_KEY_PREFIX = "memsearch:gen:"
+
+
+class MemorySearchCache:
+    """LRU + TTL cache of hybrid memory search responses, keyed by generation."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 300.0,
+        redis_client: Optional[Any] = None,
+        enabled: bool = True,
+        invalidation_bus: Optional[InvalidationBus] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses (LRU eviction)
+            ttl_seconds: Upper bound on entry age
+            redis_client: Optional redis.asyncio client for shared generations
+            enabled: Disable to turn every lookup into a miss
+            invalidation_bus: Optional bus propagating generation bumps and
+                              clears to the caches of other processes
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis_client
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.bypasses = 0
+
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None:
+            invalidation_bus.register("memsearch", self._on_invalidation)
+
+    @classmethod
+    def from_env(cls, invalidation_bus: Optional[InvalidationBus] = None) -> "MemorySearchCache":
+        """Build from MEMORY_SEARCH_CACHE_* environment variables."""
+        return cls(
+            max_entries=int(os.getenv("MEMORY_SEARCH_CACHE_MAX_ENTRIES", "512")),
+            ttl_seconds=float(os.getenv("MEMORY_SEARCH_CACHE_TTL_SECONDS", "300")),
+            enabled=os.getenv("MEMORY_SEARCH_CACHE_ENABLED", "true").lower() == "true",
+            invalidation_bus=invalidation_bus,
+        )
+
+    def bind_redis(self, redis_client: Optional[Any]) -> None:
+        """Share generation counters through Redis (None = process-local)."""
+        self.redis = redis_client
+
+    @staticmethod
+    def _scope(project_id: Optional[Any]) -> str:
+        return str(project_id) if project_id else "*"
+
+    async def generation(self, project_id: Optional[Any] = None) -> Optional[str]:
+        """
+        Current generation token for a search scope.
+
+        Args:
+            project_id: Project filter of the search (None = all projects)
+
+        Returns:
+            Token such as "0.3.0.17", or None if the cache must be bypassed
+        """
+        if not self.enabled:
+            return None
+
+        scope = self._scope(project_id)
+        # Local counters are always part of the token: this process's own
+        # writes invalidate immediately even if a Redis bump failed.
+        token = f"{self._generations.get('epoch', 0)}.{self._generations.get(scope, 0)}"
+        if self.redis is None:
+            return token
+
+        try:
+            epoch, gen = await self.redis.mget(
+                GENERATION_KEY_PREFIX + "epoch", GENERATION_KEY_PREFIX + scope
+            )
+        except Exception as e:
+            self.bypasses += 1
+            logger.warning("memory_search_cache.generation_read_failed", error=str(e))
+            return None
+        return f"{int(epoch or 0)}.{int(gen or 0)}.{token}"
+
+    async def invalidate(self, project_id: Optional[Any] = None, unknown_scope: bool = False) -> None:
+        """
+        Bump generations after a memory write. Never raises: a failed bump
+        must not fail the write.
+
+        Args:
+            project_id: Project of the written memory (None = no project)
+            unknown_scope: The written rows' projects are unknown; bump the
+                epoch, which invalidates every scope
+        """
+        if unknown_scope:
+            scopes = ["epoch"]
+        else:
+            scopes = ["*"] + ([self._scope(project_id)] if project_id else [])
+
+        self.invalidations += 1
+        self._bump_local(scopes)
+        if self.invalidation_bus is not None:
+            try:
+                await self.invalidation_bus.publish("memsearch", "generation", scopes)
+            except Exception as e:
+                logger.warning("memory_search_cache.bus_publish_failed", error=str(e))
+
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                for scope in scopes:
+                    pipe.incr(GENERATION_KEY_PREFIX + scope)
+                await pipe.execute()
+            except Exception as e:
+                # Other processes may serve stale entries until their TTL;
+                # this process has already moved on via the local counters.
+                logger.warning("memory_search_cache.generation_bump_failed", error=str(e))
+
+    def _bump_local(self, scopes) -> None:
+        for scope in scopes:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def _on_invalidation(self, kind: str, scopes) -> None:
+        """Apply a bump or clear made by another process."""
+        if kind == "generation":
+            self._bump_local(scopes)
+        elif kind == "clear":
+            self.clear()
+
+    async def invalidate_many(self, project_ids: Iterable[Optional[Any]]) -> None:
+        """Bump generations for several written projects."""
+        distinct = {self._scope(p) for p in project_ids}
+        if not distinct:
+            return
+        for scope in distinct:
+            await self.invalidate(None if scope == "*" else scope)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached response, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of a response."""
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (generations are kept)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "bypasses": self.bypasses,
+            "shared_generations": self.redis is not None,
+        }
+
+
+_memory_search_cache: Optional[MemorySearchCache] = None
+
+
+def get_memory_search_cache() -> MemorySearchCache:
+    """Process-wide cache shared by HybridMemorySearchService and memory writers."""
+    global _memory_search_cache
+    if _memory_search_cache is None:
+        _memory_search_cache = MemorySearchCache.from_env(invalidation_bus=get_invalidation_bus())
+    return _memory_search_cache
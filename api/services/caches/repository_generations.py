@@ -0,0 +1,175 @@
+"""
+Per-repository generation counters for code caches.
+
+Code search responses, graph traversals and chunk lists are cached in
+Redis. Instead of SCAN-ing and deleting keys when a repository changes,
+every cache key embeds the repository's generation token:
+
+    epoch        bumped by invalidate_all() (unknown scope, admin flush)
+    gen["*"]     bumped on every repository change (unscoped searches)
+    gen[repo]    bumped when that repository is indexed, a file of it is
+                 reindexed, its graph is rebuilt or it is deleted
+
+Bumping is a single INCR, so invalidation is O(1) regardless of how many
+keys exist; older entries become unreachable and age out through their
+TTL, which can therefore be long. A lookup that races with a bump stores
+under the old generation and is never served afterwards.
+
+Generations live in Redis when a client is bound (API, MCP server and
+batch consumer are separate processes that all index and share the same
+Redis cache entries): the token is then made of the Redis counters only,
+so every process computes the same key. Without Redis, process-local
+counters are used; bumps are broadcast on the invalidation bus so the
+local counters of other processes follow.
+
+If Redis cannot be read, callers bypass the cache rather than risk a
+stale hit. A bump whose INCR failed is retried before the next read; until
+it lands, this process bypasses the cache as well.
+
+Usage:
+    generations = get_repository_generations()
+    generation = await generations.generation(repository)
+    if generation is not None:
+        key = cache_keys.search_result_key(..., generation=generation)
+    ...
+    await generations.bump(repository)  # after indexing
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import structlog
+
+from services.caches.invalidation_bus import InvalidationBus, get_invalidation_bus
+
+logger = structlog.get_logger()
+
+GENERATION_KEY_PREFIX = "repogen:"
+
+
+class RepositoryGenerations:
+    """Generation tokens scoping code cache keys to repository versions."""
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
+    ):
+        """
+        Initialize generation counters.
+
+        Args:
+            redis_client: Optional redis.asyncio client for shared generations
+            invalidation_bus: Optional bus propagating bumps to the local
+                              counters of other processes
+        """
+        self.redis = redis_client
+        self.invalidation_bus = invalidation_bus
+        self._generations: Dict[str, int] = {}
+        # Bumps not yet applied in Redis (INCR failed), per scope
+        self._unsynced: Counter = Counter()
+        self.bumps = 0
+        self.bypasses = 0
+        if invalidation_bus is not None:
+            invalidation_bus.register("repogen", self._on_invalidation)
+
+    def bind_redis(self, redis_client: Optional[Any]) -> None:
+        """Share generation counters through Redis (None = process-local)."""
+        self.redis = redis_client
+
+    @staticmethod
+    def _scope(repository: Optional[str]) -> str:
+        return repository if repository else "*"
+
+    async def generation(self, repository: Optional[str] = None) -> Optional[str]:
+        """
+        Current generation token for a repository scope.
+
+        Args:
+            repository: Repository of the cached result (None = all repositories)
+
+        Returns:
+            Token such as "0.3" (epoch.scope), or None if the cache must be
+            bypassed
+        """
+        scope = self._scope(repository)
+        if self.redis is None:
+            return f"{self._generations.get('epoch', 0)}.{self._generations.get(scope, 0)}"
+
+        try:
+            if self._unsynced:
+                await self._apply_in_redis(self._unsynced)
+                self._unsynced.clear()
+            epoch, gen = await self.redis.mget(
+                GENERATION_KEY_PREFIX + "epoch", GENERATION_KEY_PREFIX + scope
+            )
+        except Exception as e:
+            self.bypasses += 1
+            logger.warning("repository_generations.read_failed", error=str(e))
+            return None
+        return f"{int(epoch or 0)}.{int(gen or 0)}"
+
+    async def bump(self, repository: Optional[str]) -> None:
+        """
+        Invalidate every cached result of a repository (and unscoped results).
+
+        Args:
+            repository: Changed repository (None = unknown, bumps the epoch)
+        """
+        scopes = ["*", repository] if repository else ["epoch"]
+        await self._incr(scopes)
+
+    async def invalidate_all(self) -> None:
+        """Invalidate cached results of every repository."""
+        await self._incr(["epoch"])
+
+    def _bump_local(self, scopes) -> None:
+        for scope in scopes:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def _on_invalidation(self, kind: str, scopes) -> None:
+        """Apply a bump made by another process to the local counters."""
+        if kind == "generation":
+            self._bump_local(scopes)
+
+    async def _incr(self, scopes) -> None:
+        self.bumps += 1
+        self._bump_local(scopes)
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.publish("repogen", "generation", scopes)
+
+        if self.redis is not None:
+            try:
+                await self._apply_in_redis(Counter(scopes))
+            except Exception as e:
+                # Retried before the next read; other processes may serve
+                # stale entries until it lands
+                self._unsynced.update(scopes)
+                logger.warning("repository_generations.bump_failed", error=str(e), scopes=scopes)
+
+    async def _apply_in_redis(self, increments: Counter) -> None:
+        pipe = self.redis.pipeline()
+        for scope, amount in increments.items():
+            pipe.incrby(GENERATION_KEY_PREFIX + scope, amount)
+        await pipe.execute()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counter statistics."""
+        return {
+            "bumps": self.bumps,
+            "bypasses": self.bypasses,
+            "local_scopes": len(self._generations),
+            "unsynced_scopes": len(self._unsynced),
+            "shared_generations": self.redis is not None,
+        }
+
+
+_repository_generations: Optional[RepositoryGenerations] = None
+
+
+def get_repository_generations() -> RepositoryGenerations:
+    """Process-wide generations shared by code caches and indexers."""
+    global _repository_generations
+    if _repository_generations is None:
+        _repository_generations = RepositoryGenerations(invalidation_bus=get_invalidation_bus())
+    return _repository_generations
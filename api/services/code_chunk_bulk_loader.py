@@ -0,0 +1,253 @@
+"""
+Bulk loading of code chunks with binary COPY.
+
+CodeChunkRepository.add_batch builds one multi-row INSERT per file: every
+vector is rendered as a ~10 KB text literal, parsed back by the server and
+each row pays the HNSW insertion cost immediately. For initial imports of
+large repositories the loader instead:
+
+    buffers    chunks across files and flushes every `flush_size` rows
+    copies     each flush with COPY ... FROM STDIN (BINARY) on a dedicated
+               asyncpg connection; vector and halfvec columns use the
+               pgvector binary codecs (register_vector), metadata is JSONB
+    defers     drops the HNSW indexes of code_chunks and rebuilds them after
+               the load in one parallel bulk build (hnsw_index_maintenance):
+               up front when asked to, or automatically once the load
+               reaches HNSW_DEFER_ROW_THRESHOLD chunks
+    reports    chunks/s for the COPY and the index build time
+
+The connection is opened from the DSN rather than borrowed from the
+SQLAlchemy pool: registering the pgvector codecs changes how vector columns
+are decoded, which the pooled repositories do not expect.
+
+Deferring indexes leaves vector search on code_chunks without HNSW
+(sequential scans) for the rest of the load, for every repository: pass
+defer_indexes=False for small loads next to a serving API. The dropped
+definitions are logged so an interrupted load can be repaired by hand.
+
+Configuration (environment):
+    CODE_BULK_LOAD_FLUSH_SIZE   chunks per COPY (default: 5000)
+    HNSW_*                      build settings and threshold (hnsw_index_maintenance)
+
+Usage:
+    async with CodeChunkBulkLoader.from_engine(engine, defer_indexes=True) as loader:
+        for chunks in chunks_per_file:
+            await loader.add(chunks)
+    print(loader.stats.to_dict())
+"""
+
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import asyncpg
+import structlog
+from pgvector.asyncpg import register_vector
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from models.code_chunk_models import CodeChunkCreate
+from services.hnsw_index_maintenance import HnswIndex, HnswIndexMaintenance
+
+logger = structlog.get_logger()
+
+COPY_COLUMNS = (
+    "id", "file_path", "language", "chunk_type", "name", "name_path", "source_code",
+    "start_line", "end_line", "embedding_text", "embedding_code",
+    "embedding_text_half", "embedding_code_half", "metadata",
+    "indexed_at", "last_modified", "node_id", "repository", "commit_hash",
+)
+
+
+@dataclass
+class BulkLoadStats:
+    """Throughput of one bulk load."""
+    chunks: int = 0
+    copies: int = 0
+    copy_seconds: float = 0.0
+    index_seconds: float = 0.0
+    deferred_indexes: List[str] = field(default_factory=list)
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.copy_seconds if self.copy_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "chunks": self.chunks,
+            "copies": self.copies,
+            "copy_seconds": round(self.copy_seconds, 3),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+            "index_seconds": round(self.index_seconds, 3),
+            "deferred_indexes": list(self.deferred_indexes),
+        }
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """metadata['last_modified'] as a timestamptz value (None if absent or unparsable)."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str):
+        try:
+            return _parse_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return None
+    return None
+
+
+def chunk_record(chunk: CodeChunkCreate, indexed_at: datetime) -> Tuple[Any, ...]:
+    """One COPY record in COPY_COLUMNS order (same values as add_batch)."""
+    chunk.validate_embedding_dimensions()
+    chunk_type = chunk.chunk_type.value if hasattr(chunk.chunk_type, "value") else chunk.chunk_type
+    return (
+        uuid.uuid4(),
+        chunk.file_path,
+        chunk.language,
+        chunk_type,
+        chunk.name,
+        chunk.name_path,
+        chunk.source_code,
+        chunk.start_line,
+        chunk.end_line,
+        chunk.embedding_text,
+        chunk.embedding_code,
+        chunk.embedding_text,  # halfvec copies (the sync trigger casts the same values)
+        chunk.embedding_code,
+        json.dumps(chunk.metadata),
+        indexed_at,
+        _parse_timestamp(chunk.metadata.get("last_modified")),
+        None,
+        chunk.repository,
+        chunk.commit_hash,
+    )
+
+
+class CodeChunkBulkLoader:
+    """Streams code chunks into code_chunks with binary COPY."""
+
+    def __init__(
+        self,
+        dsn: str,
+        flush_size: Optional[int] = None,
+        defer_indexes: Optional[bool] = None,
+        maintenance: Optional[HnswIndexMaintenance] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            dsn: PostgreSQL DSN (postgresql://...)
+            flush_size: Chunks per COPY (CODE_BULK_LOAD_FLUSH_SIZE)
+            defer_indexes: Drop the HNSW indexes for the load and rebuild them
+                after: True = from the start, None = once the load reaches the
+                row threshold, False = never
+            maintenance: Index builder (build settings, row threshold)
+        """
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.flush_size = max(1, flush_size or int(os.getenv("CODE_BULK_LOAD_FLUSH_SIZE", "5000")))
+        self.defer_indexes = defer_indexes
+        self.maintenance = maintenance or HnswIndexMaintenance(self.dsn)
+
+        self.stats = BulkLoadStats()
+        self._conn: Optional[asyncpg.Connection] = None
+        self._buffer: List[Tuple[Any, ...]] = []
+        self._deferred: List[HnswIndex] = []
+
+    @classmethod
+    def from_engine(cls, engine: AsyncEngine, **kwargs) -> "CodeChunkBulkLoader":
+        """Loader connecting to the same database as a SQLAlchemy engine."""
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        return cls(dsn, **kwargs)
+
+    async def __aenter__(self) -> "CodeChunkBulkLoader":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close(flush=exc_type is None)
+
+    async def open(self) -> None:
+        """Connect, register the vector codecs and drop the HNSW indexes if deferred."""
+        self._conn = await asyncpg.connect(self.dsn)
+        await register_vector(self._conn)
+        if self.defer_indexes is True:
+            try:
+                await self._drop_hnsw_indexes()
+            except Exception:
+                await self.close(flush=False)  # recreates whatever was dropped
+                raise
+
+    def buffer(self, chunks: Iterable[CodeChunkCreate]) -> int:
+        """Convert and buffer chunks (typically one file's) without writing them."""
+        indexed_at = datetime.now(timezone.utc)
+        records = [chunk_record(chunk, indexed_at) for chunk in chunks]
+        self._buffer.extend(records)
+        return len(records)
+
+    @property
+    def full(self) -> bool:
+        return len(self._buffer) >= self.flush_size
+
+    async def add(self, chunks: Iterable[CodeChunkCreate]) -> int:
+        """Buffer chunks; COPY when the buffer is full."""
+        added = self.buffer(chunks)
+        if self.full:
+            await self.flush()
+        return added
+
+    async def flush(self) -> int:
+        """COPY the buffered chunks."""
+        if not self._buffer:
+            return 0
+        records, self._buffer = self._buffer, []
+        if (self.defer_indexes is None and not self._deferred
+                and self.maintenance.should_defer(self.stats.chunks + len(records))):
+            self.defer_indexes = True
+            await self._drop_hnsw_indexes()
+        start = time.perf_counter()
+        await self._conn.copy_records_to_table(
+            "code_chunks", records=records, columns=list(COPY_COLUMNS)
+        )
+        self.stats.copy_seconds += time.perf_counter() - start
+        self.stats.chunks += len(records)
+        self.stats.copies += 1
+        logger.debug("code_bulk_load.copied", chunks=len(records), total=self.stats.chunks,
+                     chunks_per_second=round(self.stats.chunks_per_second, 1))
+        return len(records)
+
+    async def close(self, flush: bool = True) -> BulkLoadStats:
+        """Flush (unless aborting), rebuild deferred indexes and disconnect."""
+        if self._conn is None:
+            return self.stats
+        try:
+            if flush:
+                await self.flush()
+            else:
+                self._buffer = []
+        finally:
+            try:
+                # Rebuild even after a failed load: the indexes serve every repository
+                if self._deferred:
+                    await self._rebuild_indexes()
+            finally:
+                await self._conn.close()
+                self._conn = None
+
+        logger.info("code_bulk_load.finished", **self.stats.to_dict())
+        return self.stats
+
+    async def _drop_hnsw_indexes(self) -> None:
+        for index in await self.maintenance.list_indexes("code_chunks", conn=self._conn):
+            await self.maintenance.drop_index(index, conn=self._conn)
+            self._deferred.append(index)
+            self.stats.deferred_indexes.append(index.name)
+
+    async def _rebuild_indexes(self) -> None:
+        start = time.perf_counter()
+        indexes, self._deferred = self._deferred, []
+        await self.maintenance.build(indexes, operation="bulk_load", conn=self._conn)
+        self.stats.index_seconds = time.perf_counter() - start
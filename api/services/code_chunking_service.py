@@ -21,6 +21,7 @@ from tree_sitter_language_pack import get_language, get_parser
 from api.models.code_chunk_models import ChunkType, CodeChunk, CodeUnit
 from utils.timeout import with_timeout, TimeoutError
 from config.timeouts import get_timeout
+from services.resource_scheduler import get_resource_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -377,6 +378,23 @@ class CodeChunkingService:
 
         return self._parsers[language]
 
+    async def _parse_in_slot(self, parser: LanguageParser, source_code: str, context: dict) -> Tree:
+        """
+        Parse in the thread pool while holding an executor slot (interactive work first).
+
+        The tree_sitter_parse timeout starts once the slot is held: waiting
+        behind other parses is not counted against it.
+        """
+        async with get_resource_scheduler().slot("executor"):
+            loop = asyncio.get_running_loop()
+            return await with_timeout(
+                loop.run_in_executor(self._executor, parser.parse, source_code),
+                timeout=get_timeout("tree_sitter_parse"),
+                operation_name="tree_sitter_parse",
+                context=context,
+                raise_on_timeout=True
+            )
+
     async def chunk_code(
         self,
         source_code: str,
@@ -428,19 +446,8 @@ class CodeChunkingService:
         try:
             # Parse in thread pool (CPU-bound operation) with timeout protection
             # EPIC-12 Story 12.1: Prevent infinite hangs on pathological input
-            loop = asyncio.get_event_loop()
-            parse_coro = loop.run_in_executor(
-                self._executor,
-                parser.parse,
-                source_code
-            )
-
-            tree = await with_timeout(
-                parse_coro,
-                timeout=get_timeout("tree_sitter_parse"),
-                operation_name="tree_sitter_parse",
-                context={"file_path": file_path, "language": language},
-                raise_on_timeout=True
+            tree = await self._parse_in_slot(
+                parser, source_code, context={"file_path": file_path, "language": language}
             )
 
             # EPIC-29: Handle config files (light extraction)
@@ -519,12 +526,14 @@ class CodeChunkingService:
         EPIC-25 Story 25.5: Python metadata extraction for graph relations.
 
         For TypeScript/JavaScript chunks:
-        - Extracts imports (file-level, from tree)
-        - Extracts calls (chunk-level, from node)
+        - Extracts imports (file-level, from tree, once per file)
+        - Extracts calls (chunk-level, from the chunk's node)
 
         For Python chunks:
         - Uses ast module instead of tree-sitter
         - Extracts calls, imports, docstrings, complexity
+        - One parse + one traversal per file (PythonModuleIndex); chunks are
+          matched to definitions by name and line range
 
         Args:
             chunks: List of chunks to populate with metadata
@@ -539,78 +548,45 @@ class CodeChunkingService:
 
         logger.debug(f"Extracting metadata for {len(chunks)} {language} chunks")
 
-        # EPIC-25: For Python, parse with ast module instead of tree-sitter
+        # EPIC-25: For Python, use the ast module instead of tree-sitter.
+        # One parse + one traversal for all chunks of the file.
         if language.lower() == "python":
-            import ast as python_ast
             try:
-                python_tree = python_ast.parse(source_code)
+                python_metadata = await self._metadata_service.extract_python_chunks_metadata(
+                    source_code, chunks
+                )
             except SyntaxError as e:
                 logger.warning(f"Failed to parse Python source with ast: {e}")
                 # Fallback: set empty metadata for all chunks
                 for chunk in chunks:
                     chunk.metadata = {"imports": [], "calls": []}
                 return
-        else:
-            python_tree = None
 
-        for chunk in chunks:
-            try:
-                # EPIC-25: For Python, find the ast.FunctionDef/ClassDef node for this chunk
-                if language.lower() == "python" and python_tree:
-                    # Find the ast node corresponding to this chunk
-                    # Simple approach: walk ast and match by name
-                    import ast as python_ast
-                    ast_node = None
-                    for node in python_ast.walk(python_tree):
-                        if isinstance(node, (python_ast.FunctionDef, python_ast.AsyncFunctionDef, python_ast.ClassDef)):
-                            if node.name == chunk.name:
-                                ast_node = node
-                                break
-
-                    if not ast_node:
-                        logger.debug(f"Could not find ast node for chunk '{chunk.name}', using tree root")
-                        ast_node = python_tree
-
-                    # EPIC-28: Extract metadata using FULL file source (not chunk source!)
-                    # This ensures byte offsets are correct for ast.get_source_segment()
-                    metadata = await self._metadata_service.extract_metadata(
-                        source_code=source_code,  # FULL file source
-                        node=ast_node,
-                        tree=python_tree,
-                        language=language
-                    )
-                else:
-                    # For TypeScript/JavaScript, use tree-sitter nodes
-                    # Find the tree-sitter node corresponding to this chunk's line range
-                    # For now, use the root node (will extract file-level imports + all calls)
-                    # TODO: Optimize by finding exact node for chunk (performance improvement)
-                    node = tree.root_node
-
-                    # EPIC-28: Extract metadata using FULL file source (not chunk source!)
-                    # This ensures tree-sitter byte offsets are correct
-                    metadata = await self._metadata_service.extract_metadata(
-                        source_code=source_code,  # FULL file source
-                        node=node,
-                        tree=tree,
-                        language=language
-                    )
-
-                # Assign metadata to chunk
+            for chunk, metadata in zip(chunks, python_metadata):
                 chunk.metadata = metadata
 
-                logger.debug(
-                    f"Extracted metadata for chunk '{chunk.name}': "
-                    f"{len(metadata.get('imports', []))} imports, "
-                    f"{len(metadata.get('calls', []))} calls"
-                )
+            logger.info(f"Metadata extraction complete for {len(chunks)} chunks ({language})")
+            return
 
-            except Exception as e:
-                # Graceful degradation: log error but continue with empty metadata
-                logger.warning(
-                    f"Failed to extract metadata for chunk '{chunk.name}': {e}",
-                    exc_info=True
-                )
-                chunk.metadata = {"imports": [], "calls": []}
+        # EPIC-26: TypeScript/JavaScript - imports once per file, calls and
+        # complexity from each chunk's own subtree (mapped by byte range).
+        # EPIC-28: FULL file source (not chunk source!) so tree-sitter byte
+        # offsets are correct.
+        try:
+            chunk_metadata = await self._metadata_service.extract_typescript_chunks_metadata(
+                source_code, tree, chunks, language
+            )
+        except Exception as e:
+            # Graceful degradation: log error but continue with empty metadata
+            logger.warning(f"Failed to extract {language} metadata: {e}", exc_info=True)
+            chunk_metadata = [{"imports": [], "calls": []} for _ in chunks]
+        for chunk, metadata in zip(chunks, chunk_metadata):
+            chunk.metadata = metadata
+            logger.debug(
+                f"Extracted metadata for chunk '{chunk.name}': "
+                f"{len(metadata.get('imports', []))} imports, "
+                f"{len(metadata.get('calls', []))} calls"
+            )
 
         logger.info(
             f"Metadata extraction complete for {len(chunks)} chunks "
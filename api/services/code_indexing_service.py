@@ -19,17 +19,46 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from db.repositories.code_chunk_repository import CodeChunkRepository
 from models.code_chunk_models import ChunkType, CodeChunk, CodeChunkCreate
 from services.caches.cascade_cache import CascadeCache
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
 from services.code_chunking_service import CodeChunkingService
 from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
 from services.graph_construction_service import GraphConstructionService
 from services.lsp.type_extractor import TypeExtractorService  # EPIC-13 Story 13.2
+from services.lsp.lsp_process_pool import lsp_workspace_affinity
 from services.metadata_extractor_service import MetadataExtractorService
+from services.repository_stats_service import RepositoryStatsService
+from services.resource_scheduler import background_work, get_resource_scheduler
 from services.symbol_path_service import SymbolPathService  # EPIC-11
 from utils.timeout import with_timeout, TimeoutError
 from config.timeouts import get_timeout
 
 logger = logging.getLogger(__name__)
 
+# Language names of the chunking service per file extension
+LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".md": "markdown",
+}
+
 
 @dataclass
 class FileInput:
@@ -111,6 +140,8 @@ class CodeIndexingService:
         chunk_cache: Optional[CascadeCache] = None,
         symbol_path_service: Optional[SymbolPathService] = None,  # EPIC-11
         type_extractor: Optional[TypeExtractorService] = None,  # EPIC-13 Story 13.2
+        generations: Optional[RepositoryGenerations] = None,
+        repository_stats: Optional[RepositoryStatsService] = None,
     ):
         """
         Initialize CodeIndexingService with all required dependencies.
@@ -125,6 +156,10 @@ class CodeIndexingService:
             chunk_cache: Optional L1/L2 cascade cache for code chunks (Story 10.3)
             symbol_path_service: Optional service for generating hierarchical name_path (EPIC-11)
             type_extractor: Optional service for extracting type info via LSP (EPIC-13 Story 13.2)
+            generations: Optional repository generation counters, bumped after
+                         indexing to invalidate cached searches (process-wide default)
+            repository_stats: Optional materialised dashboard statistics,
+                              refreshed for the indexed repository
         """
         self.engine = engine
         self.chunking_service = chunking_service
@@ -135,6 +170,8 @@ class CodeIndexingService:
         self.chunk_cache = chunk_cache  # CascadeCache from dependencies.py
         self.symbol_path_service = symbol_path_service or SymbolPathService()  # EPIC-11
         self.type_extractor = type_extractor  # EPIC-13: Optional LSP type extraction
+        self.generations = generations or get_repository_generations()
+        self.repository_stats = repository_stats or RepositoryStatsService(engine)
 
         self.logger = logging.getLogger(__name__)
         self.logger.info(
@@ -162,6 +199,16 @@ class CodeIndexingService:
         Returns:
             IndexingSummary with statistics and errors
         """
+        # Indexing yields embedding/DB/executor slots to search and write_memory
+        with background_work():
+            return await self._index_files(files, options, progress_callback)
+
+    async def _index_files(
+        self,
+        files: List[FileInput],
+        options: IndexingOptions,
+        progress_callback: Optional[Callable[[int, int, str], Awaitable[None]]] = None,
+    ) -> IndexingSummary:
         start_time = datetime.now()
 
         # Statistics tracking
@@ -232,6 +279,12 @@ class CodeIndexingService:
                     exc_info=True,
                 )
 
+        # New chunks are visible to searches: invalidate cached results
+        # (search/graph/chunk cache keys embed the repository generation)
+        if indexed_files or failed_files:
+            await self.generations.bump(options.repository)
+            await self.repository_stats.refresh_chunks(options.repository, [f.path for f in files])
+
         # Build graph for entire repository (if enabled)
         indexed_nodes = 0
         indexed_edges = 0
@@ -420,24 +473,29 @@ class CodeIndexingService:
                     f"Extracting LSP type metadata for {len(chunks)} chunks in {file_input.path}"
                 )
 
-                for chunk in chunks:
-                    try:
-                        # EPIC-12 Story 12.1: Timeout protection for LSP queries
-                        type_metadata = await with_timeout(
-                            self.type_extractor.extract_type_metadata(
+                # One document open + pipelined hovers for the whole file
+                # (per-hover timeout 3s; the file gets a bounded overall budget)
+                try:
+                    # EPIC-12 Story 12.1: Timeout protection for LSP queries
+                    # Pooled LSP servers: same repository -> same server when possible
+                    with lsp_workspace_affinity(options.repository):
+                        file_type_metadata = await with_timeout(
+                            self.type_extractor.extract_file_type_metadata(
                                 file_path=file_input.path,
                                 source_code=file_input.content,
-                                chunk=chunk
+                                chunks=chunks,
+                                hover_timeout=3.0
                             ),
-                            timeout=3.0,  # 3s per chunk (conservative)
+                            timeout=10.0,
                             operation_name="lsp_type_extraction",
                             context={
-                                "chunk_name": chunk.name,
+                                "chunk_count": len(chunks),
                                 "file_path": file_input.path
                             },
                             raise_on_timeout=False  # Graceful degradation on timeout
                         )
 
+                    for chunk, type_metadata in zip(chunks, file_type_metadata or []):
                         # Merge LSP metadata with existing tree-sitter metadata
                         if type_metadata and any(type_metadata.values()):
                             # Only merge if we got actual type info
@@ -448,19 +506,17 @@ class CodeIndexingService:
                                 f"return_type={type_metadata.get('return_type')}"
                             )
 
-                    except TimeoutError:
-                        # Timeout extracting types - skip this chunk (graceful degradation)
-                        self.logger.warning(
-                            f"LSP type extraction timed out for {chunk.name} in {file_input.path}"
-                        )
-                        continue
+                except TimeoutError:
+                    # Timeout extracting types - keep tree-sitter metadata only
+                    self.logger.warning(
+                        f"LSP type extraction timed out for {file_input.path}"
+                    )
 
-                    except Exception as e:
-                        # Unexpected error - skip this chunk (never crash indexing)
-                        self.logger.warning(
-                            f"LSP type extraction failed for {chunk.name}: {e}"
-                        )
-                        continue
+                except Exception as e:
+                    # Unexpected error - never crash indexing
+                    self.logger.warning(
+                        f"LSP type extraction failed for {file_input.path}: {e}"
+                    )
 
             # Step 4: Generate embeddings (if enabled) - USE BATCH PROCESSING
             # PHASE 1 OPTIMIZATION: Generate TEXT OR CODE (not both) based on chunk characteristics
@@ -604,8 +660,9 @@ class CodeIndexingService:
             # Cache is only populated after successful transaction commit
             if chunks_to_insert:
                 try:
-                    # Use transaction for atomic batch insert
-                    async with self.engine.begin() as conn:
+                    # Use transaction for atomic batch insert; background
+                    # writes share a capped number of pool connections
+                    async with get_resource_scheduler().slot("db"), self.engine.begin() as conn:
                         self.logger.info(
                             f"💾 EPIC-12: Batch inserting {len(chunks_to_insert)} chunks in transaction "
                             f"(atomic all-or-nothing operation)"
@@ -848,31 +905,7 @@ class CodeIndexingService:
         Returns:
             Language name ('python', 'javascript', etc.) or None
         """
-        extension_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".jsx": "javascript",
-            ".tsx": "typescript",
-            ".go": "go",
-            ".rs": "rust",
-            ".java": "java",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".cc": "cpp",
-            ".cxx": "cpp",
-            ".h": "c",
-            ".hpp": "cpp",
-            ".rb": "ruby",
-            ".php": "php",
-            ".cs": "csharp",
-            ".swift": "swift",
-            ".kt": "kotlin",
-            ".scala": "scala",
-            ".md": "markdown",
-        }
-
         # Extract extension
         _, ext = os.path.splitext(file_path)
 
-        return extension_map.get(ext.lower())
+        return LANGUAGE_BY_EXTENSION.get(ext.lower())
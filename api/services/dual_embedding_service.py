@@ -14,12 +14,23 @@ Features:
 
 EPIC-12 Story 12.1: Added timeout protection for embedding generation.
 EPIC-12 Story 12.3: Added circuit breaker to prevent fail-forever behavior.
+
+Inference backends (EMBEDDING_BACKEND, CPU hosts):
+- torch:       fp32 PyTorch (reference)
+- torch-int8:  torch dynamic int8 quantisation of nn.Linear layers
+- onnx:        ONNX Runtime fp32 (needs optimum[onnxruntime], sentence-transformers>=3.2)
+- onnx-int8:   ONNX Runtime with dynamic int8 quantisation; the quantised
+               export is cached under EMBEDDING_ONNX_CACHE_DIR
+All backends produce the same 768D vectors; BACKEND_COSINE_TOLERANCE is the
+minimum mean cosine to the torch output that
+scripts/benchmarks/embedding_backend_benchmark.py accepts. A backend that
+cannot be loaded falls back to torch with a warning.
 """
 
 import os
 import logging
 import asyncio
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
 from sentence_transformers import SentenceTransformer
@@ -38,9 +49,60 @@ from config.timeouts import get_timeout
 from utils.circuit_breaker import CircuitBreaker
 from config.circuit_breakers import EMBEDDING_CIRCUIT_CONFIG
 from utils.circuit_breaker_registry import register_circuit_breaker
+from services.resource_scheduler import get_resource_scheduler
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+# Minimum mean cosine similarity to the fp32 torch embeddings
+BACKEND_COSINE_TOLERANCE = {
+    "torch": 1.0,
+    "torch-int8": 0.98,
+    "onnx": 0.999,
+    "onnx-int8": 0.98,
+}
+
+
+def plan_token_batches(
+    lengths: List[int],
+    max_tokens: int,
+    max_batch_size: int = 128
+) -> List[List[int]]:
+    """
+    Group inputs into length-bucketed batches under a padded-token budget.
+
+    Inputs are sorted longest first and packed greedily: a batch holds as
+    many sequences as fit in `max_tokens` once padded to its longest
+    member (count × longest). A sequence longer than the budget gets a
+    batch of its own.
+
+    Args:
+        lengths: Token length of each input
+        max_tokens: Padded tokens allowed per batch
+        max_batch_size: Hard cap on sequences per batch
+
+    Returns:
+        Batches of indices into `lengths` (every index exactly once)
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for idx in order:
+        if current and (
+            len(current) >= max_batch_size
+            or (len(current) + 1) * longest > max_tokens
+        ):
+            batches.append(current)
+            current = []
+        if not current:
+            longest = max(lengths[idx], 1)
+        current.append(idx)
+    if current:
+        batches.append(current)
+    return batches
+
 
 class EmbeddingDomain(str, Enum):
     """
@@ -101,7 +163,8 @@ class DualEmbeddingService:
         code_model_name: Optional[str] = None,
         dimension: int = 768,
         device: str = "cpu",
-        cache_size: int = 1000
+        cache_size: int = 1000,
+        backend: Optional[str] = None
     ):
         """
         Initialize dual embedding service.
@@ -114,6 +177,8 @@ class DualEmbeddingService:
             dimension: Expected embedding dimension (must be 768)
             device: PyTorch device ('cpu', 'cuda', 'mps')
             cache_size: Not used (kept for backward compat)
+            backend: Inference backend, one of EMBEDDING_BACKENDS
+                     (default: EMBEDDING_BACKEND env or 'torch')
         """
         # EPIC-18 Fix: Check EMBEDDING_MODE to support mock mode
         self._embedding_mode = os.getenv("EMBEDDING_MODE", "real").lower()
@@ -130,6 +195,30 @@ class DualEmbeddingService:
         self.dimension = dimension
         self.device = device
 
+        self.backend = (backend or os.getenv("EMBEDDING_BACKEND", "torch")).lower()
+        if self.backend not in EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"Invalid EMBEDDING_BACKEND: '{self.backend}'. "
+                f"Must be one of {EMBEDDING_BACKENDS}."
+            )
+        if self.backend != "torch" and device != "cpu":
+            logger.warning(f"EMBEDDING_BACKEND={self.backend} is CPU-only; using torch on {device}")
+            self.backend = "torch"
+        self.onnx_cache_dir = os.getenv(
+            "EMBEDDING_ONNX_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "mnemolite", "onnx")
+        )
+        self.onnx_quantization = os.getenv("EMBEDDING_ONNX_QUANTIZATION", "avx2")
+        # Backend each loaded model actually runs on ("text"/"code"); differs
+        # from self.backend when the configured one could not be loaded
+        self.loaded_backends: Dict[str, str] = {}
+
+        # Token-budget batching for batch encodes (0 = single encode call)
+        self.max_batch_tokens = int(os.getenv("EMBEDDING_MAX_BATCH_TOKENS", "8192"))
+        self.max_batch_size = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "128"))
+        self._real_tokens = 0
+        self._padded_tokens = 0
+
         # Models (lazy loaded, EXCEPT in mock mode)
         self._text_model: Optional[SentenceTransformer] = None
         self._code_model: Optional[SentenceTransformer] = None
@@ -181,24 +270,95 @@ class DualEmbeddingService:
                     "text_model": self.text_model_name,
                     "code_model": self.code_model_name,
                     "dimension": dimension,
-                    "device": device
+                    "device": device,
+                    "backend": self.backend
                 }
             )
 
-    def _load_text_model_sync(self) -> SentenceTransformer:
+    def _build_model(self, model_name: str) -> Tuple[SentenceTransformer, str]:
         """
-        Synchronous text model loading (runs in executor).
+        Build a SentenceTransformer for the configured backend.
+
+        Falls back to fp32 torch (and logs why) if the backend cannot be
+        loaded, e.g. optimum/onnxruntime missing or ONNX export unsupported.
+        The configured backend is left as is, so the other model still
+        tries it.
+
+        Args:
+            model_name: Hugging Face model id or local path
 
         Returns:
-            Loaded SentenceTransformer model for text
+            (SentenceTransformer ready for encode(), backend it runs on)
         """
-        logger.info(f"Loading TEXT model: {self.text_model_name}")
+        if self.backend in ("onnx", "onnx-int8"):
+            try:
+                return self._build_onnx_model(model_name, quantized=self.backend == "onnx-int8"), self.backend
+            except Exception as e:
+                logger.warning(f"ONNX backend unavailable for {model_name}, falling back to torch: {e}")
+
         model = SentenceTransformer(
-            self.text_model_name,
+            model_name,
             device=self.device,
             trust_remote_code=True
         )
 
+        if self.backend == "torch-int8":
+            if TORCH_AVAILABLE and torch is not None:
+                # Linear layers dominate BERT-style encoders; weights become
+                # int8, activations are quantised per batch at runtime.
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                return model, "torch-int8"
+            logger.warning("torch not available, torch-int8 backend falls back to fp32")
+        return model, "torch"
+
+    def _build_onnx_model(self, model_name: str, quantized: bool) -> SentenceTransformer:
+        """
+        Load an ONNX Runtime model, exporting (and int8-quantising) it once.
+
+        The exported model is saved under EMBEDDING_ONNX_CACHE_DIR so later
+        processes load it directly instead of re-exporting.
+        """
+        export_dir = os.path.join(self.onnx_cache_dir, model_name.replace("/", "__"))
+        file_name = (
+            f"onnx/model_qint8_{self.onnx_quantization}.onnx" if quantized else "onnx/model.onnx"
+        )
+
+        if not os.path.exists(os.path.join(export_dir, file_name)):
+            logger.info(f"Exporting {model_name} to ONNX ({file_name}) in {export_dir}")
+            model = SentenceTransformer(
+                model_name,
+                device=self.device,
+                trust_remote_code=True,
+                backend="onnx"
+            )
+            model.save(export_dir)
+            if quantized:
+                from sentence_transformers import export_dynamic_quantized_onnx_model
+
+                export_dynamic_quantized_onnx_model(
+                    model, self.onnx_quantization, export_dir
+                )
+
+        return SentenceTransformer(
+            export_dir,
+            device=self.device,
+            trust_remote_code=True,
+            backend="onnx",
+            model_kwargs={"file_name": file_name}
+        )
+
+    def _load_text_model_sync(self) -> SentenceTransformer:
+        """
+        Synchronous text model loading (runs in executor).
+
+        Returns:
+            Loaded SentenceTransformer model for text
+        """
+        logger.info(f"Loading TEXT model: {self.text_model_name} (backend={self.backend})")
+        model, self.loaded_backends["text"] = self._build_model(self.text_model_name)
+
         # Validate dimension
         test_emb = model.encode("test")
         if len(test_emb) != self.dimension:
@@ -219,12 +379,8 @@ class DualEmbeddingService:
         Returns:
             Loaded SentenceTransformer model for code
         """
-        logger.info(f"Loading CODE model: {self.code_model_name}")
-        model = SentenceTransformer(
-            self.code_model_name,
-            device=self.device,
-            trust_remote_code=True
-        )
+        logger.info(f"Loading CODE model: {self.code_model_name} (backend={self.backend})")
+        model, self.loaded_backends["code"] = self._build_model(self.code_model_name)
 
         # Validate dimension
         test_emb = model.encode("def test(): pass")
@@ -239,6 +395,28 @@ class DualEmbeddingService:
         )
         return model
 
+    async def _encode_in_slot(self, encode_fn, *args, timeout: float, operation_name: str, context: dict):
+        """
+        Run an encode call in the default executor while holding an embedding slot.
+
+        Interactive callers (search, write_memory) get a free slot before
+        background indexing batches (see services/resource_scheduler.py).
+        The timeout starts once the slot is held: waiting behind other
+        encodes is not counted against it.
+
+        Raises:
+            TimeoutError: If the encode call exceeds `timeout`
+        """
+        async with get_resource_scheduler().slot("embedding"):
+            loop = asyncio.get_running_loop()
+            return await with_timeout(
+                loop.run_in_executor(None, encode_fn, *args),
+                timeout=timeout,
+                operation_name=operation_name,
+                context=context,
+                raise_on_timeout=True
+            )
+
     def _encode_single_with_no_grad(self, model: SentenceTransformer, text: str):
         """
         Encode single text with torch.no_grad() to prevent memory accumulation.
@@ -276,22 +454,22 @@ class DualEmbeddingService:
         Encode batch of texts with torch.no_grad() to prevent memory accumulation.
 
         Critical for large batches where memory can accumulate significantly.
+        Inputs are grouped by token length into batches under
+        EMBEDDING_MAX_BATCH_TOKENS padded tokens (see plan_token_batches),
+        so short chunks are not padded to the longest class in the list;
+        rows are returned in input order.
 
         Args:
             model: Loaded SentenceTransformer model
             texts: List of texts/code to encode
-            show_progress_bar: Show tqdm progress bar
+            show_progress_bar: Show tqdm progress bar (single-call path only)
 
         Returns:
             Embedding matrix (numpy array)
         """
         if TORCH_AVAILABLE and torch is not None:
             with torch.no_grad():
-                embeddings = model.encode(
-                    texts,
-                    show_progress_bar=show_progress_bar,
-                    convert_to_numpy=True
-                )
+                embeddings = self._encode_token_batches(model, texts, show_progress_bar)
 
             # Clear CUDA cache if using GPU
             if torch.cuda.is_available():
@@ -300,12 +478,55 @@ class DualEmbeddingService:
             return embeddings
         else:
             # Fallback without torch.no_grad()
+            return self._encode_token_batches(model, texts, show_progress_bar)
+
+    def _token_lengths(self, model: SentenceTransformer, texts: List[str]) -> Optional[List[int]]:
+        """Token count per text (truncated to the model's max length), None if unknown."""
+        try:
+            encoded = model.tokenizer(
+                texts,
+                add_special_tokens=True,
+                truncation=True,
+                max_length=model.max_seq_length,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )
+            return [len(ids) for ids in encoded["input_ids"]]
+        except Exception:
+            return None
+
+    def _encode_token_batches(
+        self,
+        model: SentenceTransformer,
+        texts: List[str],
+        show_progress_bar: bool
+    ):
+        """Encode texts in token-budget batches and restore the input order."""
+        lengths = self._token_lengths(model, texts) if self.max_batch_tokens > 0 and len(texts) > 1 else None
+        if lengths is None:
             return model.encode(
                 texts,
                 show_progress_bar=show_progress_bar,
                 convert_to_numpy=True
             )
 
+        embeddings = None
+        for batch in plan_token_batches(lengths, self.max_batch_tokens, self.max_batch_size):
+            vectors = model.encode(
+                [texts[i] for i in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+                convert_to_numpy=True
+            )
+            if embeddings is None:
+                embeddings = np.empty((len(texts), vectors.shape[1]), dtype=vectors.dtype)
+            embeddings[batch] = vectors
+
+            self._real_tokens += sum(lengths[i] for i in batch)
+            self._padded_tokens += len(batch) * max(lengths[i] for i in batch)
+
+        return embeddings
+
     async def _ensure_text_model(self):
         """
         Load text model if not already loaded (thread-safe with double-checked locking).
@@ -571,21 +792,14 @@ class DualEmbeddingService:
             # EPIC-12 Story 12.1: Prevent infinite hangs on large/pathological inputs
             await self._ensure_text_model()
 
-            loop = asyncio.get_running_loop()
-            encode_coro = loop.run_in_executor(
-                None,
-                self._encode_single_with_no_grad,
-                self._text_model,
-                text
-            )
-
             try:
-                text_emb = await with_timeout(
-                    encode_coro,
+                text_emb = await self._encode_in_slot(
+                    self._encode_single_with_no_grad,
+                    self._text_model,
+                    text,
                     timeout=get_timeout("embedding_generation_single"),
                     operation_name="embedding_generation_text_single",
-                    context={"domain": "text", "text_length": len(text)},
-                    raise_on_timeout=True
+                    context={"domain": "text", "text_length": len(text)}
                 )
                 result['text'] = text_emb.tolist()
 
@@ -601,21 +815,14 @@ class DualEmbeddingService:
             # EPIC-12 Story 12.1: Prevent infinite hangs on large/pathological inputs
             await self._ensure_code_model()
 
-            loop = asyncio.get_running_loop()
-            encode_coro = loop.run_in_executor(
-                None,
-                self._encode_single_with_no_grad,
-                self._code_model,
-                text
-            )
-
             try:
-                code_emb = await with_timeout(
-                    encode_coro,
+                code_emb = await self._encode_in_slot(
+                    self._encode_single_with_no_grad,
+                    self._code_model,
+                    text,
                     timeout=get_timeout("embedding_generation_single"),
                     operation_name="embedding_generation_code_single",
-                    context={"domain": "code", "text_length": len(text)},
-                    raise_on_timeout=True
+                    context={"domain": "code", "text_length": len(text)}
                 )
                 result['code'] = code_emb.tolist()
 
@@ -717,22 +924,15 @@ class DualEmbeddingService:
             # EPIC-12 Story 12.1: Prevent infinite hangs on large batches
             await self._ensure_text_model()
 
-            loop = asyncio.get_running_loop()
-            encode_coro = loop.run_in_executor(
-                None,
-                self._encode_batch_with_no_grad,
-                self._text_model,
-                valid_texts,
-                show_progress_bar
-            )
-
             try:
-                text_embeddings = await with_timeout(
-                    encode_coro,
+                text_embeddings = await self._encode_in_slot(
+                    self._encode_batch_with_no_grad,
+                    self._text_model,
+                    valid_texts,
+                    show_progress_bar,
                     timeout=get_timeout("embedding_generation_batch"),
                     operation_name="embedding_generation_text_batch",
-                    context={"domain": "text", "batch_size": len(valid_texts)},
-                    raise_on_timeout=True
+                    context={"domain": "text", "batch_size": len(valid_texts)}
                 )
 
             except TimeoutError as e:
@@ -753,22 +953,15 @@ class DualEmbeddingService:
             # EPIC-12 Story 12.1: Prevent infinite hangs on large batches
             await self._ensure_code_model()
 
-            loop = asyncio.get_running_loop()
-            encode_coro = loop.run_in_executor(
-                None,
-                self._encode_batch_with_no_grad,
-                self._code_model,
-                valid_texts,
-                show_progress_bar
-            )
-
             try:
-                code_embeddings = await with_timeout(
-                    encode_coro,
+                code_embeddings = await self._encode_in_slot(
+                    self._encode_batch_with_no_grad,
+                    self._code_model,
+                    valid_texts,
+                    show_progress_bar,
                     timeout=get_timeout("embedding_generation_batch"),
                     operation_name="embedding_generation_code_batch",
-                    context={"domain": "code", "batch_size": len(valid_texts)},
-                    raise_on_timeout=True
+                    context={"domain": "code", "batch_size": len(valid_texts)}
                 )
 
             except TimeoutError as e:
@@ -902,6 +1095,12 @@ class DualEmbeddingService:
             "code_model_name": self.code_model_name,
             "dimension": self.dimension,
             "device": self.device,
+            "backend": self.backend,
+            "loaded_backends": dict(self.loaded_backends),
+            "max_batch_tokens": self.max_batch_tokens,
+            "padding_efficiency": (
+                round(self._real_tokens / self._padded_tokens, 4) if self._padded_tokens else None
+            ),
             "text_model_loaded": self._text_model is not None,
             "code_model_loaded": self._code_model is not None,
             **ram_usage
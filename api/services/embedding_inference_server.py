@@ -0,0 +1,336 @@
+"""
+Embedding inference sidecar - one model copy shared by every component.
+
+The API, the batch indexing subprocesses and the indexing scripts each
+load their own DualEmbeddingService (~700 MB for nomic + jina) and pay
+their own cold start. This module serves one DualEmbeddingService over
+localhost HTTP or a Unix socket; components use RemoteDualEmbeddingService
+(services/remote_embedding_service.py) instead of loading models.
+
+Scheduling:
+- Priority lanes: "interactive" (search queries) is always served before
+  "bulk" (indexing). Bulk requests are split into slices of at most
+  max_batch_texts, so an interactive query waits for at most one slice.
+- Dynamic batching: requests of the same lane and domain are coalesced
+  into one encode call, up to max_batch_texts texts. The scheduler waits
+  up to max_wait_ms for more requests when a batch is not full.
+
+Endpoints:
+    POST /embed     {"texts": [...], "domain": "text|code|hybrid", "priority": "interactive|bulk"}
+                    header X-Embedding-Client: <client name> (per-client metrics)
+    GET  /health    readiness
+    GET  /metrics   per-client and per-lane throughput, queue depths
+
+Run (Docker Compose service "embeddings", or locally):
+    python -m services.embedding_inference_server
+    EMBEDDING_SIDECAR_SOCKET=/tmp/mnemo-embed.sock python -m services.embedding_inference_server
+
+Tests drive create_app() through httpx.ASGITransport with EMBEDDING_MODE=mock.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import structlog
+from fastapi import FastAPI, Header, HTTPException
+from pydantic import BaseModel, Field
+
+from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
+
+logger = structlog.get_logger(__name__)
+
+PRIORITIES = ("interactive", "bulk")
+
+
+@dataclass
+class _EmbedSlice:
+    """Part of a client request waiting in a lane."""
+
+    texts: List[str]
+    domain: EmbeddingDomain
+    client: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _ClientMetrics:
+    requests: int = 0
+    texts: int = 0
+    errors: int = 0
+    queue_wait_ms: float = 0.0
+    inference_ms: float = 0.0
+    first_seen: float = field(default_factory=time.monotonic)
+
+
+class EmbeddingBatchScheduler:
+    """Priority-lane, dynamic-batching front of a DualEmbeddingService."""
+
+    def __init__(
+        self,
+        service: DualEmbeddingService,
+        max_batch_texts: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            service: The single embedding service (model copy) to serve
+            max_batch_texts: Texts per encode call (EMBEDDING_SIDECAR_MAX_BATCH)
+            max_wait_ms: Coalescing window (EMBEDDING_SIDECAR_MAX_WAIT_MS)
+        """
+        self.service = service
+        self.max_batch_texts = max_batch_texts or int(os.getenv("EMBEDDING_SIDECAR_MAX_BATCH", "64"))
+        self.max_wait_ms = (
+            max_wait_ms if max_wait_ms is not None
+            else float(os.getenv("EMBEDDING_SIDECAR_MAX_WAIT_MS", "5"))
+        )
+
+        self._lanes: Dict[str, Deque[_EmbedSlice]] = {p: deque() for p in PRIORITIES}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.clients: Dict[str, _ClientMetrics] = {}
+        self.lane_batches: Dict[str, int] = {p: 0 for p in PRIORITIES}
+        self.lane_texts: Dict[str, int] = {p: 0 for p in PRIORITIES}
+
+    def _ensure_started(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(
+        self,
+        texts: List[str],
+        domain: EmbeddingDomain = EmbeddingDomain.TEXT,
+        priority: str = "interactive",
+        client: str = "anonymous",
+    ) -> List[Dict[str, List[float]]]:
+        """
+        Embed texts through the shared model.
+
+        Returns:
+            One {"text": [...]} / {"code": [...]} dict per text, as
+            DualEmbeddingService.generate_embeddings_batch returns
+
+        Raises:
+            ValueError: If priority is unknown
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {PRIORITIES}, got {priority!r}")
+        if not texts:
+            return []
+
+        self._ensure_started()
+        metrics = self.clients.setdefault(client, _ClientMetrics())
+        metrics.requests += 1
+
+        loop = asyncio.get_running_loop()
+        slices = []
+        for start in range(0, len(texts), self.max_batch_texts):
+            piece = _EmbedSlice(
+                texts=texts[start:start + self.max_batch_texts],
+                domain=domain,
+                client=client,
+                future=loop.create_future(),
+            )
+            self._lanes[priority].append(piece)
+            slices.append(piece)
+        self._wakeup.set()
+
+        try:
+            parts = await asyncio.gather(*(s.future for s in slices))
+        except Exception:
+            metrics.errors += 1
+            raise
+        metrics.texts += len(texts)
+        return [embedding for part in parts for embedding in part]
+
+    def _take_batch(self) -> Optional[tuple]:
+        """Pop the next batch: highest lane first, same domain as its head."""
+        for priority in PRIORITIES:
+            lane = self._lanes[priority]
+            if not lane:
+                continue
+            domain = lane[0].domain
+            batch: List[_EmbedSlice] = []
+            count = 0
+            for piece in list(lane):
+                if piece.domain != domain:
+                    continue
+                if batch and count + len(piece.texts) > self.max_batch_texts:
+                    break
+                batch.append(piece)
+                count += len(piece.texts)
+            for piece in batch:
+                lane.remove(piece)
+            return priority, domain, batch
+        return None
+
+    def _pending_texts(self) -> int:
+        return sum(len(p.texts) for lane in self._lanes.values() for p in lane)
+
+    async def _run(self) -> None:
+        """Scheduler loop: one encode call at a time (single model copy)."""
+        while True:
+            if not any(self._lanes.values()):
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            # Coalescing window when there is not yet a full batch
+            if self.max_wait_ms > 0 and self._pending_texts() < self.max_batch_texts:
+                await asyncio.sleep(self.max_wait_ms / 1000)
+
+            taken = self._take_batch()
+            if taken is None:
+                continue
+            priority, domain, batch = taken
+            await self._encode(priority, domain, batch)
+
+    async def _encode(self, priority: str, domain: EmbeddingDomain, batch: List[_EmbedSlice]) -> None:
+        texts = [text for piece in batch for text in piece.texts]
+        started = time.perf_counter()
+        try:
+            embeddings = await self.service.generate_embeddings_batch(
+                texts, domain=domain, show_progress_bar=False
+            )
+        except Exception as e:
+            logger.error("embedding_sidecar.batch_failed", error=str(e), batch_size=len(texts))
+            for piece in batch:
+                if not piece.future.done():
+                    piece.future.set_exception(e)
+            return
+
+        inference_ms = (time.perf_counter() - started) * 1000
+        self.lane_batches[priority] += 1
+        self.lane_texts[priority] += len(texts)
+
+        offset = 0
+        for piece in batch:
+            metrics = self.clients.setdefault(piece.client, _ClientMetrics())
+            metrics.queue_wait_ms += (started - piece.enqueued_at) * 1000
+            metrics.inference_ms += inference_ms * len(piece.texts) / len(texts)
+            if not piece.future.done():
+                piece.future.set_result(embeddings[offset:offset + len(piece.texts)])
+            offset += len(piece.texts)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-client and per-lane counters."""
+        now = time.monotonic()
+        return {
+            "queue_depth": {p: sum(len(s.texts) for s in lane) for p, lane in self._lanes.items()},
+            "lanes": {
+                p: {
+                    "batches": self.lane_batches[p],
+                    "texts": self.lane_texts[p],
+                    "avg_batch_size": (
+                        round(self.lane_texts[p] / self.lane_batches[p], 2) if self.lane_batches[p] else 0.0
+                    ),
+                }
+                for p in PRIORITIES
+            },
+            "clients": {
+                name: {
+                    "requests": m.requests,
+                    "texts": m.texts,
+                    "errors": m.errors,
+                    "texts_per_second": round(m.texts / max(now - m.first_seen, 1e-3), 2),
+                    "avg_queue_wait_ms": round(m.queue_wait_ms / m.requests, 2) if m.requests else 0.0,
+                    "inference_ms": round(m.inference_ms, 2),
+                }
+                for name, m in self.clients.items()
+            },
+            "max_batch_texts": self.max_batch_texts,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+
+class EmbedRequest(BaseModel):
+    texts: List[str] = Field(..., description="Texts to embed")
+    domain: EmbeddingDomain = Field(EmbeddingDomain.TEXT, description="text | code | hybrid")
+    priority: str = Field("interactive", description="interactive | bulk")
+
+
+class EmbedResponse(BaseModel):
+    embeddings: List[Dict[str, List[float]]]
+
+
+def create_app(scheduler: EmbeddingBatchScheduler) -> FastAPI:
+    """Build the sidecar ASGI app around a scheduler."""
+    app = FastAPI(title="MnemoLite embedding inference sidecar")
+
+    @app.post("/embed", response_model=EmbedResponse)
+    async def embed(
+        request: EmbedRequest,
+        x_embedding_client: str = Header("anonymous"),
+    ) -> EmbedResponse:
+        if request.priority not in PRIORITIES:
+            raise HTTPException(status_code=422, detail=f"priority must be one of {PRIORITIES}")
+        try:
+            embeddings = await scheduler.submit(
+                request.texts,
+                domain=request.domain,
+                priority=request.priority,
+                client=x_embedding_client,
+            )
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"Embedding failed: {e}")
+        return EmbedResponse(embeddings=embeddings)
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "healthy", **scheduler.service.get_stats()}
+
+    @app.get("/metrics")
+    async def metrics() -> Dict[str, Any]:
+        return scheduler.get_metrics()
+
+    return app
+
+
+def build_service_from_env() -> DualEmbeddingService:
+    """DualEmbeddingService configured like the API's."""
+    return DualEmbeddingService(
+        text_model_name=os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-text-v1.5"),
+        code_model_name=os.getenv("CODE_EMBEDDING_MODEL", "jinaai/jina-embeddings-v2-base-code"),
+        dimension=int(os.getenv("EMBEDDING_DIMENSION", "768")),
+        device=os.getenv("EMBEDDING_DEVICE", "cpu"),
+        cache_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "1000")),
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    service = build_service_from_env()
+    if os.getenv("EMBEDDING_MODE", "real").lower() == "real":
+        asyncio.run(service.preload_models())
+
+    app = create_app(EmbeddingBatchScheduler(service))
+    socket_path = os.getenv("EMBEDDING_SIDECAR_SOCKET")
+    if socket_path:
+        logger.info("embedding_sidecar.starting", uds=socket_path)
+        uvicorn.run(app, uds=socket_path, log_level="warning")
+    else:
+        host = os.getenv("EMBEDDING_SIDECAR_HOST", "127.0.0.1")
+        port = int(os.getenv("EMBEDDING_SIDECAR_PORT", "8765"))
+        logger.info("embedding_sidecar.starting", host=host, port=port)
+        uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
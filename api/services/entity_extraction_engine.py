@@ -0,0 +1,212 @@
+"""
+Entity Extraction Engine — off-loop, batched GLiNER inference.
+
+GLiNER's predict call is synchronous CPU/GPU work. Called from a coroutine
+it runs on the event loop and stalls every concurrent request for the
+duration of the forward pass. The engine moves inference to a dedicated
+single-thread executor (the model is not shared across threads; torch
+releases the GIL during the forward pass) and micro-batches concurrent
+requests:
+
+    extract(text) ──> queue ──> batcher task ──> executor thread
+                                   │               extract_entities_batch(texts)
+                                   └─ waits up to max_wait_ms for
+                                      max_batch_size texts
+
+Each batch is a single batch_predict_entities() call over the windows of
+all texts in it (see GLiNERService.extract_entities_batch).
+
+Usage:
+    engine = get_entity_extraction_engine(gliner_service)
+    entities = await engine.extract(f"{title}\\n\\n{content}")
+    engine.get_stats()  # queue depth, batch sizes, throughput
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from services.gliner_service import GLiNERService
+
+logger = structlog.get_logger(__name__)
+
+
+class EntityExtractionEngine:
+    """Queue + micro-batcher in front of a GLiNERService."""
+
+    def __init__(
+        self,
+        gliner_service: GLiNERService,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            gliner_service: Service holding the model
+            max_batch_size: Texts per forward pass (ENTITY_EXTRACTION_BATCH_SIZE)
+            max_wait_ms: How long the batcher waits to fill a batch
+                (ENTITY_EXTRACTION_BATCH_WAIT_MS)
+        """
+        self.gliner_service = gliner_service
+        self.max_batch_size = max_batch_size or int(
+            os.getenv("ENTITY_EXTRACTION_BATCH_SIZE", "8")
+        )
+        self.max_wait_ms = (
+            max_wait_ms if max_wait_ms is not None
+            else float(os.getenv("ENTITY_EXTRACTION_BATCH_WAIT_MS", "20"))
+        )
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gliner")
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Stats
+        self.batches = 0
+        self.texts_processed = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.last_batch_ms = 0.0
+        self.max_batch_seen = 0
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """
+        Start the batcher on the running loop.
+
+        A batcher bound to another loop is stopped first: if that loop is
+        still alive the batcher is cancelled there and fails what it holds
+        (see _run); the requests of a closed loop have no awaiter left.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            old_loop, old_batcher = self._loop, self._batcher
+            if old_batcher is not None and not old_batcher.done() and not old_loop.is_closed():
+                old_loop.call_soon_threadsafe(old_batcher.cancel)
+            self._batcher = None
+        if self._batcher is None or self._batcher.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._batcher = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def extract(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Extract entities from text without blocking the event loop.
+
+        Returns:
+            Entities as returned by GLiNERService.extract_entities
+        """
+        queue = self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+
+    async def _next_batch(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one request, then collect more until full or timed out."""
+        batch = [await queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Batcher loop: one executor call per batch."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = await self._next_batch(queue)
+                texts = [text for text, _ in batch]
+                start = time.perf_counter()
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor, self.gliner_service.extract_entities_batch, texts
+                    )
+                except Exception as e:
+                    self.failures += len(batch)
+                    logger.error("entity_extraction_batch_failed", error=str(e), batch_size=len(batch))
+                    results = [[] for _ in batch]
+
+                elapsed = time.perf_counter() - start
+                self.batches += 1
+                self.texts_processed += len(batch)
+                self.busy_seconds += elapsed
+                self.last_batch_ms = elapsed * 1000
+                self.max_batch_seen = max(self.max_batch_seen, len(batch))
+
+                for (_, future), entities in zip(batch, results):
+                    if not future.done():
+                        future.set_result(entities)
+                batch = []
+        finally:
+            # Cancelled or crashed: nobody would resolve what is left
+            pending = batch + _drain(queue)
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(RuntimeError("entity extraction engine stopped"))
+            if pending:
+                self.failures += len(pending)
+                logger.warning("entity_extraction_batcher_stopped", failed_requests=len(pending))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self.batches,
+            "texts_processed": self.texts_processed,
+            "failures": self.failures,
+            "avg_batch_size": round(self.texts_processed / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size_seen": self.max_batch_seen,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+            "texts_per_second": (
+                round(self.texts_processed / self.busy_seconds, 2) if self.busy_seconds else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    async def close(self) -> None:
+        """Stop the batcher and the executor thread."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        self._executor.shutdown(wait=False)
+
+
+def _drain(queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+_engine: Optional[EntityExtractionEngine] = None
+
+
+def get_entity_extraction_engine(gliner_service: GLiNERService) -> EntityExtractionEngine:
+    """
+    Process-wide engine for a GLiNER service.
+
+    All callers sharing the (singleton) GLiNER service share one queue, so
+    concurrent extractions end up in the same batch.
+    """
+    global _engine
+    if _engine is None or _engine.gliner_service is not gliner_service:
+        _engine = EntityExtractionEngine(gliner_service)
+    return _engine
@@ -11,13 +11,15 @@ Usage:
 
 import os
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.sql import text
 
 from services.gliner_service import GLiNERService
+from services.entity_extraction_engine import EntityExtractionEngine, get_entity_extraction_engine
+from services.caches.memory_search_cache import get_memory_search_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -31,13 +33,20 @@ class EntityExtractionService:
     """
     Extracts entities, concepts, and tags from memories via GLiNER.
 
-    Extraction is async and non-blocking. If GLiNER is unavailable,
-    extraction is silently skipped.
+    Extraction is async and non-blocking: inference runs off the event loop
+    in the (shared) EntityExtractionEngine, which batches concurrent
+    extractions. If GLiNER is unavailable, extraction is silently skipped.
     """
 
-    def __init__(self, engine: AsyncEngine, gliner_service: GLiNERService):
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        gliner_service: GLiNERService,
+        extraction_engine: Optional[EntityExtractionEngine] = None,
+    ):
         self.engine = engine
         self.gliner_service = gliner_service
+        self.extraction_engine = extraction_engine or get_entity_extraction_engine(gliner_service)
         self.enabled = os.getenv("ENTITY_EXTRACTION_ENABLED", "true").lower() == "true"
         logger.info("EntityExtractionService initialized", enabled=self.enabled)
 
@@ -80,7 +89,7 @@ class EntityExtractionService:
             return False
 
         text = f"{title}\n\n{content}"
-        entities = self.gliner_service.extract_entities(text)
+        entities = await self.extraction_engine.extract(text)
 
         if not entities:
             logger.debug("entity_extraction_no_results", memory_id=memory_id)
@@ -118,6 +127,7 @@ class EntityExtractionService:
                 concepts = :concepts,
                 auto_tags = :auto_tags
             WHERE id = :memory_id
+            RETURNING project_id
         """)
         params = {
             "memory_id": memory_id,
@@ -127,8 +137,13 @@ class EntityExtractionService:
         }
         try:
             async with self.engine.begin() as conn:
-                await conn.execute(query, params)
-            return True
+                result = await conn.execute(query, params)
+                row = result.fetchone()
         except Exception as e:
             logger.error("entity_extraction_db_error", memory_id=memory_id, error=str(e))
             return False
+
+        # Entities/tags feed entity and tag search: drop cached results
+        if row is not None:
+            await get_memory_search_cache().invalidate(row._mapping.get("project_id"))
+        return True
@@ -0,0 +1,417 @@
+"""
+Filtered ANN Planner — selectivity-aware pgvector HNSW tuning.
+
+A plain HNSW scan visits ef_search candidates and only then applies the
+WHERE filters (project, tags, memory_type, repository...). With a selective
+filter most candidates are discarded and `LIMIT k` silently returns far fewer
+than k rows: recall collapses without any error.
+
+The planner estimates how selective the filters are and picks a strategy
+per query:
+
+    exact      filtered set <= exact_scan_threshold rows
+               → index scans disabled, exact distance sort on the partition
+    iterative  pgvector iterative index scan (hnsw.iterative_scan)
+               → ef_search scaled to limit / selectivity,
+                 hnsw.max_scan_tuples bounded by config
+    hnsw       no filters (or mode=off) → static ef_search, unchanged path
+
+The size probes (bounded COUNT, EXPLAIN) run in a savepoint of the search
+transaction and are cached per filter for SELECTIVITY_TTL_SECONDS.
+
+Configuration (environment):
+    FILTERED_ANN_MODE               auto | off           (default: auto)
+    FILTERED_ANN_EXACT_THRESHOLD    rows for exact scan  (default: 2000)
+    FILTERED_ANN_MAX_EF_SEARCH      ef_search ceiling    (default: 1000)
+    FILTERED_ANN_MAX_SCAN_TUPLES    iterative scan cap   (default: 100000)
+    FILTERED_ANN_RECALL_SAMPLE_RATE fraction of queries re-run exactly
+                                    to measure recall    (default: 0.0)
+
+Usage:
+    planner = FilteredANNPlanner()
+    async with engine.begin() as conn:
+        plan = await planner.plan(conn, "memories", where_sql, params, limit=50)
+        await planner.apply(conn, plan)
+        rows = (await conn.execute(query_sql, params)).fetchall()
+        recall = None
+        if planner.should_sample_recall(plan):
+            recall = await planner.measure_recall(conn, query_sql, params, ids)
+    planner.record(plan, returned=len(rows), latency_ms=..., recall=recall)
+"""
+
+import math
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import structlog
+from sqlalchemy.sql import text
+
+from utils.keyset_pagination import estimate_count
+from utils.search_metrics import log_filtered_ann_metrics
+
+logger = structlog.get_logger()
+
+# Tables the planner may estimate (table name is interpolated into SQL)
+ALLOWED_TABLES = {"memories", "code_chunks"}
+
+# pgvector default for hnsw.max_scan_tuples
+PGVECTOR_DEFAULT_MAX_SCAN_TUPLES = 20000
+
+# reltuples is refreshed by ANALYZE/autovacuum only, no need to re-read per query
+RELTUPLES_TTL_SECONDS = 60.0
+
+# Filtered-set size per (table, filter): the same project / tag / repository
+# filters repeat across queries, so the probes run once per TTL, not per search
+SELECTIVITY_TTL_SECONDS = 60.0
+SELECTIVITY_CACHE_SIZE = 1024
+
+_BIND_PARAM = re.compile(r"(?<!:):(\w+)")
+
+
+@dataclass
+class FilteredANNConfig:
+    """Tuning knobs for filtered ANN search."""
+    mode: str = "auto"
+    exact_scan_threshold: int = 2000
+    max_ef_search: int = 1000
+    max_scan_tuples: int = 100000
+    recall_sample_rate: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "FilteredANNConfig":
+        """Build config from FILTERED_ANN_* environment variables."""
+        return cls(
+            mode=os.getenv("FILTERED_ANN_MODE", "auto").lower(),
+            exact_scan_threshold=int(os.getenv("FILTERED_ANN_EXACT_THRESHOLD", "2000")),
+            max_ef_search=int(os.getenv("FILTERED_ANN_MAX_EF_SEARCH", "1000")),
+            max_scan_tuples=int(os.getenv("FILTERED_ANN_MAX_SCAN_TUPLES", "100000")),
+            recall_sample_rate=float(os.getenv("FILTERED_ANN_RECALL_SAMPLE_RATE", "0.0")),
+        )
+
+
+@dataclass
+class FilteredANNPlan:
+    """Strategy chosen for one filtered vector query."""
+    table: str
+    strategy: str  # "hnsw", "iterative" or "exact"
+    ef_search: int
+    limit: int
+    max_scan_tuples: Optional[int] = None
+    estimated_rows: Optional[int] = None
+    total_rows: Optional[int] = None
+    selectivity: Optional[float] = None
+    planning_time_ms: float = 0.0
+
+
+@dataclass
+class _StrategyStats:
+    """Running telemetry for one strategy."""
+    queries: int = 0
+    total_latency_ms: float = 0.0
+    underfilled: int = 0
+    recall_samples: List[float] = field(default_factory=list)
+
+
+class FilteredANNPlanner:
+    """
+    Chooses and applies HNSW settings for filtered vector searches.
+
+    The planner runs inside the caller's transaction so its SET LOCAL
+    statements apply to the search query that follows. Its probes (bounded
+    COUNT, EXPLAIN, pg_class) run in a SAVEPOINT: on PostgreSQL a failed
+    statement aborts the whole transaction, and the search must still run.
+    """
+
+    def __init__(self, config: Optional[FilteredANNConfig] = None):
+        """
+        Initialize planner.
+
+        Args:
+            config: Tuning config (read from environment if not provided)
+        """
+        self.config = config or FilteredANNConfig.from_env()
+        self._reltuples: Dict[str, tuple] = {}  # table -> (rows, fetched_at)
+        # (table, where_sql, filter params) -> (bounded_count, estimated_rows, total_rows, fetched_at)
+        self._selectivity: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._stats: Dict[str, _StrategyStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """True when filtered ANN planning is active (mode != off)."""
+        return self.config.mode != "off"
+
+    async def plan(
+        self,
+        conn,
+        table: str,
+        where_sql: str,
+        params: Dict[str, Any],
+        limit: int,
+        base_ef_search: int = 100,
+    ) -> FilteredANNPlan:
+        """
+        Estimate filter selectivity and choose a strategy.
+
+        Args:
+            conn: Open connection (same transaction as the search)
+            table: "memories" or "code_chunks"
+            where_sql: WHERE clause of the search (bind parameters allowed)
+            params: Bind parameters for where_sql
+            limit: Number of neighbours requested
+            base_ef_search: ef_search used for unfiltered queries
+
+        Returns:
+            FilteredANNPlan
+        """
+        if table not in ALLOWED_TABLES:
+            raise ValueError(f"Unsupported table for filtered ANN: {table}")
+
+        start = time.time()
+        plan = FilteredANNPlan(
+            table=table,
+            strategy="hnsw",
+            ef_search=base_ef_search,
+            limit=limit,
+        )
+        if not self.enabled:
+            return plan
+
+        try:
+            bounded_count, estimated, total_rows = await self._filtered_size(
+                conn, table, where_sql, params
+            )
+            plan.total_rows = total_rows
+
+            if estimated is None:
+                plan.strategy = "exact"
+                plan.estimated_rows = bounded_count
+                plan.selectivity = (
+                    bounded_count / total_rows if total_rows else None
+                )
+            else:
+                plan.estimated_rows = estimated
+                selectivity = min(1.0, estimated / total_rows) if total_rows else 1.0
+                plan.selectivity = selectivity
+                plan.strategy = "iterative"
+                plan.ef_search = self.ef_search_for(selectivity, limit, base_ef_search)
+                plan.max_scan_tuples = self.max_scan_tuples_for(selectivity, limit)
+
+        except Exception as e:
+            # Estimation is best-effort: the savepoint was rolled back, the
+            # caller's transaction is intact; keep the unfiltered defaults
+            logger.warning("Filtered ANN planning failed, using defaults", error=str(e))
+            plan.strategy = "hnsw"
+            plan.ef_search = base_ef_search
+
+        plan.planning_time_ms = (time.time() - start) * 1000
+        return plan
+
+    def ef_search_for(self, selectivity: float, limit: int, base_ef_search: int) -> int:
+        """
+        ef_search needed to see ~limit matching rows in the first pass.
+
+        A filter keeping a fraction s of rows needs about limit / s
+        candidates; clamped to [base_ef_search, max_ef_search].
+        """
+        if selectivity <= 0:
+            return self.config.max_ef_search
+        wanted = math.ceil(limit / selectivity)
+        return int(min(self.config.max_ef_search, max(base_ef_search, wanted)))
+
+    def max_scan_tuples_for(self, selectivity: float, limit: int) -> int:
+        """Iterative scan budget: twice the expected candidates, bounded."""
+        if selectivity <= 0:
+            return self.config.max_scan_tuples
+        wanted = math.ceil(2 * limit / selectivity)
+        return int(min(
+            self.config.max_scan_tuples,
+            max(PGVECTOR_DEFAULT_MAX_SCAN_TUPLES, wanted),
+        ))
+
+    async def apply(self, conn, plan: FilteredANNPlan) -> None:
+        """
+        Apply the plan with SET LOCAL statements.
+
+        SET cannot use bind parameters; all values are int() casts.
+        """
+        if plan.strategy == "exact":
+            # HNSW only supports plain index scans: disabling them forces an
+            # exact distance sort over the (bitmap/seq scanned) filtered rows.
+            await conn.execute(text("SET LOCAL enable_indexscan = off"))
+            return
+
+        await conn.execute(text(f"SET LOCAL hnsw.ef_search = {int(plan.ef_search)}"))
+        await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+        if plan.max_scan_tuples:
+            await conn.execute(
+                text(f"SET LOCAL hnsw.max_scan_tuples = {int(plan.max_scan_tuples)}")
+            )
+
+    def should_sample_recall(self, plan: FilteredANNPlan) -> bool:
+        """Sample recall on approximate strategies only (exact is 1.0)."""
+        if plan.strategy == "exact" or self.config.recall_sample_rate <= 0:
+            return False
+        return random.random() < self.config.recall_sample_rate
+
+    async def measure_recall(
+        self,
+        conn,
+        query_sql,
+        params: Dict[str, Any],
+        ann_ids: List[str],
+    ) -> Optional[float]:
+        """
+        Re-run the query as an exact scan and return recall@k of the ANN ids.
+
+        Runs after the ANN query, in a savepoint that is rolled back: the
+        SET LOCAL disabling index scans does not outlive the measurement,
+        and a failure leaves the caller's transaction usable.
+        """
+        try:
+            savepoint = await conn.begin_nested()
+            try:
+                await conn.execute(text("SET LOCAL enable_indexscan = off"))
+                result = await conn.execute(query_sql, params)
+                exact_ids = {str(row[0]) for row in result.fetchall()}
+            finally:
+                await savepoint.rollback()
+        except Exception as e:
+            logger.warning("Filtered ANN recall sampling failed", error=str(e))
+            return None
+
+        if not exact_ids:
+            return 1.0
+        found = len(exact_ids.intersection(str(i) for i in ann_ids))
+        return found / len(exact_ids)
+
+    def record(
+        self,
+        plan: FilteredANNPlan,
+        returned: int,
+        latency_ms: float,
+        recall: Optional[float] = None,
+    ) -> None:
+        """Record per-query telemetry (structured log + running stats)."""
+        stats = self._stats.setdefault(plan.strategy, _StrategyStats())
+        stats.queries += 1
+        stats.total_latency_ms += latency_ms
+        if returned < plan.limit and (
+            plan.estimated_rows is None or plan.estimated_rows > returned
+        ):
+            stats.underfilled += 1
+        if recall is not None:
+            stats.recall_samples.append(recall)
+            # Keep a bounded window of recent samples
+            if len(stats.recall_samples) > 1000:
+                del stats.recall_samples[:-1000]
+
+        log_filtered_ann_metrics(
+            table=plan.table,
+            strategy=plan.strategy,
+            ef_search=plan.ef_search,
+            limit=plan.limit,
+            returned=returned,
+            latency_ms=latency_ms,
+            planning_time_ms=plan.planning_time_ms,
+            estimated_rows=plan.estimated_rows,
+            selectivity=plan.selectivity,
+            max_scan_tuples=plan.max_scan_tuples,
+            recall=recall,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregated telemetry per strategy, for tuning."""
+        out: Dict[str, Any] = {"mode": self.config.mode}
+        for strategy, s in self._stats.items():
+            out[strategy] = {
+                "queries": s.queries,
+                "avg_latency_ms": round(s.total_latency_ms / s.queries, 2) if s.queries else 0.0,
+                "underfilled": s.underfilled,
+                "recall_samples": len(s.recall_samples),
+                "avg_recall": (
+                    round(sum(s.recall_samples) / len(s.recall_samples), 4)
+                    if s.recall_samples else None
+                ),
+            }
+        return out
+
+    async def _filtered_size(
+        self,
+        conn,
+        table: str,
+        where_sql: str,
+        params: Dict[str, Any],
+    ) -> tuple:
+        """
+        Size of the filtered set: (bounded_count, estimated_rows, total_rows).
+
+        estimated_rows is None when the set is small enough for an exact scan
+        (bounded_count <= exact_scan_threshold). Results are cached per filter
+        for SELECTIVITY_TTL_SECONDS; the probes run in a savepoint.
+        """
+        key = (table, where_sql, tuple(
+            (name, repr(params.get(name)))
+            for name in sorted(set(_BIND_PARAM.findall(where_sql)))
+        ))
+        now = time.time()
+        cached = self._selectivity.get(key)
+        if cached and now - cached[3] < SELECTIVITY_TTL_SECONDS:
+            self._selectivity.move_to_end(key)
+            return cached[:3]
+
+        async with conn.begin_nested():
+            # 1. Bounded count: cheap exact answer for small partitions
+            threshold = self.config.exact_scan_threshold
+            count_params = dict(params)
+            count_params["_ann_cap"] = threshold + 1
+            result = await conn.execute(
+                text(
+                    f"SELECT count(*) FROM (SELECT 1 FROM {table} "
+                    f"WHERE {where_sql} LIMIT :_ann_cap) AS _ann_sample"
+                ),
+                count_params,
+            )
+            bounded_count = int(result.scalar() or 0)
+            total_rows = await self._get_reltuples(conn, table)
+
+            estimated = None
+            if bounded_count > threshold:
+                # 2. Planner estimate for large filtered sets
+                estimated = await self._estimate_rows(conn, table, where_sql, params)
+                estimated = max(estimated, bounded_count)
+
+        self._selectivity[key] = (bounded_count, estimated, total_rows, now)
+        if len(self._selectivity) > SELECTIVITY_CACHE_SIZE:
+            self._selectivity.popitem(last=False)
+        return bounded_count, estimated, total_rows
+
+    async def _get_reltuples(self, conn, table: str) -> Optional[int]:
+        """Table row estimate from pg_class (cached for RELTUPLES_TTL_SECONDS)."""
+        cached = self._reltuples.get(table)
+        if cached and time.time() - cached[1] < RELTUPLES_TTL_SECONDS:
+            return cached[0]
+
+        result = await conn.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": table},
+        )
+        rows = result.scalar()
+        # reltuples = -1 means never analyzed
+        rows = int(rows) if rows is not None and rows >= 0 else None
+        self._reltuples[table] = (rows, time.time())
+        return rows
+
+    async def _estimate_rows(
+        self,
+        conn,
+        table: str,
+        where_sql: str,
+        params: Dict[str, Any],
+    ) -> int:
+        """Planner row estimate for the filtered set (EXPLAIN, no execution)."""
+        return await estimate_count(conn, table, where_sql, params)
@@ -3,9 +3,14 @@ GLiNER Service — Deterministic entity extraction.
 
 Uses GLiNER (Generalist and Lightweight Model for NER) to extract
 entities from text with zero hallucinations.
+
+Long texts are split into overlapping windows (GLiNER truncates its input
+to a few hundred words); window spans are shifted back to document
+offsets and merged. extract_entities_batch() runs the windows of several
+texts through one batch_predict_entities() forward pass.
 """
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import structlog
 
@@ -17,6 +22,10 @@ DEFAULT_ENTITY_TYPES = [
     "organization", "concept", "location"
 ]
 
+# Windowing of long texts (characters; windows end on whitespace)
+DEFAULT_WINDOW_CHARS = int(os.getenv("GLINER_WINDOW_CHARS", "1500"))
+DEFAULT_WINDOW_OVERLAP_CHARS = int(os.getenv("GLINER_WINDOW_OVERLAP_CHARS", "200"))
+
 # Module-level singleton (shared across all requests)
 _gliner_service: Optional["GLiNERService"] = None
 
@@ -30,11 +39,15 @@ class GLiNERService:
         self,
         model_path: Optional[str] = None,
         entity_types: Optional[List[str]] = None,
+        window_chars: int = DEFAULT_WINDOW_CHARS,
+        overlap_chars: int = DEFAULT_WINDOW_OVERLAP_CHARS,
     ):
         self.model_path = model_path or os.getenv(
             "GLINER_MODEL_PATH", "/app/models/gliner_multi-v2.1"
         )
         self.entity_types = entity_types or DEFAULT_ENTITY_TYPES
+        self.window_chars = window_chars
+        self.overlap_chars = min(overlap_chars, window_chars // 2)
         self.model = None
         self._load_attempted = False
         # Don't load model at init — load lazily on first use
@@ -71,16 +84,61 @@ class GLiNERService:
             List of entities with name, type, start, end positions.
             Returns empty list if model not loaded.
         """
+        return self.extract_entities_batch([text])[0]
+
+    def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract entities from several texts in one forward pass.
+
+        Blocking: call from an executor, not from the event loop
+        (see EntityExtractionEngine).
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One entity list per input text (empty lists if model not loaded)
+        """
         self._ensure_model_loaded()
-        if not self.model:
-            return []
+        if not self.model or not texts:
+            return [[] for _ in texts]
+
+        windows: List[Tuple[int, int]] = []  # (text index, window offset)
+        window_texts: List[str] = []
+        for i, text in enumerate(texts):
+            for offset, window in split_windows(text, self.window_chars, self.overlap_chars):
+                windows.append((i, offset))
+                window_texts.append(window)
 
         try:
-            raw_entities = self.model.predict_entities(text, self.entity_types)
-            return self._post_process(raw_entities, text)
+            raw_per_window = self._predict(window_texts)
         except Exception as e:
-            logger.error("gliner_extraction_failed", error=str(e))
+            logger.error("gliner_extraction_failed", error=str(e), batch_size=len(texts))
+            return [[] for _ in texts]
+
+        raw_per_text: List[List[Dict[str, Any]]] = [[] for _ in texts]
+        for (i, offset), raw in zip(windows, raw_per_window):
+            raw_per_text[i].extend(
+                {**e, "start": e.get("start", 0) + offset, "end": e.get("end", 0) + offset}
+                for e in raw
+            )
+
+        return [
+            self._post_process(merge_spans(raw), text)
+            for raw, text in zip(raw_per_text, texts)
+        ]
+
+    def _predict(self, window_texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Run the model over windows (batched when there is more than one)."""
+        if not window_texts:
             return []
+        if len(window_texts) == 1:
+            return [self.model.predict_entities(window_texts[0], self.entity_types)]
+
+        batch_predict = getattr(self.model, "batch_predict_entities", None)
+        if batch_predict is None:
+            return [self.model.predict_entities(t, self.entity_types) for t in window_texts]
+        return batch_predict(window_texts, self.entity_types)
 
     def _post_process(
         self,
@@ -124,6 +182,59 @@ class GLiNERService:
         return list(seen.values())
 
 
+def split_windows(text: str, window_chars: int, overlap_chars: int) -> List[Tuple[int, str]]:
+    """
+    Split text into overlapping windows.
+
+    Windows end on whitespace when possible so that words are not cut;
+    consecutive windows share about overlap_chars characters, so an
+    entity cut by one window boundary is whole in the next window.
+
+    Returns:
+        List of (offset in text, window text)
+    """
+    if len(text) <= window_chars:
+        return [(0, text)]
+
+    windows = []
+    start = 0
+    while start < len(text):
+        end = min(start + window_chars, len(text))
+        if end < len(text):
+            cut = text.rfind(" ", start + window_chars // 2, end)
+            if cut > start:
+                end = cut
+        windows.append((start, text[start:end]))
+        if end >= len(text):
+            break
+        next_start = max(end - overlap_chars, start + 1)
+        # Start on a word boundary as well
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return windows
+
+
+def merge_spans(raw_entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge entity spans predicted in overlapping windows.
+
+    Overlapping spans with the same label collapse to the highest-scoring
+    one; the result is ordered by position.
+    """
+    merged: List[Dict[str, Any]] = []
+    for e in sorted(raw_entities, key=lambda e: -e.get("score", 0.0)):
+        label = e.get("label", "").lower()
+        if any(
+            m.get("label", "").lower() == label
+            and e.get("start", 0) < m.get("end", 0)
+            and m.get("start", 0) < e.get("end", 0)
+            for m in merged
+        ):
+            continue
+        merged.append(e)
+    return sorted(merged, key=lambda e: e.get("start", 0))
+
+
 def get_gliner_service() -> GLiNERService:
     """Get or create the module-level singleton GLiNER service."""
     global _gliner_service
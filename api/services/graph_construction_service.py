@@ -20,6 +20,8 @@ from db.repositories.edge_repository import EdgeRepository
 from db.repositories.code_chunk_repository import CodeChunkRepository
 from models.code_chunk_models import CodeChunkModel
 from models.graph_models import GraphStats, NodeModel, EdgeModel, NodeCreate, EdgeCreate
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
+from services.repository_stats_service import RepositoryStatsService
 from utils.timeout import with_timeout, TimeoutError
 from config.timeouts import get_timeout
 
@@ -65,12 +67,19 @@ class GraphConstructionService:
     - Store in PostgreSQL
     """
 
-    def __init__(self, engine: AsyncEngine):
-        """Initialize service with database engine."""
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        generations: Optional[RepositoryGenerations] = None,
+        repository_stats: Optional[RepositoryStatsService] = None,
+    ):
+        """Initialize service with database engine (cache generations: process-wide default)."""
         self.engine = engine
         self.node_repo = NodeRepository(engine)
         self.edge_repo = EdgeRepository(engine)
         self.chunk_repo = CodeChunkRepository(engine)
+        self.generations = generations or get_repository_generations()
+        self.repository_stats = repository_stats or RepositoryStatsService(engine)
         self.logger = logging.getLogger(__name__)
         self.logger.info("GraphConstructionService initialized.")
 
@@ -287,6 +296,10 @@ class GraphConstructionService:
         # Calculate metrics (NEW - Task 5.2)
         await self.calculate_and_store_metrics(repository, chunk_to_node)
 
+        # Nodes were replaced: cached traversals of this repository are stale
+        await self.generations.bump(repository)
+        await self.repository_stats.refresh_graph(repository)
+
         return stats
 
     async def calculate_and_store_metrics(
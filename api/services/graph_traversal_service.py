@@ -8,6 +8,7 @@ EPIC-12 Story 12.1: Added timeout protection for graph traversal.
 """
 
 import logging
+import os
 import uuid
 from typing import List, Optional
 
@@ -18,6 +19,7 @@ import structlog
 from db.repositories.node_repository import NodeRepository
 from models.graph_models import GraphTraversal, NodeModel
 from services.caches import RedisCache, cache_keys
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
 from utils.timeout import with_timeout, TimeoutError
 from config.timeouts import get_timeout
 
@@ -34,20 +36,29 @@ class GraphTraversalService:
     - Filter by relationship type (calls, imports, etc.)
     - Limit traversal depth to prevent infinite loops
     - Use recursive CTEs for performance
-    - L2 Redis caching for graph traversal results (120s TTL)
+    - L2 Redis caching for graph traversal results (repository-generation keyed)
     """
 
-    def __init__(self, engine: AsyncEngine, redis_cache: Optional[RedisCache] = None):
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        redis_cache: Optional[RedisCache] = None,
+        generations: Optional[RepositoryGenerations] = None,
+    ):
         """
         Initialize service with database engine and optional Redis cache.
 
         Args:
             engine: SQLAlchemy async engine
             redis_cache: Optional L2 Redis cache for performance
+            generations: Optional repository generation counters for cache keys
+                         (process-wide default)
         """
         self.engine = engine
         self.node_repo = NodeRepository(engine)
         self.redis_cache = redis_cache
+        self.generations = generations or get_repository_generations()
+        self.cache_ttl_seconds = int(os.getenv("GRAPH_TRAVERSAL_CACHE_TTL_SECONDS", "3600"))
         self.logger = structlog.get_logger()
         self.logger.info(
             "GraphTraversalService initialized",
@@ -105,35 +116,42 @@ class GraphTraversalService:
             )
 
         # L2 CACHE LOOKUP (EPIC-10 Story 10.2)
+        # Keyed by the node's repository generation: graph rebuilds and
+        # re-indexing bump it, invalidating every traversal of that repository
+        cache_key = None
         if self.redis_cache:
-            # Build relation_types list for cache key
-            relation_types = [relationship] if relationship else None
-            cache_key = cache_keys.graph_traversal_key(
-                node_id=str(start_node_id),
-                max_hops=max_depth,
-                relation_types=relation_types
-            )
-            # Add direction to cache key to distinguish inbound vs outbound
-            cache_key = f"{cache_key}:{direction}"
+            repository = (start_node.properties or {}).get("repository")
+            generation = await self.generations.generation(repository)
+            if generation is not None:
+                # Build relation_types list for cache key
+                relation_types = [relationship] if relationship else None
+                cache_key = cache_keys.graph_traversal_key(
+                    node_id=str(start_node_id),
+                    max_hops=max_depth,
+                    relation_types=relation_types,
+                    generation=generation,
+                )
+                # Add direction to cache key to distinguish inbound vs outbound
+                cache_key = f"{cache_key}:{direction}"
+
+                cached_response = await self.redis_cache.get(cache_key)
 
-            cached_response = await self.redis_cache.get(cache_key)
+                if cached_response:
+                    self.logger.info(
+                        "L2 cache HIT for graph traversal",
+                        start_node=str(start_node_id)[:12],
+                        direction=direction,
+                        relationship=relationship,
+                    )
+                    # Deserialize GraphTraversal
+                    return self._deserialize_graph_traversal(cached_response)
 
-            if cached_response:
-                self.logger.info(
-                    "L2 cache HIT for graph traversal",
+                self.logger.debug(
+                    "L2 cache MISS for graph traversal",
                     start_node=str(start_node_id)[:12],
                     direction=direction,
                     relationship=relationship,
                 )
-                # Deserialize GraphTraversal
-                return self._deserialize_graph_traversal(cached_response)
-
-            self.logger.debug(
-                "L2 cache MISS for graph traversal",
-                start_node=str(start_node_id)[:12],
-                direction=direction,
-                relationship=relationship,
-            )
 
         # Build and execute recursive CTE query with timeout protection
         # EPIC-12 Story 12.1: Prevent infinite hangs on complex graphs
@@ -183,25 +201,15 @@ class GraphTraversalService:
         )
 
         # POPULATE L2 CACHE (EPIC-10 Story 10.2)
-        if self.redis_cache:
-            relation_types = [relationship] if relationship else None
-            cache_key = cache_keys.graph_traversal_key(
-                node_id=str(start_node_id),
-                max_hops=max_depth,
-                relation_types=relation_types
-            )
-            # Add direction to cache key
-            cache_key = f"{cache_key}:{direction}"
-
+        if cache_key:
             serialized = self._serialize_graph_traversal(response)
-            # Cache for 120 seconds (graph traversals)
-            await self.redis_cache.set(cache_key, serialized, ttl_seconds=120)
+            await self.redis_cache.set(cache_key, serialized, ttl_seconds=self.cache_ttl_seconds)
             self.logger.debug(
                 "L2 cache populated for graph traversal",
                 start_node=str(start_node_id)[:12],
                 direction=direction,
                 relationship=relationship,
-                ttl_seconds=120,
+                ttl_seconds=self.cache_ttl_seconds,
             )
 
         return response
@@ -369,31 +377,36 @@ class GraphTraversalService:
         )
 
         # L2 CACHE LOOKUP (EPIC-10 Story 10.2)
+        # Paths may cross repositories, so the key uses the unscoped
+        # generation, which every repository change bumps
+        cache_key = None
         if self.redis_cache:
-            # Build custom cache key for path finding
-            source_short = str(source_node_id)[:12]
-            target_short = str(target_node_id)[:12]
-            rel_str = relationship if relationship else "all"
-            cache_key = f"graph:path:{source_short}:{target_short}:{rel_str}:hops{max_depth}"
+            generation = await self.generations.generation(None)
+            if generation is not None:
+                # Build custom cache key for path finding
+                source_short = str(source_node_id)[:12]
+                target_short = str(target_node_id)[:12]
+                rel_str = relationship if relationship else "all"
+                cache_key = f"graph:path:{generation}:{source_short}:{target_short}:{rel_str}:hops{max_depth}"
+
+                cached_response = await self.redis_cache.get(cache_key)
 
-            cached_response = await self.redis_cache.get(cache_key)
+                if cached_response:
+                    self.logger.info(
+                        "L2 cache HIT for path finding",
+                        source=source_short,
+                        target=target_short,
+                        relationship=relationship,
+                    )
+                    # Deserialize path (List[UUID] or None)
+                    return self._deserialize_path(cached_response)
 
-            if cached_response:
-                self.logger.info(
-                    "L2 cache HIT for path finding",
+                self.logger.debug(
+                    "L2 cache MISS for path finding",
                     source=source_short,
                     target=target_short,
                     relationship=relationship,
                 )
-                # Deserialize path (List[UUID] or None)
-                return self._deserialize_path(cached_response)
-
-            self.logger.debug(
-                "L2 cache MISS for path finding",
-                source=source_short,
-                target=target_short,
-                relationship=relationship,
-            )
 
         # Build relationship filter
         relationship_filter = ""
@@ -477,20 +490,14 @@ class GraphTraversalService:
             self.logger.info(f"No path found between {source_node_id} and {target_node_id}")
 
             # POPULATE L2 CACHE for "no path found" case (EPIC-10 Story 10.2)
-            if self.redis_cache:
-                source_short = str(source_node_id)[:12]
-                target_short = str(target_node_id)[:12]
-                rel_str = relationship if relationship else "all"
-                cache_key = f"graph:path:{source_short}:{target_short}:{rel_str}:hops{max_depth}"
-
+            if cache_key:
                 serialized = self._serialize_path(None)
-                # Cache for 120 seconds (graph paths)
-                await self.redis_cache.set(cache_key, serialized, ttl_seconds=120)
+                await self.redis_cache.set(cache_key, serialized, ttl_seconds=self.cache_ttl_seconds)
                 self.logger.debug(
                     "L2 cache populated for path finding (no path)",
                     source=source_short,
                     target=target_short,
-                    ttl_seconds=120,
+                    ttl_seconds=self.cache_ttl_seconds,
                 )
 
             return None
@@ -501,21 +508,15 @@ class GraphTraversalService:
         self.logger.info(f"Found path with {len(path)} nodes")
 
         # POPULATE L2 CACHE for found path (EPIC-10 Story 10.2)
-        if self.redis_cache:
-            source_short = str(source_node_id)[:12]
-            target_short = str(target_node_id)[:12]
-            rel_str = relationship if relationship else "all"
-            cache_key = f"graph:path:{source_short}:{target_short}:{rel_str}:hops{max_depth}"
-
+        if cache_key:
             serialized = self._serialize_path(path)
-            # Cache for 120 seconds (graph paths)
-            await self.redis_cache.set(cache_key, serialized, ttl_seconds=120)
+            await self.redis_cache.set(cache_key, serialized, ttl_seconds=self.cache_ttl_seconds)
             self.logger.debug(
                 "L2 cache populated for path finding",
                 source=source_short,
                 target=target_short,
                 path_length=len(path),
-                ttl_seconds=120,
+                ttl_seconds=self.cache_ttl_seconds,
             )
 
         return path
@@ -0,0 +1,339 @@
+"""
+HNSW index maintenance: deferred builds, concurrent swaps, build history.
+
+The HNSW indexes of memories and code_chunks are created inline by the
+alembic migrations with default build settings, and every row written
+afterwards is inserted into the graph one at a time - far slower than one
+bulk build when millions of rows arrive at once. This module owns their
+(re)construction:
+
+    drop(table)     drops a table's HNSW indexes, returning their definitions
+    build(indexes)  recreates dropped indexes in one bulk build each
+                    (plain CREATE INDEX: fastest, locks writes on the table)
+    swap(index)     rebuilds a live index without blocking readers/writers:
+                    CREATE INDEX CONCURRENTLY <name>_rebuild, then DROP the
+                    old index and RENAME the new one in a short transaction
+    rebuild(table)  swap() for every HNSW index of one or all tables
+
+Every build runs with maintenance_work_mem and
+max_parallel_maintenance_workers raised (parallel HNSW builds need
+pgvector >= 0.6; the graph should fit in maintenance_work_mem, otherwise
+the build slows down sharply) and is recorded in hnsw_index_builds with its
+duration, index size and table row estimate.
+
+Indexing jobs defer their indexes automatically once they write at least
+HNSW_DEFER_ROW_THRESHOLD rows (should_defer): the bulk loader of code
+chunks and the memory re-embedding script. While deferred, vector search on
+the table falls back to sequential scans for every caller.
+
+Work runs on dedicated asyncpg connections (CONCURRENTLY cannot run inside
+a transaction block; asyncpg is in autocommit mode outside explicit ones).
+
+Configuration (environment):
+    HNSW_MAINTENANCE_WORK_MEM   maintenance_work_mem for builds       (default: 1GB)
+    HNSW_MAINTENANCE_WORKERS    max_parallel_maintenance_workers      (default: 4)
+    HNSW_DEFER_ROW_THRESHOLD    rows written by a job before its
+                                indexes are deferred, 0 = never       (default: 20000)
+
+Usage:
+    maintenance = HnswIndexMaintenance.from_engine(engine)
+    builds = await maintenance.rebuild("code_chunks")
+"""
+
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import asyncpg
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger()
+
+HNSW_TABLES = ("memories", "code_chunks")
+
+_LIST_QUERY = """
+    SELECT i.tablename, i.indexname, i.indexdef,
+           pg_relation_size(c.oid) AS size_bytes, x.indisvalid AS valid
+    FROM pg_indexes i
+    JOIN pg_class c ON c.relname = i.indexname
+    JOIN pg_namespace n ON n.oid = c.relnamespace AND n.nspname = i.schemaname
+    JOIN pg_index x ON x.indexrelid = c.oid
+    WHERE i.schemaname = current_schema() AND i.tablename = ANY($1::text[])
+      AND i.indexdef ILIKE '%USING hnsw%'
+      AND i.indexname NOT LIKE '%\\_rebuild'
+    ORDER BY i.tablename, i.indexname
+"""
+
+_RECORD_QUERY = """
+    INSERT INTO hnsw_index_builds (
+        table_name, index_name, operation, status, table_rows, size_bytes,
+        duration_ms, maintenance_work_mem, parallel_workers, error
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+"""
+
+_CREATE_PREFIX = re.compile(r"^CREATE (UNIQUE )?INDEX (\S+) ON ", re.IGNORECASE)
+_MEMORY_SETTING = re.compile(r"^\d+\s*(kB|MB|GB|TB)?$", re.IGNORECASE)
+
+
+@dataclass
+class HnswIndex:
+    """An HNSW index and the DDL that recreates it."""
+    table: str
+    name: str
+    definition: str
+    size_bytes: Optional[int] = None
+    valid: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "table": self.table,
+            "name": self.name,
+            "size_bytes": self.size_bytes,
+            "valid": self.valid,
+            "definition": self.definition,
+        }
+
+
+@dataclass
+class IndexBuild:
+    """Outcome of one index build."""
+    table: str
+    index: str
+    operation: str  # build, swap, bulk_load, ...
+    status: str = "completed"  # completed, failed
+    seconds: float = 0.0
+    size_bytes: Optional[int] = None
+    table_rows: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "table": self.table,
+            "index": self.index,
+            "operation": self.operation,
+            "status": self.status,
+            "seconds": round(self.seconds, 3),
+            "size_bytes": self.size_bytes,
+            "table_rows": self.table_rows,
+            "error": self.error,
+        }
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class HnswIndexMaintenance:
+    """Drops, builds and swaps the HNSW indexes of memories and code_chunks."""
+
+    def __init__(
+        self,
+        dsn: str,
+        maintenance_work_mem: Optional[str] = None,
+        parallel_workers: Optional[int] = None,
+        defer_row_threshold: Optional[int] = None,
+    ):
+        """
+        Initialize the maintenance helper.
+
+        Args:
+            dsn: PostgreSQL DSN (postgresql://...)
+            maintenance_work_mem: Memory per build, e.g. '2GB' (HNSW_MAINTENANCE_WORK_MEM)
+            parallel_workers: max_parallel_maintenance_workers (HNSW_MAINTENANCE_WORKERS)
+            defer_row_threshold: Rows before a job defers its indexes (HNSW_DEFER_ROW_THRESHOLD)
+        """
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.maintenance_work_mem = maintenance_work_mem or os.getenv("HNSW_MAINTENANCE_WORK_MEM", "1GB")
+        if not _MEMORY_SETTING.match(self.maintenance_work_mem):
+            raise ValueError(f"Invalid maintenance_work_mem: {self.maintenance_work_mem!r}")
+        self.parallel_workers = (
+            parallel_workers if parallel_workers is not None
+            else int(os.getenv("HNSW_MAINTENANCE_WORKERS", "4"))
+        )
+        self.defer_row_threshold = (
+            defer_row_threshold if defer_row_threshold is not None
+            else int(os.getenv("HNSW_DEFER_ROW_THRESHOLD", "20000"))
+        )
+
+    @classmethod
+    def from_engine(cls, engine: AsyncEngine, **kwargs) -> "HnswIndexMaintenance":
+        """Maintenance helper for the database of a SQLAlchemy engine."""
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        return cls(dsn, **kwargs)
+
+    def should_defer(self, rows: int) -> bool:
+        """Whether a job writing `rows` rows should build its indexes afterwards."""
+        return self.defer_row_threshold > 0 and rows >= self.defer_row_threshold
+
+    @asynccontextmanager
+    async def _connection(self, conn: Optional[asyncpg.Connection] = None) -> AsyncIterator[asyncpg.Connection]:
+        if conn is not None:
+            yield conn
+            return
+        conn = await asyncpg.connect(self.dsn)
+        try:
+            yield conn
+        finally:
+            await conn.close()
+
+    async def list_indexes(
+        self, table: Optional[str] = None, conn: Optional[asyncpg.Connection] = None
+    ) -> List[HnswIndex]:
+        """HNSW indexes of one table (default: memories and code_chunks) with their sizes."""
+        tables = [table] if table else list(HNSW_TABLES)
+        async with self._connection(conn) as c:
+            rows = await c.fetch(_LIST_QUERY, tables)
+        return [
+            HnswIndex(table=row["tablename"], name=row["indexname"], definition=row["indexdef"],
+                      size_bytes=row["size_bytes"], valid=row["valid"])
+            for row in rows
+        ]
+
+    async def drop(self, table: str, conn: Optional[asyncpg.Connection] = None) -> List[HnswIndex]:
+        """
+        Drop the HNSW indexes of a table; returns what build() needs to restore them.
+
+        Definitions are logged as they are dropped so an interrupted job can be
+        repaired by hand.
+        """
+        async with self._connection(conn) as c:
+            indexes = await self.list_indexes(table, conn=c)
+            for index in indexes:
+                await self.drop_index(index, conn=c)
+        return indexes
+
+    async def drop_index(self, index: HnswIndex, conn: Optional[asyncpg.Connection] = None) -> None:
+        """Drop one index (logging its definition)."""
+        async with self._connection(conn) as c:
+            await c.execute(f"DROP INDEX IF EXISTS {_quote(index.name)}")
+        logger.warning("hnsw_index.dropped", table=index.table, index=index.name,
+                       definition=index.definition)
+
+    async def build(
+        self,
+        indexes: List[HnswIndex],
+        operation: str = "build",
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> List[IndexBuild]:
+        """
+        Recreate dropped indexes with the tuned build settings.
+
+        Every index is attempted; the first failure is raised afterwards.
+        """
+        builds: List[IndexBuild] = []
+        async with self._connection(conn) as c:
+            await self._tune(c)
+            for index in indexes:
+                build = await self._timed_build(c, index, operation, index.definition)
+                builds.append(build)
+        failed = [b for b in builds if b.status == "failed"]
+        if failed:
+            raise RuntimeError(f"HNSW index build failed for {failed[0].index}: {failed[0].error}")
+        return builds
+
+    async def swap(self, index: HnswIndex, conn: Optional[asyncpg.Connection] = None) -> IndexBuild:
+        """
+        Rebuild a live index without blocking reads or writes.
+
+        The replacement is built CONCURRENTLY under a temporary name; only the
+        final DROP + RENAME takes a (short) exclusive lock.
+        """
+        temporary = f"{index.name[:55]}_rebuild"
+        match = _CREATE_PREFIX.match(index.definition)
+        if not match:
+            raise ValueError(f"Unexpected index definition: {index.definition}")
+        definition = _CREATE_PREFIX.sub(
+            f"CREATE {match.group(1) or ''}INDEX CONCURRENTLY {_quote(temporary)} ON ",
+            index.definition, count=1,
+        )
+
+        async with self._connection(conn) as c:
+            await self._tune(c)
+            # Leftover of an interrupted swap (invalid index)
+            await c.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote(temporary)}")
+            build = await self._timed_build(c, index, "swap", definition, name=temporary, record=False)
+            if build.status == "completed" and not await c.fetchval(
+                "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)", temporary
+            ):
+                build.status, build.error = "failed", "concurrent build left an invalid index"
+            if build.status == "completed":
+                try:
+                    async with c.transaction():
+                        await c.execute("SET LOCAL lock_timeout = '10s'")
+                        await c.execute(f"DROP INDEX IF EXISTS {_quote(index.name)}")
+                        await c.execute(f"ALTER INDEX {_quote(temporary)} RENAME TO {_quote(index.name)}")
+                except Exception as e:
+                    build.status, build.error = "failed", f"swap: {e}"
+            if build.status == "failed":
+                # The old index stays in place
+                await c.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote(temporary)}")
+            await self._record(c, build)
+
+        logger.info("hnsw_index.swapped", **build.to_dict(), previous_size_bytes=index.size_bytes)
+        return build
+
+    async def rebuild(self, table: Optional[str] = None) -> List[IndexBuild]:
+        """Swap every HNSW index of one table (default: memories and code_chunks)."""
+        async with self._connection() as c:
+            return [await self.swap(index, conn=c) for index in await self.list_indexes(table, conn=c)]
+
+    async def history(self, limit: int = 20, conn: Optional[asyncpg.Connection] = None) -> List[Dict[str, Any]]:
+        """Most recent builds from hnsw_index_builds."""
+        async with self._connection(conn) as c:
+            rows = await c.fetch(
+                "SELECT * FROM hnsw_index_builds ORDER BY started_at DESC, id DESC LIMIT $1", limit
+            )
+        return [dict(row) for row in rows]
+
+    async def _tune(self, conn: asyncpg.Connection) -> None:
+        await conn.execute(f"SET maintenance_work_mem = '{self.maintenance_work_mem}'")
+        await conn.execute(f"SET max_parallel_maintenance_workers = {int(self.parallel_workers)}")
+
+    async def _timed_build(
+        self,
+        conn: asyncpg.Connection,
+        index: HnswIndex,
+        operation: str,
+        definition: str,
+        name: Optional[str] = None,
+        record: bool = True,
+    ) -> IndexBuild:
+        build = IndexBuild(table=index.table, index=index.name, operation=operation)
+        start = time.perf_counter()
+        try:
+            await conn.execute(definition)
+            build.size_bytes = await conn.fetchval(
+                "SELECT pg_relation_size(to_regclass($1))", name or index.name
+            )
+        except Exception as e:
+            build.status, build.error = "failed", str(e)
+            logger.error("hnsw_index.build_failed", table=index.table, index=index.name,
+                         operation=operation, error=str(e), definition=definition)
+        build.seconds = time.perf_counter() - start
+        try:
+            build.table_rows = await conn.fetchval(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass($1)", index.table
+            )
+        except Exception:
+            pass
+        if record:
+            await self._record(conn, build)
+            logger.info("hnsw_index.built", **build.to_dict())
+        return build
+
+    async def _record(self, conn: asyncpg.Connection, build: IndexBuild) -> None:
+        try:
+            await conn.execute(
+                _RECORD_QUERY, build.table, build.index, build.operation, build.status,
+                build.table_rows, build.size_bytes, int(build.seconds * 1000),
+                self.maintenance_work_mem, int(self.parallel_workers), build.error,
+            )
+        except Exception as e:
+            # History is best effort (e.g. migration not applied yet)
+            logger.warning("hnsw_index.record_failed", index=build.index, error=str(e))
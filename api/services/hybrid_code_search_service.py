@@ -14,6 +14,7 @@ Designed for <50ms P95 on 10k chunks with parallel execution.
 
 import logging
 import asyncio
+import os
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -22,6 +23,8 @@ from services.lexical_search_service import LexicalSearchService, LexicalSearchR
 from services.vector_search_service import VectorSearchService, VectorSearchResult
 from services.rrf_fusion_service import RRFFusionService, FusedResult
 from services.caches import RedisCache, cache_keys
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
+from services.resource_scheduler import interactive_operation
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +150,7 @@ class HybridCodeSearchService:
         redis_cache: Optional[RedisCache] = None,
         reranker_service: Optional["BM25RerankService"] = None,
         default_enable_reranking: bool = True,
+        generations: Optional[RepositoryGenerations] = None,
     ):
         """
         Initialize hybrid search service.
@@ -159,6 +163,8 @@ class HybridCodeSearchService:
             redis_cache: Optional RedisCache for L2 caching (EPIC-10 Story 10.2)
             reranker_service: Optional BM25 reranker (EPIC-24 P2)
             default_enable_reranking: Enable BM25 reranking by default (True)
+            generations: Optional repository generation counters for cache keys
+                         (process-wide default)
         """
         self.engine = engine
 
@@ -179,6 +185,10 @@ class HybridCodeSearchService:
 
         # L2 Redis cache (optional - graceful degradation)
         self.redis_cache = redis_cache
+        self.generations = generations or get_repository_generations()
+        # Generation-keyed entries are invalidated by re-indexing, so the
+        # TTL only bounds memory use
+        self.cache_ttl_seconds = int(os.getenv("CODE_SEARCH_CACHE_TTL_SECONDS", "3600"))
 
         # EPIC-24 P2: BM25 reranking (lazy-loaded)
         self.reranker = reranker_service
@@ -192,6 +202,7 @@ class HybridCodeSearchService:
             }
         )
 
+    @interactive_operation("search_code")
     async def search(
         self,
         query: str,
@@ -248,34 +259,32 @@ class HybridCodeSearchService:
         filters_dict = self._filters_to_dict(filters) if filters else None
 
         # L2 CACHE LOOKUP (EPIC-10 Story 10.2)
+        # The key embeds the repository generation: re-indexing bumps it,
+        # so entries never outlive the index state they were computed from.
+        cache_key = None
         if self.redis_cache:
             repository = filters.repository if filters else None
-            cache_key = cache_keys.search_result_key(
-                query=query,
-                repository=repository,
-                limit=top_k,
-                filters=filters_dict,
-                enable_lexical=enable_lexical,
-                enable_vector=enable_vector,
-                lexical_weight=lexical_weight,
-                vector_weight=vector_weight,
-            )
-            cached_response = await self.redis_cache.get(cache_key)
-
-            if cached_response:
-                logger.info(
-                    "L2 cache HIT for search",
-                    query=query[:50],
+            generation = await self.generations.generation(repository)
+            if generation is not None:
+                cache_key = cache_keys.search_result_key(
+                    query=query,
                     repository=repository,
+                    limit=top_k,
+                    filters=filters_dict,
+                    enable_lexical=enable_lexical,
+                    enable_vector=enable_vector,
+                    lexical_weight=lexical_weight,
+                    vector_weight=vector_weight,
+                    generation=generation,
                 )
-                # Deserialize HybridSearchResponse
-                return self._deserialize_search_response(cached_response)
+                cached_response = await self.redis_cache.get(cache_key)
 
-            logger.debug(
-                "L2 cache MISS for search",
-                query=query[:50],
-                repository=repository,
-            )
+                if cached_response:
+                    logger.info(f"L2 cache HIT for search: query='{query[:50]}', repository={repository}")
+                    # Deserialize HybridSearchResponse
+                    return self._deserialize_search_response(cached_response)
+
+                logger.debug(f"L2 cache MISS for search: query='{query[:50]}', repository={repository}")
 
         # Execute searches in parallel
         lexical_results = None
@@ -428,26 +437,14 @@ class HybridCodeSearchService:
         )
 
         # POPULATE L2 CACHE (EPIC-10 Story 10.2)
-        if self.redis_cache:
-            repository = filters.repository if filters else None
-            cache_key = cache_keys.search_result_key(
-                query=query,
-                repository=repository,
-                limit=top_k,
-                filters=filters_dict,
-                enable_lexical=enable_lexical,
-                enable_vector=enable_vector,
-                lexical_weight=lexical_weight,
-                vector_weight=vector_weight,
-            )
+        # Stored under the generation read before searching: if the
+        # repository was re-indexed meanwhile, the entry is never served.
+        if cache_key:
             serialized = self._serialize_search_response(response)
-            # Cache for 120 seconds (EPIC-32: increased from 30s)
-            await self.redis_cache.set(cache_key, serialized, ttl_seconds=120)
+            await self.redis_cache.set(cache_key, serialized, ttl_seconds=self.cache_ttl_seconds)
             logger.debug(
-                "L2 cache populated for search",
-                query=query[:50],
-                repository=repository,
-                ttl_seconds=120,
+                f"L2 cache populated for search: query='{query[:50]}', "
+                f"ttl_seconds={self.cache_ttl_seconds}"
             )
 
         return response
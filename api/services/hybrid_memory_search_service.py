@@ -6,6 +6,22 @@ using RRF (Reciprocal Rank Fusion) for optimal retrieval.
 
 EPIC-24 P2: Optional BM25 reranking for +20-30% quality improvement.
 
+Lean projection: candidate generators fetch bounded previews
+(LEFT(content, preview_chars)); full content is hydrated lazily, only for
+rerank candidates and (on request) the final page.
+
+Fusion modes:
+    python  each candidate generator runs on its own pooled connection in
+            parallel; RRF fusion happens in Python (default)
+    sql     one statement on one connection: candidate generators are CTEs,
+            weighted RRF is computed in SQL and only the fused top-N (with
+            per-method ranks) is returned. Lower pool pressure under load.
+
+Result cache: with a MemorySearchCache, identical searches (normalised
+query, filters, weights, pools, embedding model) are answered from an
+in-process LRU. The searched project's write generation is part of the
+key, so no result older than the last memory write is ever served.
+
 Performance target: <100ms P95 (without reranking), <200ms P95 (with reranking)
 
 Architecture:
@@ -30,27 +46,36 @@ Architecture:
 
 import asyncio
 import json
+import os
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.sql import text
 import structlog
 
 from services.rrf_fusion_service import RRFFusionService
+from services.filtered_ann_planner import FilteredANNPlanner
+from services.matryoshka_search import MatryoshkaSearch, get_matryoshka_search
+from services.binary_prefilter import BinaryPrefilter, get_binary_prefilter
+from services.caches import cache_keys
+from services.caches.memory_search_cache import MemorySearchCache
+from services.resource_scheduler import interactive_operation
 from mnemo_mcp.models.memory_models import MemoryFilters, MemoryType
 
 logger = structlog.get_logger()
 
+FUSION_MODES = ("python", "sql")
+
 
 @dataclass
 class MemorySearchResult:
     """Base result for memory search (used by both lexical and vector)."""
     memory_id: str  # For RRF fusion (uses chunk_id internally)
     title: str
-    content_preview: str  # First 500 chars
+    content_preview: str  # First preview_chars chars (LEFT(content, n))
     memory_type: str
     tags: List[str]
     created_at: str
@@ -95,6 +120,26 @@ class HybridMemorySearchResult:
     rerank_score: Optional[float] = None  # EPIC-24 P2: BM25 score
     contribution: Dict[str, float] = field(default_factory=dict)
 
+    # Full content, hydrated only when search(include_content=True)
+    content: Optional[str] = None
+
+
+@dataclass
+class CandidateFusion:
+    """Fused candidates plus per-method results/timings (either fusion mode)."""
+    fused: List[Any]
+    lexical_results: Optional[List[MemorySearchResult]] = None
+    vector_results: Optional[List[MemorySearchResult]] = None
+    entity_results: Optional[List[MemorySearchResult]] = None
+    tag_results: Optional[List[MemorySearchResult]] = None
+    lexical_time_ms: Optional[float] = None
+    vector_time_ms: Optional[float] = None
+    entity_time_ms: Optional[float] = None
+    tag_time_ms: Optional[float] = None
+    fusion_time_ms: Optional[float] = None
+    connections: int = 0
+    content_bytes: Optional[int] = None  # Preview bytes fetched, if not derivable from the lists
+
 
 @dataclass
 class HybridMemorySearchMetadata:
@@ -124,6 +169,18 @@ class HybridMemorySearchMetadata:
     tag_time_ms: Optional[float] = None
     keywords_extracted: bool = False
 
+    # Lean projection: content bytes shipped from PostgreSQL for this search
+    content_bytes_fetched: int = 0
+    hydrated_count: int = 0
+    hydration_time_ms: Optional[float] = None
+
+    # Served from MemorySearchCache
+    cache_hit: bool = False
+
+    # "python" (parallel generators + Python RRF) or "sql" (single statement)
+    fusion_mode: str = "python"
+    connections_used: int = 0
+
 
 @dataclass
 class HybridMemorySearchResponse:
@@ -159,6 +216,12 @@ class HybridMemorySearchService:
         default_vector_weight: float = 0.5,
         default_enable_reranking: bool = True,
         default_enable_decay: bool = True,
+        ann_planner: Optional[FilteredANNPlanner] = None,
+        preview_chars: int = 500,
+        result_cache: Optional[MemorySearchCache] = None,
+        default_fusion_mode: Optional[str] = None,
+        matryoshka: Optional[MatryoshkaSearch] = None,
+        binary_prefilter: Optional[BinaryPrefilter] = None,
     ):
         """
         Initialize hybrid memory search service.
@@ -172,6 +235,13 @@ class HybridMemorySearchService:
             default_vector_weight: Default weight for vector results (0.5)
             default_enable_reranking: Enable BM25 reranking by default (True)
             default_enable_decay: Enable temporal decay scoring by default (True)
+            ann_planner: Optional filtered ANN planner (created from env if not provided)
+            preview_chars: Content characters fetched per candidate (default: 500)
+            result_cache: Optional write-aware result cache (None = no caching)
+            default_fusion_mode: "python" or "sql" (default: MEMORY_SEARCH_FUSION_MODE or "python")
+            matryoshka: Optional two-stage vector search settings (process-wide default)
+            binary_prefilter: Optional binary-quantised prefilter (process-wide default,
+                              enabled by VECTOR_SEARCH_PREFILTER=binary)
         """
         self.engine = engine
         self.fusion = fusion_service or RRFFusionService(k=60)
@@ -181,6 +251,15 @@ class HybridMemorySearchService:
         self.default_vector_weight = default_vector_weight
         self.default_enable_reranking = default_enable_reranking
         self.default_enable_decay = default_enable_decay
+        self.ann_planner = ann_planner or FilteredANNPlanner()
+        self.matryoshka = matryoshka or get_matryoshka_search()
+        self.binary_prefilter = binary_prefilter or get_binary_prefilter()
+        self.preview_chars = preview_chars
+        self.result_cache = result_cache
+        self.default_fusion_mode = default_fusion_mode or os.getenv("MEMORY_SEARCH_FUSION_MODE", "python")
+        if self.default_fusion_mode not in FUSION_MODES:
+            raise ValueError(f"Invalid fusion mode: {self.default_fusion_mode} (expected one of {FUSION_MODES})")
+        self.embedding_model = os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-text-v1.5")
 
         logger.info(
             "HybridMemorySearchService initialized",
@@ -190,6 +269,7 @@ class HybridMemorySearchService:
             decay_enabled=default_enable_decay,
         )
 
+    @interactive_operation("search_memory")
     async def search(
         self,
         query: str,
@@ -206,6 +286,8 @@ class HybridMemorySearchService:
         candidate_pool_size: int = 50,
         rerank_pool_size: int = 30,
         vector_similarity_threshold: float = 0.1,
+        include_content: bool = False,
+        fusion_mode: Optional[str] = None,
     ) -> HybridMemorySearchResponse:
         """
         Execute hybrid memory search.
@@ -229,6 +311,12 @@ class HybridMemorySearchService:
             vector_similarity_threshold: Minimum similarity for vector results (default: 0.1)
                 - Filters out low-quality vector results that would pollute fusion
                 - Prevents semantic noise from dominating exact lexical matches
+            include_content: Hydrate full content for the returned page (default: False)
+                Candidates only carry a bounded preview; full content is
+                fetched for the final page only.
+            fusion_mode: "python" or "sql" (default: default_fusion_mode)
+                sql returns only the fused top max(offset + limit, rerank_pool_size),
+                so decay re-ordering operates on that window.
 
         Returns:
             HybridMemorySearchResponse with fused results and metadata
@@ -246,118 +334,93 @@ class HybridMemorySearchService:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
+        fusion_mode = fusion_mode or self.default_fusion_mode
+        if fusion_mode not in FUSION_MODES:
+            raise ValueError(f"Invalid fusion mode: {fusion_mode} (expected one of {FUSION_MODES})")
+
         if enable_vector and embedding is None:
             logger.warning("Vector search enabled but no embedding provided, using lexical-only")
             enable_vector = False
 
-        # Execute searches (parallel for lexical + vector)
-        lexical_results = None
-        vector_results = None
-        entity_results = None
-        tag_results = None
-        lexical_time = None
-        vector_time = None
-        entity_time = None
-        tag_time = None
-
-        # Build search tasks
-        search_tasks = []
-        task_map = {}
-        task_idx = 0
-
-        if enable_lexical:
-            search_tasks.append(self._lexical_search(query=query, filters=filters, limit=candidate_pool_size))
-            task_map[task_idx] = "lexical"
-            task_idx += 1
-
-        if enable_vector:
-            search_tasks.append(self._vector_search(embedding=embedding, filters=filters, limit=candidate_pool_size))
-            task_map[task_idx] = "vector"
-            task_idx += 1
-
-        # Entity and tag search only if keywords available
-        ll_keywords = keywords.ll_keywords if keywords else []
-        if enable_lexical and ll_keywords:
-            search_tasks.append(self._entity_search(keywords=ll_keywords, filters=filters, limit=candidate_pool_size))
-            task_map[task_idx] = "entity"
-            task_idx += 1
-
-        if ll_keywords:
-            search_tasks.append(self._tag_search(keywords=ll_keywords, filters=filters, limit=candidate_pool_size))
-            task_map[task_idx] = "tag"
-            task_idx += 1
-
-        # Execute all searches in parallel
-        if search_tasks:
-            results = await asyncio.gather(*search_tasks)
-            for i, (search_results, search_time) in enumerate(results):
-                method = task_map.get(i)
-                if method == "lexical":
-                    lexical_results, lexical_time = search_results, search_time
-                elif method == "vector":
-                    vector_results, vector_time = search_results, search_time
-                elif method == "entity":
-                    entity_results, entity_time = search_results, search_time
-                elif method == "tag":
-                    tag_results, tag_time = search_results, search_time
-
-        # Filter low-quality vector results to prevent semantic noise
-        # from dominating exact lexical matches
-        if vector_results and vector_similarity_threshold > 0:
-            original_count = len(vector_results)
-            vector_results = [
-                r for r in vector_results
-                if r.similarity_score and r.similarity_score >= vector_similarity_threshold
-            ]
-            # Re-assign ranks after filtering
-            for i, r in enumerate(vector_results, start=1):
-                r.rank = i
-
-            if len(vector_results) < original_count:
-                logger.debug(
-                    "Vector results filtered by threshold",
-                    original=original_count,
-                    filtered=len(vector_results),
-                    threshold=vector_similarity_threshold
-                )
-
-        # RRF Fusion
-        fusion_start = time.time()
-
-        # Build results and weights lists dynamically
-        fusion_results = []
-        fusion_weights = []
+        should_rerank = enable_reranking if enable_reranking is not None else self.default_enable_reranking
 
-        if lexical_results:
-            fusion_results.append(lexical_results)
-            fusion_weights.append(lexical_weight)
-        if vector_results:
-            fusion_results.append(vector_results)
-            fusion_weights.append(vector_weight)
-        if entity_results:
-            fusion_results.append(entity_results)
-            entity_w = 0.15 if (lexical_results and vector_results) else 0.3
-            fusion_weights.append(entity_w)
-        if tag_results:
-            fusion_results.append(tag_results)
-            tag_w = 0.15 if (lexical_results and vector_results) else 0.3
-            fusion_weights.append(tag_w)
-
-        # Normalize weights
-        total_w = sum(fusion_weights)
-        if total_w > 0:
-            fusion_weights = [w / total_w for w in fusion_weights]
-
-        if fusion_results:
-            fused_results = self.fusion.fuse(*fusion_results)
+        cache_key = None
+        if self.result_cache is not None:
+            generation = await self.result_cache.generation(
+                filters.project_id if filters else None
+            )
+            if generation is not None:
+                cache_key = cache_keys.memory_search_key(generation, {
+                    "q": " ".join(query.split()),
+                    "kw": [sorted(keywords.hl_keywords), sorted(keywords.ll_keywords)] if keywords else None,
+                    "f": filters.model_dump(mode="json") if filters else None,
+                    "l": limit,
+                    "o": offset,
+                    "el": enable_lexical,
+                    "ev": enable_vector,
+                    "emb": hash(tuple(embedding)) if enable_vector else None,
+                    "model": self.embedding_model,
+                    "rr": should_rerank,
+                    "decay": self.default_enable_decay,
+                    "lw": lexical_weight,
+                    "vw": vector_weight,
+                    "cp": candidate_pool_size,
+                    "rp": rerank_pool_size,
+                    "vt": vector_similarity_threshold,
+                    "ic": include_content,
+                    "fm": fusion_mode,
+                })
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    cached.metadata.cache_hit = True
+                    cached.metadata.execution_time_ms = (time.time() - start_time) * 1000
+                    logger.debug("Hybrid memory search cache hit", query=query[:50])
+                    return cached
+
+        if fusion_mode == "sql":
+            candidates = await self._sql_fusion(
+                query=query,
+                embedding=embedding,
+                keywords=keywords,
+                filters=filters,
+                enable_lexical=enable_lexical,
+                enable_vector=enable_vector,
+                lexical_weight=lexical_weight,
+                vector_weight=vector_weight,
+                candidate_pool_size=candidate_pool_size,
+                vector_similarity_threshold=vector_similarity_threshold,
+                fetch_limit=max(offset + limit, rerank_pool_size if should_rerank else 0),
+            )
         else:
-            fused_results = []
-        fusion_time = (time.time() - fusion_start) * 1000
+            candidates = await self._python_fusion(
+                query=query,
+                embedding=embedding,
+                keywords=keywords,
+                filters=filters,
+                enable_lexical=enable_lexical,
+                enable_vector=enable_vector,
+                lexical_weight=lexical_weight,
+                vector_weight=vector_weight,
+                candidate_pool_size=candidate_pool_size,
+                vector_similarity_threshold=vector_similarity_threshold,
+            )
+
+        fused_results = candidates.fused
+        lexical_results = candidates.lexical_results
+        vector_results = candidates.vector_results
+        entity_results = candidates.entity_results
+        tag_results = candidates.tag_results
+        lexical_time = candidates.lexical_time_ms
+        vector_time = candidates.vector_time_ms
+        entity_time = candidates.entity_time_ms
+        tag_time = candidates.tag_time_ms
+        fusion_time = candidates.fusion_time_ms
 
         # EPIC-24 P2: BM25 reranking (optional)
         reranking_time = None
         rerank_scores = {}  # memory_id -> rerank_score
-        should_rerank = enable_reranking if enable_reranking is not None else self.default_enable_reranking
+        full_content: Dict[str, str] = {}  # memory_id -> hydrated content
+        hydration_time = None
 
         if should_rerank and fused_results:
             # Limit reranking candidates for performance
@@ -369,9 +432,21 @@ class HybridMemorySearchService:
                 # Lazy-load reranker
                 await self._ensure_reranker_loaded()
 
-                # Prepare documents for reranking (use content preview)
+                # Hydrate full content for rerank candidates only
+                hydration_start = time.time()
+                full_content.update(await self._hydrate_content(
+                    [f.chunk_id for f in rerank_candidates]
+                ))
+                hydration_time = (time.time() - hydration_start) * 1000
+
+                # Prepare documents for reranking (full content, preview as fallback)
                 documents = [
-                    (f.chunk_id, f.original_result.content_preview or f.original_result.title)
+                    (
+                        f.chunk_id,
+                        full_content.get(f.chunk_id)
+                        or f.original_result.content_preview
+                        or f.original_result.title,
+                    )
                     for f in rerank_candidates
                 ]
 
@@ -457,14 +532,31 @@ class HybridMemorySearchService:
         # Apply offset and limit (after reranking + decay)
         fused_results = fused_results[offset:offset + limit]
 
+        # Hydrate full content for the final page (reuses rerank hydration)
+        if include_content and fused_results:
+            missing = [f.chunk_id for f in fused_results if f.chunk_id not in full_content]
+            if missing:
+                hydration_start = time.time()
+                full_content.update(await self._hydrate_content(missing))
+                hydration_time = (hydration_time or 0.0) + (time.time() - hydration_start) * 1000
+
         # Build hybrid results
         hybrid_results = self._build_hybrid_results(
             fused_results=fused_results,
             lexical_results=lexical_results,
             vector_results=vector_results,
             rerank_scores=rerank_scores,
+            full_content=full_content if include_content else None,
         )
 
+        if candidates.content_bytes is not None:
+            content_bytes = candidates.content_bytes
+        else:
+            content_bytes = self._content_bytes(
+                lexical_results, vector_results, entity_results, tag_results
+            )
+        content_bytes += sum(len(c.encode("utf-8")) for c in full_content.values())
+
         # Build metadata
         total_time = (time.time() - start_time) * 1000
 
@@ -488,6 +580,11 @@ class HybridMemorySearchService:
             keywords_extracted=bool(keywords and (keywords.hl_keywords or keywords.ll_keywords)),
             fusion_time_ms=fusion_time,
             reranking_time_ms=reranking_time,
+            content_bytes_fetched=content_bytes,
+            hydrated_count=len(full_content),
+            hydration_time_ms=hydration_time,
+            fusion_mode=fusion_mode,
+            connections_used=candidates.connections,
         )
 
         logger.info(
@@ -498,12 +595,542 @@ class HybridMemorySearchService:
             lexical_count=len(lexical_results) if lexical_results else 0,
             vector_count=len(vector_results) if vector_results else 0,
             reranking=should_rerank,
+            content_bytes=content_bytes,
+            hydrated=len(full_content),
+            fusion_mode=fusion_mode,
+            connections=candidates.connections,
         )
 
-        return HybridMemorySearchResponse(
+        response = HybridMemorySearchResponse(
             results=hybrid_results,
             metadata=metadata,
         )
+        if cache_key is not None:
+            self.result_cache.set(cache_key, response)
+
+        return response
+
+    async def _python_fusion(
+        self,
+        query: str,
+        embedding: Optional[List[float]],
+        keywords: Optional[Any],
+        filters: Optional[MemoryFilters],
+        enable_lexical: bool,
+        enable_vector: bool,
+        lexical_weight: float,
+        vector_weight: float,
+        candidate_pool_size: int,
+        vector_similarity_threshold: float,
+    ) -> "CandidateFusion":
+        """
+        Run candidate generators in parallel (one connection each) and fuse in Python.
+        """
+        # Execute searches (parallel for lexical + vector)
+        lexical_results = None
+        vector_results = None
+        entity_results = None
+        tag_results = None
+        lexical_time = None
+        vector_time = None
+        entity_time = None
+        tag_time = None
+
+        # Build search tasks
+        search_tasks = []
+        task_map = {}
+        task_idx = 0
+
+        if enable_lexical:
+            search_tasks.append(self._lexical_search(query=query, filters=filters, limit=candidate_pool_size))
+            task_map[task_idx] = "lexical"
+            task_idx += 1
+
+        if enable_vector:
+            search_tasks.append(self._vector_search(embedding=embedding, filters=filters, limit=candidate_pool_size))
+            task_map[task_idx] = "vector"
+            task_idx += 1
+
+        # Entity and tag search only if keywords available
+        ll_keywords = keywords.ll_keywords if keywords else []
+        if enable_lexical and ll_keywords:
+            search_tasks.append(self._entity_search(keywords=ll_keywords, filters=filters, limit=candidate_pool_size))
+            task_map[task_idx] = "entity"
+            task_idx += 1
+
+        if ll_keywords:
+            search_tasks.append(self._tag_search(keywords=ll_keywords, filters=filters, limit=candidate_pool_size))
+            task_map[task_idx] = "tag"
+            task_idx += 1
+
+        # Execute all searches in parallel
+        if search_tasks:
+            results = await asyncio.gather(*search_tasks)
+            for i, (search_results, search_time) in enumerate(results):
+                method = task_map.get(i)
+                if method == "lexical":
+                    lexical_results, lexical_time = search_results, search_time
+                elif method == "vector":
+                    vector_results, vector_time = search_results, search_time
+                elif method == "entity":
+                    entity_results, entity_time = search_results, search_time
+                elif method == "tag":
+                    tag_results, tag_time = search_results, search_time
+
+        # Filter low-quality vector results to prevent semantic noise
+        # from dominating exact lexical matches
+        if vector_results and vector_similarity_threshold > 0:
+            original_count = len(vector_results)
+            vector_results = [
+                r for r in vector_results
+                if r.similarity_score and r.similarity_score >= vector_similarity_threshold
+            ]
+            # Re-assign ranks after filtering
+            for i, r in enumerate(vector_results, start=1):
+                r.rank = i
+
+            if len(vector_results) < original_count:
+                logger.debug(
+                    "Vector results filtered by threshold",
+                    original=original_count,
+                    filtered=len(vector_results),
+                    threshold=vector_similarity_threshold
+                )
+
+        # RRF Fusion
+        fusion_start = time.time()
+
+        # Weighted RRF over the generators that returned candidates
+        method_results = {
+            "lexical": lexical_results,
+            "vector": vector_results,
+            "entity": entity_results,
+            "tag": tag_results,
+        }
+        method_results = {m: r for m, r in method_results.items() if r}
+        weights = self._fusion_weights(lexical_weight, vector_weight, method_results)
+
+        if method_results:
+            fused_results = self.fusion.fuse_with_weights(
+                [(results, weights[method]) for method, results in method_results.items()]
+            )
+        else:
+            fused_results = []
+        fusion_time = (time.time() - fusion_start) * 1000
+
+        return CandidateFusion(
+            fused=fused_results,
+            lexical_results=lexical_results,
+            vector_results=vector_results,
+            entity_results=entity_results,
+            tag_results=tag_results,
+            lexical_time_ms=lexical_time,
+            vector_time_ms=vector_time,
+            entity_time_ms=entity_time,
+            tag_time_ms=tag_time,
+            fusion_time_ms=fusion_time,
+            connections=len(search_tasks),
+        )
+
+    async def _sql_fusion(
+        self,
+        query: str,
+        embedding: Optional[List[float]],
+        keywords: Optional[Any],
+        filters: Optional[MemoryFilters],
+        enable_lexical: bool,
+        enable_vector: bool,
+        lexical_weight: float,
+        vector_weight: float,
+        candidate_pool_size: int,
+        vector_similarity_threshold: float,
+        fetch_limit: int,
+    ) -> CandidateFusion:
+        """
+        Run all candidate generators as CTEs and fuse with RRF in SQL.
+
+        One connection, one statement (plus SET LOCAL for HNSW tuning). Only
+        the fused top fetch_limit rows come back, with per-method ranks.
+        Generators mirror _lexical_search/_vector_search/_entity_search/
+        _tag_search, and the fusion is RRFFusionService.fuse_with_weights:
+        weight / (k + rank) with the _fusion_weights() of the generators
+        that returned candidates, ties in first-seen order (lexical, vector,
+        entity, tag). Both modes therefore return the same ranking.
+        """
+        start_time = time.time()
+        params: Dict[str, Any] = {
+            "pool": candidate_pool_size,
+            "fetch_limit": fetch_limit,
+            "preview_chars": self.preview_chars,
+            "rrf_k": self.fusion.k,
+            "lexical_weight": float(lexical_weight),
+            "vector_weight": float(vector_weight),
+        }
+        filter_sql = " AND ".join(self._filter_clauses(filters, params, include_tags=True))
+        tag_filter_sql = " AND ".join(self._filter_clauses(filters, params, include_tags=False))
+
+        ctes: List[str] = []
+        generators: List[str] = []
+
+        if enable_lexical:
+            params["query"] = query
+            params["ilike_pattern"] = f"%{query}%"
+            ctes.append(f"""
+            lexical_candidates AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY score DESC) AS rnk, score
+                FROM (
+                    SELECT
+                        id,
+                        GREATEST(
+                            similarity(title, :query),
+                            COALESCE(similarity(embedding_source, :query), 0),
+                            CASE WHEN title ILIKE :ilike_pattern THEN 1.0
+                                 WHEN embedding_source ILIKE :ilike_pattern THEN 0.95
+                                 ELSE 0.0 END
+                        ) AS score
+                    FROM memories
+                    WHERE {filter_sql}
+                        AND (
+                            title ILIKE :ilike_pattern
+                            OR embedding_source ILIKE :ilike_pattern
+                            OR title % :query
+                            OR embedding_source % :query
+                        )
+                    ORDER BY score DESC
+                    LIMIT :pool
+                ) s
+            )""")
+            generators.append("lexical")
+
+        filtered = False
+        if enable_vector:
+            from utils.sql_vector import format_halfvec_for_sql
+            vector_str = f"'{format_halfvec_for_sql(embedding)}'::halfvec"
+            threshold_sql = ""
+            if vector_similarity_threshold > 0:
+                params["vector_threshold"] = vector_similarity_threshold
+                threshold_sql = "WHERE 1 - distance >= :vector_threshold"
+            vector_source = f"""
+                    SELECT id, embedding_half <=> {vector_str} AS distance
+                    FROM memories
+                    WHERE {filter_sql} AND embedding_half IS NOT NULL
+                    ORDER BY embedding_half <=> {vector_str}
+                    LIMIT :pool"""
+            mrl_dim = self.matryoshka.dim_for("TEXT")
+            vector_where = f"{filter_sql} AND embedding_half IS NOT NULL"
+            coarse_sql = None
+            # Two-stage: compact-index ANN candidates rescored on full vectors
+            if self.binary_prefilter.enabled:
+                coarse_sql = self.binary_prefilter.coarse_candidates_sql(
+                    "memories", "embedding_half", embedding, vector_where,
+                )
+                candidate_param = "bq_candidate_limit"
+                params[candidate_param] = self.binary_prefilter.candidate_limit(candidate_pool_size)
+            elif mrl_dim:
+                coarse_sql = self.matryoshka.coarse_candidates_sql(
+                    "memories", "embedding_half", mrl_dim, embedding, vector_where,
+                )
+                candidate_param = "mrl_candidate_limit"
+                params[candidate_param] = self.matryoshka.candidate_limit(candidate_pool_size)
+            if coarse_sql:
+                vector_source = f"""
+                    SELECT id, embedding_half <=> {vector_str} AS distance
+                    FROM memories
+                    JOIN ({coarse_sql}
+                    ) coarse_c USING (id)
+                    ORDER BY distance
+                    LIMIT :pool"""
+            ctes.append(f"""
+            vector_candidates AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS rnk, 1 - distance AS score
+                FROM ({vector_source}
+                ) s
+                {threshold_sql}
+            )""")
+            generators.append("vector")
+            filtered = filter_sql != "deleted_at IS NULL"
+
+        ll_keywords = (keywords.ll_keywords if keywords else [])[:5]
+
+        if enable_lexical and ll_keywords:
+            entity_conditions = []
+            for i, kw in enumerate(ll_keywords):
+                params[f"ent_kw{i}"] = json.dumps([{"name": kw}])
+                entity_conditions.append(f"entities @> CAST(:ent_kw{i} AS jsonb)")
+            ctes.append(f"""
+            entity_candidates AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY created_at DESC) AS rnk, 1.0 AS score
+                FROM (
+                    SELECT id, created_at
+                    FROM memories
+                    WHERE {filter_sql} AND entities != '[]'::jsonb
+                        AND ({" OR ".join(entity_conditions)})
+                    ORDER BY created_at DESC
+                    LIMIT :pool
+                ) s
+            )""")
+            generators.append("entity")
+
+        if ll_keywords:
+            tag_conditions = []
+            for i, kw in enumerate(ll_keywords):
+                params[f"tag_kw{i}"] = kw.lower()
+                tag_conditions.append(
+                    f"(:tag_kw{i} = ANY(tags) OR auto_tags LIKE '%' || :tag_kw{i} || '%')"
+                )
+            ctes.append(f"""
+            tag_candidates AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY created_at DESC) AS rnk, 1.0 AS score
+                FROM (
+                    SELECT id, created_at
+                    FROM memories
+                    WHERE {tag_filter_sql} AND ({" OR ".join(tag_conditions)})
+                    ORDER BY created_at DESC
+                    LIMIT :pool
+                ) s
+            )""")
+            generators.append("tag")
+
+        if not generators:
+            return CandidateFusion(fused=[], connections=0)
+
+        branches = [
+            f"SELECT id, rnk, score, '{method}' AS method FROM {method}_candidates"
+            for method in generators
+        ]
+
+        rank_columns = ",\n".join(
+            f"                    MIN(rnk) FILTER (WHERE method = '{m}') AS {m}_rank"
+            for m in ("lexical", "vector", "entity", "tag")
+        )
+        union_sql = "\n                    UNION ALL ".join(branches)
+
+        # Same weights as _fusion_weights(), over the non-empty generators
+        both_sql = (
+            "EXISTS (SELECT 1 FROM lexical_candidates) AND EXISTS (SELECT 1 FROM vector_candidates)"
+            if {"lexical", "vector"} <= set(generators) else "FALSE"
+        )
+        method_weight_sql = {
+            "lexical": "CAST(:lexical_weight AS double precision)",
+            "vector": "CAST(:vector_weight AS double precision)",
+            "entity": f"CASE WHEN {both_sql} THEN 0.15 ELSE 0.3 END",
+            "tag": f"CASE WHEN {both_sql} THEN 0.15 ELSE 0.3 END",
+        }
+        weight_sql = "\n                    UNION ALL ".join(
+            f"SELECT '{m}' AS method, {method_weight_sql[m]} AS weight"
+            f" WHERE EXISTS (SELECT 1 FROM {m}_candidates)"
+            for m in generators
+        )
+        weight_columns = ",\n".join(
+            f"                (SELECT weight FROM weights WHERE method = '{m}') AS {m}_weight"
+            for m in ("lexical", "vector", "entity", "tag")
+        )
+
+        query_sql = text(f"""
+            WITH {",".join(ctes)},
+            weights AS (
+                SELECT method, weight / SUM(weight) OVER () AS weight
+                FROM (
+                    {weight_sql}
+                ) w
+            ),
+            fused AS (
+                SELECT
+                    id,
+                    SUM(w.weight / (:rrf_k + rnk)) AS rrf_score,
+{rank_columns},
+                    MAX(score) FILTER (WHERE method = 'lexical') AS lexical_score,
+                    MAX(score) FILTER (WHERE method = 'vector') AS vector_score
+                FROM (
+                    {union_sql}
+                ) u
+                JOIN weights w USING (method)
+                GROUP BY id
+            )
+            SELECT
+                m.id::text AS memory_id,
+                m.title,
+                LEFT(m.content, :preview_chars) AS content_preview,
+                m.memory_type,
+                m.tags,
+                m.created_at::text,
+                m.author,
+                f.rrf_score,
+                f.lexical_rank,
+                f.vector_rank,
+                f.entity_rank,
+                f.tag_rank,
+                f.lexical_score,
+                f.vector_score,
+{weight_columns}
+            FROM fused f
+            JOIN memories m ON m.id = f.id
+            ORDER BY f.rrf_score DESC,
+                f.lexical_rank NULLS LAST, f.vector_rank NULLS LAST,
+                f.entity_rank NULLS LAST, f.tag_rank NULLS LAST
+            LIMIT :fetch_limit
+        """)
+
+        try:
+            async with self.engine.begin() as conn:
+                if enable_vector:
+                    if filtered and self.ann_planner.enabled:
+                        plan = await self.ann_planner.plan(
+                            conn, "memories", filter_sql, params,
+                            limit=params.get(
+                                "bq_candidate_limit", params.get("mrl_candidate_limit", candidate_pool_size)
+                            ),
+                            base_ef_search=100,
+                        )
+                        await self.ann_planner.apply(conn, plan)
+                    else:
+                        await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
+                        await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+                result = await conn.execute(query_sql, params)
+                rows = result.fetchall()
+        except Exception as e:
+            # Degrade to one statement per generator rather than no results
+            logger.error("SQL hybrid search failed, falling back to Python fusion", error=str(e))
+            return await self._python_fusion(
+                query=query,
+                embedding=embedding,
+                keywords=keywords,
+                filters=filters,
+                enable_lexical=enable_lexical,
+                enable_vector=enable_vector,
+                lexical_weight=lexical_weight,
+                vector_weight=vector_weight,
+                candidate_pool_size=candidate_pool_size,
+                vector_similarity_threshold=vector_similarity_threshold,
+            )
+
+        from services.rrf_fusion_service import FusedResult
+
+        k = self.fusion.k
+        methods = ("lexical", "vector", "entity", "tag")
+        per_method: Dict[str, List[MemorySearchResult]] = {m: [] for m in methods}
+        fused: List[FusedResult] = []
+        content_bytes = 0
+
+        for position, row in enumerate(rows, start=1):
+            original = MemorySearchResult(
+                memory_id=row[0],
+                title=row[1],
+                content_preview=row[2],
+                memory_type=row[3],
+                tags=self._parse_pg_array(row[4]),
+                created_at=row[5],
+                author=row[6],
+                trgm_score=float(row[12]) if row[12] is not None else None,
+                similarity_score=float(row[13]) if row[13] is not None else None,
+            )
+            original.rank = position
+            if original.content_preview:
+                content_bytes += len(original.content_preview.encode("utf-8"))
+
+            contribution = {}
+            for method, method_rank, weight in zip(methods, row[8:12], row[14:18]):
+                if method_rank is not None:
+                    contribution[method] = float(weight) / (k + method_rank)
+                    per_method[method].append(original)
+
+            fused.append(FusedResult(
+                chunk_id=row[0],
+                rrf_score=float(row[7]),
+                rank=position,
+                original_result=original,
+                contribution=contribution,
+            ))
+
+        elapsed = (time.time() - start_time) * 1000
+
+        logger.debug(
+            "SQL hybrid search completed",
+            results=len(fused),
+            generators=generators,
+            time_ms=f"{elapsed:.2f}",
+        )
+
+        return CandidateFusion(
+            fused=fused,
+            lexical_results=per_method["lexical"] if enable_lexical else None,
+            vector_results=per_method["vector"] if enable_vector else None,
+            entity_results=per_method["entity"] if "entity" in generators else None,
+            tag_results=per_method["tag"] if "tag" in generators else None,
+            fusion_time_ms=elapsed,
+            connections=1,
+            content_bytes=content_bytes,
+        )
+
+    @staticmethod
+    def _fusion_weights(
+        lexical_weight: float,
+        vector_weight: float,
+        methods: Iterable[str],
+    ) -> Dict[str, float]:
+        """
+        Normalised RRF weight of each generator that returned candidates.
+
+        Entity and tag matches weigh 0.15 next to both lexical and vector
+        results, 0.3 otherwise.
+        """
+        methods = set(methods)
+        side_weight = 0.15 if {"lexical", "vector"} <= methods else 0.3
+        weights = {
+            "lexical": lexical_weight,
+            "vector": vector_weight,
+            "entity": side_weight,
+            "tag": side_weight,
+        }
+        weights = {m: w for m, w in weights.items() if m in methods}
+        total = sum(weights.values())
+        if total > 0:
+            weights = {m: w / total for m, w in weights.items()}
+        return weights
+
+    @staticmethod
+    def _filter_clauses(
+        filters: Optional[MemoryFilters],
+        params: Dict[str, Any],
+        include_tags: bool = True,
+    ) -> List[str]:
+        """WHERE clauses of every candidate generator, both fusion modes (fills params)."""
+        where_clauses = ["deleted_at IS NULL"]
+        if not filters:
+            return where_clauses
+
+        if filters.project_id:
+            where_clauses.append("project_id = :project_id")
+            params["project_id"] = str(filters.project_id)
+
+        if filters.memory_type:
+            where_clauses.append("memory_type = :memory_type")
+            params["memory_type"] = filters.memory_type.value
+
+        if include_tags and filters.tags:
+            for i, tag in enumerate(filters.tags):
+                where_clauses.append(f":tag{i} = ANY(tags)")
+                params[f"tag{i}"] = tag
+
+        if filters.consumed is not None:
+            if filters.consumed:
+                where_clauses.append("consumed_at IS NOT NULL")
+            else:
+                where_clauses.append("consumed_at IS NULL")
+
+        # EPIC-32: lifecycle_state filtering via tag-based rules
+        if filters.lifecycle_state:
+            if filters.lifecycle_state == "sealed":
+                where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
+                where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
+            elif filters.lifecycle_state == "candidate":
+                where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
+            elif filters.lifecycle_state == "doubt":
+                where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
+            elif filters.lifecycle_state == "summary":
+                where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:summary')")
+
+        return where_clauses
 
     async def _ensure_reranker_loaded(self):
         """Lazy-load the BM25 reranker on first use."""
@@ -517,6 +1144,36 @@ class HybridMemorySearchService:
             from services.memory_decay_service import MemoryDecayService
             self.decay_service = MemoryDecayService()
 
+    async def _hydrate_content(self, memory_ids: List[str]) -> Dict[str, str]:
+        """Fetch full content for a small set of memories (rerank pool / final page)."""
+        if not memory_ids:
+            return {}
+
+        query_sql = text("""
+            SELECT id::text, content
+            FROM memories
+            WHERE id = ANY(:ids) AND deleted_at IS NULL
+        """)
+
+        try:
+            async with self.engine.begin() as conn:
+                result = await conn.execute(query_sql, {"ids": list(memory_ids)})
+                rows = result.fetchall()
+            return {row[0]: row[1] for row in rows if row[1] is not None}
+        except Exception as e:
+            logger.warning("Content hydration failed, using previews", error=str(e))
+            return {}
+
+    @staticmethod
+    def _content_bytes(*result_lists: Optional[List[MemorySearchResult]]) -> int:
+        """UTF-8 size of the content previews fetched by candidate generators."""
+        total = 0
+        for results in result_lists:
+            for r in results or []:
+                if r.content_preview:
+                    total += len(r.content_preview.encode("utf-8"))
+        return total
+
     async def _lexical_search(
         self,
         query: str,
@@ -535,47 +1192,13 @@ class HybridMemorySearchService:
         """
         start_time = time.time()
 
-        # Build WHERE clauses
-        where_clauses = ["deleted_at IS NULL"]
-        params: Dict[str, Any] = {"query": query, "limit": limit}
+        params: Dict[str, Any] = {"query": query, "limit": limit, "preview_chars": self.preview_chars}
 
         # For ILIKE pattern
         ilike_pattern = f"%{query}%"
         params["ilike_pattern"] = ilike_pattern
 
-        if filters:
-            if filters.project_id:
-                where_clauses.append("project_id = :project_id")
-                params["project_id"] = str(filters.project_id)
-
-            if filters.memory_type:
-                where_clauses.append("memory_type = :memory_type")
-                params["memory_type"] = filters.memory_type.value
-
-            if filters.tags:
-                for i, tag in enumerate(filters.tags):
-                    where_clauses.append(f":tag{i} = ANY(tags)")
-                    params[f"tag{i}"] = tag
-
-            if filters.consumed is not None:
-                if filters.consumed:
-                    where_clauses.append("consumed_at IS NOT NULL")
-                else:
-                    where_clauses.append("consumed_at IS NULL")
-
-            # EPIC-32: lifecycle_state filtering via tag-based rules
-            if filters.lifecycle_state:
-                if filters.lifecycle_state == "sealed":
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "candidate":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                elif filters.lifecycle_state == "doubt":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "summary":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:summary')")
-
-        where_sql = " AND ".join(where_clauses)
+        where_sql = " AND ".join(self._filter_clauses(filters, params))
 
         # Optimized approach: ILIKE + trigram on title/embedding_source ONLY
         # Skip content entirely - too slow without proper index
@@ -584,7 +1207,7 @@ class HybridMemorySearchService:
             SELECT
                 id::text as memory_id,
                 title,
-                content as content_preview,
+                LEFT(content, :preview_chars) as content_preview,
                 memory_type,
                 tags,
                 created_at::text,
@@ -641,74 +1264,99 @@ class HybridMemorySearchService:
         filters: Optional[MemoryFilters],
         limit: int,
     ) -> Tuple[List[MemorySearchResult], float]:
-        """Execute vector search using pgvector HNSW."""
-        start_time = time.time()
-
-        # Build WHERE clauses
-        where_clauses = ["deleted_at IS NULL", "embedding_half IS NOT NULL"]
-        params: Dict[str, Any] = {"limit": limit}
-
-        if filters:
-            if filters.project_id:
-                where_clauses.append("project_id = :project_id")
-                params["project_id"] = str(filters.project_id)
-
-            if filters.memory_type:
-                where_clauses.append("memory_type = :memory_type")
-                params["memory_type"] = filters.memory_type.value
+        """
+        Execute vector search using pgvector HNSW.
 
-            if filters.tags:
-                for i, tag in enumerate(filters.tags):
-                    where_clauses.append(f":tag{i} = ANY(tags)")
-                    params[f"tag{i}"] = tag
+        Filtered queries go through the filtered ANN planner (iterative scan
+        with selectivity-based ef_search, or exact scan on small partitions).
+        """
+        start_time = time.time()
 
-            if filters.consumed is not None:
-                if filters.consumed:
-                    where_clauses.append("consumed_at IS NOT NULL")
-                else:
-                    where_clauses.append("consumed_at IS NULL")
-
-            # EPIC-32: lifecycle_state filtering via tag-based rules
-            if filters.lifecycle_state:
-                if filters.lifecycle_state == "sealed":
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "candidate":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                elif filters.lifecycle_state == "doubt":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "summary":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:summary')")
-
-        where_sql = " AND ".join(where_clauses)
+        params: Dict[str, Any] = {"limit": limit, "preview_chars": self.preview_chars}
+        filter_clauses = self._filter_clauses(filters, params)
+        # Beyond deleted_at
+        filtered = len(filter_clauses) > 1
+        where_sql = " AND ".join(filter_clauses + ["embedding_half IS NOT NULL"])
 
         # Format vector for pgvector halfvec (validated via helper)
         from utils.sql_vector import format_halfvec_for_sql
         vector_str = f"'{format_halfvec_for_sql(embedding)}'::halfvec"
 
-        query_sql = text(f"""
-            SELECT
+        select_sql = f"""
                 id::text as memory_id,
                 title,
-                content as content_preview,
+                LEFT(content, :preview_chars) as content_preview,
                 memory_type,
                 tags,
                 created_at::text,
                 author,
-                (1 - (embedding_half <=> {vector_str})) as similarity_score
+                (1 - (embedding_half <=> {vector_str})) as similarity_score"""
+        query_sql = text(f"""
+            SELECT {select_sql}
             FROM memories
             WHERE {where_sql}
             ORDER BY embedding_half <=> {vector_str}
             LIMIT :limit
         """)
 
+        # Two-stage: binary-quantised or truncated-dim ANN, full-vector rescoring
+        mrl_dim = self.matryoshka.dim_for("TEXT")
+        prefilter = None
+        if self.binary_prefilter.enabled:
+            prefilter, alias, candidate_param = self.binary_prefilter, "bq_c", "bq_candidate_limit"
+            coarse_sql = self.binary_prefilter.coarse_candidates_sql(
+                "memories", "embedding_half", embedding, where_sql
+            )
+        elif mrl_dim:
+            prefilter, alias, candidate_param = self.matryoshka, "mrl_c", "mrl_candidate_limit"
+            coarse_sql = self.matryoshka.coarse_candidates_sql(
+                "memories", "embedding_half", mrl_dim, embedding, where_sql
+            )
+        if prefilter:
+            two_stage_sql = text(f"""
+            SELECT {select_sql},
+                {alias}.coarse_rank
+            FROM memories
+            JOIN ({coarse_sql}
+            ) {alias} USING (id)
+            ORDER BY embedding_half <=> {vector_str}
+            LIMIT :limit
+        """)
+            params[candidate_param] = prefilter.candidate_limit(limit)
+
         try:
+            plan = None
+            recall = None
+            two_stage = False
             async with self.engine.begin() as conn:
-                # pgvector tuning for halfvec search
-                await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
-                await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+                if filtered and self.ann_planner.enabled:
+                    plan = await self.ann_planner.plan(
+                        conn, "memories", where_sql, params,
+                        limit=params[candidate_param] if prefilter else limit, base_ef_search=100,
+                    )
+                    await self.ann_planner.apply(conn, plan)
+                else:
+                    # pgvector tuning for halfvec search
+                    await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
+                    await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+                # An exact scan of a small filtered set is cheap on full vectors
+                if prefilter and not (plan and plan.strategy == "exact"):
+                    query_sql = two_stage_sql
+                    two_stage = True
+                query_start = time.time()
                 result = await conn.execute(query_sql, params)
                 rows = result.fetchall()
+                query_time = (time.time() - query_start) * 1000
+
+                if plan and self.ann_planner.should_sample_recall(plan):
+                    recall = await self.ann_planner.measure_recall(
+                        conn, query_sql, params, [row[0] for row in rows],
+                    )
+
+            if plan:
+                self.ann_planner.record(plan, returned=len(rows), latency_ms=query_time, recall=recall)
+            if two_stage:
+                prefilter.record(limit, params[candidate_param], [row[8] for row in rows])
 
             results = []
             for rank, row in enumerate(rows, start=1):
@@ -751,40 +1399,8 @@ class HybridMemorySearchService:
         if not keywords:
             return [], (time.time() - start_time) * 1000
 
-        where_clauses = ["deleted_at IS NULL", "entities != '[]'::jsonb"]
-        params: Dict[str, Any] = {"limit": limit}
-
-        if filters:
-            if filters.project_id:
-                where_clauses.append("project_id = :project_id")
-                params["project_id"] = str(filters.project_id)
-            if filters.memory_type:
-                where_clauses.append("memory_type = :memory_type")
-                params["memory_type"] = filters.memory_type.value
-            if filters.tags:
-                for i, tag in enumerate(filters.tags):
-                    where_clauses.append(f":tag{i} = ANY(tags)")
-                    params[f"tag{i}"] = tag
-
-            if filters.consumed is not None:
-                if filters.consumed:
-                    where_clauses.append("consumed_at IS NOT NULL")
-                else:
-                    where_clauses.append("consumed_at IS NULL")
-
-            # EPIC-32: lifecycle_state filtering via tag-based rules
-            if filters.lifecycle_state:
-                if filters.lifecycle_state == "sealed":
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "candidate":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                elif filters.lifecycle_state == "doubt":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "summary":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:summary')")
-
-        where_sql = " AND ".join(where_clauses)
+        params: Dict[str, Any] = {"limit": limit, "preview_chars": self.preview_chars}
+        where_sql = " AND ".join(self._filter_clauses(filters, params) + ["entities != '[]'::jsonb"])
 
         # Build JSONB containment conditions for each keyword
         entity_conditions = []
@@ -801,7 +1417,7 @@ class HybridMemorySearchService:
             SELECT
                 id::text as memory_id,
                 title,
-                content as content_preview,
+                LEFT(content, :preview_chars) as content_preview,
                 memory_type,
                 tags,
                 created_at::text,
@@ -852,36 +1468,9 @@ class HybridMemorySearchService:
         if not keywords:
             return [], (time.time() - start_time) * 1000
 
-        where_clauses = ["deleted_at IS NULL"]
-        params: Dict[str, Any] = {"limit": limit}
-
-        if filters:
-            if filters.project_id:
-                where_clauses.append("project_id = :project_id")
-                params["project_id"] = str(filters.project_id)
-            if filters.memory_type:
-                where_clauses.append("memory_type = :memory_type")
-                params["memory_type"] = filters.memory_type.value
-
-            if filters.consumed is not None:
-                if filters.consumed:
-                    where_clauses.append("consumed_at IS NOT NULL")
-                else:
-                    where_clauses.append("consumed_at IS NULL")
-
-            # EPIC-32: lifecycle_state filtering via tag-based rules
-            if filters.lifecycle_state:
-                if filters.lifecycle_state == "sealed":
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                    where_clauses.append("NOT EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "candidate":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:candidate')")
-                elif filters.lifecycle_state == "doubt":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:doubt')")
-                elif filters.lifecycle_state == "summary":
-                    where_clauses.append("EXISTS (SELECT 1 FROM unnest(tags) t WHERE t LIKE '%:summary')")
-
-        where_sql = " AND ".join(where_clauses)
+        params: Dict[str, Any] = {"limit": limit, "preview_chars": self.preview_chars}
+        # Without the tag filters, like the tag_candidates CTE
+        where_sql = " AND ".join(self._filter_clauses(filters, params, include_tags=False))
 
         # Build tag overlap conditions
         tag_conditions = []
@@ -901,7 +1490,7 @@ class HybridMemorySearchService:
             SELECT
                 id::text as memory_id,
                 title,
-                content as content_preview,
+                LEFT(content, :preview_chars) as content_preview,
                 memory_type,
                 tags,
                 created_at::text,
@@ -983,6 +1572,7 @@ class HybridMemorySearchService:
         lexical_results: Optional[List[MemorySearchResult]],
         vector_results: Optional[List[MemorySearchResult]],
         rerank_scores: Optional[Dict[str, float]] = None,
+        full_content: Optional[Dict[str, str]] = None,
     ) -> List[HybridMemorySearchResult]:
         """Build final hybrid results from fused results."""
         # Build score lookup dicts
@@ -997,6 +1587,7 @@ class HybridMemorySearchService:
                 vector_scores[r.memory_id] = r.similarity_score
 
         rerank_scores = rerank_scores or {}
+        full_content = full_content or {}
 
         # Build hybrid results
         hybrid_results = []
@@ -1018,6 +1609,7 @@ class HybridMemorySearchService:
                 vector_similarity=vector_scores.get(fused.chunk_id),
                 rerank_score=rerank_scores.get(fused.chunk_id),  # EPIC-24 P2
                 contribution=fused.contribution,
+                content=full_content.get(fused.chunk_id),
             ))
 
         return hybrid_results
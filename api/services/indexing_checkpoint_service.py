@@ -0,0 +1,425 @@
+"""
+Durable per-file indexing checkpoints and restart-proof run counters.
+
+Indexing progress used to live only in the Redis status hash (batch
+consumer) and on stderr (scripts/index_directory.py): a crash halfway
+through a 20k-file repository meant starting over. Two tables keep it in
+PostgreSQL instead:
+
+    indexing_checkpoints   (repository, file_path) -> content hash, status
+                           (completed / failed), chunks, error
+    indexing_runs          current run per repository: files processed /
+                           failed / skipped, chunks, active seconds,
+                           resumes -- throughput survives restarts
+
+A completed checkpoint means "the chunks of this exact content are in
+code_chunks". Every entry point checks it before doing any work:
+
+    index_directory.py --resume     skips completed files, purges chunks
+                                    of the files it will redo
+    batch worker subprocess         skips completed files of its batch,
+                                    so a retried batch continues where
+                                    the killed one stopped
+    batch consumer                  continues the run of the same job
+
+Checkpoints are recorded after the chunks are durable (per file
+transaction, or after the COPY that carried them) and flushed in batches
+together with the run counters. Anything that deletes the chunks of a
+repository clears its checkpoints. Checkpoint writes are best effort:
+failures are logged and never fail indexing (the files are simply redone
+on resume).
+
+Configuration (environment):
+    INDEXING_CHECKPOINT_FLUSH_SIZE   files per checkpoint write  (default: 50)
+
+Usage:
+    checkpoints = IndexingCheckpointService(engine)
+    run = await checkpoints.start_run("MnemoLite", len(files), resume=True)
+    pending, completed = await checkpoints.pending_files("MnemoLite", files)
+    for file_path, content_hash in pending:
+        ...
+        checkpoints.record("MnemoLite", file_path, content_hash, chunks=12)
+        if checkpoints.full:
+            await checkpoints.flush()
+    await checkpoints.flush()
+    await checkpoints.finish_run("MnemoLite")
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger()
+
+_RUN_COLUMNS = (
+    "repository", "run_id", "source", "status", "total_files", "processed_files",
+    "failed_files", "skipped_files", "chunks", "active_seconds", "resumes",
+    "started_at", "updated_at", "completed_at",
+)
+
+_START_SQL = """
+    INSERT INTO indexing_runs (repository, run_id, source, status, total_files)
+    VALUES (:repository, :run_id, :source, 'running', :total_files)
+    ON CONFLICT (repository) DO UPDATE SET
+        run_id = EXCLUDED.run_id, source = EXCLUDED.source, status = 'running',
+        total_files = EXCLUDED.total_files, processed_files = 0, failed_files = 0,
+        skipped_files = 0, chunks = 0, active_seconds = 0, resumes = 0,
+        started_at = NOW(), updated_at = NOW(), completed_at = NULL
+"""
+
+_RESUME_SQL = """
+    UPDATE indexing_runs
+    SET status = 'running', source = :source, total_files = :total_files,
+        resumes = resumes + 1, updated_at = NOW()
+    WHERE repository = :repository
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO indexing_checkpoints (repository, file_path, content_hash, status, chunks, error)
+    VALUES (:repository, :file_path, :content_hash, :status, :chunks, :error)
+    ON CONFLICT (repository, file_path) DO UPDATE SET
+        content_hash = EXCLUDED.content_hash, status = EXCLUDED.status,
+        chunks = EXCLUDED.chunks, error = EXCLUDED.error, updated_at = NOW()
+"""
+
+_COUNTERS_SQL = """
+    UPDATE indexing_runs
+    SET processed_files = processed_files + :processed,
+        failed_files = failed_files + :failed,
+        skipped_files = skipped_files + :skipped,
+        chunks = chunks + :chunks,
+        active_seconds = active_seconds + :seconds,
+        updated_at = NOW()
+    WHERE repository = :repository
+"""
+
+
+def file_hash(file_path: Path) -> Optional[str]:
+    """MD5 of the file bytes (None if the file cannot be read)."""
+    try:
+        return hashlib.md5(Path(file_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+@dataclass
+class IndexingRun:
+    """Restart-proof progress of the current indexing run of a repository."""
+    repository: str
+    run_id: str
+    source: str
+    status: str  # running, completed, failed, interrupted
+    total_files: int = 0
+    processed_files: int = 0
+    failed_files: int = 0
+    skipped_files: int = 0
+    chunks: int = 0
+    active_seconds: float = 0.0
+    resumes: int = 0
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def files_per_second(self) -> float:
+        return self.processed_files / self.active_seconds if self.active_seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.active_seconds if self.active_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        done = self.processed_files + self.failed_files + self.skipped_files
+        return {
+            "repository": self.repository,
+            "run_id": self.run_id,
+            "source": self.source,
+            "status": self.status,
+            "total_files": self.total_files,
+            "processed_files": self.processed_files,
+            "failed_files": self.failed_files,
+            "skipped_files": self.skipped_files,
+            "remaining_files": max(0, self.total_files - done),
+            "chunks": self.chunks,
+            "active_seconds": round(self.active_seconds, 1),
+            "files_per_second": round(self.files_per_second, 2),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+            "resumes": self.resumes,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+
+class IndexingCheckpointService:
+    """Reads and writes indexing_checkpoints / indexing_runs."""
+
+    def __init__(self, engine: AsyncEngine, flush_size: Optional[int] = None):
+        """
+        Initialize the service.
+
+        Args:
+            engine: Database async engine
+            flush_size: Buffered checkpoints per write (INDEXING_CHECKPOINT_FLUSH_SIZE)
+        """
+        self.engine = engine
+        self.flush_size = max(1, flush_size or int(os.getenv("INDEXING_CHECKPOINT_FLUSH_SIZE", "50")))
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._skipped: Counter = Counter()
+        self._active_since: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
+    async def get_run(self, repository: str) -> Optional[IndexingRun]:
+        """Current (or last) run of a repository, None if unknown or unreadable."""
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(
+                    text(f"SELECT {', '.join(_RUN_COLUMNS)} FROM indexing_runs WHERE repository = :repository"),
+                    {"repository": repository},
+                )
+                row = result.mappings().first()
+        except Exception as e:
+            logger.warning("indexing_checkpoints.read_failed", repository=repository, error=str(e))
+            return None
+        return IndexingRun(**dict(row)) if row else None
+
+    async def start_run(
+        self,
+        repository: str,
+        total_files: int,
+        source: str = "cli",
+        run_id: Optional[str] = None,
+        resume: bool = False,
+    ) -> Optional[IndexingRun]:
+        """
+        Start a run, or continue the unfinished one.
+
+        The previous run continues (counters kept, resumes + 1) when it did not
+        complete and either resume is set or it has the same run_id (e.g. the
+        batch job ID after a consumer restart). Otherwise the counters start
+        from zero. Checkpoints are never touched here: see clear().
+
+        Returns:
+            The run, None if it could not be written (logged)
+        """
+        previous = await self.get_run(repository)
+        continued = (
+            previous is not None
+            and previous.status != "completed"
+            and (resume or (run_id is not None and previous.run_id == run_id))
+        )
+        params = {
+            "repository": repository,
+            "run_id": run_id or uuid.uuid4().hex,
+            "source": source,
+            "total_files": total_files,
+        }
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(text(_RESUME_SQL if continued else _START_SQL), params)
+        except Exception as e:
+            logger.warning("indexing_checkpoints.start_failed", repository=repository, error=str(e))
+            return None
+
+        self._active_since[repository] = time.monotonic()
+        run = await self.get_run(repository)
+        logger.info("indexing_checkpoints.run_started", repository=repository,
+                    resumed=continued, run=run.to_dict() if run else None)
+        return run
+
+    async def finish_run(self, repository: str, status: str = "completed") -> bool:
+        """
+        Close the run with its final status (completed, failed, interrupted).
+
+        Buffered checkpoints are not written: flush() first when their chunks
+        are durable.
+        """
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    text("""
+                        UPDATE indexing_runs
+                        SET status = :status, updated_at = NOW(),
+                            completed_at = CASE WHEN :status = 'completed' THEN NOW() END
+                        WHERE repository = :repository
+                    """),
+                    {"repository": repository, "status": status},
+                )
+            return True
+        except Exception as e:
+            logger.warning("indexing_checkpoints.finish_failed", repository=repository, error=str(e))
+            return False
+        finally:
+            self._active_since.pop(repository, None)
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    async def pending_files(
+        self,
+        repository: str,
+        files: Sequence[Path],
+    ) -> Tuple[List[Tuple[Path, Optional[str]]], List[Path]]:
+        """
+        Split files into those still to index and those already completed.
+
+        A file is skipped only if its completed checkpoint has the hash of the
+        current content; changed, failed and unknown files are pending. If the
+        checkpoints cannot be read every file is pending. Only files indexed
+        before the current run started add to its skipped_files counter (the
+        others are already counted as processed).
+
+        Returns:
+            (pending [(file_path, content_hash)], completed file paths)
+        """
+        hashes = [(Path(f), file_hash(f)) for f in files]
+        self._active_since.setdefault(repository, time.monotonic())
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(
+                    text("""
+                        SELECT c.file_path, c.content_hash,
+                               c.updated_at < COALESCE(r.started_at, 'infinity') AS before_run
+                        FROM indexing_checkpoints c
+                        LEFT JOIN indexing_runs r ON r.repository = c.repository
+                        WHERE c.repository = :repository AND c.status = 'completed'
+                          AND c.file_path = ANY(:paths)
+                    """),
+                    {"repository": repository, "paths": [str(f) for f, _ in hashes]},
+                )
+                done = {row.file_path: (row.content_hash, row.before_run) for row in result}
+        except Exception as e:
+            logger.warning("indexing_checkpoints.read_failed", repository=repository, error=str(e))
+            done = {}
+
+        pending, completed = [], []
+        for file_path, content_hash in hashes:
+            checkpoint_hash, before_run = done.get(str(file_path), (None, False))
+            if content_hash is not None and checkpoint_hash == content_hash:
+                completed.append(file_path)
+                if before_run:
+                    self._skipped[repository] += 1
+            else:
+                pending.append((file_path, content_hash))
+        return pending, completed
+
+    def record(
+        self,
+        repository: str,
+        file_path: Path,
+        content_hash: Optional[str],
+        chunks: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Buffer the outcome of one file (written by the next flush())."""
+        self._active_since.setdefault(repository, time.monotonic())
+        self._buffer.append({
+            "repository": repository,
+            "file_path": str(file_path),
+            "content_hash": content_hash or "",
+            "status": "failed" if error is not None else "completed",
+            "chunks": chunks,
+            "error": error[:1000] if error is not None else None,
+        })
+
+    @property
+    def full(self) -> bool:
+        return len(self._buffer) >= self.flush_size
+
+    async def flush(self) -> bool:
+        """
+        Write buffered checkpoints and add them to the run counters (one transaction).
+
+        Records buffered while the write is in flight wait for the next flush.
+
+        Returns:
+            True on success; on failure the records are kept for the next flush
+        """
+        records, skipped = self._buffer, self._skipped
+        repositories = {r["repository"] for r in records} | {r for r, n in skipped.items() if n}
+        if not repositories:
+            return True
+        self._buffer, self._skipped = [], Counter()
+
+        now = time.monotonic()
+        counters = []
+        for repository in repositories:
+            mine = [r for r in records if r["repository"] == repository]
+            counters.append({
+                "repository": repository,
+                "processed": sum(r["status"] == "completed" for r in mine),
+                "failed": sum(r["status"] == "failed" for r in mine),
+                "skipped": skipped[repository],
+                "chunks": sum(r["chunks"] for r in mine),
+                "seconds": now - self._active_since.get(repository, now),
+            })
+        try:
+            async with self.engine.begin() as conn:
+                if records:
+                    await conn.execute(text(_UPSERT_SQL), records)
+                await conn.execute(text(_COUNTERS_SQL), counters)
+        except Exception as e:
+            logger.warning("indexing_checkpoints.flush_failed", files=len(records), error=str(e))
+            self._buffer = records + self._buffer
+            self._skipped.update(skipped)
+            return False
+
+        for repository in repositories:
+            self._active_since[repository] = now
+        return True
+
+    async def purge_unfinished(self, repository: str, completed: Sequence[Path]) -> int:
+        """
+        Delete the chunks of every file not in `completed` before a resume.
+
+        Files written before the crash but not yet checkpointed, changed files
+        and files removed from disk are redone (or dropped) instead of
+        duplicated.
+
+        Returns:
+            Number of chunks deleted
+        """
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                text("""
+                    DELETE FROM code_chunks
+                    WHERE repository = :repository AND NOT (file_path = ANY(:paths))
+                """),
+                {"repository": repository, "paths": [str(f) for f in completed]},
+            )
+        return result.rowcount or 0
+
+    async def clear(self, repository: str) -> bool:
+        """Forget the checkpoints and run of a repository whose chunks were deleted."""
+        self._buffer = [r for r in self._buffer if r["repository"] != repository]
+        self._skipped.pop(repository, None)
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    text("DELETE FROM indexing_checkpoints WHERE repository = :repository"),
+                    {"repository": repository},
+                )
+                await conn.execute(
+                    text("DELETE FROM indexing_runs WHERE repository = :repository"),
+                    {"repository": repository},
+                )
+            return True
+        except Exception as e:
+            logger.warning("indexing_checkpoints.clear_failed", repository=repository, error=str(e))
+            return False
@@ -0,0 +1,184 @@
+"""
+Indexing job queue: MCP indexing tools enqueue into the batch pipeline.
+
+index_project and index_markdown_workspace used to index inside the tool
+call: bounded by the 30s MCP client timeout and the middleware timeout,
+and keeping the MCP server's event loop busy with chunking, embeddings
+and inserts. They now submit a job to the Redis Stream batch pipeline
+(EPIC-27) and return its job id immediately:
+
+    tool → list files (thread, nothing read)
+         → BatchIndexingProducer.enqueue_files   indexing:jobs:{repository}
+         → consumer process for the repository   scripts/batch_index_consumer.py
+           (started unless one is running; exits once the stream is drained)
+         → batch worker subprocesses             workers/batch_worker_subprocess.py
+
+Progress is kept in the status hash indexing:status:{repository}
+(read_indexing_status(), used by get_indexing_status and the
+index://status resource) and in the durable run counters (indexing_runs,
+services/indexing_checkpoint_service.py).
+
+One job per repository at a time, across MCP server restarts and
+replicas: submitting claims the Redis lock indexing:consumer:{repository}
+(SET NX with a TTL), the consumer refreshes it as a heartbeat and deletes
+it when it exits, and a lost consumer's lock expires. A repository whose
+lock is held reports the running job instead of enqueuing a second one.
+
+Configuration (environment):
+    INDEXING_CONSUMER_SCRIPT    consumer CLI (default: /app/scripts/batch_index_consumer.py)
+    INDEXING_CONSUMER_LOG_DIR   consumer logs, one file per repository (default: temp dir)
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+from redis.exceptions import ResponseError
+
+from services.batch_indexing_producer import BatchIndexingProducer
+
+logger = structlog.get_logger()
+
+JOB_KINDS = ("code", "markdown")
+
+# Batch pipeline status values → status names of the MCP tools
+_STATUS_NAMES = {"pending": "queued", "processing": "in_progress"}
+
+# Consumer processes started by this server, kept only to reap them once
+# they exit (whether one runs is decided by the Redis lock)
+_consumers: Dict[str, subprocess.Popen] = {}
+
+
+async def read_indexing_status(redis_client, repository: str) -> Optional[Dict[str, Any]]:
+    """
+    Status of the last indexing job of a repository, None if there is none.
+
+    Reads the batch pipeline hash; falls back to the JSON string written by
+    older MCP servers under the same key.
+    """
+    key = BatchIndexingProducer.STATUS_KEY_TEMPLATE.format(repository=repository)
+    try:
+        try:
+            raw = await redis_client.get(key)
+        except ResponseError:  # WRONGTYPE: a batch pipeline hash
+            raw = None
+        if raw:
+            return json.loads(raw)
+        job = await redis_client.hgetall(key)
+    except Exception as e:
+        logger.warning("indexing_jobs.status_read_failed", repository=repository, error=str(e))
+        return None
+    if not job:
+        return None
+
+    total = int(job.get("total_files") or 0)
+    processed = int(job.get("processed_files") or 0)
+    failed = int(job.get("failed_files") or 0)
+    status = job.get("status") or "unknown"
+    return {
+        "job_id": job.get("job_id"),
+        "kind": job.get("kind") or "code",
+        "status": _STATUS_NAMES.get(status, status),
+        "total_files": total,
+        "indexed_files": processed,
+        "failed_files": failed,
+        "current_batch": int(job.get("current_batch") or 0),
+        "total_batches": int(job.get("total_batches") or 0),
+        "progress": round((processed + failed) / total, 4) if total else 0.0,
+        "started_at": job.get("started_at") or None,
+        "completed_at": job.get("completed_at") or None,
+    }
+
+
+class IndexingJobQueue:
+    """Submit indexing jobs to the batch pipeline and run its consumer."""
+
+    def __init__(self, redis_client, redis_url: str, db_url: Optional[str] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            redis_client: Shared async Redis client (decode_responses=True)
+            redis_url: Redis URL handed to the consumer process
+            db_url: SQLAlchemy asyncpg URL for the consumer (default: DATABASE_URL)
+        """
+        self.redis = redis_client
+        self.redis_url = redis_url
+        self.db_url = db_url or os.getenv("DATABASE_URL")
+        self.consumer_script = os.getenv("INDEXING_CONSUMER_SCRIPT", "/app/scripts/batch_index_consumer.py")
+        self.log_dir = Path(os.getenv("INDEXING_CONSUMER_LOG_DIR") or tempfile.gettempdir())
+
+    async def _claim_consumer(self, repository: str) -> bool:
+        """Claim the repository's consumer lock; False if a consumer holds it."""
+        key = BatchIndexingProducer.CONSUMER_LOCK_KEY_TEMPLATE.format(repository=repository)
+        # The started consumer takes the lock over before its TTL expires
+        return bool(await self.redis.set(key, "submitted", nx=True, ex=BatchIndexingProducer.CONSUMER_LOCK_TTL))
+
+    async def _release_consumer(self, repository: str) -> None:
+        key = BatchIndexingProducer.CONSUMER_LOCK_KEY_TEMPLATE.format(repository=repository)
+        await self.redis.delete(key)
+
+    @staticmethod
+    def _reap_consumers() -> None:
+        for repository, process in list(_consumers.items()):
+            if process.poll() is not None:
+                del _consumers[repository]
+
+    async def submit(
+        self, repository: str, files: List[Path], kind: str = "code", replace: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Enqueue a job and make sure a consumer processes it.
+
+        With replace, files are the whole repository: the job ends by
+        removing the chunks and checkpoints of every other file.
+
+        Returns:
+            Job info (job_id, total_files, total_batches, status); status is
+            "already_running" with the running job if the repository has one
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"kind must be one of {JOB_KINDS}, got {kind!r}")
+
+        self._reap_consumers()
+        if not await self._claim_consumer(repository):
+            running = await read_indexing_status(self.redis, repository) or {}
+            return {**running, "status": "already_running"}
+
+        try:
+            producer = BatchIndexingProducer(redis_url=self.redis_url, redis_client=self.redis)
+            job = await producer.enqueue_files(repository, files, kind=kind, replace=replace)
+            self._start_consumer(repository)
+        except Exception:
+            await self._release_consumer(repository)
+            raise
+        logger.info("indexing_jobs.submitted", repository=repository, kind=kind,
+                    job_id=job["job_id"], files=job["total_files"], batches=job["total_batches"])
+        return job
+
+    def _start_consumer(self, repository: str) -> None:
+        env = dict(os.environ)
+        if self.db_url:
+            env["DATABASE_URL"] = self.db_url
+        safe_name = re.sub(r"[^\w.-]", "_", repository)
+        log_path = self.log_dir / f"indexing-consumer-{safe_name}.log"
+        with open(log_path, "ab") as log_file:
+            # Own session: the consumer outlives an MCP server restart and
+            # does not receive its signals; the log handle is inherited
+            _consumers[repository] = subprocess.Popen(
+                [sys.executable, self.consumer_script,
+                 "--repository", repository, "--redis-url", self.redis_url],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env=env,
+                start_new_session=True,
+            )
+        logger.info("indexing_jobs.consumer_started", repository=repository,
+                    pid=_consumers[repository].pid, log=str(log_path))
@@ -4,6 +4,7 @@ LSP (Language Server Protocol) Integration.
 Story: EPIC-13 Story 13.1 - Pyright LSP Wrapper
 Story: EPIC-13 Story 13.2 - Type Metadata Extraction Service
 Story: EPIC-13 Story 13.3 - LSP Lifecycle Management
+LSP process pool: bounded multi-server dispatch for type extraction
 Author: Claude Code
 Date: 2025-10-22
 """
@@ -18,6 +19,7 @@ from .lsp_errors import (
 )
 from .type_extractor import TypeExtractorService
 from .lsp_lifecycle_manager import LSPLifecycleManager
+from .lsp_process_pool import LSPProcessPool, PooledLSPClient, lsp_workspace_affinity
 
 __all__ = [
     "PyrightLSPClient",
@@ -29,4 +31,7 @@ __all__ = [
     "LSPServerCrashedError",
     "TypeExtractorService",
     "LSPLifecycleManager",
+    "LSPProcessPool",
+    "PooledLSPClient",
+    "lsp_workspace_affinity",
 ]
@@ -11,7 +11,7 @@ Based on LSP specification: https://microsoft.github.io/language-server-protocol
 import asyncio
 import json
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import structlog
 
 from .lsp_errors import (
@@ -205,31 +205,93 @@ class PyrightLSPClient:
             if not hover_content:
                 return None
 
-            # Parse hover content (can be string, dict, or list)
-            if isinstance(hover_content, str):
-                return hover_content
-            elif isinstance(hover_content, dict):
-                # MarkupContent format
-                if "value" in hover_content:
-                    return hover_content["value"]
-                elif "kind" in hover_content and "value" in hover_content:
-                    return hover_content["value"]
-            elif isinstance(hover_content, list) and hover_content:
-                # Array of MarkedString
-                parts = []
-                for item in hover_content:
-                    if isinstance(item, str):
-                        parts.append(item)
-                    elif isinstance(item, dict) and "value" in item:
-                        parts.append(item["value"])
-                return "\n".join(parts)
-
-            return None
+            return self._hover_contents_to_text(hover_content)
 
         finally:
             # Close document
             await self._close_document(file_path)
 
+    async def hover_many(
+        self,
+        file_path: str,
+        source_code: str,
+        positions: List[Tuple[int, int]],
+        timeout: float = 3.0
+    ) -> List[Optional[str]]:
+        """
+        Get hover information for several positions of one document.
+
+        Opens the document once and pipelines all textDocument/hover requests
+        over the JSON-RPC channel (responses are matched by id), so a file
+        costs about one round-trip instead of one per position.
+
+        Args:
+            file_path: File path (used as document URI)
+            source_code: Complete source code of file
+            positions: (line, character) pairs, 0-indexed
+            timeout: Timeout of each hover request in seconds
+
+        Returns:
+            Hover text per position (None where no hover info, or on
+            per-request error/timeout)
+
+        Raises:
+            LSPError: If server not initialized
+        """
+        if not self.initialized:
+            raise LSPError("LSP server not initialized")
+        if not positions:
+            return []
+
+        await self._open_document(file_path, source_code)
+
+        try:
+            uri = f"file://{file_path}"
+            responses = await asyncio.gather(
+                *(
+                    self._send_request(
+                        "textDocument/hover",
+                        {"textDocument": {"uri": uri}, "position": {"line": line, "character": character}},
+                        timeout=timeout
+                    )
+                    for line, character in positions
+                ),
+                return_exceptions=True
+            )
+        finally:
+            await self._close_document(file_path)
+
+        hover_texts: List[Optional[str]] = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                if not isinstance(response, LSPError):
+                    raise response
+                hover_texts.append(None)
+            elif response.error or not response.result:
+                hover_texts.append(None)
+            else:
+                hover_texts.append(self._hover_contents_to_text(response.result.get("contents")))
+        return hover_texts
+
+    @staticmethod
+    def _hover_contents_to_text(hover_content: Any) -> Optional[str]:
+        """Flatten hover contents (string, MarkupContent or MarkedString list)."""
+        if not hover_content:
+            return None
+        if isinstance(hover_content, str):
+            return hover_content
+        if isinstance(hover_content, dict):
+            return hover_content.get("value")
+        if isinstance(hover_content, list):
+            parts = []
+            for item in hover_content:
+                if isinstance(item, str):
+                    parts.append(item)
+                elif isinstance(item, dict) and "value" in item:
+                    parts.append(item["value"])
+            return "\n".join(parts)
+        return None
+
     async def get_document_symbols(
         self,
         file_path: str,
@@ -322,15 +384,17 @@ class PyrightLSPClient:
         content = json.dumps(request)
         message = f"Content-Length: {len(content)}\r\n\r\n{content}"
 
+        # Register before writing: with pipelined requests the reader task
+        # may receive the response before drain() returns.
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.pending_requests[request_id] = future
+
         try:
             # Send request
             self.process.stdin.write(message.encode('utf-8'))
             await self.process.stdin.drain()
 
             # Wait for response (with timeout)
-            future: asyncio.Future = asyncio.Future()
-            self.pending_requests[request_id] = future
-
             try:
                 response = await asyncio.wait_for(future, timeout=timeout)
                 return response
@@ -343,6 +407,7 @@ class PyrightLSPClient:
         except Exception as e:
             if isinstance(e, (LSPTimeoutError, LSPServerCrashedError)):
                 raise
+            self.pending_requests.pop(request_id, None)
             logger.error("LSP communication error", method=method, error=str(e))
             raise LSPCommunicationError(f"Communication error: {e}")
 
@@ -0,0 +1,418 @@
+"""
+LSP Process Pool - bounded pool of language servers with least-loaded dispatch.
+
+A single Pyright (or TypeScript) server serialises all type extraction:
+every indexing request and worker funnels through one process. The pool
+runs up to `max_size` servers of one kind and leases them per operation:
+
+- Least-loaded dispatch: the server with the fewest in-flight leases wins.
+  A new server is started (up to max_size) when even the least-loaded one
+  already has `scale_up_in_flight` leases, i.e. the caller would queue
+  behind them; each such caller triggers at most one start. Servers start
+  in the background, outside the pool lock: the caller is served by the
+  least-loaded server meanwhile, and leases are never held up by a
+  language server's startup (only the first server is waited for).
+- Workspace affinity: operations for the same repository prefer the server
+  that already analysed it (warm program/type caches), unless that server
+  is more than `affinity_slack` leases busier than the least-loaded one.
+- Health-based recycling: dead servers and servers with repeated failures
+  are replaced. The pool owns the lifecycle of its servers: a dead server
+  is replaced by a new one rather than restarted in place, so servers are
+  not wrapped in LSPLifecycleManager (which keeps managing the single
+  Pyright process behind the /lsp health and restart routes).
+- Memory ceiling: a server whose RSS (including child processes) exceeds
+  `max_rss_mb` stops receiving leases and is restarted once drained.
+
+PooledLSPClient exposes the pool with the client interface used by
+TypeExtractorService (hover / hover_many / get_document_symbols), so the
+extractor does not know whether it talks to one server or a pool.
+
+Example:
+    pool = LSPProcessPool(PyrightLSPClient, name="pyright", max_size=4)
+    client = PooledLSPClient(pool)
+
+    with lsp_workspace_affinity("my-repo"):
+        hovers = await client.hover_many(path, source, positions)
+
+    await pool.shutdown()
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set
+
+import structlog
+
+from .lsp_errors import LSPError
+
+logger = structlog.get_logger()
+
+# Repository (workspace) of the current indexing operation, used for affinity
+current_lsp_workspace: ContextVar[Optional[str]] = ContextVar("current_lsp_workspace", default=None)
+
+
+@contextmanager
+def lsp_workspace_affinity(workspace: Optional[str]) -> Iterator[None]:
+    """Route pooled LSP calls made in this context by workspace affinity."""
+    token = current_lsp_workspace.set(workspace)
+    try:
+        yield
+    finally:
+        current_lsp_workspace.reset(token)
+
+
+def _default_pool_size() -> int:
+    return int(os.getenv("LSP_POOL_SIZE", str(max(1, min(4, (os.cpu_count() or 2) // 2)))))
+
+
+def _default_scale_up_in_flight() -> int:
+    return int(os.getenv("LSP_POOL_SCALE_UP_IN_FLIGHT", "2"))
+
+
+@dataclass
+class PooledServer:
+    """One language server process and its lease accounting."""
+
+    server_id: int
+    client: Any
+    in_flight: int = 0
+    requests: int = 0
+    consecutive_failures: int = 0
+    draining: bool = False
+    rss_mb: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    workspaces: set = field(default_factory=set)
+
+    def is_alive(self) -> bool:
+        try:
+            return bool(self.client.is_alive())
+        except Exception:
+            return False
+
+
+class LSPProcessPool:
+    """Bounded pool of LSP client processes of one kind."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        name: str = "lsp",
+        max_size: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        affinity_slack: int = 2,
+        max_consecutive_failures: int = 3,
+        memory_check_interval: int = 50,
+        scale_up_in_flight: Optional[int] = None,
+    ):
+        """
+        Initialize the pool (no process is started until first use).
+
+        Args:
+            client_factory: Creates an unstarted client (e.g. PyrightLSPClient)
+            name: Pool name for logs/stats
+            max_size: Maximum servers (LSP_POOL_SIZE, default min(4, cores/2))
+            max_rss_mb: Memory ceiling per server (LSP_POOL_MAX_RSS_MB, 0 = off)
+            affinity_slack: Extra in-flight leases tolerated to keep affinity
+            max_consecutive_failures: Failures before a server is recycled
+            memory_check_interval: Check RSS every N leases of a server
+            scale_up_in_flight: Leases on the least-loaded server that trigger
+                a new server (LSP_POOL_SCALE_UP_IN_FLIGHT, default 2)
+        """
+        self.client_factory = client_factory
+        self.name = name
+        self.max_size = max(1, max_size or _default_pool_size())
+        self.max_rss_mb = (
+            max_rss_mb if max_rss_mb is not None
+            else float(os.getenv("LSP_POOL_MAX_RSS_MB", "1024"))
+        )
+        self.affinity_slack = affinity_slack
+        self.max_consecutive_failures = max_consecutive_failures
+        self.memory_check_interval = max(1, memory_check_interval)
+        self.scale_up_in_flight = max(1, scale_up_in_flight or _default_scale_up_in_flight())
+
+        self._servers: List[PooledServer] = []
+        self._affinity: Dict[str, int] = {}
+        self._next_id = 0
+        # Guards the server list; notified whenever a start finishes
+        self._lock = asyncio.Condition()
+        self._starting = 0
+        self._closed = False
+        # Background starts of scale-ups (kept referenced, awaited on shutdown)
+        self._scale_ups: Set[asyncio.Task] = set()
+
+        self.leases = 0
+        self.recycled = 0
+        self.logger = logger.bind(service="lsp_pool", pool=name)
+
+    async def start(self, initial_size: int = 1) -> None:
+        """Start `initial_size` servers up front (the rest start on demand)."""
+        async with self._lock:
+            missing = max(0, min(initial_size, self.max_size) - len(self._servers) - self._starting)
+            self._starting += missing
+        await asyncio.gather(*(self._start_server() for _ in range(missing)))
+
+    async def _start_server(self) -> PooledServer:
+        """
+        Start one server and add it to the pool.
+
+        The caller reserved the start in `_starting` under the lock; the
+        language server itself starts without holding it.
+        """
+        client = None
+        try:
+            client = self.client_factory()
+            await client.start()
+        except BaseException:
+            async with self._lock:
+                self._starting -= 1
+                self._lock.notify_all()
+            raise
+
+        async with self._lock:
+            self._starting -= 1
+            self._lock.notify_all()
+            if not self._closed:
+                server = PooledServer(server_id=self._next_id, client=client)
+                self._next_id += 1
+                self._servers.append(server)
+                self.logger.info(
+                    "LSP pool server started",
+                    server_id=server.server_id,
+                    pool_size=len(self._servers),
+                    pid=getattr(getattr(client, "process", None), "pid", None)
+                )
+                return server
+
+        # Shut down while the server was starting
+        await self._shutdown_client(client)
+        raise LSPError(f"LSP pool {self.name} is shut down")
+
+    def _retire(self, server: PooledServer, reason: str) -> None:
+        """Remove a server from the pool (caller holds the lock)."""
+        if server in self._servers:
+            self._servers.remove(server)
+        self._affinity = {k: v for k, v in self._affinity.items() if v != server.server_id}
+        self.recycled += 1
+        self.logger.info(
+            "LSP pool server recycled",
+            server_id=server.server_id,
+            reason=reason,
+            requests=server.requests,
+            rss_mb=round(server.rss_mb, 1)
+        )
+
+    async def _shutdown_client(self, client: Any) -> None:
+        try:
+            await client.shutdown()
+        except Exception as e:
+            self.logger.warning("LSP pool server shutdown failed", error=str(e))
+
+    def _prefer(
+        self, least: PooledServer, available: List[PooledServer], workspace: Optional[str]
+    ) -> PooledServer:
+        """The workspace's server unless it is too much busier than `least`."""
+        if workspace is not None:
+            preferred_id = self._affinity.get(workspace)
+            preferred = next((s for s in available if s.server_id == preferred_id), None)
+            if preferred and preferred.in_flight <= least.in_flight + self.affinity_slack:
+                return preferred
+        return least
+
+    async def _select(self, workspace: Optional[str]) -> PooledServer:
+        """Pick (or start) the server for a lease."""
+        retired: List[PooledServer] = []
+        chosen: Optional[PooledServer] = None
+        try:
+            async with self._lock:
+                while True:
+                    if self._closed:
+                        raise LSPError(f"LSP pool {self.name} is shut down")
+
+                    for server in [s for s in self._servers if not s.is_alive()]:
+                        self._retire(server, "dead")
+                        retired.append(server)
+
+                    available = [s for s in self._servers if not s.draining]
+                    least = min(available, key=lambda s: s.in_flight, default=None)
+                    if least is not None:
+                        chosen = self._prefer(least, available, workspace)
+
+                    busy = least is None or least.in_flight >= self.scale_up_in_flight
+                    has_room = len(self._servers) + self._starting < self.max_size
+                    # With no server to fall back on, wait for a pending start
+                    # rather than starting one per caller
+                    if busy and has_room and (least is not None or not self._starting):
+                        self._starting += 1
+                        break
+                    if chosen is not None:
+                        return chosen
+                    if not self._starting:
+                        raise LSPError(f"LSP pool {self.name} has no available server")
+                    await self._lock.wait()
+        finally:
+            for server in retired:
+                await self._shutdown_client(server.client)
+
+        if chosen is not None:
+            # Serve the caller now; the new server takes later leases
+            task = asyncio.create_task(self._scale_up())
+            self._scale_ups.add(task)
+            task.add_done_callback(self._scale_ups.discard)
+            return chosen
+
+        try:
+            return await self._start_server()
+        except Exception as e:
+            raise LSPError(f"LSP pool {self.name} could not start a server: {e}")
+
+    async def _scale_up(self) -> None:
+        """Start a server reserved by _select() in the background."""
+        try:
+            await self._start_server()
+        except Exception as e:
+            self.logger.warning("LSP pool scale-up failed", error=str(e))
+
+    @asynccontextmanager
+    async def lease(self, workspace: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        Lease a started client for one operation.
+
+        Args:
+            workspace: Affinity key (defaults to the lsp_workspace_affinity context)
+
+        Yields:
+            The leased LSP client
+        """
+        workspace = workspace if workspace is not None else current_lsp_workspace.get()
+        server = await self._select(workspace)
+        server.in_flight += 1
+        server.requests += 1
+        self.leases += 1
+        if workspace is not None:
+            self._affinity[workspace] = server.server_id
+            server.workspaces.add(workspace)
+
+        try:
+            yield server.client
+            server.consecutive_failures = 0
+        except LSPError:
+            server.consecutive_failures += 1
+            raise
+        finally:
+            server.in_flight -= 1
+            await self._after_lease(server)
+
+    async def _after_lease(self, server: PooledServer) -> None:
+        """Apply health and memory policies once a lease is returned."""
+        if server.consecutive_failures >= self.max_consecutive_failures:
+            server.draining = True
+        elif self.max_rss_mb and server.requests % self.memory_check_interval == 0:
+            server.rss_mb = self._rss_mb(server.client)
+            if server.rss_mb > self.max_rss_mb:
+                self.logger.warning(
+                    "LSP pool server over memory ceiling",
+                    server_id=server.server_id,
+                    rss_mb=round(server.rss_mb, 1),
+                    max_rss_mb=self.max_rss_mb
+                )
+                server.draining = True
+
+        if server.draining and server.in_flight == 0:
+            async with self._lock:
+                if server not in self._servers:
+                    return
+                reason = (
+                    "failures" if server.consecutive_failures >= self.max_consecutive_failures
+                    else "memory"
+                )
+                self._retire(server, reason)
+            await self._shutdown_client(server.client)
+
+    @staticmethod
+    def _rss_mb(client: Any) -> float:
+        """RSS of the server process and its children (0 if unknown)."""
+        pid = getattr(getattr(client, "process", None), "pid", None)
+        if pid is None:
+            return 0.0
+        try:
+            import psutil
+
+            process = psutil.Process(pid)
+            rss = process.memory_info().rss
+            for child in process.children(recursive=True):
+                rss += child.memory_info().rss
+            return rss / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def is_alive(self) -> bool:
+        """True while the pool accepts leases."""
+        return not self._closed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics."""
+        return {
+            "name": self.name,
+            "size": len(self._servers),
+            "max_size": self.max_size,
+            "starting": self._starting,
+            "scale_up_in_flight": self.scale_up_in_flight,
+            "leases": self.leases,
+            "recycled": self.recycled,
+            "max_rss_mb": self.max_rss_mb,
+            "servers": [
+                {
+                    "server_id": s.server_id,
+                    "pid": getattr(getattr(s.client, "process", None), "pid", None),
+                    "alive": s.is_alive(),
+                    "in_flight": s.in_flight,
+                    "requests": s.requests,
+                    "draining": s.draining,
+                    "rss_mb": round(s.rss_mb, 1),
+                    "workspaces": len(s.workspaces),
+                }
+                for s in self._servers
+            ],
+        }
+
+    async def shutdown(self) -> None:
+        """Shut down every server."""
+        async with self._lock:
+            self._closed = True
+            servers, self._servers = self._servers, []
+            self._affinity.clear()
+            self._lock.notify_all()
+        for server in servers:
+            await self._shutdown_client(server.client)
+        # Servers still starting shut themselves down once started
+        await asyncio.gather(*self._scale_ups, return_exceptions=True)
+
+
+class PooledLSPClient:
+    """LSP client facade that dispatches each call to a pooled server."""
+
+    def __init__(self, pool: LSPProcessPool):
+        self.pool = pool
+        self.initialized = True
+
+    async def hover(self, *args, **kwargs) -> Optional[str]:
+        async with self.pool.lease() as client:
+            return await client.hover(*args, **kwargs)
+
+    async def hover_many(self, *args, **kwargs) -> List[Optional[str]]:
+        async with self.pool.lease() as client:
+            return await client.hover_many(*args, **kwargs)
+
+    async def get_document_symbols(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        async with self.pool.lease() as client:
+            return await client.get_document_symbols(*args, **kwargs)
+
+    def is_alive(self) -> bool:
+        return self.pool.is_alive()
+
+    async def shutdown(self) -> None:
+        await self.pool.shutdown()
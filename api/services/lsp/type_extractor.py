@@ -9,12 +9,17 @@ Date: 2025-10-22 (Updated: 2025-10-23)
 
 Extracts type information from Pyright LSP (Python) and TypeScript LSP servers.
 Caches LSP results in Redis (L2) for 10× performance improvement.
+
+extract_file_type_metadata() handles all chunks of a file at once: the
+source is hashed and split once, the document is opened once and all
+hover requests are pipelined; results are cached per file by content hash.
 """
 
 import re
 import hashlib
+from collections import OrderedDict
 import structlog
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from services.lsp.lsp_client import PyrightLSPClient
 from services.lsp.typescript_lsp_client import TypeScriptLSPClient
@@ -57,6 +62,9 @@ class TypeExtractorService:
         }
     """
 
+    # Files kept in the in-process per-file result cache
+    FILE_CACHE_MAX_ENTRIES = 256
+
     def __init__(
         self,
         lsp_client: Optional[PyrightLSPClient] = None,
@@ -75,6 +83,8 @@ class TypeExtractorService:
         self.typescript_lsp = typescript_lsp_client
         self.cache = redis_cache
         self.logger = logger.bind(service="type_extractor")
+        # Per-file results by content hash: {(language, hash): {lsp_line: metadata}}
+        self._file_results: "OrderedDict[Tuple[str, str], Dict[int, Dict[str, Any]]]" = OrderedDict()
 
     async def extract_type_metadata(
         self,
@@ -125,6 +135,205 @@ class TypeExtractorService:
             self.logger.debug("Unsupported language for LSP type extraction", language=language)
             return metadata
 
+    async def extract_file_type_metadata(
+        self,
+        file_path: str,
+        source_code: str,
+        chunks: List[CodeChunk],
+        hover_timeout: float = 3.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract type metadata for all chunks of one file.
+
+        Equivalent to calling extract_type_metadata() per chunk, but the file
+        is hashed, split and opened once and the hover requests are pipelined
+        (see hover_many on the LSP clients). Results are cached per file:
+        in process (LRU) and in Redis under one key per content hash, so
+        re-indexing an unchanged file costs at most one cache read.
+
+        Args:
+            file_path: Absolute file path (for LSP URI)
+            source_code: Complete source code of file
+            chunks: Chunks of the file
+            hover_timeout: Timeout of each hover request in seconds
+
+        Returns:
+            Type metadata per chunk (same order as chunks). Never raises.
+        """
+        results: List[Dict[str, Any]] = [self._empty_metadata() for _ in chunks]
+
+        language = self._detect_language(file_path)
+        if language in ("typescript", "javascript", "tsx", "jsx"):
+            client = self.typescript_lsp
+            # TypeScript chunks are 1-indexed, Pyright chunks are used as-is
+            line_offset = 1
+            cache_prefix = "lsp:ts:type:file"
+        elif language == "python":
+            client = self.lsp
+            line_offset = 0
+            cache_prefix = "lsp:type:file"
+        else:
+            self.logger.debug("Unsupported language for LSP type extraction", language=language)
+            return results
+
+        if not client:
+            return results
+
+        # Chunk index -> LSP line (chunks without start_line are skipped)
+        chunk_lines = {
+            i: chunk.start_line - line_offset
+            for i, chunk in enumerate(chunks)
+            if chunk.start_line is not None
+        }
+        if not chunk_lines:
+            return results
+
+        content_hash = hashlib.md5(source_code.encode()).hexdigest()
+        file_key = (language, content_hash)
+        cache_key = f"{cache_prefix}:{content_hash}"
+
+        known = await self._get_file_results(file_key, cache_key)
+
+        # Query only lines not cached yet (one hover per distinct line)
+        missing_lines = sorted({line for line in chunk_lines.values() if line not in known})
+        if missing_lines:
+            lines = source_code.split("\n")
+            names = {}
+            for i, line in chunk_lines.items():
+                names.setdefault(line, chunks[i].name)
+            positions = [
+                (line, self._hover_character(lines, line, names[line]))
+                for line in missing_lines
+            ]
+
+            try:
+                if client is self.typescript_lsp:
+                    hover_texts = await client.hover_many(
+                        file_path=file_path,
+                        source_code=source_code,
+                        positions=positions,
+                        timeout=hover_timeout,
+                        language_id=self._typescript_language_id(language)
+                    )
+                else:
+                    hover_texts = await client.hover_many(
+                        file_path=file_path,
+                        source_code=source_code,
+                        positions=positions,
+                        timeout=hover_timeout
+                    )
+            except Exception as e:
+                self.logger.warning(
+                    "LSP file type extraction failed",
+                    file_path=file_path,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                hover_texts = [None] * len(positions)
+
+            parse = (
+                self._parse_typescript_hover if client is self.typescript_lsp
+                else self._parse_hover_signature
+            )
+            new_results = {}
+            for line, hover_text in zip(missing_lines, hover_texts):
+                if not hover_text:
+                    continue
+                metadata = parse(hover_text, names[line] or "unknown")
+                # Only cache meaningful metadata (as extract_type_metadata does)
+                if metadata.get("signature"):
+                    new_results[line] = metadata
+            if new_results:
+                known = {**known, **new_results}
+                await self._store_file_results(file_key, cache_key, known)
+
+        for i, line in chunk_lines.items():
+            metadata = known.get(line)
+            if metadata:
+                results[i] = dict(metadata)
+
+        self.logger.debug(
+            "File type metadata extracted",
+            file_path=file_path,
+            chunks=len(chunks),
+            hover_requests=len(missing_lines)
+        )
+        return results
+
+    async def _get_file_results(
+        self,
+        file_key: Tuple[str, str],
+        cache_key: str
+    ) -> Dict[int, Dict[str, Any]]:
+        """Per-file results from the in-process LRU, then Redis (L2)."""
+        if file_key in self._file_results:
+            self._file_results.move_to_end(file_key)
+            return self._file_results[file_key]
+
+        if self.cache:
+            try:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    known = {int(line): metadata for line, metadata in cached.items()}
+                    self._remember_file_results(file_key, known)
+                    return known
+            except Exception as e:
+                self.logger.warning(
+                    "Redis cache lookup failed, continuing to LSP query",
+                    error=str(e)
+                )
+        return {}
+
+    async def _store_file_results(
+        self,
+        file_key: Tuple[str, str],
+        cache_key: str,
+        known: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """Store per-file results in the in-process LRU and Redis (300s TTL)."""
+        self._remember_file_results(file_key, known)
+        if self.cache:
+            try:
+                await self.cache.set(
+                    cache_key,
+                    {str(line): metadata for line, metadata in known.items()},
+                    ttl_seconds=300
+                )
+            except Exception as e:
+                self.logger.warning("Redis cache set failed", error=str(e))
+
+    def _remember_file_results(
+        self,
+        file_key: Tuple[str, str],
+        known: Dict[int, Dict[str, Any]]
+    ) -> None:
+        self._file_results[file_key] = known
+        self._file_results.move_to_end(file_key)
+        while len(self._file_results) > self.FILE_CACHE_MAX_ENTRIES:
+            self._file_results.popitem(last=False)
+
+    @staticmethod
+    def _empty_metadata() -> Dict[str, Any]:
+        return {"return_type": None, "param_types": {}, "signature": None}
+
+    @staticmethod
+    def _hover_character(lines: List[str], line: int, name: Optional[str]) -> int:
+        """Character position of the symbol name on its line (4 as fallback)."""
+        if 0 <= line < len(lines) and name:
+            name_index = lines[line].find(name)
+            if name_index != -1:
+                return name_index
+        return 4
+
+    @staticmethod
+    def _typescript_language_id(language: str) -> str:
+        return {
+            "typescript": "typescript",
+            "tsx": "typescriptreact",
+            "javascript": "javascript",
+            "jsx": "javascriptreact"
+        }.get(language, "typescript")
+
     def _detect_language(self, file_path: str) -> str:
         """
         Detect language from file extension.
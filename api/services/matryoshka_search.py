@@ -0,0 +1,184 @@
+"""
+Matryoshka two-stage vector search — ANN on truncated vectors, exact rescoring.
+
+nomic-embed-text-v1.5 is trained with Matryoshka representation learning:
+the first d dimensions of its 768D vectors are themselves a usable
+embedding. HNSW index size and build time grow with dimension, so the
+coarse stage of two-stage search (services/two_stage_search.py) scans an
+expression index over the first `dim` dimensions,
+subvector(embedding_half, 1, dim)::halfvec(dim), before the full 768D
+halfvec rescores the candidates.
+
+Full vectors stay in the table (rescoring needs them); what shrinks is the
+HNSW index, which is the part that must stay in memory. Indexes are
+created by scripts/matryoshka_backfill.py (CREATE INDEX CONCURRENTLY), which
+can also drop the full-dimension HNSW indexes once the reduced ones serve
+all searches. Cosine distance is scale-invariant, so the truncated prefix
+needs no re-normalisation.
+
+Adaptive oversampling: after each query the deepest coarse rank that made
+it into the final top-k is recorded. Final results drawn from the tail of
+the candidate pool mean better candidates were probably cut off, so
+oversample grows (×1.5 up to max_oversample); results that all come from
+the head of the pool let it decay slowly (×0.95 down to min_oversample).
+
+Configuration (environment):
+    EMBEDDING_MRL_DIM           coarse dim for TEXT columns (0 = off)  (default: 0)
+    EMBEDDING_MRL_CODE_DIM      coarse dim for CODE columns (0 = off)  (default: 0)
+                                jina-embeddings-v2-base-code is not Matryoshka-trained;
+                                measure with scripts/benchmarks/matryoshka_recall_benchmark.py
+    EMBEDDING_MRL_OVERSAMPLE    initial candidate multiplier           (default: 4)
+    EMBEDDING_MRL_MIN_CANDIDATES                                       (default: 50)
+    EMBEDDING_MRL_ADAPTIVE      true | false                           (default: true)
+
+Usage:
+    mrl = get_matryoshka_search()
+    dim = mrl.dim_for("TEXT")
+    if dim:
+        coarse = mrl.coarse_candidates_sql("memories", "embedding_half", dim, embedding, where_sql)
+        params["mrl_candidate_limit"] = mrl.candidate_limit(limit)
+        ... JOIN ({coarse}) mrl_c USING (id) ORDER BY <full distance> LIMIT :limit
+        mrl.record(limit, params["mrl_candidate_limit"], [row.coarse_rank for row in rows])
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from services.two_stage_search import (
+    EMBEDDING_COLUMNS,
+    FULL_DIMENSION,
+    TwoStageConfig,
+    TwoStageSearch,
+)
+from utils.sql_vector import format_halfvec_for_sql
+
+logger = structlog.get_logger()
+
+# (table, halfvec column) -> embedding domain
+MRL_COLUMNS = EMBEDDING_COLUMNS
+
+
+def truncated_expression(column: str, dim: int) -> str:
+    """SQL expression of the first `dim` dimensions (matches the index expression)."""
+    dim = int(dim)
+    return f"(subvector({column}, 1, {dim})::halfvec({dim}))"
+
+
+def mrl_index_name(table: str, column: str, dim: int) -> str:
+    """Name of the reduced-dimension HNSW index for a column."""
+    return f"idx_{table}_{column}_mrl{int(dim)}"
+
+
+def truncate_embedding(embedding: List[float], dim: int) -> List[float]:
+    """First `dim` dimensions of a query embedding."""
+    if dim <= 0 or dim > len(embedding):
+        raise ValueError(f"Matryoshka dim must be in 1..{len(embedding)}, got {dim}")
+    return list(embedding[:dim])
+
+
+@dataclass
+class MatryoshkaConfig(TwoStageConfig):
+    """Reduced-dimension search settings."""
+    text_dim: int = 0
+    code_dim: int = 0
+    oversample: float = 4.0
+    min_oversample: float = 2.0
+    max_oversample: float = 16.0
+    min_candidates: int = 50
+    adaptive: bool = True
+
+    @classmethod
+    def from_env(cls) -> "MatryoshkaConfig":
+        """Build config from EMBEDDING_MRL_* environment variables."""
+        return cls(
+            text_dim=int(os.getenv("EMBEDDING_MRL_DIM", "0")),
+            code_dim=int(os.getenv("EMBEDDING_MRL_CODE_DIM", "0")),
+            adaptive=os.getenv("EMBEDDING_MRL_ADAPTIVE", "true").lower() == "true",
+            **cls._pool_from_env("EMBEDDING_MRL"),
+        )
+
+
+class MatryoshkaSearch(TwoStageSearch):
+    """Builds two-stage queries and adapts the candidate pool size."""
+
+    config: MatryoshkaConfig
+
+    def __init__(self, config: Optional[MatryoshkaConfig] = None):
+        """
+        Initialize two-stage search.
+
+        Args:
+            config: Settings (read from environment if not provided)
+        """
+        super().__init__(config or MatryoshkaConfig.from_env())
+        self.grown = 0
+
+    def dim_for(self, domain: str) -> int:
+        """Coarse dimension for a domain ("TEXT" / "CODE"), 0 when disabled."""
+        dim = self.config.text_dim if domain.upper() == "TEXT" else self.config.code_dim
+        return dim if 0 < dim < FULL_DIMENSION else 0
+
+    def coarse_candidates_sql(
+        self,
+        table: str,
+        column: str,
+        dim: int,
+        embedding: List[float],
+        where_sql: str,
+    ) -> str:
+        """
+        Stage-1 subquery: ids and coarse ranks of the nearest truncated vectors.
+
+        Uses the :mrl_candidate_limit bind parameter. The ORDER BY expression
+        matches the index created by scripts/matryoshka_backfill.py.
+
+        Raises:
+            ValueError: If (table, column) is not a known embedding column
+        """
+        if (table, column) not in MRL_COLUMNS:
+            raise ValueError(f"No Matryoshka index for {table}.{column}")
+
+        query_str = f"'{format_halfvec_for_sql(truncate_embedding(embedding, dim))}'::halfvec({int(dim)})"
+        distance = f"{truncated_expression(column, dim)} <=> {query_str}"
+        return self._coarse_sql(table, where_sql, distance, "mrl_candidate_limit")
+
+    def _adapt(self, depth_ratio: float) -> None:
+        """Grow oversample on deep results, let it decay on shallow ones."""
+        if not self.config.adaptive:
+            return
+
+        if depth_ratio > 0.75:
+            new = min(self.config.max_oversample, self.oversample * 1.5)
+            if new > self.oversample:
+                self.grown += 1
+                logger.info(
+                    "matryoshka.oversample_increased",
+                    oversample=round(new, 2),
+                    depth_ratio=round(depth_ratio, 3),
+                )
+            self.oversample = new
+        elif depth_ratio < 0.25:
+            self.oversample = max(self.config.min_oversample, self.oversample * 0.95)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current settings and adaptation telemetry."""
+        return {
+            "text_dim": self.dim_for("TEXT"),
+            "code_dim": self.dim_for("CODE"),
+            **super().stats(),
+            "oversample_increases": self.grown,
+        }
+
+
+_matryoshka_search: Optional[MatryoshkaSearch] = None
+
+
+def get_matryoshka_search() -> MatryoshkaSearch:
+    """Process-wide two-stage search settings shared by vector search paths."""
+    global _matryoshka_search
+    if _matryoshka_search is None:
+        _matryoshka_search = MatryoshkaSearch()
+    return _matryoshka_search
@@ -42,6 +42,8 @@ except ImportError:
     PythonMetadataExtractor = None  # type: ignore
     PYTHON_EXTRACTOR_AVAILABLE = False
 
+from services.python_module_index import PythonModuleIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -172,6 +174,87 @@ class MetadataExtractorService:
             self.logger.warning(f"Language '{language}' not supported, returning basic metadata")
             return self._extract_basic_metadata(node)
 
+    async def extract_python_chunks_metadata(
+        self,
+        source_code: str,
+        chunks: list[Any],
+    ) -> list[dict[str, Any]]:
+        """
+        Extract metadata for all chunks of one Python module in a single pass.
+
+        Builds a PythonModuleIndex once (one parse, one traversal) and
+        resolves each chunk to its definition by name and line range, instead
+        of walking the module per chunk.
+
+        Args:
+            source_code: Full module source
+            chunks: Chunks with name, start_line and end_line
+
+        Returns:
+            Metadata dicts aligned with chunks (same fields as extract_metadata)
+
+        Raises:
+            SyntaxError: If the module cannot be parsed
+        """
+        index = PythonModuleIndex(source_code)
+
+        results = []
+        for chunk in chunks:
+            try:
+                node = index.find(chunk.name, chunk.start_line, chunk.end_line)
+                if node is None:
+                    self.logger.debug(f"Could not find ast node for chunk '{chunk.name}', using module root")
+                results.append(index.metadata(node))
+            except Exception as e:
+                self.logger.warning(f"Failed to extract metadata for chunk '{chunk.name}': {e}", exc_info=True)
+                results.append({"imports": [], "calls": []})
+        return results
+
+    async def extract_typescript_chunks_metadata(
+        self,
+        source_code: str,
+        tree: Any,
+        chunks: list[Any],
+        language: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Extract metadata for all chunks of one TypeScript/JavaScript file.
+
+        File-level imports are extracted once and shared; calls, call
+        contexts, signature and complexity come from the chunk's own subtree
+        (mapped by byte range) instead of the whole file.
+
+        Args:
+            source_code: Full file source
+            tree: tree-sitter Tree of source_code
+            chunks: Chunks with name, start_line and end_line
+            language: 'typescript' or 'javascript'
+
+        Returns:
+            Metadata dicts aligned with chunks
+        """
+        extractor = self.extractors.get(language)
+        if not extractor:
+            # Same per-chunk fallback as extract_metadata (empty/basic metadata)
+            return [
+                await self.extract_metadata(source_code, tree.root_node, tree, language)
+                for _ in chunks
+            ]
+
+        imports = await extractor.extract_imports(tree, source_code)
+        mapped = extractor.chunk_nodes(tree, source_code, [(c.start_line, c.end_line) for c in chunks])
+
+        results = []
+        for chunk, (node, byte_range) in zip(chunks, mapped):
+            try:
+                results.append(await extractor.extract_metadata(
+                    source_code, node, tree, imports=list(imports), byte_range=byte_range
+                ))
+            except Exception as e:
+                self.logger.warning(f"Failed to extract metadata for chunk '{chunk.name}': {e}", exc_info=True)
+                results.append({"imports": [], "calls": []})
+        return results
+
     async def _extract_typescript_metadata(
         self,
         source_code: str,
@@ -57,6 +57,8 @@ class TypeScriptMetadataExtractor:
         self.language = get_language(language)
         self.language_name = language
         self.logger = logging.getLogger(__name__)
+        self._encoded_source: str | None = None
+        self._encoded_bytes = b""
 
         # Import extraction queries
         # Split into multiple queries for better compatibility
@@ -102,6 +104,19 @@ class TypeScriptMetadataExtractor:
             "(new_expression constructor: (_) @constructor)"
         )
 
+    def _encode(self, source_code: str) -> bytes:
+        """
+        UTF-8 bytes of the source, encoded once per file.
+
+        Tree-sitter offsets are byte offsets, so every node text is sliced
+        from the encoded source; re-encoding the whole file per node made
+        extraction quadratic in file size.
+        """
+        if source_code is not self._encoded_source:
+            self._encoded_source = source_code
+            self._encoded_bytes = source_code.encode('utf-8')
+        return self._encoded_bytes
+
     def _extract_string_literal(self, node: Node, source_code: str) -> str:
         """
         Extract string content from string node (remove quotes).
@@ -114,7 +129,7 @@ class TypeScriptMetadataExtractor:
             String content without quotes (e.g., './models' → ./models)
         """
         # EPIC-28: Fix UTF-8 byte offset bug (slice bytes, not chars)
-        source_bytes = source_code.encode('utf-8')
+        source_bytes = self._encode(source_code)
         text_bytes = source_bytes[node.start_byte:node.end_byte]
         text = text_bytes.decode('utf-8')
         # Remove quotes (single or double)
@@ -179,7 +194,7 @@ class TypeScriptMetadataExtractor:
         """Process a type-only import statement."""
         source_str = None
         names = []
-        source_bytes = source_code.encode('utf-8')
+        source_bytes = self._encode(source_code)
 
         # Extract source and named imports
         for child in import_node.children:
@@ -217,7 +232,7 @@ class TypeScriptMetadataExtractor:
         """Process a type-only export statement."""
         source_str = None
         names = []
-        source_bytes = source_code.encode('utf-8')
+        source_bytes = self._encode(source_code)
 
         # Extract source and named exports
         for child in export_node.children:
@@ -455,7 +470,7 @@ class TypeScriptMetadataExtractor:
         for child in specifier_node.children:
             if child.type == "identifier":
                 # EPIC-28: Fix UTF-8 byte offset
-                source_bytes = source_code.encode('utf-8')
+                source_bytes = self._encode(source_code)
                 name_bytes = source_bytes[child.start_byte:child.end_byte]
                 name = name_bytes.decode('utf-8')
                 identifiers.append(name)
@@ -548,7 +563,7 @@ class TypeScriptMetadataExtractor:
                     source = self._extract_string_literal(source_nodes[0], source_code)
                     for name_node in name_nodes:
                         # EPIC-28: Fix UTF-8 byte offset bug
-                        source_bytes = source_code.encode('utf-8')
+                        source_bytes = self._encode(source_code)
                         name_bytes = source_bytes[name_node.start_byte:name_node.end_byte]
                         name = name_bytes.decode('utf-8')
                         import_ref = f"{source}.{name}"
@@ -594,7 +609,7 @@ class TypeScriptMetadataExtractor:
                     source = self._extract_string_literal(source_nodes[0], source_code)
                     for name_node in name_nodes:
                         # EPIC-28: Fix UTF-8 byte offset bug
-                        source_bytes = source_code.encode('utf-8')
+                        source_bytes = self._encode(source_code)
                         name_bytes = source_bytes[name_node.start_byte:name_node.end_byte]
                         name = name_bytes.decode('utf-8')
                         import_ref = f"{source}.{name}"
@@ -649,7 +664,7 @@ class TypeScriptMetadataExtractor:
             # Tree-sitter returns BYTE offsets, but Python string slicing uses CHARACTER indices
             # With UTF-8 multi-byte chars (é, à, etc.), these don't align
             # Solution: Slice bytes, then decode
-            source_bytes = source_code.encode('utf-8')
+            source_bytes = self._encode(source_code)
             call_bytes = source_bytes[function_node.start_byte:function_node.end_byte]
             call_text = call_bytes.decode('utf-8')
 
@@ -668,7 +683,12 @@ class TypeScriptMetadataExtractor:
             self.logger.debug(f"Failed to extract call expression: {e}")
             return None
 
-    async def extract_calls(self, node: Node, source_code: str) -> list[str]:
+    async def extract_calls(
+        self,
+        node: Node,
+        source_code: str,
+        byte_range: tuple[int, int] | None = None
+    ) -> list[str]:
         """
         Extract function/method calls from a code node.
 
@@ -684,6 +704,8 @@ class TypeScriptMetadataExtractor:
         Args:
             node: tree-sitter AST node (function, class, method, or any node)
             source_code: Full source code
+            byte_range: Only calls within (start_byte, end_byte) of the node,
+                        for chunks spanning several sibling nodes
 
         Returns:
             List of call references.
@@ -711,6 +733,8 @@ class TypeScriptMetadataExtractor:
         try:
             # 1. Extract regular function/method calls
             cursor = QueryCursor(self.call_expression_query)
+            if byte_range:
+                cursor.set_byte_range(*byte_range)
             matches = cursor.matches(node)
 
             for pattern_index, captures_dict in matches:
@@ -725,6 +749,8 @@ class TypeScriptMetadataExtractor:
 
             # 2. Extract constructor calls (new expressions)
             cursor = QueryCursor(self.new_expression_query)
+            if byte_range:
+                cursor.set_byte_range(*byte_range)
             matches = cursor.matches(node)
 
             for pattern_index, captures_dict in matches:
@@ -732,7 +758,7 @@ class TypeScriptMetadataExtractor:
 
                 for constructor_node in constructor_nodes:
                     # EPIC-28: Fix UTF-8 byte offset bug
-                    source_bytes = source_code.encode('utf-8')
+                    source_bytes = self._encode(source_code)
                     constructor_bytes = source_bytes[constructor_node.start_byte:constructor_node.end_byte]
                     constructor_text = constructor_bytes.decode('utf-8')
                     constructor_text = constructor_text.strip()
@@ -749,6 +775,64 @@ class TypeScriptMetadataExtractor:
 
         return calls
 
+    def chunk_nodes(
+        self,
+        tree: Tree,
+        source_code: str,
+        line_ranges: list[tuple[int | None, int | None]]
+    ) -> list[tuple[Node, tuple[int, int] | None]]:
+        """
+        Map chunks (1-based line ranges) to the tree-sitter node they cover.
+
+        The chunk's content (its lines without surrounding whitespace) is
+        converted to a byte range once, and the smallest node spanning it is
+        used, so metadata is extracted from the chunk's subtree instead of the
+        whole file. `export` wrappers are unwrapped to their declaration.
+
+        Args:
+            tree: Full file tree
+            source_code: Full file source
+            line_ranges: (start_line, end_line) per chunk
+
+        Returns:
+            (node, byte_range) per chunk. byte_range restricts call
+            extraction when the node is larger than the chunk (a chunk made
+            of several sibling statements); it is None for chunks without
+            line information, which fall back to the root node.
+        """
+        root = tree.root_node
+        source_bytes = self._encode(source_code)
+
+        line_starts = [0]
+        newline = source_bytes.find(b"\n")
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = source_bytes.find(b"\n", newline + 1)
+
+        mapped = []
+        for start_line, end_line in line_ranges:
+            if not start_line or not end_line or start_line > len(line_starts):
+                mapped.append((root, None))
+                continue
+
+            start = line_starts[start_line - 1]
+            end = line_starts[end_line] if end_line < len(line_starts) else len(source_bytes)
+            while start < end and source_bytes[start] in b" \t\r\n":
+                start += 1
+            while end > start and source_bytes[end - 1] in b" \t\r\n":
+                end -= 1
+            if start >= end:
+                mapped.append((root, None))
+                continue
+
+            node = root.descendant_for_byte_range(start, end) or root
+            if node.type == "export_statement":
+                declaration = node.child_by_field_name("declaration")
+                if declaration is not None:
+                    node = declaration
+            mapped.append((node, (start, end)))
+        return mapped
+
     def _get_lsp_type(self, node_type: str) -> str:
         """
         Map tree-sitter node type to LSP-compliant type.
@@ -777,7 +861,9 @@ class TypeScriptMetadataExtractor:
         self,
         source_code: str,
         node: Node,
-        tree: Tree
+        tree: Tree,
+        imports: list[str] | None = None,
+        byte_range: tuple[int, int] | None = None
     ) -> dict[str, Any]:
         """
         Extract ALL metadata including enriched context and metrics.
@@ -791,6 +877,10 @@ class TypeScriptMetadataExtractor:
             source_code: FULL FILE source code (CRITICAL: not chunk source!)
             node: tree-sitter AST node (function, class, method) from full file tree
             tree: Full file AST tree (parsed from source_code)
+            imports: File-level imports already extracted from tree (shared
+                     by all chunks of a file); extracted when None
+            byte_range: Restrict calls to this (start_byte, end_byte) range
+                        (see chunk_nodes)
 
         Returns:
             Metadata dict with:
@@ -845,8 +935,9 @@ class TypeScriptMetadataExtractor:
         """
         try:
             # Extract basic metadata (existing)
-            imports = await self.extract_imports(tree, source_code)
-            calls = await self.extract_calls(node, source_code)
+            if imports is None:
+                imports = await self.extract_imports(tree, source_code)
+            calls = await self.extract_calls(node, source_code, byte_range)
             re_exports = await self.extract_re_exports(node, source_code)
 
             # Extract enriched metadata (NEW)
@@ -854,17 +945,17 @@ class TypeScriptMetadataExtractor:
             scope_name = None
             for child in node.children:
                 if child.type == "identifier":
-                    source_bytes = source_code.encode('utf-8')
+                    source_bytes = self._encode(source_code)
                     name_bytes = source_bytes[child.start_byte:child.end_byte]
                     scope_name = name_bytes.decode('utf-8')
                     break
 
-            call_contexts = await self.extract_call_contexts(node, source_code, scope_name)
+            call_contexts = await self.extract_call_contexts(node, source_code, scope_name, byte_range)
             signature = await self.extract_function_signature(node, source_code)
 
             # Calculate complexity
             cyclomatic = self.calculate_cyclomatic_complexity(node)
-            source_bytes = source_code.encode('utf-8')
+            source_bytes = self._encode(source_code)
             node_source = source_bytes[node.start_byte:node.end_byte].decode('utf-8')
             lines_of_code = len([l for l in node_source.split('\n') if l.strip()])
 
@@ -898,7 +989,8 @@ class TypeScriptMetadataExtractor:
         self,
         node: Node,
         source_code: str,
-        scope_name: str = None
+        scope_name: str = None,
+        byte_range: tuple[int, int] | None = None
     ) -> list[dict]:
         """
         Extract detailed context for each function call.
@@ -917,6 +1009,8 @@ class TypeScriptMetadataExtractor:
 
         # Extract all call expressions
         cursor = QueryCursor(self.call_expression_query)
+        if byte_range:
+            cursor.set_byte_range(*byte_range)
         matches = cursor.matches(node)
 
         for pattern_index, captures_dict in matches:
@@ -1024,7 +1118,7 @@ class TypeScriptMetadataExtractor:
                 signature["is_generator"] = True
             elif child.type == "identifier":
                 # Function name
-                source_bytes = source_code.encode('utf-8')
+                source_bytes = self._encode(source_code)
                 name_bytes = source_bytes[child.start_byte:child.end_byte]
                 signature["function_name"] = name_bytes.decode('utf-8')
             elif child.type == "formal_parameters":
@@ -1032,7 +1126,7 @@ class TypeScriptMetadataExtractor:
                 signature["parameters"] = self._extract_parameters(child, source_code)
             elif child.type == "type_annotation":
                 # Return type
-                source_bytes = source_code.encode('utf-8')
+                source_bytes = self._encode(source_code)
                 type_bytes = source_bytes[child.start_byte:child.end_byte]
                 signature["return_type"] = type_bytes.decode('utf-8').lstrip(': ')
 
@@ -1041,7 +1135,7 @@ class TypeScriptMetadataExtractor:
     def _extract_parameters(self, params_node: Node, source_code: str) -> list[dict]:
         """Extract parameter details from formal_parameters node."""
         parameters = []
-        source_bytes = source_code.encode('utf-8')
+        source_bytes = self._encode(source_code)
 
         for child in params_node.children:
             if child.type == "required_parameter" or child.type == "optional_parameter":
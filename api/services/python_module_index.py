@@ -0,0 +1,239 @@
+"""
+One-pass Python metadata extraction for all chunks of a file.
+
+CodeChunkingService used to resolve every chunk with a full ast.walk of the
+module (matching the first definition with the same name) and then run the
+per-node extractors, each of which walked the node again, re-collected the
+module imports and re-split the whole source for ast.get_source_segment.
+That is O(chunks x nodes) per file and picks the wrong node for duplicate
+names (methods named __init__, overloads, nested helpers).
+
+PythonModuleIndex parses the module once and makes a single breadth-first
+traversal that records:
+- every FunctionDef/AsyncFunctionDef/ClassDef by name with its line range
+- module imports (same last-wins semantics as the per-node extractor)
+- referenced names and calls, attributed to every enclosing definition
+
+Metadata for a chunk is then assembled from the index; the output matches
+MetadataExtractorService._extract_python_metadata for the same node.
+
+EPIC-29 follow-up: single-pass Python metadata extraction.
+"""
+
+import ast
+import logging
+from collections import deque
+from typing import Any, Optional, Union
+
+from radon.complexity import cc_visit_ast
+
+logger = logging.getLogger(__name__)
+
+DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def split_source_lines(source_code: str) -> list[str]:
+    """Split like the Python parser (\\r\\n, \\r, \\n only; form feeds kept)."""
+    lines = []
+    start = 0
+    idx = 0
+    length = len(source_code)
+    while idx < length:
+        c = source_code[idx]
+        idx += 1
+        if c == "\r" and idx < length and source_code[idx] == "\n":
+            idx += 1
+        if c in "\r\n":
+            lines.append(source_code[start:idx])
+            start = idx
+    if start < length:
+        lines.append(source_code[start:])
+    return lines
+
+
+class _Scope:
+    """Names and calls collected under one node (definition or module)."""
+
+    __slots__ = ("node", "names", "calls")
+
+    def __init__(self, node: ast.AST):
+        self.node = node
+        self.names: set[str] = set()
+        self.calls: set[str] = set()
+
+
+class PythonModuleIndex:
+    """Definitions, imports, names and calls of one Python module."""
+
+    def __init__(self, source_code: str, tree: Optional[ast.Module] = None):
+        """
+        Parse (unless a tree is given) and index a module.
+
+        Args:
+            source_code: Full module source
+            tree: Already parsed ast.Module of source_code
+
+        Raises:
+            SyntaxError: If the source cannot be parsed
+        """
+        self.source_code = source_code
+        self.tree = tree if tree is not None else ast.parse(source_code)
+        self._lines = split_source_lines(source_code)
+
+        self.module_imports: dict[str, str] = {}
+        self.definitions: dict[str, list[ast.AST]] = {}
+        self._scopes: dict[int, _Scope] = {}
+        self._index()
+
+    def _index(self) -> None:
+        root = _Scope(self.tree)
+        self._scopes[id(self.tree)] = root
+
+        # Breadth-first like ast.walk, so "first definition with this name"
+        # and last-wins import aliases behave as before.
+        queue = deque([(self.tree, (root,))])
+        while queue:
+            node, owners = queue.popleft()
+
+            if isinstance(node, DEFINITION_TYPES):
+                self.definitions.setdefault(node.name, []).append(node)
+                scope = _Scope(node)
+                self._scopes[id(node)] = scope
+                owners = owners + (scope,)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    self.module_imports[alias.asname or alias.name] = alias.name
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                for alias in node.names:
+                    full_name = f"{module}.{alias.name}" if module else alias.name
+                    self.module_imports[alias.asname or alias.name] = full_name
+            elif isinstance(node, ast.Name):
+                for scope in owners:
+                    scope.names.add(node.id)
+            elif isinstance(node, ast.Attribute):
+                if isinstance(node.value, ast.Name):
+                    for scope in owners:
+                        scope.names.add(node.value.id)
+            elif isinstance(node, ast.Call):
+                call = self._call_name(node)
+                if call:
+                    for scope in owners:
+                        scope.calls.add(call)
+
+            for child in ast.iter_child_nodes(node):
+                queue.append((child, owners))
+
+    @staticmethod
+    def _call_name(node: ast.Call) -> Optional[str]:
+        if isinstance(node.func, ast.Name):
+            return node.func.id
+        if isinstance(node.func, ast.Attribute):
+            if isinstance(node.func.value, ast.Name):
+                return f"{node.func.value.id}.{node.func.attr}"
+            return node.func.attr
+        return None
+
+    def find(
+        self,
+        name: Optional[str],
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+    ) -> Optional[ast.AST]:
+        """
+        Definition node of a chunk.
+
+        Among definitions named `name`, prefers the outermost one inside
+        [start_line, end_line], then one overlapping it, then the first in
+        traversal order (the previous name-only behaviour).
+
+        Returns:
+            The definition node, or None if no definition has that name
+        """
+        candidates = self.definitions.get(name) if name else None
+        if not candidates:
+            return None
+        if start_line is None or end_line is None:
+            return candidates[0]
+
+        inside = [n for n in candidates if start_line <= n.lineno and n.end_lineno <= end_line]
+        if inside:
+            return max(inside, key=lambda n: n.end_lineno - n.lineno)
+        overlapping = [n for n in candidates if n.lineno <= end_line and start_line <= n.end_lineno]
+        if overlapping:
+            return overlapping[0]
+        return candidates[0]
+
+    def source_segment(self, node: ast.AST) -> Optional[str]:
+        """ast.get_source_segment without re-splitting the module per call."""
+        try:
+            if node.end_lineno is None or node.end_col_offset is None:
+                return None
+            lineno = node.lineno - 1
+            end_lineno = node.end_lineno - 1
+            col_offset = node.col_offset
+            end_col_offset = node.end_col_offset
+        except AttributeError:
+            return None
+
+        if end_lineno == lineno:
+            return self._lines[lineno].encode()[col_offset:end_col_offset].decode()
+
+        first = self._lines[lineno].encode()[col_offset:].decode()
+        last = self._lines[end_lineno].encode()[:end_col_offset].decode()
+        return "".join([first, *self._lines[lineno + 1:end_lineno], last])
+
+    def metadata(self, node: Union[ast.AST, None] = None) -> dict[str, Any]:
+        """
+        Metadata of a definition node (or of the module when node is None).
+
+        Returns:
+            Same fields as MetadataExtractorService._extract_python_metadata:
+            signature, parameters, returns, decorators, docstring,
+            complexity, imports, calls
+        """
+        node = node if node is not None else self.tree
+        scope = self._scopes[id(node)]
+        segment = self.source_segment(node)
+
+        metadata: dict[str, Any] = {
+            "signature": segment,
+            "parameters": [],
+            "returns": None,
+            "decorators": [],
+        }
+        try:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                metadata["parameters"] = [arg.arg for arg in node.args.args]
+                if node.returns:
+                    metadata["returns"] = ast.unparse(node.returns)
+                metadata["decorators"] = [ast.unparse(dec) for dec in node.decorator_list]
+            elif isinstance(node, ast.ClassDef):
+                if node.bases:
+                    metadata["parameters"] = [ast.unparse(base) for base in node.bases]
+                metadata["decorators"] = [ast.unparse(dec) for dec in node.decorator_list]
+        except Exception as e:
+            logger.warning(f"Signature extraction failed: {e}")
+
+        try:
+            metadata["docstring"] = ast.get_docstring(node)
+        except Exception as e:
+            logger.warning(f"Docstring extraction failed: {e}")
+            metadata["docstring"] = None
+
+        metadata["complexity"] = {"cyclomatic": None, "lines_of_code": 0}
+        if segment:
+            metadata["complexity"]["lines_of_code"] = len(segment.split("\n"))
+            try:
+                # Visit the already-parsed node instead of re-parsing its source
+                blocks = cc_visit_ast(ast.Module(body=[node], type_ignores=[]))
+                if blocks:
+                    metadata["complexity"]["cyclomatic"] = blocks[0].complexity
+            except Exception as e:
+                logger.warning(f"Radon complexity extraction failed: {e}")
+
+        metadata["imports"] = sorted(
+            {self.module_imports[name] for name in scope.names if name in self.module_imports}
+        )
+        metadata["calls"] = sorted(scope.calls)
+        return metadata
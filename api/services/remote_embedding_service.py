@@ -0,0 +1,190 @@
+"""
+Remote Dual Embedding Service - client of the embedding inference sidecar.
+
+Drop-in replacement for DualEmbeddingService that calls the sidecar
+(services/embedding_inference_server.py) instead of loading models in the
+calling process. Each client declares a priority lane: API/MCP search is
+"interactive", indexing is "bulk"; the sidecar serves interactive batches
+first. Work tagged with background_work() (services/resource_scheduler.py)
+always uses the bulk lane, whatever the client declared.
+
+EMBEDDING_SIDECAR_URL selects the transport:
+    http://embeddings:8765          localhost / Compose network
+    unix:///tmp/mnemo-embed.sock    Unix domain socket
+
+Usage:
+    service = create_dual_embedding_service(priority="bulk", client_name="indexer")
+    # RemoteDualEmbeddingService if EMBEDDING_SIDECAR_URL is set,
+    # otherwise an in-process DualEmbeddingService
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+import structlog
+
+from services.dual_embedding_service import EmbeddingDomain
+from services.resource_scheduler import BACKGROUND, current_work_class
+
+logger = structlog.get_logger(__name__)
+
+
+class RemoteDualEmbeddingService:
+    """DualEmbeddingService interface backed by the embedding sidecar."""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client_name: str = "api",
+        priority: str = "interactive",
+        timeout: Optional[float] = None,
+        dimension: int = 768,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the client (no connection is made until first use).
+
+        Args:
+            url: Sidecar URL (EMBEDDING_SIDECAR_URL); unix:// for a Unix socket
+            client_name: Reported to the sidecar for per-client metrics
+            priority: "interactive" or "bulk" lane
+            timeout: Request timeout in seconds (EMBEDDING_SIDECAR_TIMEOUT)
+            dimension: Embedding dimension (for stats)
+            transport: Explicit httpx transport (tests use ASGITransport)
+        """
+        self.url = url or os.getenv("EMBEDDING_SIDECAR_URL", "http://127.0.0.1:8765")
+        self.client_name = client_name
+        self.priority = priority
+        self.timeout = timeout or float(os.getenv("EMBEDDING_SIDECAR_TIMEOUT", "60"))
+        self.dimension = dimension
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            transport = self._transport
+            base_url = self.url
+            if transport is None and self.url.startswith("unix://"):
+                transport = httpx.AsyncHTTPTransport(uds=self.url[len("unix://"):])
+                base_url = "http://sidecar"
+            self._client = httpx.AsyncClient(
+                base_url=base_url,
+                transport=transport,
+                timeout=self.timeout,
+                headers={"X-Embedding-Client": self.client_name},
+            )
+        return self._client
+
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        domain: EmbeddingDomain = EmbeddingDomain.TEXT,
+        show_progress_bar: bool = True
+    ) -> List[Dict[str, List[float]]]:
+        """
+        Embed texts through the sidecar.
+
+        Raises:
+            RuntimeError: If the sidecar is unreachable or fails
+        """
+        if not texts:
+            return []
+        try:
+            response = await self._get_client().post(
+                "/embed",
+                json={"texts": texts, "domain": EmbeddingDomain(domain).value, "priority": self._lane()},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("remote_embedding.request_failed", url=self.url, error=str(e), batch_size=len(texts))
+            raise RuntimeError(f"Embedding sidecar request failed: {e}") from e
+        return response.json()["embeddings"]
+
+    async def generate_embedding(
+        self,
+        text: str,
+        domain: EmbeddingDomain = EmbeddingDomain.TEXT
+    ) -> Dict[str, List[float]]:
+        """Embed one text (same return shape as DualEmbeddingService)."""
+        if not text or not text.strip():
+            return {
+                key: [0.0] * self.dimension
+                for key in ("text", "code")
+                if domain in (EmbeddingDomain(key), EmbeddingDomain.HYBRID)
+            }
+        return (await self.generate_embeddings_batch([text], domain=domain))[0]
+
+    async def generate_embedding_legacy(self, text: str) -> List[float]:
+        """Text embedding only (backward compatible API)."""
+        result = await self.generate_embedding(text, domain=EmbeddingDomain.TEXT)
+        return result["text"]
+
+    async def compute_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
+        """Cosine similarity clipped to [0, 1]."""
+        emb1 = np.array(embedding1)
+        emb2 = np.array(embedding2)
+        norm1 = np.linalg.norm(emb1)
+        norm2 = np.linalg.norm(emb2)
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+        return float(np.clip(np.dot(emb1, emb2) / (norm1 * norm2), 0.0, 1.0))
+
+    async def preload_models(self) -> None:
+        """Wait for the sidecar to answer /health (models live there)."""
+        try:
+            response = await self._get_client().get("/health")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Embedding sidecar not reachable at {self.url}: {e}") from e
+
+    def _lane(self) -> str:
+        return "bulk" if current_work_class() == BACKGROUND else self.priority
+
+    async def get_sidecar_metrics(self) -> Dict[str, Any]:
+        """Per-client and per-lane metrics reported by the sidecar."""
+        response = await self._get_client().get("/metrics")
+        response.raise_for_status()
+        return response.json()
+
+    def get_stats(self) -> dict:
+        return {
+            "remote": True,
+            "url": self.url,
+            "client_name": self.client_name,
+            "priority": self.priority,
+            "dimension": self.dimension,
+        }
+
+    def force_memory_cleanup(self) -> None:
+        """No local models to clean up."""
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_dual_embedding_service(
+    priority: str = "interactive",
+    client_name: str = "api",
+    **kwargs: Any,
+):
+    """
+    Embedding service for a component.
+
+    Returns a RemoteDualEmbeddingService when EMBEDDING_SIDECAR_URL is set,
+    otherwise an in-process DualEmbeddingService built with kwargs.
+    """
+    url = os.getenv("EMBEDDING_SIDECAR_URL")
+    if url:
+        return RemoteDualEmbeddingService(
+            url=url,
+            client_name=client_name,
+            priority=priority,
+            dimension=kwargs.get("dimension", int(os.getenv("EMBEDDING_DIMENSION", "768"))),
+        )
+
+    from services.dual_embedding_service import DualEmbeddingService
+    return DualEmbeddingService(**kwargs)
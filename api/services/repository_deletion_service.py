@@ -0,0 +1,417 @@
+"""
+Background repository deletion in short batched transactions.
+
+Deleting a repository used to run three unbounded DELETEs (edges, nodes,
+code_chunks) in one request transaction: row locks were held while every
+HNSW / GIN / trigram index entry was removed, the request blocked for the
+whole duration and autovacuum only saw the dead tuples at the end.
+
+A deletion is now a job:
+
+    start()    O(1) in the request: cached searches/graph traversals of the
+               repository are invalidated (generation bump), its dashboard
+               row and indexing checkpoints are dropped and the job is
+               scheduled; returns the job
+    run        edges (by source, then by target node), nodes, then chunks,
+               each as DELETE ... WHERE pk IN (SELECT pk ... LIMIT batch)
+               in its own transaction (db/batched_delete.py), with a short
+               pause between batches so concurrent writers and autovacuum
+               keep up
+    progress   get_job() / list_jobs(): phase, rows deleted per table
+               against the totals counted at start, percentage
+
+Every batch is index-driven (code_chunks.repository, the nodes
+(properties->>'repository') expression index, edges source/target
+indexes); the previous orphaned-edge sweep over the whole edges table is
+gone. A failed job can be restarted: batches are idempotent and rows
+already deleted stay deleted.
+
+Jobs live in the repository_deletion_jobs table, so every API worker and
+the MCP server see the same jobs and deleting() set. Progress is written
+in the transaction of each batch, which doubles as the job's heartbeat.
+A unique index allows one unfinished job per repository; a job whose
+heartbeat is older than JOB_STALE_SECONDS (its process died) is taken
+over and resumed by the next start() of that repository. Finished jobs
+are dropped an hour after they finish.
+
+Configuration (environment):
+    REPOSITORY_DELETE_BATCH_SIZE   rows per transaction       (default: 2000)
+    REPOSITORY_DELETE_PAUSE_MS     pause between batches      (default: 20)
+
+Usage:
+    service = get_repository_deletion_service(engine)
+    job = await service.start("MnemoLite")
+    ...
+    service.get_job(job.job_id).to_dict()
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from db.batched_delete import batch_size_from_env, delete_in_batches, pause_seconds_from_env
+from db.repositories.code_chunk_repository import DELETE_CHUNKS_BATCH_SQL
+from services.caches.repository_generations import RepositoryGenerations, get_repository_generations
+from services.indexing_checkpoint_service import IndexingCheckpointService
+from services.repository_stats_service import RepositoryStatsService
+
+logger = structlog.get_logger()
+
+JOB_RETENTION_SECONDS = 3600
+JOB_STALE_SECONDS = 300  # no batch written for that long: the owning process is gone
+
+ACTIVE_STATUSES = ("pending", "running")
+
+# (phase, counter, batch DELETE, COUNT for the progress total)
+_PHASES = (
+    (
+        "edges_by_source", "edges",
+        """
+        DELETE FROM edges WHERE edge_id IN (
+            SELECT e.edge_id FROM nodes n
+            JOIN edges e ON e.source_node_id = n.node_id
+            WHERE n.properties->>'repository' = :repository
+            LIMIT :batch_size
+        )
+        """,
+        """
+        SELECT COUNT(*) FROM nodes n
+        JOIN edges e ON e.source_node_id = n.node_id
+        WHERE n.properties->>'repository' = :repository
+        """,
+    ),
+    (
+        "edges_by_target", "edges",
+        """
+        DELETE FROM edges WHERE edge_id IN (
+            SELECT e.edge_id FROM nodes n
+            JOIN edges e ON e.target_node_id = n.node_id
+            WHERE n.properties->>'repository' = :repository
+            LIMIT :batch_size
+        )
+        """,
+        None,  # mostly already counted (and deleted) with the source phase
+    ),
+    (
+        "nodes", "nodes",
+        """
+        DELETE FROM nodes WHERE node_id IN (
+            SELECT node_id FROM nodes
+            WHERE properties->>'repository' = :repository
+            LIMIT :batch_size
+        )
+        """,
+        "SELECT COUNT(*) FROM nodes WHERE properties->>'repository' = :repository",
+    ),
+    (
+        "chunks", "chunks",
+        DELETE_CHUNKS_BATCH_SQL,
+        "SELECT COUNT(*) FROM code_chunks WHERE repository = :repository",
+    ),
+)
+
+_JOB_COLUMNS = (
+    "job_id", "repository", "status", "phase", "totals", "deleted",
+    "batches", "error", "created_at", "finished_at",
+)
+_ACTIVE_SQL = f"status IN ({', '.join(repr(s) for s in ACTIVE_STATUSES)})"
+
+_CREATE_JOB_SQL = f"""
+    INSERT INTO repository_deletion_jobs (job_id, repository)
+    VALUES (:job_id, :repository)
+    ON CONFLICT (repository) WHERE {_ACTIVE_SQL} DO NOTHING
+    RETURNING {", ".join(_JOB_COLUMNS)}
+"""
+
+# Unfinished job of a repository whose heartbeat stopped: this process resumes it
+_CLAIM_STALE_JOB_SQL = f"""
+    UPDATE repository_deletion_jobs SET updated_at = NOW()
+    WHERE repository = :repository AND {_ACTIVE_SQL}
+      AND updated_at < NOW() - make_interval(secs => :stale_seconds)
+    RETURNING {", ".join(_JOB_COLUMNS)}
+"""
+
+_SAVE_JOB_SQL = """
+    UPDATE repository_deletion_jobs
+    SET status = :status, phase = :phase,
+        totals = CAST(:totals AS jsonb), deleted = CAST(:deleted AS jsonb),
+        batches = :batches, error = :error, updated_at = NOW(),
+        finished_at = CASE WHEN :finished THEN NOW() END
+    WHERE job_id = :job_id
+"""
+
+
+def _json(value: Any) -> Dict[str, int]:
+    """JSONB columns arrive decoded with asyncpg codecs, as text otherwise."""
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return dict(value or {})
+
+
+def _epoch(value: Any) -> Optional[float]:
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+@dataclass
+class DeletionJob:
+    """Progress of one repository deletion."""
+    job_id: str
+    repository: str
+    status: str = "pending"  # pending, running, completed, failed
+    phase: str = "pending"
+    totals: Dict[str, int] = field(default_factory=lambda: {"edges": 0, "nodes": 0, "chunks": 0})
+    deleted: Dict[str, int] = field(default_factory=lambda: {"edges": 0, "nodes": 0, "chunks": 0})
+    batches: int = 0
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "DeletionJob":
+        """Job from a repository_deletion_jobs row."""
+        job = cls(job_id=row["job_id"], repository=row["repository"])
+        job.status = row["status"]
+        job.phase = row["phase"]
+        job.totals.update(_json(row["totals"]))
+        job.deleted.update(_json(row["deleted"]))
+        job.batches = row["batches"] or 0
+        job.error = row["error"]
+        job.created_at = _epoch(row["created_at"]) or job.created_at
+        job.finished_at = _epoch(row["finished_at"])
+        return job
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        total = sum(self.totals.values())
+        deleted = sum(self.deleted.values())
+        percentage = 100 if self.status == "completed" else (
+            min(99, int(deleted / total * 100)) if total else 0
+        )
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "repository": self.repository,
+            "status": self.status,
+            "phase": self.phase,
+            "percentage": percentage,
+            "totals": dict(self.totals),
+            "deleted": dict(self.deleted),
+            "batches": self.batches,
+            "error": self.error,
+            "elapsed_ms": int((end - self.created_at) * 1000),
+            "created_at": datetime.fromtimestamp(self.created_at, tz=timezone.utc).isoformat(),
+        }
+
+
+class RepositoryDeletionService:
+    """Runs repository deletions as batched background jobs."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        generations: Optional[RepositoryGenerations] = None,
+        repository_stats: Optional[RepositoryStatsService] = None,
+        checkpoints: Optional[IndexingCheckpointService] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            engine: Database async engine
+            batch_size: Rows per DELETE transaction (REPOSITORY_DELETE_BATCH_SIZE)
+            pause_seconds: Pause between batches (REPOSITORY_DELETE_PAUSE_MS)
+            generations: Repository generation counters (process-wide default)
+            repository_stats: Materialised dashboard statistics
+            checkpoints: Per-file indexing checkpoints (cleared with the chunks)
+        """
+        self.engine = engine
+        self.batch_size = max(1, batch_size or batch_size_from_env())
+        self.pause_seconds = pause_seconds if pause_seconds is not None else pause_seconds_from_env()
+        self.generations = generations or get_repository_generations()
+        self.repository_stats = repository_stats or RepositoryStatsService(engine)
+        self.checkpoints = checkpoints or IndexingCheckpointService(engine)
+
+        # Jobs running in this process (the table is the source of truth)
+        self._jobs: Dict[str, DeletionJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def start(self, repository: str) -> DeletionJob:
+        """
+        Schedule the deletion of a repository (O(1) for the caller).
+
+        A repository that is already being deleted returns its running job
+        (resumed here when the process that ran it is gone).
+        """
+        await self._cleanup_old_jobs()
+        params = {"repository": repository}
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                text(_CREATE_JOB_SQL), {**params, "job_id": uuid.uuid4().hex}
+            )
+            row = result.mappings().first()
+            if row is None:
+                result = await conn.execute(
+                    text(_CLAIM_STALE_JOB_SQL), {**params, "stale_seconds": JOB_STALE_SECONDS}
+                )
+                row = result.mappings().first()
+                if row is None:
+                    result = await conn.execute(
+                        text(f"SELECT {', '.join(_JOB_COLUMNS)} FROM repository_deletion_jobs "
+                             f"WHERE repository = :repository AND {_ACTIVE_SQL}"),
+                        params,
+                    )
+                    running = DeletionJob.from_row(result.mappings().first())
+                    return self._jobs.get(running.job_id, running)
+                logger.warning("repository_deletion.resumed", repository=repository, job_id=row["job_id"])
+
+        job = DeletionJob.from_row(row)
+        self._jobs[job.job_id] = job
+
+        # Hide the repository right away: cached results and its dashboard row;
+        # a resumed indexing run must not skip files whose chunks are going away
+        await self.generations.bump(repository)
+        await self.repository_stats.remove(repository)
+        await self.checkpoints.clear(repository)
+
+        task = asyncio.create_task(self.run(job))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._finished(job.job_id))
+        logger.info("repository_deletion.scheduled", repository=repository, job_id=job.job_id)
+        return job
+
+    async def wait(self, job_id: str) -> Optional[DeletionJob]:
+        """Wait for a job to finish (synchronous API callers)."""
+        job = self._jobs.get(job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return job or await self.get_job(job_id)
+
+    async def run(self, job: DeletionJob) -> DeletionJob:
+        """Delete the repository batch by batch, updating job progress."""
+        job.status = "running"
+        params = {"repository": job.repository}
+        try:
+            await self._save(job)
+            # A resumed job keeps what it already deleted in its totals
+            job.totals = dict(job.deleted)
+            async with self.engine.connect() as conn:
+                for _, counter, _, count_sql in _PHASES:
+                    if count_sql:
+                        result = await conn.execute(text(count_sql), params)
+                        job.totals[counter] += result.scalar() or 0
+
+            for phase, counter, delete_sql, _ in _PHASES:
+                job.phase = phase
+
+                async def progress(deleted: int, conn: AsyncConnection, counter: str = counter) -> None:
+                    job.batches += 1
+                    job.deleted[counter] += deleted
+                    # Rows the totals missed (edges pointing into the repository,
+                    # rows written while the job runs) still count as progress
+                    job.totals[counter] = max(job.totals[counter], job.deleted[counter])
+                    await self._save(job, conn)  # commits with the batch
+
+                await delete_in_batches(
+                    self.engine, delete_sql, params, self.batch_size,
+                    pause_seconds=self.pause_seconds, on_batch=progress,
+                )
+
+            job.status = "completed"
+            job.phase = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error("repository_deletion.failed", repository=job.repository,
+                         job_id=job.job_id, phase=job.phase, error=str(e))
+        finally:
+            job.finished_at = time.time()
+            try:
+                await self._save(job)
+            except Exception as e:
+                logger.error("repository_deletion.save_failed", job_id=job.job_id, error=str(e))
+            # Writes that raced the job must not survive in caches or stats
+            await self.generations.bump(job.repository)
+            await self.repository_stats.remove(job.repository)
+            await self.checkpoints.clear(job.repository)
+
+        logger.info("repository_deletion.finished", repository=job.repository, job_id=job.job_id,
+                    status=job.status, deleted=job.deleted, batches=job.batches)
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[DeletionJob]:
+        """Job by ID (None if unknown or expired)."""
+        if job_id in self._jobs:
+            return self._jobs[job_id]
+        jobs = await self._select("WHERE job_id = :job_id", {"job_id": job_id})
+        return jobs[0] if jobs else None
+
+    async def list_jobs(self, active_only: bool = False) -> List[DeletionJob]:
+        """Known jobs of every process, most recent first."""
+        return await self._select(f"WHERE {_ACTIVE_SQL}" if active_only else "")
+
+    async def deleting(self) -> Set[str]:
+        """Repositories with a deletion in progress (in any process)."""
+        return {job.repository for job in await self.list_jobs(active_only=True)}
+
+    async def _select(self, where: str, params: Optional[Dict[str, Any]] = None) -> List[DeletionJob]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(f"SELECT {', '.join(_JOB_COLUMNS)} FROM repository_deletion_jobs {where} "
+                     f"ORDER BY created_at DESC"),
+                params or {},
+            )
+            rows = result.mappings().all()
+        # Jobs running here carry progress newer than their last batch
+        return [self._jobs.get(row["job_id"]) or DeletionJob.from_row(row) for row in rows]
+
+    async def _save(self, job: DeletionJob, conn: Optional[AsyncConnection] = None) -> None:
+        params = {
+            "job_id": job.job_id, "status": job.status, "phase": job.phase,
+            "totals": json.dumps(job.totals), "deleted": json.dumps(job.deleted),
+            "batches": job.batches, "error": job.error, "finished": job.done,
+        }
+        if conn is not None:
+            await conn.execute(text(_SAVE_JOB_SQL), params)
+            return
+        async with self.engine.begin() as conn:
+            await conn.execute(text(_SAVE_JOB_SQL), params)
+
+    def _finished(self, job_id: str) -> None:
+        self._tasks.pop(job_id, None)
+        self._jobs.pop(job_id, None)
+
+    async def _cleanup_old_jobs(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    DELETE FROM repository_deletion_jobs
+                    WHERE finished_at < NOW() - make_interval(secs => :retention)
+                """),
+                {"retention": JOB_RETENTION_SECONDS},
+            )
+
+
+_deletion_service: Optional[RepositoryDeletionService] = None
+
+
+def get_repository_deletion_service(engine: AsyncEngine) -> RepositoryDeletionService:
+    """Process-wide deletion service (runs the jobs started by this process)."""
+    global _deletion_service
+    if _deletion_service is None:
+        _deletion_service = RepositoryDeletionService(engine)
+    return _deletion_service
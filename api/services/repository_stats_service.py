@@ -0,0 +1,516 @@
+"""
+Materialised code-intelligence statistics, one row per repository.
+
+The code dashboard, LSP widget, repository list and graph stats endpoints
+used to run full-table COUNT / GROUP BY aggregates (with JSONB extraction)
+over code_chunks, nodes and edges on every page load. The repository_stats
+table keeps those aggregates per repository instead:
+
+    chunks  file/chunk/function counts, chunks by language and type,
+            complexity sum/count/histogram, top 10 complex functions,
+            LSP coverage counters, first/last indexed_at
+    graph   node/edge counts by type
+
+Chunk aggregates are kept per file as well (repository_file_stats) and
+the repository row is rolled up from those file rows. Writers refresh only
+the files they touched, right after the data changed (same places that
+bump RepositoryGenerations):
+
+    CodeIndexingService.index_repository   refresh_chunks(files indexed)
+    GraphConstructionService (build)       refresh_graph
+    batch consumer (after all batches)     refresh_chunks(files of the batches)
+    MCP reindex_file / retry_indexing      refresh_chunks(files reindexed)
+    scripts/index_directory.py pipelines   refresh_chunks (whole repository)
+    repository deletion                    remove
+
+An incremental refresh scans the chunks of the touched files only; the
+roll-up reads one small row per file of the repository. Readers fetch the
+repository rows (O(repositories)) and merge them with summarise().
+Chunks without a repository are tracked under the '' key.
+
+Refresh failures are logged and never fail the indexing pipeline; drift
+(e.g. rows written by hand) is repaired with rebuild_all(), exposed as
+scripts/rebuild_repository_stats.py and serialised by an advisory lock.
+The first API start after the migration runs ensure_built() in the
+background (skipping repositories being deleted); reads never rebuild.
+
+Usage:
+    stats = RepositoryStatsService(engine)
+    await stats.refresh_chunks("MnemoLite", ["/src/app.py"])
+    rows = await stats.list_stats()
+    summary = RepositoryStatsService.summarise(rows)
+"""
+
+import heapq
+import json
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger()
+
+# Repository key for chunks whose repository column is NULL
+UNASSIGNED_REPOSITORY = ""
+
+FUNCTION_CHUNK_TYPES = ("function", "method", "class")
+TOP_COMPLEX_LIMIT = 10
+
+# pg advisory lock (hashtext) serialising rebuild_all()
+_REBUILD_LOCK = "repository_stats.rebuild"
+
+_CHUNK_COLUMNS = (
+    "file_count", "chunk_count", "function_count",
+    "chunks_by_language", "chunks_by_type",
+    "complexity_sum", "complexity_count", "complexity_histogram", "top_complex",
+    "lsp_with_return_type", "lsp_with_signature", "lsp_with_params",
+    "first_indexed_at", "last_indexed_at",
+)
+_GRAPH_COLUMNS = ("node_count", "edge_count", "nodes_by_type", "edges_by_type")
+_JSON_COLUMNS = (
+    "chunks_by_language", "chunks_by_type", "complexity_histogram",
+    "top_complex", "nodes_by_type", "edges_by_type",
+)
+
+# Same guards as the former dashboard queries: complexity is stored as a
+# JSON document inside metadata and cyclomatic may be missing or non-numeric
+_COMPLEXITY = "(metadata->>'complexity')::jsonb"
+_CYCLOMATIC = rf"""
+    CASE WHEN metadata->>'complexity' IS NOT NULL
+          AND metadata->>'complexity' != 'null'
+          AND {_COMPLEXITY}->>'cyclomatic' ~ '^[0-9]+\.?[0-9]*$'
+         THEN ({_COMPLEXITY}->>'cyclomatic')::float
+    END"""
+_LINES = rf"""
+    CASE WHEN metadata->>'complexity' IS NOT NULL
+          AND metadata->>'complexity' != 'null'
+          AND {_COMPLEXITY}->>'lines_of_code' ~ '^[0-9]+$'
+         THEN ({_COMPLEXITY}->>'lines_of_code')::int
+    END"""
+_FUNCTION_TYPES_SQL = ", ".join(f"'{t}'" for t in FUNCTION_CHUNK_TYPES)
+
+_FILE_COLUMNS = _CHUNK_COLUMNS[1:]  # file_count is the number of file rows
+
+
+def _merge_counts(column: str) -> str:
+    """Sum the {key: count} objects of one column over the file rows."""
+    return f"""
+        SELECT COALESCE(jsonb_object_agg(key, n), '{{}}'::jsonb) AS value
+        FROM (SELECT e.key, SUM(e.value::int) AS n
+              FROM files, jsonb_each_text(files.{column}) e GROUP BY e.key) merged"""
+
+
+# Per-file aggregates of the chunks in {scope} (one repository, optionally
+# restricted to the files an indexing run wrote)
+_REFRESH_FILES_SQL = f"""
+    WITH scoped AS (
+        SELECT file_path, language, chunk_type, name, indexed_at, metadata,
+               {_CYCLOMATIC} AS cyclomatic,
+               {_LINES} AS lines,
+               chunk_type IN ({_FUNCTION_TYPES_SQL}) AS is_function
+        FROM code_chunks
+        WHERE {{scope}}
+    ),
+    totals AS (
+        SELECT file_path,
+               COUNT(*) AS chunk_count,
+               COUNT(*) FILTER (WHERE is_function) AS function_count,
+               COALESCE(SUM(cyclomatic), 0) AS complexity_sum,
+               COUNT(cyclomatic) AS complexity_count,
+               COUNT(*) FILTER (WHERE is_function AND metadata->>'return_type' IS NOT NULL) AS lsp_with_return_type,
+               COUNT(*) FILTER (WHERE is_function AND metadata->>'signature' IS NOT NULL) AS lsp_with_signature,
+               COUNT(*) FILTER (WHERE is_function AND metadata->>'param_types' IS NOT NULL) AS lsp_with_params,
+               MIN(indexed_at) AS first_indexed_at,
+               MAX(indexed_at) AS last_indexed_at
+        FROM scoped
+        GROUP BY file_path
+    ),
+    by_language AS (
+        SELECT file_path, jsonb_object_agg(language, n) AS value
+        FROM (SELECT file_path, language, COUNT(*) AS n FROM scoped
+              WHERE language IS NOT NULL GROUP BY file_path, language) l
+        GROUP BY file_path
+    ),
+    by_type AS (
+        SELECT file_path, jsonb_object_agg(chunk_type, n) AS value
+        FROM (SELECT file_path, chunk_type, COUNT(*) AS n FROM scoped
+              WHERE chunk_type IS NOT NULL GROUP BY file_path, chunk_type) t
+        GROUP BY file_path
+    ),
+    histogram AS (
+        SELECT file_path, jsonb_object_agg(bucket, n) AS value
+        FROM (SELECT file_path, ROUND(cyclomatic)::int::text AS bucket, COUNT(*) AS n FROM scoped
+              WHERE cyclomatic IS NOT NULL GROUP BY 1, 2) h
+        GROUP BY file_path
+    ),
+    top_complex AS (
+        SELECT file_path, jsonb_agg(jsonb_build_object(
+                   'name', name, 'file_path', file_path, 'language', language,
+                   'complexity', ROUND(cyclomatic)::int, 'lines', lines
+               ) ORDER BY cyclomatic DESC) AS value
+        FROM (SELECT file_path, name, language, cyclomatic, lines,
+                     ROW_NUMBER() OVER (PARTITION BY file_path ORDER BY cyclomatic DESC) AS rn
+              FROM scoped
+              WHERE is_function AND cyclomatic IS NOT NULL) c
+        WHERE rn <= {TOP_COMPLEX_LIMIT}
+        GROUP BY file_path
+    )
+    INSERT INTO repository_file_stats (repository, file_path, {", ".join(_FILE_COLUMNS)})
+    SELECT :repository, totals.file_path, totals.chunk_count, totals.function_count,
+           COALESCE(by_language.value, '{{}}'::jsonb), COALESCE(by_type.value, '{{}}'::jsonb),
+           totals.complexity_sum, totals.complexity_count,
+           COALESCE(histogram.value, '{{}}'::jsonb), COALESCE(top_complex.value, '[]'::jsonb),
+           totals.lsp_with_return_type, totals.lsp_with_signature, totals.lsp_with_params,
+           totals.first_indexed_at, totals.last_indexed_at
+    FROM totals
+    LEFT JOIN by_language USING (file_path)
+    LEFT JOIN by_type USING (file_path)
+    LEFT JOIN histogram USING (file_path)
+    LEFT JOIN top_complex USING (file_path)
+    ON CONFLICT (repository, file_path) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _FILE_COLUMNS)}
+"""
+
+# Repository row from its file rows: O(files of the repository), no chunk scan
+_ROLLUP_CHUNKS_SQL = f"""
+    WITH files AS (
+        SELECT * FROM repository_file_stats WHERE repository = :repository
+    ),
+    totals AS (
+        SELECT COUNT(*) AS file_count,
+               COALESCE(SUM(chunk_count), 0) AS chunk_count,
+               COALESCE(SUM(function_count), 0) AS function_count,
+               COALESCE(SUM(complexity_sum), 0) AS complexity_sum,
+               COALESCE(SUM(complexity_count), 0) AS complexity_count,
+               COALESCE(SUM(lsp_with_return_type), 0) AS lsp_with_return_type,
+               COALESCE(SUM(lsp_with_signature), 0) AS lsp_with_signature,
+               COALESCE(SUM(lsp_with_params), 0) AS lsp_with_params,
+               MIN(first_indexed_at) AS first_indexed_at,
+               MAX(last_indexed_at) AS last_indexed_at
+        FROM files
+    ),
+    by_language AS ({_merge_counts("chunks_by_language")}
+    ),
+    by_type AS ({_merge_counts("chunks_by_type")}
+    ),
+    histogram AS ({_merge_counts("complexity_histogram")}
+    ),
+    top_complex AS (
+        SELECT COALESCE(jsonb_agg(value ORDER BY (value->>'complexity')::int DESC), '[]'::jsonb) AS value
+        FROM (SELECT e.value FROM files, jsonb_array_elements(files.top_complex) e
+              ORDER BY (e.value->>'complexity')::int DESC LIMIT {TOP_COMPLEX_LIMIT}) c
+    )
+    INSERT INTO repository_stats (repository, {", ".join(_CHUNK_COLUMNS)}, chunks_refreshed_at)
+    SELECT :repository, totals.file_count, totals.chunk_count, totals.function_count,
+           by_language.value, by_type.value,
+           totals.complexity_sum, totals.complexity_count, histogram.value, top_complex.value,
+           totals.lsp_with_return_type, totals.lsp_with_signature, totals.lsp_with_params,
+           totals.first_indexed_at, totals.last_indexed_at, NOW()
+    FROM totals, by_language, by_type, histogram, top_complex
+    ON CONFLICT (repository) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _CHUNK_COLUMNS)},
+        chunks_refreshed_at = EXCLUDED.chunks_refreshed_at
+"""
+
+_REFRESH_GRAPH_SQL = f"""
+    WITH node_counts AS (
+        SELECT node_type, COUNT(*) AS n
+        FROM nodes
+        WHERE properties->>'repository' = :repository
+        GROUP BY node_type
+    ),
+    edge_counts AS (
+        SELECT e.relation_type, COUNT(*) AS n
+        FROM edges e
+        JOIN nodes n ON e.source_node_id = n.node_id
+        WHERE n.properties->>'repository' = :repository
+        GROUP BY e.relation_type
+    )
+    INSERT INTO repository_stats (repository, {", ".join(_GRAPH_COLUMNS)}, graph_refreshed_at)
+    SELECT :repository,
+           (SELECT COALESCE(SUM(n), 0) FROM node_counts),
+           (SELECT COALESCE(SUM(n), 0) FROM edge_counts),
+           (SELECT COALESCE(jsonb_object_agg(node_type, n), '{{}}'::jsonb) FROM node_counts),
+           (SELECT COALESCE(jsonb_object_agg(relation_type, n), '{{}}'::jsonb) FROM edge_counts),
+           NOW()
+    ON CONFLICT (repository) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _GRAPH_COLUMNS)},
+        graph_refreshed_at = EXCLUDED.graph_refreshed_at
+"""
+
+# A repository with neither chunks nor nodes left no longer has a row
+_PRUNE_SQL = """
+    DELETE FROM repository_stats
+    WHERE repository = :repository AND chunk_count = 0 AND node_count = 0
+"""
+
+
+def _json(value: Any, default: Any) -> Any:
+    """JSONB columns arrive decoded with asyncpg codecs, as text otherwise."""
+    if value is None:
+        return default
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return value
+
+
+class RepositoryStatsService:
+    """Maintains and reads the repository_stats table."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    @staticmethod
+    def _key(repository: Optional[str]) -> str:
+        return repository or UNASSIGNED_REPOSITORY
+
+    # ------------------------------------------------------------------
+    # Write side
+    # ------------------------------------------------------------------
+
+    async def refresh_chunks(self, repository: Optional[str], file_paths: Optional[Iterable[str]] = None) -> bool:
+        """
+        Recompute the chunk aggregates of one repository.
+
+        Only the per-file rows of `file_paths` (the files an indexing run
+        wrote or deleted) are recomputed from code_chunks; the repository
+        row is then rolled up from the file rows. Without file_paths, or
+        while the repository has no file rows yet, every file is recomputed.
+
+        Returns:
+            True on success (failures are logged, never raised)
+        """
+        key = self._key(repository)
+        scope = "repository IS NULL" if key == UNASSIGNED_REPOSITORY else "repository = :repository"
+        params: Dict[str, Any] = {"repository": key}
+        files = sorted(set(file_paths)) if file_paths is not None else None
+        try:
+            async with self.engine.begin() as conn:
+                if files is not None:
+                    result = await conn.execute(
+                        text("SELECT EXISTS (SELECT 1 FROM repository_file_stats WHERE repository = :repository)"),
+                        params,
+                    )
+                    if not result.scalar():
+                        files = None
+                file_scope = ""
+                if files is not None:
+                    file_scope = " AND file_path = ANY(:file_paths)"
+                    params["file_paths"] = files
+                # Files without chunks left must not keep a row
+                await conn.execute(
+                    text(f"DELETE FROM repository_file_stats WHERE repository = :repository{file_scope}"), params
+                )
+                await conn.execute(text(_REFRESH_FILES_SQL.replace("{scope}", scope + file_scope)), params)
+                await conn.execute(text(_ROLLUP_CHUNKS_SQL), {"repository": key})
+                await conn.execute(text(_PRUNE_SQL), {"repository": key})
+            return True
+        except Exception as e:
+            logger.warning("repository_stats.refresh_failed", repository=key, part="chunks", error=str(e))
+            return False
+
+    async def refresh_graph(self, repository: Optional[str]) -> bool:
+        """
+        Recompute the graph aggregates (nodes/edges by type) of one repository.
+
+        Returns:
+            True on success (failures are logged, never raised)
+        """
+        key = self._key(repository)
+        if key == UNASSIGNED_REPOSITORY:
+            return True  # graphs are always built for a named repository
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(text(_REFRESH_GRAPH_SQL), {"repository": key})
+                await conn.execute(text(_PRUNE_SQL), {"repository": key})
+            return True
+        except Exception as e:
+            logger.warning("repository_stats.refresh_failed", repository=key, part="graph", error=str(e))
+            return False
+
+    async def refresh(self, repository: Optional[str]) -> bool:
+        """Recompute chunk and graph aggregates of one repository."""
+        chunks_ok = await self.refresh_chunks(repository)
+        graph_ok = await self.refresh_graph(repository)
+        return chunks_ok and graph_ok
+
+    async def remove(self, repository: Optional[str]) -> bool:
+        """Drop the row of a deleted repository."""
+        key = self._key(repository)
+        try:
+            async with self.engine.begin() as conn:
+                for table in ("repository_file_stats", "repository_stats"):
+                    await conn.execute(
+                        text(f"DELETE FROM {table} WHERE repository = :repository"),
+                        {"repository": key},
+                    )
+            return True
+        except Exception as e:
+            logger.warning("repository_stats.remove_failed", repository=key, error=str(e))
+            return False
+
+    async def rebuild_all(self) -> Optional[int]:
+        """
+        Recompute every repository and drop rows of vanished ones (drift repair).
+
+        Runs under a PostgreSQL advisory lock, so concurrent API workers and
+        scripts/rebuild_repository_stats.py never rebuild at the same time.
+        Repositories with an unfinished deletion job are skipped: their rows
+        must not come back while the job deletes them.
+
+        Returns:
+            Number of repositories refreshed, None if another rebuild holds the lock
+        """
+        async with self.engine.connect() as lock_conn:
+            result = await lock_conn.execute(
+                text("SELECT pg_try_advisory_lock(hashtext(:lock))"), {"lock": _REBUILD_LOCK}
+            )
+            if not result.scalar():
+                logger.info("repository_stats.rebuild_skipped", reason="already running")
+                return None
+            try:
+                async with self.engine.begin() as conn:
+                    result = await conn.execute(text("""
+                        SELECT DISTINCT COALESCE(repository, '') FROM code_chunks
+                        UNION
+                        SELECT DISTINCT properties->>'repository' FROM nodes
+                        WHERE properties->>'repository' IS NOT NULL
+                        EXCEPT
+                        SELECT repository FROM repository_deletion_jobs
+                        WHERE status IN ('pending', 'running')
+                    """))
+                    repositories = sorted({row[0] for row in result.fetchall()})
+                    for table in ("repository_file_stats", "repository_stats"):
+                        await conn.execute(
+                            text(f"DELETE FROM {table} WHERE NOT (repository = ANY(:repositories))"),
+                            {"repositories": repositories},
+                        )
+
+                for repository in repositories:
+                    await self.refresh(repository)
+            finally:
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(hashtext(:lock))"), {"lock": _REBUILD_LOCK}
+                )
+
+        logger.info("repository_stats.rebuilt", repositories=len(repositories))
+        return len(repositories)
+
+    async def ensure_built(self) -> Optional[int]:
+        """
+        One-off rebuild when chunks exist but no file rows do (first start
+        after the migration); run at API startup, never on the read path.
+
+        Returns:
+            rebuild_all() result, or None when nothing had to be built
+        """
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(text("""
+                    SELECT EXISTS (SELECT 1 FROM code_chunks)
+                       AND NOT EXISTS (SELECT 1 FROM repository_file_stats)
+                """))
+                if not result.scalar():
+                    return None
+            return await self.rebuild_all()
+        except Exception as e:
+            logger.warning("repository_stats.rebuild_failed", error=str(e))
+            return None
+
+    # ------------------------------------------------------------------
+    # Read side
+    # ------------------------------------------------------------------
+
+    async def list_stats(self) -> List[Dict[str, Any]]:
+        """All repository rows, most recently indexed first."""
+        return await self._select()
+
+    async def get(self, repository: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Row of one repository (None if unknown)."""
+        rows = await self._select("WHERE repository = :repository", {"repository": self._key(repository)})
+        return rows[0] if rows else None
+
+    async def _select(self, where: str = "", params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(f"SELECT * FROM repository_stats {where} ORDER BY last_indexed_at DESC NULLS LAST"),
+                params or {},
+            )
+            rows = [dict(row._mapping) for row in result.fetchall()]
+        for row in rows:
+            for column in _JSON_COLUMNS:
+                row[column] = _json(row.get(column), [] if column == "top_complex" else {})
+        return rows
+
+    @staticmethod
+    def summarise(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge repository rows into corpus-wide dashboard figures.
+
+        Args:
+            rows: Output of list_stats()
+
+        Returns:
+            Dict with repository/file/function totals, avg_complexity,
+            language and complexity distributions, top complex functions,
+            LSP counters and first/last indexed timestamps
+        """
+        languages: Counter = Counter()
+        histogram: Counter = Counter()
+        complexity_sum = 0.0
+        complexity_count = 0
+        lsp = Counter()
+        top: List[Dict[str, Any]] = []
+        first_indexed = last_indexed = None
+
+        for row in rows:
+            languages.update(row.get("chunks_by_language") or {})
+            histogram.update({int(k): v for k, v in (row.get("complexity_histogram") or {}).items()})
+            complexity_sum += row.get("complexity_sum") or 0
+            complexity_count += row.get("complexity_count") or 0
+            for field in ("function_count", "lsp_with_return_type", "lsp_with_signature", "lsp_with_params"):
+                lsp[field] += row.get(field) or 0
+            top.extend(row.get("top_complex") or [])
+            if row.get("first_indexed_at") and (first_indexed is None or row["first_indexed_at"] < first_indexed):
+                first_indexed = row["first_indexed_at"]
+            if row.get("last_indexed_at") and (last_indexed is None or row["last_indexed_at"] > last_indexed):
+                last_indexed = row["last_indexed_at"]
+
+        return {
+            "total_repositories": sum(1 for row in rows if row["repository"] != UNASSIGNED_REPOSITORY
+                                      and row.get("chunk_count")),
+            "total_files": sum(row.get("file_count") or 0 for row in rows),
+            "total_chunks": sum(row.get("chunk_count") or 0 for row in rows),
+            "total_functions": lsp["function_count"],
+            "avg_complexity": complexity_sum / complexity_count if complexity_count else 0.0,
+            "language_distribution": [
+                {"language": language, "count": count} for language, count in languages.most_common()
+            ],
+            "complexity_distribution": [
+                {"complexity": complexity, "count": histogram[complexity]} for complexity in sorted(histogram)
+            ],
+            "top_complex_functions": heapq.nlargest(
+                TOP_COMPLEX_LIMIT, top, key=lambda f: f.get("complexity") or 0
+            ),
+            "lsp_with_return_type": lsp["lsp_with_return_type"],
+            "lsp_with_signature": lsp["lsp_with_signature"],
+            "lsp_with_params": lsp["lsp_with_params"],
+            "first_indexed_at": first_indexed,
+            "last_indexed_at": last_indexed,
+        }
+
+    @staticmethod
+    def repositories(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Named repositories with chunks, most recently indexed first (repository list)."""
+        return [
+            {
+                "repository": row["repository"],
+                "file_count": row.get("file_count") or 0,
+                "chunk_count": row.get("chunk_count") or 0,
+                "last_indexed": row["last_indexed_at"].isoformat() if row.get("last_indexed_at") else None,
+            }
+            for row in rows
+            if row["repository"] != UNASSIGNED_REPOSITORY and row.get("chunk_count")
+        ]
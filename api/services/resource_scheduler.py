@@ -0,0 +1,346 @@
+"""
+Priority scheduling of shared resources between interactive and background work.
+
+Search, write_memory and bulk indexing run in the same process and share
+the embedding models, the database pool and CPU threads: a large
+index_project run used to add its full load in front of every
+search_code / search_memory query. Work is now tagged with a class:
+
+    interactive   default: API/MCP requests (search, write_memory, ...)
+    background    code indexing (CodeIndexingService.index_repository),
+                  tagged with `with background_work():`
+
+and the shared resources are handed out through priority slots:
+
+    embedding     model encode calls (DualEmbeddingService)
+    db            background write transactions (interactive requests use
+                  the pool directly, so background never holds all of it)
+    executor      CPU-bound parse offloads (CodeChunkingService)
+
+A free slot goes to a waiting interactive caller first. Background work
+also never holds more than its share of a resource's slots, so some
+capacity is always left for interactive work. The share adapts (AIMD):
+when the p95 of interactive operations (observed with
+@interactive_operation) exceeds the target it is halved, down to a
+minimum; while p95 stays comfortably below the target it grows back.
+Requests to the embedding sidecar follow the same tagging: background work
+uses the "bulk" lane.
+
+Metrics (Prometheus /metrics, and get_metrics() for JSON):
+    scheduler_queue_depth{resource,work_class}       waiting callers
+    scheduler_active{resource,work_class}            slots held
+    scheduler_acquired_total{resource,work_class}
+    scheduler_wait_seconds{resource,work_class}      time to get a slot
+    scheduler_background_limit{resource}             current background cap
+    scheduler_interactive_latency_seconds{operation}
+
+Configuration (environment):
+    SCHEDULER_EMBEDDING_SLOTS          concurrent encode calls      (default: 2)
+    SCHEDULER_DB_SLOTS                 background DB budget base    (default: 20, the API pool size)
+    SCHEDULER_EXECUTOR_SLOTS           concurrent parse offloads    (default: CPU count)
+    SCHEDULER_INTERACTIVE_P95_MS       interactive latency target   (default: 500)
+    SCHEDULER_BACKGROUND_MAX_SHARE     background share, unthrottled (default: 0.75)
+    SCHEDULER_BACKGROUND_MIN_SHARE     background share, throttled   (default: 0.1)
+
+Every resource keeps at least one background slot: background work is
+slowed down, never starved.
+
+Usage:
+    with background_work():
+        await service.index_repository(...)
+
+    async with get_resource_scheduler().slot("embedding"):
+        ...
+"""
+
+import asyncio
+import functools
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, Optional
+
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = structlog.get_logger()
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+WORK_CLASSES = (INTERACTIVE, BACKGROUND)
+
+RESOURCES = ("embedding", "db", "executor")
+
+# Minimum interactive samples and seconds between two share adjustments
+_MIN_SAMPLES = 20
+_ADJUST_INTERVAL = 1.0
+_LATENCY_WINDOW = 200
+
+_work_class: ContextVar[str] = ContextVar("work_class", default=INTERACTIVE)
+
+_queue_depth = Gauge("scheduler_queue_depth", "Callers waiting for a slot", ["resource", "work_class"])
+_active = Gauge("scheduler_active", "Slots held", ["resource", "work_class"])
+_acquired = Counter("scheduler_acquired_total", "Slots granted", ["resource", "work_class"])
+_wait_seconds = Histogram(
+    "scheduler_wait_seconds", "Time waited for a slot", ["resource", "work_class"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+_background_limit = Gauge("scheduler_background_limit", "Slots background work may hold", ["resource"])
+_interactive_latency = Histogram(
+    "scheduler_interactive_latency_seconds", "Interactive operation latency", ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+def current_work_class() -> str:
+    """Class of the work running in this context (interactive unless tagged)."""
+    return _work_class.get()
+
+
+@contextmanager
+def work_class(name: str) -> Iterator[None]:
+    """Tag the work of this context (and of tasks it creates) with a class."""
+    if name not in WORK_CLASSES:
+        raise ValueError(f"work class must be one of {WORK_CLASSES}, got {name!r}")
+    token = _work_class.set(name)
+    try:
+        yield
+    finally:
+        _work_class.reset(token)
+
+
+def background_work():
+    """Tag the work of this context as background (bulk indexing)."""
+    return work_class(BACKGROUND)
+
+
+def _p95(samples) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+
+
+class PrioritySlots:
+    """Counting semaphore serving interactive waiters first, with a background cap."""
+
+    def __init__(self, name: str, capacity: int, background_limit: Optional[int] = None):
+        self.name = name
+        self.capacity = max(1, capacity)
+        self.background_limit = min(self.capacity, max(1, background_limit or self.capacity))
+
+        self._active: Dict[str, int] = {c: 0 for c in WORK_CLASSES}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {c: deque() for c in WORK_CLASSES}
+        self.acquired: Dict[str, int] = {c: 0 for c in WORK_CLASSES}
+        self._waits: Dict[str, Deque[float]] = {c: deque(maxlen=_LATENCY_WINDOW) for c in WORK_CLASSES}
+        _background_limit.labels(name).set(self.background_limit)
+
+    def _can_grant(self, cls: str) -> bool:
+        if sum(self._active.values()) >= self.capacity:
+            return False
+        return cls == INTERACTIVE or self._active[BACKGROUND] < self.background_limit
+
+    def _grant(self, cls: str) -> None:
+        self._active[cls] += 1
+        self.acquired[cls] += 1
+        _active.labels(self.name, cls).set(self._active[cls])
+        _acquired.labels(self.name, cls).inc()
+
+    def _wake(self) -> None:
+        # Interactive waiters first; background only within its cap
+        for cls in WORK_CLASSES:
+            waiters = self._waiters[cls]
+            while waiters and self._can_grant(cls):
+                future = waiters.popleft()
+                if future.done():  # cancelled while waiting
+                    continue
+                self._grant(cls)
+                future.set_result(None)
+            _queue_depth.labels(self.name, cls).set(len(waiters))
+
+    def _release(self, cls: str) -> None:
+        self._active[cls] -= 1
+        _active.labels(self.name, cls).set(self._active[cls])
+        self._wake()
+
+    def set_background_limit(self, limit: int) -> None:
+        self.background_limit = min(self.capacity, max(1, limit))
+        _background_limit.labels(self.name).set(self.background_limit)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, cls: Optional[str] = None):
+        """Hold one slot for the duration of the block."""
+        cls = cls or current_work_class()
+        started = time.perf_counter()
+        if not self._waiters[cls] and self._can_grant(cls):
+            self._grant(cls)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[cls].append(future)
+            _queue_depth.labels(self.name, cls).set(len(self._waiters[cls]))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release(cls)  # granted just before the cancellation
+                else:
+                    future.cancel()
+                    self._wake()
+                raise
+        waited = time.perf_counter() - started
+        self._waits[cls].append(waited)
+        _wait_seconds.labels(self.name, cls).observe(waited)
+        try:
+            yield
+        finally:
+            self._release(cls)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "background_limit": self.background_limit,
+            "classes": {
+                cls: {
+                    "active": self._active[cls],
+                    "waiting": sum(not f.done() for f in self._waiters[cls]),
+                    "acquired": self.acquired[cls],
+                    "p95_wait_ms": round(_p95(self._waits[cls]) * 1000, 2),
+                }
+                for cls in WORK_CLASSES
+            },
+        }
+
+
+class ResourceScheduler:
+    """Priority slots per shared resource and the adaptive background share."""
+
+    def __init__(
+        self,
+        embedding_slots: Optional[int] = None,
+        db_slots: Optional[int] = None,
+        executor_slots: Optional[int] = None,
+        latency_target_ms: Optional[float] = None,
+        max_background_share: Optional[float] = None,
+        min_background_share: Optional[float] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            embedding_slots: Concurrent encode calls (SCHEDULER_EMBEDDING_SLOTS)
+            db_slots: Base of the background DB budget (SCHEDULER_DB_SLOTS)
+            executor_slots: Concurrent parse offloads (SCHEDULER_EXECUTOR_SLOTS)
+            latency_target_ms: Interactive p95 target (SCHEDULER_INTERACTIVE_P95_MS)
+            max_background_share: Share of slots background work may hold (SCHEDULER_BACKGROUND_MAX_SHARE)
+            min_background_share: Share when throttled (SCHEDULER_BACKGROUND_MIN_SHARE)
+        """
+        capacities = {
+            "embedding": embedding_slots or int(os.getenv("SCHEDULER_EMBEDDING_SLOTS", "2")),
+            "db": db_slots or int(os.getenv("SCHEDULER_DB_SLOTS", "20")),
+            "executor": executor_slots or int(os.getenv("SCHEDULER_EXECUTOR_SLOTS") or os.cpu_count() or 4),
+        }
+        self.latency_target = (
+            latency_target_ms if latency_target_ms is not None
+            else float(os.getenv("SCHEDULER_INTERACTIVE_P95_MS", "500"))
+        ) / 1000
+        self.max_share = (
+            max_background_share if max_background_share is not None
+            else float(os.getenv("SCHEDULER_BACKGROUND_MAX_SHARE", "0.75"))
+        )
+        self.min_share = min(self.max_share, (
+            min_background_share if min_background_share is not None
+            else float(os.getenv("SCHEDULER_BACKGROUND_MIN_SHARE", "0.1"))
+        ))
+        self.background_share = self.max_share
+
+        self.resources: Dict[str, PrioritySlots] = {
+            name: PrioritySlots(name, capacity, self._limit(capacity))
+            for name, capacity in capacities.items()
+        }
+        self._latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._last_adjust = 0.0
+        self.throttle_events = 0
+
+    def _limit(self, capacity: int) -> int:
+        return max(1, int(capacity * self.background_share))
+
+    def slot(self, resource: str, cls: Optional[str] = None):
+        """Async context manager holding one slot of a resource."""
+        return self.resources[resource].slot(cls)
+
+    # ------------------------------------------------------------------
+    # Adaptive background share
+    # ------------------------------------------------------------------
+
+    def record_latency(self, seconds: float, operation: str = "interactive") -> None:
+        """Record the latency of an interactive operation and adapt the background share."""
+        self._latencies.append(seconds)
+        _interactive_latency.labels(operation).observe(seconds)
+
+        now = time.monotonic()
+        if len(self._latencies) < _MIN_SAMPLES or now - self._last_adjust < _ADJUST_INTERVAL:
+            return
+        self._last_adjust = now
+
+        p95 = _p95(self._latencies)
+        share = self.background_share
+        if p95 > self.latency_target:
+            share = max(self.min_share, share / 2)
+        elif p95 < self.latency_target * 0.8:
+            share = min(self.max_share, share + 0.05)
+        if share == self.background_share:
+            return
+
+        if share < self.background_share:
+            self.throttle_events += 1
+            # Samples taken before the throttle would throttle again
+            self._latencies.clear()
+        self.background_share = share
+        for slots in self.resources.values():
+            slots.set_background_limit(self._limit(slots.capacity))
+        logger.info("resource_scheduler.background_share", share=round(share, 2),
+                    interactive_p95_ms=round(p95 * 1000, 1),
+                    limits={name: s.background_limit for name, s in self.resources.items()})
+
+    @asynccontextmanager
+    async def observe(self, operation: str):
+        """Time a block; interactive blocks feed the p95 that throttles background work."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if current_work_class() == INTERACTIVE:
+                self.record_latency(time.perf_counter() - started, operation)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-resource, per-class queue metrics and the throttling state."""
+        return {
+            "background_share": round(self.background_share, 3),
+            "interactive_p95_ms": round(_p95(self._latencies) * 1000, 2),
+            "latency_target_ms": self.latency_target * 1000,
+            "throttle_events": self.throttle_events,
+            "resources": {name: slots.get_metrics() for name, slots in self.resources.items()},
+        }
+
+
+_scheduler: Optional[ResourceScheduler] = None
+
+
+def get_resource_scheduler() -> ResourceScheduler:
+    """Process-wide scheduler (slots are shared by every request and job)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ResourceScheduler()
+    return _scheduler
+
+
+def interactive_operation(operation: str):
+    """Decorator: time an async operation for the interactive p95 (search_code, search_memory)."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with get_resource_scheduler().observe(operation):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
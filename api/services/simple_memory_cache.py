@@ -10,11 +10,19 @@ import json
 import hashlib
 import asyncio
 
+from services.caches.invalidation_bus import InvalidationBus, get_invalidation_bus
+
 
 class SimpleMemoryCache:
     """Thread-safe memory cache with TTL support."""
 
-    def __init__(self, ttl_seconds: int = 60, max_items: int = 1000):
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_items: int = 1000,
+        name: Optional[str] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
+    ):
         self._cache: dict = {}
         self._timestamps: dict = {}
         self.ttl = ttl_seconds
@@ -22,6 +30,11 @@ class SimpleMemoryCache:
         self.hits = 0
         self.misses = 0
         self._lock = asyncio.Lock()
+        # Removals and clears are broadcast to the same-named cache of other processes
+        self.name = name
+        self.invalidation_bus = invalidation_bus
+        if invalidation_bus is not None and name:
+            invalidation_bus.register(f"simple:{name}", self._on_invalidation)
 
     def _make_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate unique cache key from arguments."""
@@ -72,15 +85,31 @@ class SimpleMemoryCache:
         async with self._lock:
             self._cache.clear()
             self._timestamps.clear()
+        await self._broadcast("clear")
 
     async def remove(self, key: str) -> bool:
         """Remove specific key from cache."""
         async with self._lock:
-            if key in self._cache:
+            removed = key in self._cache
+            if removed:
                 del self._cache[key]
                 del self._timestamps[key]
-                return True
-            return False
+        await self._broadcast("key", key)
+        return removed
+
+    async def _broadcast(self, kind: str, key: Optional[str] = None):
+        if self.invalidation_bus is not None and self.name:
+            await self.invalidation_bus.publish(f"simple:{self.name}", kind, key)
+
+    def _on_invalidation(self, kind: str, key: Optional[str]):
+        """Apply an invalidation received from another process."""
+        # Plain dict operations: atomic with respect to the event loop
+        if kind == "key":
+            self._cache.pop(key, None)
+            self._timestamps.pop(key, None)
+        elif kind == "clear":
+            self._cache.clear()
+            self._timestamps.clear()
 
     def cache_async(self, ttl: Optional[int] = None):
         """Decorator for async functions."""
@@ -129,9 +158,9 @@ class SimpleMemoryCache:
 
 
 # Global cache instances for different purposes
-_event_cache = SimpleMemoryCache(ttl_seconds=60, max_items=500)
-_search_cache = SimpleMemoryCache(ttl_seconds=30, max_items=200)
-_graph_cache = SimpleMemoryCache(ttl_seconds=120, max_items=100)
+_event_cache = SimpleMemoryCache(ttl_seconds=60, max_items=500, name="event", invalidation_bus=get_invalidation_bus())
+_search_cache = SimpleMemoryCache(ttl_seconds=30, max_items=200, name="search", invalidation_bus=get_invalidation_bus())
+_graph_cache = SimpleMemoryCache(ttl_seconds=120, max_items=100, name="graph", invalidation_bus=get_invalidation_bus())
 
 
 def get_event_cache() -> SimpleMemoryCache:
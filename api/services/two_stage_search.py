@@ -0,0 +1,169 @@
+"""
+Two-stage vector search — shared base of the coarse ANN + exact rescoring paths.
+
+Both reduced-index search paths work the same way:
+
+    1. coarse   HNSW scan of an expression index over a compact form of the
+                halfvec column → candidate_limit rows
+                = max(min_candidates, limit × oversample)
+    2. rescore  exact cosine distance on the full 768D halfvec of those
+                candidates only → top `limit`
+
+and differ only in the compact form and its distance:
+
+    services/matryoshka_search.py   first `dim` dimensions, cosine     (EMBEDDING_MRL_*)
+    services/binary_prefilter.py    sign bits, Hamming                 (VECTOR_BINARY_*)
+
+This module holds what they share: the embedding columns and their
+full-dimension indexes, the config/telemetry base (candidate pool size,
+depth of the final results in the pool) and the helpers of the scripts
+that build the coarse indexes (scripts/matryoshka_backfill.py,
+scripts/binary_prefilter_indexes.py).
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+FULL_DIMENSION = 768
+
+# (table, halfvec column) -> embedding domain
+EMBEDDING_COLUMNS = {
+    ("memories", "embedding_half"): "TEXT",
+    ("code_chunks", "embedding_text_half"): "TEXT",
+    ("code_chunks", "embedding_code_half"): "CODE",
+}
+
+# Full-dimension HNSW indexes (alembic b7c2e4f8a901)
+FULL_INDEXES = {
+    ("memories", "embedding_half"): "idx_memories_embedding_half",
+    ("code_chunks", "embedding_text_half"): "idx_code_emb_text_half",
+    ("code_chunks", "embedding_code_half"): "idx_code_emb_code_half",
+}
+
+
+@dataclass
+class TwoStageConfig:
+    """Candidate pool settings shared by the two-stage search paths."""
+    oversample: float = 4.0
+    min_candidates: int = 50
+
+    @classmethod
+    def _pool_from_env(cls, prefix: str) -> Dict[str, Any]:
+        """oversample / min_candidates from {prefix}_OVERSAMPLE / {prefix}_MIN_CANDIDATES."""
+        return {
+            "oversample": float(os.getenv(f"{prefix}_OVERSAMPLE", str(cls.oversample))),
+            "min_candidates": int(os.getenv(f"{prefix}_MIN_CANDIDATES", str(cls.min_candidates))),
+        }
+
+
+class TwoStageSearch:
+    """Candidate pool sizing, coarse subquery and depth telemetry."""
+
+    def __init__(self, config: TwoStageConfig):
+        self.config = config
+        self.oversample = config.oversample
+        self.queries = 0
+        self._depth_ratio_sum = 0.0
+        self._max_depth_ratio = 0.0
+
+    def candidate_limit(self, limit: int) -> int:
+        """Size of the coarse candidate pool for a final `limit`."""
+        return max(self.config.min_candidates, int(math.ceil(limit * self.oversample)))
+
+    @staticmethod
+    def _coarse_sql(table: str, where_sql: str, distance_sql: str, limit_param: str) -> str:
+        """Stage-1 subquery: ids and coarse ranks (ties broken by id) of the nearest rows."""
+        return f"""
+                SELECT id, ROW_NUMBER() OVER (ORDER BY coarse_distance, id) AS coarse_rank
+                FROM (
+                    SELECT id, {distance_sql} AS coarse_distance
+                    FROM {table}
+                    WHERE {where_sql}
+                    ORDER BY {distance_sql}
+                    LIMIT :{limit_param}
+                ) coarse"""
+
+    def record(self, limit: int, candidate_limit: int, coarse_ranks: List[Optional[int]]) -> None:
+        """
+        Record how deep into the candidate pool the final results reached.
+
+        A depth ratio close to 1.0 means the final top-k needed the last
+        candidates, i.e. better ones were probably cut off.
+
+        Args:
+            limit: Requested result count
+            candidate_limit: Size of the candidate pool used
+            coarse_ranks: coarse_rank of each returned row
+        """
+        ranks = [int(r) for r in coarse_ranks if r is not None]
+        self.queries += 1
+        if not ranks or candidate_limit <= limit:
+            return
+        depth_ratio = max(ranks) / candidate_limit
+        self._depth_ratio_sum += depth_ratio
+        self._max_depth_ratio = max(self._max_depth_ratio, depth_ratio)
+        self._adapt(depth_ratio)
+
+    def _adapt(self, depth_ratio: float) -> None:
+        """Hook: adjust the pool after a query (default: fixed oversample)."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool settings and depth telemetry."""
+        return {
+            "oversample": round(self.oversample, 2),
+            "min_candidates": self.config.min_candidates,
+            "queries": self.queries,
+            "avg_depth_ratio": round(self._depth_ratio_sum / self.queries, 3) if self.queries else 0.0,
+            "max_depth_ratio": round(self._max_depth_ratio, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Coarse index builds (scripts/matryoshka_backfill.py, scripts/binary_prefilter_indexes.py)
+# ---------------------------------------------------------------------------
+
+def fmt_bytes(size) -> str:
+    if size is None:
+        return "-"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def database_dsn() -> str:
+    """asyncpg DSN from DATABASE_URL (SQLAlchemy driver prefix removed)."""
+    database_url = os.getenv("DATABASE_URL", "postgresql://mnemo:mnemopass@db:5432/mnemolite")
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def coarse_index_ddl(name: str, table: str, expression: str, opclass: str, m: int, ef_construction: int) -> str:
+    """CREATE INDEX CONCURRENTLY statement of an HNSW expression index."""
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} "
+        f"USING hnsw ({expression} {opclass}) "
+        f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+    )
+
+
+async def index_size(conn: asyncpg.Connection, index_name: str) -> Optional[int]:
+    """Index size in bytes, or None if it does not exist."""
+    return await conn.fetchval("SELECT pg_relation_size(to_regclass($1))", index_name)
+
+
+async def build_coarse_index(conn: asyncpg.Connection, name: str, create_sql: str) -> bool:
+    """
+    Run a coarse_index_ddl() statement; False if the index ended up INVALID.
+
+    CONCURRENTLY cannot run inside a transaction block; asyncpg executes
+    in autocommit mode outside explicit transactions.
+    """
+    await conn.execute("SET maintenance_work_mem = '512MB'")
+    await conn.execute(create_sql)
+    valid = await conn.fetchval(
+        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)", name
+    )
+    if not valid:
+        print(f"  ✗ {name} is INVALID (interrupted build?) - drop it and re-run")
+    return bool(valid)
@@ -6,11 +6,16 @@ optimized for sub-20ms query time on 10k+ code chunks.
 """
 
 import logging
+import time
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy import text
 
+from services.filtered_ann_planner import FilteredANNPlanner
+from services.matryoshka_search import MatryoshkaSearch, get_matryoshka_search
+from services.binary_prefilter import BinaryPrefilter, get_binary_prefilter
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +48,9 @@ class VectorSearchService:
     - Dual embeddings (TEXT for natural language, CODE for code)
     - Inner product operator (<#>) for 10-20% speedup vs cosine (<=>)
     - Query-time ef_search tuning
+    - Filtered ANN planning (iterative scan / exact scan) for selective filters
+    - Optional Matryoshka two-stage search (truncated-dim ANN + full rescoring)
+    - Optional binary-quantised prefilter (Hamming ANN + full rescoring)
     - Metadata filtering (language, chunk_type, repository)
     - Distance → similarity conversion
     """
@@ -51,6 +59,9 @@ class VectorSearchService:
         self,
         engine: AsyncEngine,
         ef_search: int = 100,  # HNSW ef_search parameter
+        ann_planner: Optional[FilteredANNPlanner] = None,
+        matryoshka: Optional[MatryoshkaSearch] = None,
+        binary_prefilter: Optional[BinaryPrefilter] = None,
     ):
         """
         Initialize vector search service.
@@ -61,9 +72,16 @@ class VectorSearchService:
                       - Lower (40): Faster, lower recall
                       - Balanced (100): Good speed/recall tradeoff ⭐
                       - Higher (200): Slower, higher recall
+            ann_planner: Optional filtered ANN planner (created from env if not provided)
+            matryoshka: Optional two-stage search settings (process-wide default)
+            binary_prefilter: Optional binary prefilter settings (process-wide default,
+                              enabled by VECTOR_SEARCH_PREFILTER=binary)
         """
         self.engine = engine
         self.ef_search = ef_search
+        self.ann_planner = ann_planner or FilteredANNPlanner()
+        self.matryoshka = matryoshka or get_matryoshka_search()
+        self.binary_prefilter = binary_prefilter or get_binary_prefilter()
 
     async def search(
         self,
@@ -143,6 +161,8 @@ class VectorSearchService:
                 where_clauses.append("EXISTS (SELECT 1 FROM jsonb_each_text(metadata->'param_types') WHERE value ILIKE :param_type)")
                 params["param_type"] = f"%{filters['param_type']}%"
 
+        # Beyond the "embedding IS NOT NULL" clause
+        filtered = len(where_clauses) > 1
         where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
 
         # SET commands (executed in same transaction)
@@ -156,8 +176,7 @@ class VectorSearchService:
 
         # Query using halfvec columns (50% smaller index, 99.2% recall)
         # Cast query vector to halfvec for operator <=> compatibility
-        query_sql = f"""
-            SELECT
+        select_sql = f"""
                 id::TEXT as chunk_id,
                 ({embedding_column} <=> '{embedding_str}'::halfvec) as distance,
                 (1 - ({embedding_column} <=> '{embedding_str}'::halfvec) / 2) as similarity,
@@ -167,20 +186,78 @@ class VectorSearchService:
                 language,
                 chunk_type,
                 file_path,
-                metadata
+                metadata"""
+        query_sql = f"""
+            SELECT {select_sql}
             FROM code_chunks
             WHERE {where_clause}
             ORDER BY {embedding_column} <=> '{embedding_str}'::halfvec
             LIMIT :limit
         """
 
+        # Two-stage search: ANN on a compact index (binary-quantised bits or
+        # truncated Matryoshka dims), then exact rescoring on the full halfvec
+        mrl_dim = self.matryoshka.dim_for(embedding_domain)
+        prefilter = None
+        if self.binary_prefilter.enabled:
+            prefilter, alias, candidate_param = self.binary_prefilter, "bq_c", "bq_candidate_limit"
+            stage_label = "binary"
+            coarse_sql = self.binary_prefilter.coarse_candidates_sql(
+                "code_chunks", embedding_column, embedding, where_clause
+            )
+        elif mrl_dim:
+            prefilter, alias, candidate_param = self.matryoshka, "mrl_c", "mrl_candidate_limit"
+            stage_label = f"matryoshka_dim={mrl_dim}"
+            coarse_sql = self.matryoshka.coarse_candidates_sql(
+                "code_chunks", embedding_column, mrl_dim, embedding, where_clause
+            )
+        if prefilter:
+            two_stage_sql = f"""
+            SELECT {select_sql},
+                {alias}.coarse_rank
+            FROM code_chunks
+            JOIN ({coarse_sql}
+            ) {alias} USING (id)
+            ORDER BY {embedding_column} <=> '{embedding_str}'::halfvec
+            LIMIT :limit
+        """
+            params[candidate_param] = prefilter.candidate_limit(limit)
+
         try:
+            plan = None
+            recall = None
+            two_stage = False
             async with self.engine.begin() as conn:
-                # Execute SET commands in same transaction (separate statements for asyncpg)
-                for set_cmd in set_cmds:
-                    await conn.execute(text(set_cmd))
+                if filtered and self.ann_planner.enabled:
+                    # Selective filters: iterative scan with scaled ef_search,
+                    # or exact scan when the filtered set is small
+                    plan = await self.ann_planner.plan(
+                        conn, "code_chunks", where_clause, params,
+                        limit=params[candidate_param] if prefilter else limit, base_ef_search=ef_value,
+                    )
+                    await self.ann_planner.apply(conn, plan)
+                else:
+                    # Execute SET commands in same transaction (separate statements for asyncpg)
+                    for set_cmd in set_cmds:
+                        await conn.execute(text(set_cmd))
+                # An exact scan of a small filtered set is cheap on full vectors
+                if prefilter and not (plan and plan.strategy == "exact"):
+                    query_sql = two_stage_sql
+                    two_stage = True
+                query_start = time.time()
                 result = await conn.execute(text(query_sql), params)
                 rows = result.fetchall()
+                query_time = (time.time() - query_start) * 1000
+
+                if plan and self.ann_planner.should_sample_recall(plan):
+                    recall = await self.ann_planner.measure_recall(
+                        conn, text(query_sql), params, [row.chunk_id for row in rows],
+                    )
+
+            if plan:
+                self.ann_planner.record(plan, returned=len(rows), latency_ms=query_time, recall=recall)
+            if two_stage:
+                prefilter.record(limit, params[candidate_param], [row.coarse_rank for row in rows])
 
             # Convert to VectorSearchResult objects
             results = []
@@ -204,7 +281,9 @@ class VectorSearchService:
             logger.info(
                 f"Vector search ({embedding_domain}): results={len(results)}, "
                 f"top_similarity={results[0].similarity if results else 0:.3f}, "
-                f"ef_search={self.ef_search}"
+                f"ef_search={plan.ef_search if plan else self.ef_search}"
+                + (f", ann_strategy={plan.strategy}" if plan else "")
+                + (f", two_stage={stage_label}" if two_stage else "")
             )
 
             return results
@@ -233,7 +312,6 @@ class VectorSearchService:
             - search_time_ms: Execution time
             - ef_search: HNSW ef_search used
         """
-        import time
         start = time.time()
 
         results = await self.search(embedding, embedding_domain, filters, limit)
@@ -0,0 +1,125 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination re-reads and discards every skipped row, so deep pages
+become linear scans; the companion COUNT(*) re-scans the filtered set on
+every call. Keyset pagination resumes from the last (created_at, id) seen:
+
+    WHERE (created_at, id) < (:cursor_created_at, :cursor_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit + 1
+
+which is an index range scan whatever the page depth. Fetching one extra
+row tells whether another page exists without counting.
+
+Cursors are opaque url-safe base64 strings; clients must not build them.
+
+Count modes:
+    exact      COUNT(*) over the filtered set (previous behaviour)
+    estimated  planner row estimate (EXPLAIN / pg_class.reltuples), O(1)
+    none       no count at all
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+import uuid
+
+from sqlalchemy.sql import text
+
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+def encode_cursor(created_at: Union[datetime, str], row_id: Union[uuid.UUID, str]) -> str:
+    """
+    Encode the (created_at, id) of the last row of a page.
+
+    Args:
+        created_at: Row creation timestamp (datetime or ISO string)
+        row_id: Row UUID
+
+    Returns:
+        Opaque url-safe cursor string
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps({"c": created_at, "i": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        created_at = datetime.fromisoformat(payload["c"])
+        row_id = str(uuid.UUID(payload["i"]))
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+    return created_at, row_id
+
+
+def keyset_condition(
+    cursor: str,
+    params: Dict[str, Any],
+    created_column: str = "created_at",
+    id_column: str = "id",
+) -> str:
+    """
+    Build the keyset WHERE condition for a DESC (created_at, id) ordering.
+
+    Adds :cursor_created_at / :cursor_id to params.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    created_at, row_id = decode_cursor(cursor)
+    params["cursor_created_at"] = created_at
+    params["cursor_id"] = row_id
+    return (
+        f"({created_column}, {id_column}) < "
+        f"(:cursor_created_at, CAST(:cursor_id AS uuid))"
+    )
+
+
+async def estimate_count(
+    conn,
+    table: str,
+    where_sql: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Planner row estimate for `SELECT ... FROM table WHERE where_sql`.
+
+    Uses EXPLAIN (no execution), so the cost does not depend on the size
+    of the filtered set. Accuracy follows the table statistics (ANALYZE).
+
+    Args:
+        conn: Open connection
+        table: Table name (trusted, not user input)
+        where_sql: WHERE clause without the WHERE keyword ("" for none)
+        params: Bind parameters used by where_sql
+    """
+    where = f"WHERE {where_sql}" if where_sql else ""
+    result = await conn.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} {where}"),
+        params or {},
+    )
+    raw = result.scalar()
+    explain = json.loads(raw) if isinstance(raw, str) else raw
+    return int(explain[0]["Plan"]["Plan Rows"])
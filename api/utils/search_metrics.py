@@ -280,6 +280,83 @@ def log_cache_metrics(
     logger.debug(**log_data)
 
 
+def log_filtered_ann_metrics(
+    table: str,
+    strategy: str,
+    ef_search: int,
+    limit: int,
+    returned: int,
+    latency_ms: float,
+    planning_time_ms: float = 0.0,
+    estimated_rows: Optional[int] = None,
+    selectivity: Optional[float] = None,
+    max_scan_tuples: Optional[int] = None,
+    recall: Optional[float] = None
+):
+    """
+    Log filtered ANN (pgvector HNSW + WHERE filters) query telemetry.
+
+    Usage:
+        log_filtered_ann_metrics(
+            table="memories",
+            strategy="iterative",
+            ef_search=400,
+            limit=50,
+            returned=50,
+            latency_ms=12.4,
+            selectivity=0.12,
+            recall=0.96
+        )
+
+    Analyse:
+        # Recall by strategy (sampled queries only)
+        docker logs mnemo-api --since 1h | grep "filtered_ann_search" | \
+          jq -s 'map(select(.recall != null)) | group_by(.strategy) | map({strategy: .[0].strategy, recall: (map(.recall) | add / length)})'
+
+        # Under-filled results (fewer rows than requested)
+        docker logs mnemo-api --since 1h | grep "filtered_ann_search" | \
+          jq 'select(.fill_ratio < 1)'
+
+    Args:
+        table: Searched table ("memories", "code_chunks")
+        strategy: Planner strategy ("hnsw", "iterative", "exact")
+        ef_search: hnsw.ef_search applied
+        limit: Neighbours requested
+        returned: Rows actually returned
+        latency_ms: Query latency in milliseconds (planning excluded)
+        planning_time_ms: Selectivity estimation time in milliseconds
+        estimated_rows: Estimated rows matching the filters
+        selectivity: Estimated fraction of rows matching the filters
+        max_scan_tuples: hnsw.max_scan_tuples applied (iterative only)
+        recall: Sampled recall@limit against an exact scan
+    """
+    log_data = {
+        "event": "filtered_ann_search",
+        "table": table,
+        "strategy": strategy,
+        "ef_search": ef_search,
+        "limit": limit,
+        "returned": returned,
+        "fill_ratio": round(returned / limit, 3) if limit else None,
+        "latency_ms": round(latency_ms, 2),
+        "planning_time_ms": round(planning_time_ms, 2),
+    }
+
+    if estimated_rows is not None:
+        log_data["estimated_rows"] = estimated_rows
+
+    if selectivity is not None:
+        log_data["selectivity"] = round(selectivity, 6)
+
+    if max_scan_tuples is not None:
+        log_data["max_scan_tuples"] = max_scan_tuples
+
+    if recall is not None:
+        log_data["recall"] = round(recall, 4)
+
+    logger.info(**log_data)
+
+
 # ==============================================================================
 # Examples & Cheat Sheet
 # ==============================================================================
@@ -25,6 +25,7 @@ describe('useMemories infinite scroll', () => {
       if (url.includes('/recent')) {
         return Promise.resolve({
           ok: true,
+          headers: new Headers({ 'X-Next-Cursor': 'cursor-1' }),
           json: () => Promise.resolve(Array(20).fill({ id: 'test' }))
         })
       }
@@ -47,6 +48,7 @@ describe('useMemories infinite scroll', () => {
       if (url.includes('/recent')) {
         return Promise.resolve({
           ok: true,
+          headers: new Headers({ 'X-Next-Cursor': 'cursor-1' }),
           json: () => Promise.resolve(Array(20).fill({ id: 'test' }))
         })
       }
@@ -67,14 +69,20 @@ describe('useMemories infinite scroll', () => {
     await nextTick()
 
     expect(data.value.recentMemories.length).toBe(40)
+    // The next page resumes from the cursor of the previous one
+    const recentUrls = (global.fetch as any).mock.calls
+      .map((call: any[]) => call[0] as string)
+      .filter((url: string) => url.includes('/recent'))
+    expect(recentUrls[recentUrls.length - 1]).toContain('cursor=cursor-1')
   })
 
-  it('should set hasMore to false when fewer than pageSize returned', async () => {
+  it('should set hasMore to false on the last page', async () => {
     global.fetch = vi.fn((url: string) => {
       if (url.includes('/recent')) {
         return Promise.resolve({
           ok: true,
-          json: () => Promise.resolve(Array(5).fill({ id: 'test' }))  // Only 5 returned
+          headers: new Headers(),  // Last page: no X-Next-Cursor
+          json: () => Promise.resolve(Array(5).fill({ id: 'test' }))
         })
       }
       // Mock other endpoints
@@ -30,7 +30,7 @@ export function useMemories(options: { refreshInterval?: number } = {}) {
   // Infinite scroll state
   const loadingMore = ref(false)
   const hasMore = ref(true)
-  const offset = ref(0)
+  const nextCursor = ref<string | null>(null)  // X-Next-Cursor of the last page
   const pageSize = 20  // Load 20 at a time
 
   let intervalId: number | null = null
@@ -54,11 +54,14 @@ export function useMemories(options: { refreshInterval?: number } = {}) {
     }
   }
 
-  // Fetch recent memories (with offset for infinite scroll)
+  // Fetch recent memories (keyset cursor for infinite scroll)
   async function fetchRecentMemories(limit: number = pageSize, append: boolean = false): Promise<void> {
     try {
-      const currentOffset = append ? offset.value : 0
-      const response = await fetch(`${API_BASE_URL}/recent?limit=${limit}&offset=${currentOffset}`)
+      const params = new URLSearchParams({ limit: String(limit) })
+      if (append && nextCursor.value) {
+        params.set('cursor', nextCursor.value)
+      }
+      const response = await fetch(`${API_BASE_URL}/recent?${params}`)
       if (!response.ok) {
         throw new Error(`HTTP ${response.status}: ${response.statusText}`)
       }
@@ -67,15 +70,14 @@ export function useMemories(options: { refreshInterval?: number } = {}) {
       if (append) {
         // Append to existing list (infinite scroll)
         data.value.recentMemories.push(...newMemories)
-        offset.value += newMemories.length
       } else {
         // Replace list (initial load or refresh)
         data.value.recentMemories = newMemories
-        offset.value = newMemories.length
       }
 
-      // Check if we have more to load
-      hasMore.value = newMemories.length === limit
+      // The API sends a cursor only when another page exists
+      nextCursor.value = response.headers.get('X-Next-Cursor')
+      hasMore.value = nextCursor.value !== null
     } catch (error) {
       const errorMsg = error instanceof Error ? error.message : 'Unknown error'
       errors.value.push({
@@ -138,7 +140,7 @@ export function useMemories(options: { refreshInterval?: number } = {}) {
   async function refresh(): Promise<void> {
     loading.value = true
     errors.value = [] // Clear previous errors
-    offset.value = 0  // Reset offset on manual refresh
+    nextCursor.value = null  // Restart from the first page on manual refresh
     hasMore.value = true  // Reset hasMore flag
 
     // Fetch all endpoints in parallel
@@ -134,6 +134,13 @@ Graceful Shutdown:
         logger.info(f"   Files failed:      {stats.get('failed_files', 0)}")
         logger.info(f"   Final status:      {stats.get('status', 'unknown')}")
         logger.info(f"   Completed at:      {stats.get('completed_at', 'N/A')}")
+        run = stats.get('run')
+        if run:
+            # Durable counters: include earlier attempts of the same job
+            logger.info(f"   Skipped (indexed): {run['skipped_files']}")
+            logger.info(f"   Throughput:        {run['files_per_second']:.2f} files/s, "
+                        f"{run['chunks_per_second']:.1f} chunks/s over {run['active_seconds']:.0f}s "
+                        f"({run['resumes']} resumes)")
         logger.info("=" * 80)
 
         # Exit code based on status
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Binary Prefilter Benchmark: Hamming prefilter + halfvec rescoring vs halfvec HNSW
+
+For one embedding column, samples stored vectors as queries and compares
+against exact full-dimension ground truth (sequential scan):
+- current path: single-stage HNSW on the 768D halfvec index
+- binary path: HNSW on binary_quantize(column)::bit(768) by Hamming
+  distance, candidates rescored by exact cosine on the halfvec
+  (VECTOR_SEARCH_PREFILTER=binary), per oversample factor
+Reports recall@k, p50 / p95 latency and index sizes. Without the bit
+index (scripts/binary_prefilter_indexes.py) stage 1 is a sequential scan
+and latency is not representative.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/binary_prefilter_benchmark.py
+    docker compose exec api python scripts/benchmarks/binary_prefilter_benchmark.py \\
+        --table code_chunks --column embedding_code_half --oversample 4 10 20 40
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql import text
+
+from services.binary_prefilter import (
+    BINARY_COLUMNS,
+    BinaryPrefilter,
+    BinaryPrefilterConfig,
+    binary_index_name,
+)
+from services.two_stage_search import FULL_INDEXES
+from utils.sql_vector import format_halfvec_for_sql
+
+
+def percentile(values: List[float], p: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+def base_where(table: str, column: str) -> str:
+    deleted = "deleted_at IS NULL AND " if table == "memories" else ""
+    return f"{deleted}{column} IS NOT NULL"
+
+
+async def load_queries(engine, table: str, column: str, n: int) -> List[List[float]]:
+    async with engine.begin() as conn:
+        result = await conn.execute(text(f"""
+            SELECT {column}::text FROM {table}
+            WHERE {base_where(table, column)}
+            ORDER BY random() LIMIT :n
+        """), {"n": n})
+        return [[float(x) for x in row[0].strip("[]").split(",")] for row in result.fetchall()]
+
+
+async def full_search(engine, table: str, column: str, query: List[float], k: int, exact: bool) -> Set[str]:
+    vector = f"'{format_halfvec_for_sql(query)}'::halfvec"
+    async with engine.begin() as conn:
+        if exact:
+            await conn.execute(text("SET LOCAL enable_indexscan = off"))
+        else:
+            await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
+        result = await conn.execute(text(f"""
+            SELECT id::text FROM {table}
+            WHERE {base_where(table, column)}
+            ORDER BY {column} <=> {vector}
+            LIMIT :k
+        """), {"k": k})
+        return {row[0] for row in result.fetchall()}
+
+
+async def binary_search(
+    engine, prefilter: BinaryPrefilter, table: str, column: str, query: List[float], k: int
+) -> Set[str]:
+    vector = f"'{format_halfvec_for_sql(query)}'::halfvec"
+    coarse = prefilter.coarse_candidates_sql(table, column, query, base_where(table, column))
+    candidate_limit = prefilter.candidate_limit(k)
+    async with engine.begin() as conn:
+        # ef_search bounds how many rows one HNSW scan returns
+        await conn.execute(text(f"SET LOCAL hnsw.ef_search = {max(100, min(candidate_limit, 1000))}"))
+        await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+        result = await conn.execute(text(f"""
+            SELECT id::text FROM {table}
+            JOIN ({coarse}) bq_c USING (id)
+            ORDER BY {column} <=> {vector}
+            LIMIT :k
+        """), {"k": k, "bq_candidate_limit": candidate_limit})
+        return {row[0] for row in result.fetchall()}
+
+
+async def index_size(engine, name: str):
+    async with engine.begin() as conn:
+        result = await conn.execute(text("SELECT pg_relation_size(to_regclass(:n))"), {"n": name})
+        return result.scalar()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Binary-quantised prefilter recall/latency benchmark")
+    parser.add_argument("--table", default="memories", choices=sorted({t for t, _ in BINARY_COLUMNS}))
+    parser.add_argument("--column", default="embedding_half")
+    parser.add_argument("--oversample", type=float, nargs="+", default=[4, 10, 20, 40])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    if (args.table, args.column) not in BINARY_COLUMNS:
+        print(f"Unknown embedding column {args.table}.{args.column}")
+        sys.exit(1)
+
+    database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url, pool_size=2)
+
+    queries = await load_queries(engine, args.table, args.column, args.queries)
+    if not queries:
+        print("No stored vectors found - nothing to benchmark")
+        await engine.dispose()
+        sys.exit(1)
+
+    truth = [await full_search(engine, args.table, args.column, q, args.k, exact=True) for q in queries]
+    full_size = await index_size(engine, FULL_INDEXES[(args.table, args.column)])
+    bit_size = await index_size(engine, binary_index_name(args.table, args.column))
+
+    print(f"\nBinary prefilter benchmark: {args.table}.{args.column}, "
+          f"{len(queries)} queries, recall@{args.k} vs exact 768D\n")
+    print(f"{'path':<16}{'recall':>9}{'p50 ms':>9}{'p95 ms':>9}{'index':>12}")
+
+    latencies, recalls = [], []
+    for q, expected in zip(queries, truth):
+        start = time.perf_counter()
+        found = await full_search(engine, args.table, args.column, q, args.k, exact=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len(found & expected) / max(len(expected), 1))
+    full_label = f"{full_size / 2**20:>10.1f}MB" if full_size else "  (no index)"
+    print(f"{'halfvec hnsw':<16}{statistics.mean(recalls):>9.3f}{statistics.median(latencies):>9.1f}"
+          f"{percentile(latencies, 95):>9.1f}{full_label}")
+
+    bit_label = f"{bit_size / 2**20:>10.1f}MB" if bit_size else "  (no index)"
+    for oversample in args.oversample:
+        prefilter = BinaryPrefilter(BinaryPrefilterConfig(mode="binary", oversample=oversample, min_candidates=0))
+        latencies, recalls = [], []
+        for q, expected in zip(queries, truth):
+            start = time.perf_counter()
+            found = await binary_search(engine, prefilter, args.table, args.column, q, args.k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(found & expected) / max(len(expected), 1))
+        label = f"binary x{oversample:g}"
+        print(f"{label:<16}{statistics.mean(recalls):>9.3f}{statistics.median(latencies):>9.1f}"
+              f"{percentile(latencies, 95):>9.1f}{bit_label}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
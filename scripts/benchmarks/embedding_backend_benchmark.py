@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Embedding Backend Benchmark: PyTorch fp32 vs quantised CPU backends
+
+Encodes the same corpus with every EMBEDDING_BACKEND of DualEmbeddingService
+and compares each against the fp32 "torch" reference:
+- load time and encode throughput (texts/s)
+- cosine similarity to the reference vector (mean / p5 / min)
+- neighbour recall@10: overlap of each query's top-10 corpus neighbours
+  under the candidate backend vs the reference backend
+- PASS/FAIL against BACKEND_COSINE_TOLERANCE (mean cosine)
+
+Corpus: source files of this repository (code domain) and markdown docs
+(text domain), split into ~1500-char chunks.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/embedding_backend_benchmark.py
+    docker compose exec api python scripts/benchmarks/embedding_backend_benchmark.py \\
+        --backends torch torch-int8 onnx-int8 --domain code --samples 400 --batch-size 32
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.dual_embedding_service import (
+    BACKEND_COSINE_TOLERANCE,
+    EMBEDDING_BACKENDS,
+    DualEmbeddingService,
+)
+
+
+def load_corpus(domain: str, samples: int, chunk_chars: int = 1500) -> List[str]:
+    """Chunks of repository files: *.py for code, *.md for text."""
+    pattern = "*.py" if domain == "code" else "*.md"
+    roots = [project_root / "api", project_root / "scripts"] if domain == "code" else [project_root / "docs", project_root]
+    texts: List[str] = []
+    for root in roots:
+        if not root.exists():
+            continue
+        for path in sorted(root.rglob(pattern)):
+            if "node_modules" in path.parts or ".git" in path.parts:
+                continue
+            try:
+                content = path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            for start in range(0, len(content), chunk_chars):
+                chunk = content[start:start + chunk_chars].strip()
+                if len(chunk) > 50:
+                    texts.append(chunk)
+                if len(texts) >= samples:
+                    return texts
+    return texts
+
+
+def encode(backend: str, domain: str, texts: List[str], batch_size: int) -> Dict:
+    service = DualEmbeddingService(backend=backend)
+    start = time.perf_counter()
+    model = service._load_text_model_sync() if domain == "text" else service._load_code_model_sync()
+    load_s = time.perf_counter() - start
+
+    service._encode_batch_with_no_grad(model, texts[:batch_size], show_progress_bar=False)  # warm-up
+
+    start = time.perf_counter()
+    vectors = model.encode(texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+    encode_s = time.perf_counter() - start
+
+    return {
+        "backend": service.loaded_backends[domain],
+        "load_s": load_s,
+        "texts_per_s": len(texts) / encode_s,
+        "vectors": np.asarray(vectors, dtype=np.float32),
+    }
+
+
+def normalise(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def neighbour_recall(reference: np.ndarray, candidate: np.ndarray, queries: int, k: int = 10) -> float:
+    """Mean overlap of top-k neighbours (excluding self) between two embeddings."""
+    ref, cand = normalise(reference), normalise(candidate)
+    queries = min(queries, len(ref))
+    overlaps = []
+    for i in range(queries):
+        ref_top = set(np.argsort(-(ref @ ref[i]))[1:k + 1])
+        cand_top = set(np.argsort(-(cand @ cand[i]))[1:k + 1])
+        overlaps.append(len(ref_top & cand_top) / k)
+    return float(np.mean(overlaps)) if overlaps else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding inference backends")
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS), choices=EMBEDDING_BACKENDS)
+    parser.add_argument("--domain", choices=["text", "code", "both"], default="both")
+    parser.add_argument("--samples", type=int, default=300, help="Corpus chunks per domain")
+    parser.add_argument("--queries", type=int, default=50, help="Queries for neighbour recall")
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    os.environ.setdefault("EMBEDDING_MODE", "real")
+    domains = ["text", "code"] if args.domain == "both" else [args.domain]
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+
+    for domain in domains:
+        texts = load_corpus(domain, args.samples)
+        if not texts:
+            print(f"No {domain} corpus found - skipping")
+            continue
+
+        print(f"\n{domain.upper()} domain: {len(texts)} chunks, batch_size={args.batch_size}\n")
+        print(f"{'backend':<12}{'load s':>9}{'texts/s':>10}{'speedup':>9}"
+              f"{'cos mean':>10}{'cos p5':>9}{'cos min':>9}{'recall@10':>11}{'tol':>8}  result")
+
+        reference = None
+        for backend in backends:
+            try:
+                result = encode(backend, domain, texts, args.batch_size)
+            except Exception as e:
+                print(f"{backend:<12}  failed: {e}")
+                continue
+
+            if reference is None:
+                reference = result
+            cosines = np.sum(normalise(reference["vectors"]) * normalise(result["vectors"]), axis=1)
+            recall = neighbour_recall(reference["vectors"], result["vectors"], args.queries)
+            tolerance = BACKEND_COSINE_TOLERANCE[backend]
+            label = backend if result["backend"] == backend else f"{backend}->{result['backend']}"
+            print(f"{label:<12}{result['load_s']:>9.1f}{result['texts_per_s']:>10.1f}"
+                  f"{result['texts_per_s'] / reference['texts_per_s']:>8.2f}x"
+                  f"{cosines.mean():>10.4f}{np.percentile(cosines, 5):>9.4f}{cosines.min():>9.4f}"
+                  f"{recall:>11.3f}{tolerance:>8.3f}  {'PASS' if cosines.mean() >= tolerance else 'FAIL'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Embedding Batching Benchmark: fixed batches vs token-budget length bucketing
+
+Encodes real indexed code chunks (code_chunks.source_code) with the CODE
+model through DualEmbeddingService._encode_batch_with_no_grad, once with
+token-budget batching disabled (EMBEDDING_MAX_BATCH_TOKENS=0, one
+model.encode call with its default batch size) and once per token budget.
+Reports:
+- throughput (chunks/s) and speedup over the single-call path
+- number of encode batches and padding efficiency (real / padded tokens)
+- max abs difference to the single-call vectors (must be ~0: batching
+  does not change the math, only the padding)
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/embedding_batching_benchmark.py
+    docker compose exec api python scripts/benchmarks/embedding_batching_benchmark.py \\
+        --samples 1000 --budgets 4096 8192 16384 --domain text
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql import text
+
+from services.dual_embedding_service import DualEmbeddingService
+
+
+async def load_chunks(samples: int, repository: str = None) -> List[str]:
+    """Random sample of indexed chunk sources."""
+    database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            result = await conn.execute(text("""
+                SELECT source_code
+                FROM code_chunks
+                WHERE (CAST(:repository AS TEXT) IS NULL OR repository = :repository)
+                  AND length(source_code) > 0
+                ORDER BY random()
+                LIMIT :n
+            """), {"n": samples, "repository": repository})
+            return [row[0] for row in result.fetchall()]
+    finally:
+        await engine.dispose()
+
+
+def run(service: DualEmbeddingService, model, chunks: List[str], budget: int):
+    service.max_batch_tokens = budget
+    service._real_tokens = service._padded_tokens = 0
+    start = time.perf_counter()
+    calls = []
+    original_encode = model.encode
+
+    def counting_encode(*args, **kwargs):
+        calls.append(1)
+        return original_encode(*args, **kwargs)
+
+    model.encode = counting_encode
+    try:
+        vectors = service._encode_batch_with_no_grad(model, chunks, show_progress_bar=False)
+    finally:
+        model.encode = original_encode
+    elapsed = time.perf_counter() - start
+    efficiency = service._real_tokens / service._padded_tokens if service._padded_tokens else None
+    return np.asarray(vectors), elapsed, len(calls), efficiency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark token-budget embedding batching")
+    parser.add_argument("--samples", type=int, default=500, help="Chunks sampled from code_chunks")
+    parser.add_argument("--repository", default=None, help="Restrict to one repository")
+    parser.add_argument("--budgets", type=int, nargs="+", default=[4096, 8192, 16384])
+    parser.add_argument("--domain", choices=["code", "text"], default="code")
+    args = parser.parse_args()
+
+    chunks = asyncio.run(load_chunks(args.samples, args.repository))
+    if not chunks:
+        print("No indexed chunks found - index a repository first")
+        sys.exit(1)
+
+    os.environ.setdefault("EMBEDDING_MODE", "real")
+    service = DualEmbeddingService()
+    model = service._load_code_model_sync() if args.domain == "code" else service._load_text_model_sync()
+
+    lengths = service._token_lengths(model, chunks) or []
+    print(f"\n{len(chunks)} chunks, tokens: min={min(lengths)} "
+          f"median={int(np.median(lengths))} max={max(lengths)} ({args.domain} model, "
+          f"backend={service.loaded_backends[args.domain]})\n")
+
+    # Warm-up
+    run(service, model, chunks[:32], 0)
+
+    reference, base_s, base_calls, _ = run(service, model, chunks, 0)
+    print(f"{'budget':>10}{'seconds':>10}{'chunks/s':>10}{'speedup':>9}{'batches':>9}"
+          f"{'pad eff':>9}{'max diff':>11}")
+    print(f"{'off':>10}{base_s:>10.2f}{len(chunks) / base_s:>10.1f}{1.0:>8.2f}x{'-':>9}{'-':>9}{0.0:>11.2e}")
+
+    for budget in args.budgets:
+        vectors, elapsed, calls, efficiency = run(service, model, chunks, budget)
+        diff = float(np.max(np.abs(vectors - reference)))
+        print(f"{budget:>10}{elapsed:>10.2f}{len(chunks) / elapsed:>10.1f}{base_s / elapsed:>8.2f}x"
+              f"{calls:>9}{efficiency:>9.2f}{diff:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Matryoshka Recall Benchmark: truncated-dim two-stage search vs full 768D
+
+For one embedding column, samples stored vectors as queries and compares
+the two-stage search (coarse ANN on the first `dim` dimensions + exact
+full-vector rescoring) against exact full-dimension ground truth:
+- recall@k per (dim, oversample)
+- p50 / p95 latency vs the single-stage 768D HNSW query
+- whether the reduced index exists (without it stage 1 is a sequential scan
+  and latency is not representative - run scripts/matryoshka_backfill.py)
+- index sizes of the full and reduced HNSW indexes
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/matryoshka_recall_benchmark.py
+    docker compose exec api python scripts/benchmarks/matryoshka_recall_benchmark.py \\
+        --table code_chunks --column embedding_text_half --dims 128 256 384 --oversample 2 4 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql import text
+
+from services.matryoshka_search import (
+    MRL_COLUMNS,
+    MatryoshkaConfig,
+    MatryoshkaSearch,
+    mrl_index_name,
+)
+from utils.sql_vector import format_halfvec_for_sql
+
+
+def percentile(values: List[float], p: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+def base_where(table: str, column: str) -> str:
+    deleted = "deleted_at IS NULL AND " if table == "memories" else ""
+    return f"{deleted}{column} IS NOT NULL"
+
+
+async def load_queries(engine, table: str, column: str, n: int) -> List[List[float]]:
+    async with engine.begin() as conn:
+        result = await conn.execute(text(f"""
+            SELECT {column}::text FROM {table}
+            WHERE {base_where(table, column)}
+            ORDER BY random() LIMIT :n
+        """), {"n": n})
+        return [[float(x) for x in row[0].strip("[]").split(",")] for row in result.fetchall()]
+
+
+async def full_search(engine, table: str, column: str, query: List[float], k: int, exact: bool) -> Set[str]:
+    vector = f"'{format_halfvec_for_sql(query)}'::halfvec"
+    async with engine.begin() as conn:
+        if exact:
+            await conn.execute(text("SET LOCAL enable_indexscan = off"))
+        else:
+            await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
+        result = await conn.execute(text(f"""
+            SELECT id::text FROM {table}
+            WHERE {base_where(table, column)}
+            ORDER BY {column} <=> {vector}
+            LIMIT :k
+        """), {"k": k})
+        return {row[0] for row in result.fetchall()}
+
+
+async def two_stage_search(
+    engine, mrl: MatryoshkaSearch, table: str, column: str, dim: int, query: List[float], k: int
+) -> Set[str]:
+    vector = f"'{format_halfvec_for_sql(query)}'::halfvec"
+    coarse = mrl.coarse_candidates_sql(table, column, dim, query, base_where(table, column))
+    async with engine.begin() as conn:
+        await conn.execute(text("SET LOCAL hnsw.ef_search = 100"))
+        await conn.execute(text("SET LOCAL hnsw.iterative_scan = 'relaxed_order'"))
+        result = await conn.execute(text(f"""
+            SELECT id::text FROM {table}
+            JOIN ({coarse}) mrl_c USING (id)
+            ORDER BY {column} <=> {vector}
+            LIMIT :k
+        """), {"k": k, "mrl_candidate_limit": mrl.candidate_limit(k)})
+        return {row[0] for row in result.fetchall()}
+
+
+async def index_sizes(engine, table: str, column: str, dims: List[int]) -> Dict[str, int]:
+    full = {"memories": "idx_memories_embedding_half",
+            "code_chunks": "idx_code_emb_text_half" if column == "embedding_text_half" else "idx_code_emb_code_half"}[table]
+    names = [full] + [mrl_index_name(table, column, d) for d in dims]
+    sizes = {}
+    async with engine.begin() as conn:
+        for name in names:
+            result = await conn.execute(text("SELECT pg_relation_size(to_regclass(:n))"), {"n": name})
+            sizes[name] = result.scalar()
+    return sizes
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Matryoshka two-stage recall benchmark")
+    parser.add_argument("--table", default="memories", choices=sorted({t for t, _ in MRL_COLUMNS}))
+    parser.add_argument("--column", default="embedding_half")
+    parser.add_argument("--dims", type=int, nargs="+", default=[128, 256, 384, 512])
+    parser.add_argument("--oversample", type=float, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    if (args.table, args.column) not in MRL_COLUMNS:
+        print(f"Unknown embedding column {args.table}.{args.column}")
+        sys.exit(1)
+
+    database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url, pool_size=2)
+
+    queries = await load_queries(engine, args.table, args.column, args.queries)
+    if not queries:
+        print("No stored vectors found - nothing to benchmark")
+        await engine.dispose()
+        sys.exit(1)
+
+    truth = [await full_search(engine, args.table, args.column, q, args.k, exact=True) for q in queries]
+
+    # Single-stage 768D HNSW baseline
+    latencies, recalls = [], []
+    for q, expected in zip(queries, truth):
+        start = time.perf_counter()
+        found = await full_search(engine, args.table, args.column, q, args.k, exact=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len(found & expected) / max(len(expected), 1))
+
+    sizes = await index_sizes(engine, args.table, args.column, args.dims)
+
+    print(f"\nMatryoshka recall benchmark: {args.table}.{args.column}, "
+          f"{len(queries)} queries, recall@{args.k} vs exact 768D\n")
+    print(f"{'dim':>6}{'oversmp':>9}{'recall':>9}{'p50 ms':>9}{'p95 ms':>9}{'index':>12}")
+    print(f"{768:>6}{'-':>9}{statistics.mean(recalls):>9.3f}{statistics.median(latencies):>9.1f}"
+          f"{percentile(latencies, 95):>9.1f}{(sizes[next(iter(sizes))] or 0) / 2**20:>10.1f}MB")
+
+    for dim in args.dims:
+        reduced = sizes.get(mrl_index_name(args.table, args.column, dim))
+        for oversample in args.oversample:
+            mrl = MatryoshkaSearch(MatryoshkaConfig(
+                text_dim=dim, code_dim=dim, oversample=oversample, min_candidates=0, adaptive=False,
+            ))
+            latencies, recalls = [], []
+            for q, expected in zip(queries, truth):
+                start = time.perf_counter()
+                found = await two_stage_search(engine, mrl, args.table, args.column, dim, q, args.k)
+                latencies.append((time.perf_counter() - start) * 1000)
+                recalls.append(len(found & expected) / max(len(expected), 1))
+            index_label = f"{reduced / 2**20:>10.1f}MB" if reduced else "  (no index)"
+            print(f"{dim:>6}{oversample:>9.0f}{statistics.mean(recalls):>9.3f}"
+                  f"{statistics.median(latencies):>9.1f}{percentile(latencies, 95):>9.1f}{index_label}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Hybrid Memory Search Fusion Benchmark: Python fusion vs single-statement SQL
+
+Runs the same hybrid memory searches through HybridMemorySearchService in
+both fusion modes at several concurrency levels and reports:
+- p50 / p95 / p99 latency
+- pool checkouts per query (python mode: one per candidate generator)
+- peak concurrently checked-out connections
+- throughput (queries/s)
+
+Query vectors are taken from stored memory embeddings, so no embedding
+model is loaded. Reranking is disabled to isolate candidate generation
+and fusion.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/memory_fusion_benchmark.py
+    docker compose exec api python scripts/benchmarks/memory_fusion_benchmark.py \\
+        --concurrency 1 8 32 --queries 200 --pool-size 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql import text
+
+from services.hybrid_memory_search_service import HybridMemorySearchService
+from services.query_understanding_service import QueryUnderstandingService
+
+
+class PoolProbe:
+    """Counts checkouts and tracks peak concurrent connections on a pool."""
+
+    def __init__(self, engine):
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak = 0
+        pool = engine.sync_engine.pool
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *args):
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+
+    def _on_checkin(self, *args):
+        self.in_use -= 1
+
+    def reset(self):
+        self.checkouts = 0
+        self.peak = self.in_use
+
+
+def percentile(values: List[float], p: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+async def load_workload(engine, n: int) -> List[Tuple[str, List[float]]]:
+    """(query, embedding) pairs from stored memories (title words + stored vector)."""
+    async with engine.begin() as conn:
+        result = await conn.execute(text("""
+            SELECT title, embedding_half::text
+            FROM memories
+            WHERE deleted_at IS NULL AND embedding_half IS NOT NULL
+            ORDER BY random()
+            LIMIT :n
+        """), {"n": n})
+        rows = result.fetchall()
+
+    workload = []
+    for title, vector in rows:
+        words = [w for w in (title or "").split() if len(w) > 3][:3]
+        if not words:
+            continue
+        embedding = [float(x) for x in vector.strip("[]").split(",")]
+        workload.append((" ".join(words), embedding))
+    return workload
+
+
+async def run_mode(
+    service: HybridMemorySearchService,
+    probe: PoolProbe,
+    workload: List[Tuple[str, List[float]]],
+    mode: str,
+    concurrency: int,
+    total_queries: int,
+) -> Dict[str, Any]:
+    keywords_service = QueryUnderstandingService()
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        query, embedding = workload[i % len(workload)]
+        async with semaphore:
+            start = time.perf_counter()
+            await service.search(
+                query=query,
+                embedding=embedding,
+                keywords=keywords_service.extract_keywords(query),
+                limit=10,
+                enable_reranking=False,
+                fusion_mode=mode,
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    probe.reset()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total_queries)))
+    wall = time.perf_counter() - wall_start
+
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "qps": total_queries / wall,
+        "checkouts_per_query": probe.checkouts / total_queries,
+        "peak_connections": probe.peak,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark python vs sql hybrid memory fusion")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--queries", type=int, default=200, help="Queries per (mode, concurrency)")
+    parser.add_argument("--workload", type=int, default=50, help="Distinct queries sampled from memories")
+    parser.add_argument("--pool-size", type=int, default=10)
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url, pool_size=args.pool_size, max_overflow=0)
+    probe = PoolProbe(engine)
+
+    workload = await load_workload(engine, args.workload)
+    if not workload:
+        print("No memories with embeddings found - nothing to benchmark")
+        await engine.dispose()
+        sys.exit(1)
+
+    service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+    # Warm up both paths (plans, pg_trgm, HNSW pages)
+    for mode in ("python", "sql"):
+        await run_mode(service, probe, workload, mode, 1, min(10, len(workload)))
+
+    results = []
+    for concurrency in args.concurrency:
+        for mode in ("python", "sql"):
+            results.append(
+                await run_mode(service, probe, workload, mode, concurrency, args.queries)
+            )
+
+    print(f"\nHybrid memory fusion benchmark (pool_size={args.pool_size}, "
+          f"{args.queries} queries per row, {len(workload)} distinct queries)\n")
+    print(f"{'mode':<8}{'conc':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'qps':>9}{'conn/q':>9}{'peak':>7}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['concurrency']:>6}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+              f"{r['p99_ms']:>10.1f}{r['qps']:>9.1f}{r['checkouts_per_query']:>9.2f}"
+              f"{r['peak_connections']:>7}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
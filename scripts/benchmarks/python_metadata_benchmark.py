@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Python Metadata Benchmark: per-chunk ast extraction vs single-pass module index
+
+For each large Python module, treats every function/method/class as a chunk
+and compares:
+- legacy path: per chunk, ast.walk the module to find the definition by
+  name, then MetadataExtractorService._extract_python_metadata (which walks
+  the node twice, re-collects module imports and re-splits the source)
+- indexed path: MetadataExtractorService.extract_python_chunks_metadata
+  (one parse, one traversal, chunks resolved by name + line range)
+Reports per-file latency, speedup and how many chunks got different
+metadata (differences come from duplicate names the legacy path resolved
+to the wrong definition).
+
+By default benchmarks large standard library modules; pass --paths to use
+your own files.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/benchmarks/python_metadata_benchmark.py
+    docker compose exec api python scripts/benchmarks/python_metadata_benchmark.py \\
+        --paths api/services/code_chunking_service.py --repeat 5
+"""
+
+import argparse
+import ast
+import asyncio
+import importlib
+import inspect
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.metadata_extractor_service import MetadataExtractorService
+
+DEFAULT_MODULES = ["typing", "argparse", "inspect", "collections", "dataclasses", "pathlib"]
+DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def load_sources(paths, modules):
+    sources = []
+    for path in paths:
+        sources.append((path, Path(path).read_text()))
+    for name in modules:
+        module = importlib.import_module(name)
+        sources.append((f"{name}.py", inspect.getsource(module)))
+    return sources
+
+
+def chunks_for(source: str):
+    tree = ast.parse(source)
+    return [
+        SimpleNamespace(name=node.name, start_line=node.lineno, end_line=node.end_lineno)
+        for node in ast.walk(tree)
+        if isinstance(node, DEFINITION_TYPES)
+    ]
+
+
+async def legacy_extract(service: MetadataExtractorService, source: str, chunks):
+    """The previous CodeChunkingService Python path."""
+    tree = ast.parse(source)
+    results = []
+    for chunk in chunks:
+        ast_node = None
+        for node in ast.walk(tree):
+            if isinstance(node, DEFINITION_TYPES) and node.name == chunk.name:
+                ast_node = node
+                break
+        results.append(await service._extract_python_metadata(source, ast_node or tree, tree))
+    return results
+
+
+async def timed(fn, repeat: int):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Single-pass Python metadata extraction benchmark")
+    parser.add_argument("--paths", nargs="*", default=[], help="Python files to benchmark")
+    parser.add_argument("--modules", nargs="*", default=None,
+                        help=f"Stdlib modules to benchmark (default: {' '.join(DEFAULT_MODULES)})")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    modules = args.modules if args.modules is not None else ([] if args.paths else DEFAULT_MODULES)
+    # radon/ast warnings would dominate the output
+    logging.disable(logging.WARNING)
+    service = MetadataExtractorService()
+
+    print(f"\nPython metadata extraction, median of {args.repeat} runs\n")
+    print(f"{'file':<28}{'lines':>7}{'chunks':>8}{'legacy ms':>11}{'index ms':>10}{'speedup':>9}{'diff':>6}")
+
+    total_legacy = total_index = 0.0
+    for label, source in load_sources(args.paths, modules):
+        chunks = chunks_for(source)
+        legacy_ms, legacy = await timed(lambda: legacy_extract(service, source, chunks), args.repeat)
+        index_ms, indexed = await timed(
+            lambda: service.extract_python_chunks_metadata(source, chunks), args.repeat
+        )
+        total_legacy += legacy_ms
+        total_index += index_ms
+        diff = sum(1 for a, b in zip(legacy, indexed) if a != b)
+        print(f"{label[-27:]:<28}{source.count(chr(10)):>7}{len(chunks):>8}{legacy_ms:>11.1f}"
+              f"{index_ms:>10.1f}{legacy_ms / max(index_ms, 1e-6):>8.1f}x{diff:>6}")
+
+    print(f"\n{'total':<43}{total_legacy:>11.1f}{total_index:>10.1f}"
+          f"{total_legacy / max(total_index, 1e-6):>8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Build the binary-quantised HNSW indexes used by VECTOR_SEARCH_PREFILTER=binary.
+
+For every embedding column, creates with CREATE INDEX CONCURRENTLY (no write lock):
+
+    idx_<table>_<column>_bq ON <table>
+        USING hnsw ((binary_quantize(<column>)::bit(768)) bit_hamming_ops)
+
+The index is over an expression of the existing halfvec column, so no data
+has to be rewritten and new rows are indexed automatically. The 768D
+halfvec HNSW indexes are kept: searches with the prefilter off and the
+filtered ANN planner still use them.
+
+Reports index sizes against the halfvec indexes.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/binary_prefilter_indexes.py --dry-run
+    docker compose exec api python scripts/binary_prefilter_indexes.py
+    docker compose exec api python scripts/binary_prefilter_indexes.py --table memories
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import asyncpg
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.binary_prefilter import (
+    BINARY_COLUMNS,
+    binary_expression,
+    binary_index_name,
+)
+from services.two_stage_search import (
+    FULL_INDEXES,
+    build_coarse_index,
+    coarse_index_ddl,
+    database_dsn,
+    fmt_bytes,
+    index_size,
+)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Create binary-quantised prefilter HNSW indexes")
+    parser.add_argument("--table", choices=sorted({t for t, _ in BINARY_COLUMNS}), default=None,
+                        help="Only index this table (default: all)")
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--dry-run", action="store_true", help="Print the DDL only")
+    args = parser.parse_args()
+
+    targets = [(t, c) for t, c in BINARY_COLUMNS if args.table in (None, t)]
+
+    conn = await asyncpg.connect(database_dsn())
+
+    try:
+        for table, column in targets:
+            name = binary_index_name(table, column)
+            full_name = FULL_INDEXES[(table, column)]
+            create_sql = coarse_index_ddl(
+                name, table, binary_expression(column), "bit_hamming_ops", args.m, args.ef_construction
+            )
+            print(f"\n{table}.{column}")
+            print(f"  {create_sql}")
+            if args.dry_run:
+                continue
+
+            if not await build_coarse_index(conn, name, create_sql):
+                continue
+
+            size = await index_size(conn, name)
+            full_size = await index_size(conn, full_name)
+            ratio = f" ({full_size / size:.1f}x smaller)" if size and full_size else ""
+            print(f"  ✓ {name}: {fmt_bytes(size)} vs {full_name}: {fmt_bytes(full_size)}{ratio}")
+
+        if not args.dry_run:
+            for table in sorted({t for t, _ in targets}):
+                await conn.execute(f"ANALYZE {table}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
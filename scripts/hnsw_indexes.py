@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Inspect and rebuild the HNSW indexes of memories and code_chunks.
+
+    list      indexes with size and validity
+    rebuild   rebuild live indexes without blocking searches or writes
+              (CREATE INDEX CONCURRENTLY + swap), e.g. after mass deletes
+              or to apply new maintenance settings
+    history   recent builds recorded in hnsw_index_builds (bulk loads,
+              re-embedding runs, rebuilds)
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/hnsw_indexes.py list
+    docker compose exec api python scripts/hnsw_indexes.py rebuild --table code_chunks --workers 8
+    docker compose exec api python scripts/hnsw_indexes.py history --limit 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.hnsw_index_maintenance import HNSW_TABLES, HnswIndexMaintenance
+from services.two_stage_search import fmt_bytes
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Inspect and rebuild HNSW indexes")
+    parser.add_argument("command", choices=["list", "rebuild", "history"])
+    parser.add_argument("--table", choices=HNSW_TABLES, default=None, help="Only this table (default: all)")
+    parser.add_argument("--index", default=None, help="rebuild: only this index")
+    parser.add_argument("--work-mem", default=None, help="maintenance_work_mem (default: HNSW_MAINTENANCE_WORK_MEM)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="max_parallel_maintenance_workers (default: HNSW_MAINTENANCE_WORKERS)")
+    parser.add_argument("--limit", type=int, default=20, help="history: rows to show")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "postgresql://mnemo:mnemopass@db:5432/mnemolite")
+    maintenance = HnswIndexMaintenance(
+        database_url, maintenance_work_mem=args.work_mem, parallel_workers=args.workers
+    )
+
+    if args.command == "list":
+        print(f"{'table':<14}{'index':<44}{'size':>12}  valid")
+        for index in await maintenance.list_indexes(args.table):
+            print(f"{index.table:<14}{index.name:<44}{fmt_bytes(index.size_bytes):>12}  {index.valid}")
+
+    elif args.command == "rebuild":
+        indexes = [i for i in await maintenance.list_indexes(args.table)
+                   if args.index in (None, i.name)]
+        if not indexes:
+            print("No matching HNSW index")
+            sys.exit(1)
+        failed = False
+        for index in indexes:
+            print(f"\n{index.table}.{index.name} ({fmt_bytes(index.size_bytes)})")
+            build = await maintenance.swap(index)
+            if build.status == "completed":
+                print(f"  ✓ rebuilt in {build.seconds:.1f}s: {fmt_bytes(build.size_bytes)}"
+                      f" ({build.table_rows} rows)")
+            else:
+                failed = True
+                print(f"  ✗ {build.error} (old index kept)")
+        if failed:
+            sys.exit(1)
+
+    else:
+        print(f"{'started':<27}{'index':<40}{'operation':<11}{'status':<11}{'time':>9}{'size':>12}")
+        for row in await maintenance.history(args.limit):
+            print(f"{str(row['started_at'])[:26]:<27}{row['index_name'][:39]:<40}{row['operation']:<11}"
+                  f"{row['status']:<11}{row['duration_ms'] / 1000:>8.1f}s{fmt_bytes(row['size_bytes']):>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,17 @@ Index entire directory of TypeScript/JavaScript code into MnemoLite.
 
 Usage:
     python scripts/index_directory.py /path/to/code --repository name
+    python scripts/index_directory.py /path/to/code --workers 8 --embed-batch-size 128
+
+Continue an interrupted run (per-file checkpoints; files already indexed
+with the same content are skipped):
+    python scripts/index_directory.py /path/to/code --resume
+
+Initial import of a large repository (binary COPY across files; the HNSW
+indexes are dropped once the load reaches HNSW_DEFER_ROW_THRESHOLD chunks and
+rebuilt with parallel workers at the end):
+    python scripts/index_directory.py /path/to/code --bulk-load
+    python scripts/index_directory.py /path/to/code --bulk-load --defer-indexes never
 """
 
 import asyncio
@@ -27,10 +38,13 @@ class FileProcessingResult:
     error_message: str = ""
 
 
-async def cleanup_repository(repository: str, engine):
+async def cleanup_repository(repository: str, engine, keep_chunks: bool = False):
     """
     Delete all existing data for a repository before reindexing.
 
+    With keep_chunks only the graph is deleted (resumed runs rebuild it
+    from the chunks already indexed).
+
     Deletes in order:
     1. edge_weights (FK to edges)
     2. computed_metrics (FK to nodes)
@@ -53,15 +67,19 @@ async def cleanup_repository(repository: str, engine):
 
         await conn.execute(text("DELETE FROM nodes WHERE properties->>'repository' = :repo"), {"repo": repository})
 
-        # Delete chunks by file_path pattern
-        await conn.execute(text("DELETE FROM code_chunks WHERE repository = :repo"), {"repo": repository})
+        if not keep_chunks:
+            # Delete chunks by file_path pattern
+            await conn.execute(text("DELETE FROM code_chunks WHERE repository = :repo"), {"repo": repository})
+
+    await invalidate_repository_caches(repository)
 
 
 async def process_file_atomically(
     file_path: Path,
     repository: str,
     embedding_service,
-    engine
+    engine,
+    bulk_loader=None
 ) -> FileProcessingResult:
     """
     Process a single source file completely and atomically.
@@ -72,13 +90,15 @@ async def process_file_atomically(
     3. Extract metadata for each chunk
     4. Write all data to database in single transaction
 
-    If any step fails, transaction rolls back automatically.
+    If any step fails, transaction rolls back automatically. With a bulk
+    loader, step 4 only buffers the chunks for the next COPY instead.
 
     Args:
         file_path: Path to source file
         repository: Repository name
         embedding_service: Pre-loaded DualEmbeddingService instance
         engine: SQLAlchemy async engine
+        bulk_loader: Optional CodeChunkBulkLoader (bulk-load mode)
 
     Returns:
         FileProcessingResult with success status and count
@@ -145,12 +165,15 @@ async def process_file_atomically(
             chunk_creates.append(chunk_create)
 
         # Step 4: Write to database atomically (single transaction)
-        async with engine.begin() as conn:
-            chunk_repo = CodeChunkRepository(engine, connection=conn)
+        if bulk_loader is not None:
+            chunks_created = bulk_loader.buffer(chunk_creates)
+        else:
+            async with engine.begin() as conn:
+                chunk_repo = CodeChunkRepository(engine, connection=conn)
 
-            for chunk_create in chunk_creates:
-                await chunk_repo.add(chunk_create)
-                chunks_created += 1
+                for chunk_create in chunk_creates:
+                    await chunk_repo.add(chunk_create)
+                    chunks_created += 1
 
         result = FileProcessingResult(
             file_path=file_path,
@@ -229,19 +252,141 @@ def scan_files(directory: Path) -> list[Path]:
     return sorted(filtered)
 
 
+async def start_indexing_run(
+    repository: str,
+    engine,
+    files: list[Path],
+    resume: bool = False,
+    verbose: bool = False
+):
+    """
+    Start the checkpointed run of a pipeline (indexing_checkpoints / indexing_runs).
+
+    Without resume the repository is wiped (chunks, graph, checkpoints) and
+    every file is pending. With resume, files already indexed with the same
+    content are skipped; the chunks of every other file (written before a
+    crash but not checkpointed, changed or deleted since) and the graph are
+    deleted instead, so nothing is duplicated.
+
+    Returns:
+        (checkpoints, pending [(file_path, content_hash)], skipped file count)
+    """
+    from services.indexing_checkpoint_service import IndexingCheckpointService, file_hash
+
+    checkpoints = IndexingCheckpointService(engine)
+    if not resume:
+        if verbose:
+            print(f"\n🧹 Cleaning up existing data for repository: {repository}")
+        await cleanup_repository(repository, engine)
+        await checkpoints.clear(repository)
+        await checkpoints.start_run(repository, len(files), source="cli")
+        return checkpoints, [(f, file_hash(f)) for f in files], 0
+
+    # Started first: files checkpointed by earlier runs count as skipped
+    await checkpoints.start_run(repository, len(files), source="cli", resume=True)
+    pending, completed = await checkpoints.pending_files(repository, files)
+    await cleanup_repository(repository, engine, keep_chunks=True)
+    purged = await checkpoints.purge_unfinished(repository, completed)
+    if verbose:
+        print(f"\n⏩ Resuming: {len(completed)} files already indexed, {len(pending)} to index "
+              f"({purged} stale chunks removed)")
+    return checkpoints, pending, len(completed)
+
+
+async def finish_indexing_run(checkpoints, repository: str, completed: bool, chunks_durable: bool = True):
+    """
+    Write the last checkpoints and close the run.
+
+    Checkpoints of files whose chunks never reached the database (bulk load
+    interrupted before its final COPY) are dropped: a resume redoes them.
+    """
+    if completed or chunks_durable:
+        await checkpoints.flush()
+    await checkpoints.finish_run(repository, "completed" if completed else "interrupted")
+    run = await checkpoints.get_run(repository)
+    return run.to_dict() if run else None
+
+
+async def refresh_repository_stats(repository: str, engine):
+    """
+    Refresh the dashboard statistics (repository_stats) after a run.
+
+    The run wiped the repository (or purged unfinished files on resume), so
+    every file is recomputed; also after an interrupted run, whose chunks
+    written so far stay in the database.
+    """
+    from services.repository_stats_service import RepositoryStatsService
+
+    await RepositoryStatsService(engine).refresh_chunks(repository)
+
+
+async def connect_cache_redis():
+    """
+    Bind the repository generations to the Redis shared with the API.
+
+    Code search and graph caches of the API, MCP server and batch consumer
+    are scoped by the generation counters in Redis; the bumps of this run
+    must land there too (batch_indexing_consumer.connect() does the same).
+
+    Returns:
+        The Redis client, None if Redis is unreachable (bumps stay local)
+    """
+    import os
+    import redis.asyncio as redis
+    from services.caches.invalidation_bus import get_invalidation_bus
+    from services.caches.repository_generations import get_repository_generations
+
+    redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
+    client = redis.from_url(redis_url, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception as e:
+        await client.aclose()
+        print(f"⚠️  Redis unreachable ({e}): API search caches keep serving the previous index until their TTL")
+        return None
+    get_repository_generations().bind_redis(client)
+    # Publish-only: the indexer keeps no L1 caches of its own
+    get_invalidation_bus().bind_redis(client)
+    return client
+
+
+async def invalidate_repository_caches(repository: str):
+    """Bump the repository generation: cached search / graph results are dropped."""
+    from services.caches.repository_generations import get_repository_generations
+
+    await get_repository_generations().bump(repository)
+
+
 async def run_streaming_pipeline_sequential(
     directory: Path,
     repository: str,
     verbose: bool = False,
-    engine=None
+    engine=None,
+    bulk_load: bool = False,
+    defer_indexes: bool | None = None,
+    maintenance_workers: int | None = None,
+    resume: bool = False
 ) -> dict:
     """
     Run streaming pipeline: process files one-at-a-time with constant memory.
 
+    Every file is checkpointed (content hash + status); with resume, files
+    already indexed with the same content are skipped (see start_indexing_run).
+
+    With bulk_load, chunks are buffered across files and written with binary
+    COPY. The code_chunks HNSW indexes are dropped for the load and rebuilt
+    with `maintenance_workers` parallel workers: from the start
+    (defer_indexes=True), once the load reaches the row threshold (None) or
+    never (False).
+
     Returns:
-        Dict with statistics: total_files, success_files, error_files, total_chunks, errors
+        Dict with statistics: total_files, skipped_files, success_files, error_files,
+        total_chunks, errors, run (durable counters, across resumes)
+        (and bulk_load throughput in bulk-load mode)
     """
     import os
+    from services.code_chunk_bulk_loader import CodeChunkBulkLoader
+    from services.hnsw_index_maintenance import HnswIndexMaintenance
     from services.dual_embedding_service import DualEmbeddingService
     from sqlalchemy.ext.asyncio import create_async_engine
     from tqdm import tqdm
@@ -255,17 +400,16 @@ async def run_streaming_pipeline_sequential(
     else:
         should_dispose = False
 
-    # Cleanup existing data
-    if verbose:
-        print(f"\n🧹 Cleaning up existing data for repository: {repository}")
-    await cleanup_repository(repository, engine)
-
     # Scan files
     files = scan_files(directory)
 
     if verbose:
         print(f"\n📊 Found {len(files)} files to index")
 
+    checkpoints, pending, skipped = await start_indexing_run(
+        repository, engine, files, resume=resume, verbose=verbose
+    )
+
     # Load embedding model ONCE
     if verbose:
         print(f"\n🔧 Loading embedding model...")
@@ -278,42 +422,323 @@ async def run_streaming_pipeline_sequential(
     total_chunks = 0
     errors = []
 
-    with tqdm(total=len(files), desc="Processing files", disable=not verbose) as pbar:
-        for file_path in files:
-            result = await process_file_atomically(
-                file_path=file_path,
-                repository=repository,
-                embedding_service=embedding_service,
-                engine=engine
-            )
-
-            if result.success:
-                success_count += 1
-                total_chunks += result.chunks_created
-            else:
-                error_count += 1
-                errors.append({
-                    "file": str(file_path),
-                    "error": result.error_message
-                })
-                if verbose:
-                    print(f"\n   ⚠️  Failed: {file_path.name} - {result.error_message}")
-
-            # Force comprehensive memory cleanup
-            embedding_service.force_memory_cleanup()
-            gc.collect()
-            pbar.update(1)
+    bulk_loader = None
+    if bulk_load:
+        bulk_loader = CodeChunkBulkLoader.from_engine(
+            engine, defer_indexes=defer_indexes,
+            maintenance=HnswIndexMaintenance.from_engine(engine, parallel_workers=maintenance_workers)
+        )
+        await bulk_loader.open()
 
-    if should_dispose:
-        await engine.dispose()
+    completed = False
+    try:
+        with tqdm(total=len(pending), desc="Processing files", disable=not verbose) as pbar:
+            for file_path, content_hash in pending:
+                result = await process_file_atomically(
+                    file_path=file_path,
+                    repository=repository,
+                    embedding_service=embedding_service,
+                    engine=engine,
+                    bulk_loader=bulk_loader
+                )
 
-    return {
+                if result.success:
+                    success_count += 1
+                    total_chunks += result.chunks_created
+                    checkpoints.record(repository, file_path, content_hash, chunks=result.chunks_created)
+                else:
+                    error_count += 1
+                    errors.append({
+                        "file": str(file_path),
+                        "error": result.error_message
+                    })
+                    checkpoints.record(repository, file_path, content_hash, error=result.error_message)
+                    if verbose:
+                        print(f"\n   ⚠️  Failed: {file_path.name} - {result.error_message}")
+
+                # COPY outside the per-file error handling: a failed COPY
+                # loses chunks of many files and must abort the load
+                if bulk_loader is not None and bulk_loader.full:
+                    await bulk_loader.flush()
+                    await checkpoints.flush()  # after the COPY that carried their chunks
+                elif bulk_loader is None and checkpoints.full:
+                    await checkpoints.flush()
+
+                # Force comprehensive memory cleanup
+                embedding_service.force_memory_cleanup()
+                gc.collect()
+                pbar.update(1)
+        completed = True
+    finally:
+        if bulk_loader is not None:
+            # Final COPY, then the deferred HNSW rebuild
+            if verbose and bulk_loader.stats.deferred_indexes:
+                print(f"\n🔨 Rebuilding HNSW indexes: {', '.join(bulk_loader.stats.deferred_indexes) or 'none'}")
+            await bulk_loader.close(flush=completed)
+        run = await finish_indexing_run(checkpoints, repository, completed, chunks_durable=bulk_loader is None)
+        await refresh_repository_stats(repository, engine)
+        await invalidate_repository_caches(repository)
+        if should_dispose:
+            await engine.dispose()
+
+    stats = {
         "total_files": len(files),
+        "skipped_files": skipped,
         "success_files": success_count,
         "error_files": error_count,
         "total_chunks": total_chunks,
-        "errors": errors
+        "errors": errors,
+        "run": run
     }
+    if bulk_loader is not None:
+        stats["bulk_load"] = bulk_loader.stats.to_dict()
+    return stats
+
+
+@dataclass
+class FileChunks:
+    """One file travelling through the streaming pipeline."""
+    file_path: Path
+    content_hash: str | None
+    chunks: list
+
+
+_END = None  # end-of-stream marker on the pipeline queues
+
+
+async def run_streaming_pipeline(
+    directory: Path,
+    repository: str,
+    verbose: bool = False,
+    engine=None,
+    n_jobs: int = 4,
+    embed_batch_size: int = 64,
+    queue_size: int = 16,
+    bulk_load: bool = False,
+    defer_indexes: bool | None = None,
+    maintenance_workers: int | None = None,
+    resume: bool = False
+) -> dict:
+    """
+    Run the bounded streaming pipeline:
+
+        scanner -> chunkers (n_jobs) -> embedding batcher -> DB writer
+
+    Stages are connected by bounded asyncio queues, so a slow stage applies
+    backpressure upstream and at most ~queue_size files (plus one embedding
+    batch) are in memory at any time, whatever the repository size. Chunkers
+    parse in the chunking service's thread pool and the batcher encodes
+    chunks of several files in one model call (off the event loop), so
+    parsing, embedding and database writes overlap.
+
+    Each file is written in its own transaction (one multi-row INSERT), or
+    buffered for binary COPY with bulk_load (see run_streaming_pipeline_sequential
+    for defer_indexes / maintenance_workers). The writer checkpoints files once
+    their chunks are durable; with resume, completed files are skipped.
+
+    Returns:
+        Dict with statistics: total_files, skipped_files, success_files, error_files,
+        total_chunks, errors, files_per_second, chunks_per_second, run (durable
+        counters, across resumes) (and bulk_load throughput in bulk-load mode)
+    """
+    import os
+    import time
+    from services.code_chunking_service import CodeChunkingService
+    from services.metadata_extractor_service import get_metadata_extractor_service
+    from services.code_chunk_bulk_loader import CodeChunkBulkLoader
+    from services.hnsw_index_maintenance import HnswIndexMaintenance
+    from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
+    from db.repositories.code_chunk_repository import CodeChunkRepository
+    from models.code_chunk_models import CodeChunkCreate
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    n_jobs = max(1, n_jobs)
+
+    # Database setup
+    if engine is None:
+        db_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+        engine = create_async_engine(db_url, echo=False)
+        should_dispose = True
+    else:
+        should_dispose = False
+
+    files = scan_files(directory)
+    if verbose:
+        print(f"\n📊 Found {len(files)} files to index ({n_jobs} chunkers, batches of {embed_batch_size} chunks)")
+
+    checkpoints, pending, skipped = await start_indexing_run(
+        repository, engine, files, resume=resume, verbose=verbose
+    )
+
+    # Load models ONCE, shared by all stages
+    os.environ["EMBEDDING_MODE"] = "real"
+    embedding_service = DualEmbeddingService()
+    chunking_service = CodeChunkingService(
+        max_workers=n_jobs, metadata_service=get_metadata_extractor_service()
+    )
+
+    file_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * n_jobs)
+    chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    stats = {"success_files": 0, "error_files": 0, "total_chunks": 0}
+    errors = []
+
+    bulk_loader = None
+    if bulk_load:
+        bulk_loader = CodeChunkBulkLoader.from_engine(
+            engine, defer_indexes=defer_indexes,
+            maintenance=HnswIndexMaintenance.from_engine(engine, parallel_workers=maintenance_workers)
+        )
+        await bulk_loader.open()
+
+    pbar = tqdm(total=len(pending), desc="Indexing files", disable=not verbose)
+
+    def file_done(file_path: Path, content_hash: str | None, chunks_created: int = 0, error: str | None = None):
+        if error is None:
+            stats["success_files"] += 1
+            stats["total_chunks"] += chunks_created
+        else:
+            stats["error_files"] += 1
+            errors.append({"file": str(file_path), "error": error})
+            if verbose:
+                print(f"\n   ⚠️  Failed: {file_path.name} - {error}")
+        checkpoints.record(repository, file_path, content_hash, chunks=chunks_created, error=error)
+        pbar.update(1)
+
+    async def scanner():
+        for item in pending:
+            await file_queue.put(item)
+        for _ in range(n_jobs):
+            await file_queue.put(_END)
+
+    async def chunker():
+        while (item := await file_queue.get()) is not _END:
+            file_path, content_hash = item
+            try:
+                content = file_path.read_text(encoding="utf-8")
+                chunks = await chunking_service.chunk_code(
+                    source_code=content,
+                    language=detect_language(file_path),
+                    file_path=str(file_path)
+                )
+            except Exception as e:
+                file_done(file_path, content_hash, error=str(e))
+                continue
+            if not chunks:
+                file_done(file_path, content_hash)  # empty or filtered: not an error
+                continue
+            await chunk_queue.put(FileChunks(file_path, content_hash, chunks))
+        await chunk_queue.put(_END)
+
+    async def embed(batch: list[FileChunks]):
+        texts = [chunk.source_code for item in batch for chunk in item.chunks]
+        try:
+            embeddings = iter(await embedding_service.generate_embeddings_batch(
+                texts, domain=EmbeddingDomain.CODE, show_progress_bar=False
+            ))
+        except Exception as e:
+            for item in batch:
+                file_done(item.file_path, item.content_hash, error=f"embedding: {e}")
+            return
+        for item in batch:
+            item.chunks = [
+                CodeChunkCreate(
+                    file_path=chunk.file_path,
+                    language=chunk.language,
+                    chunk_type=chunk.chunk_type,
+                    name=chunk.name,
+                    source_code=chunk.source_code,
+                    start_line=chunk.start_line,
+                    end_line=chunk.end_line,
+                    repository=repository,
+                    metadata=chunk.metadata,
+                    embedding_text=None,
+                    embedding_code=next(embeddings)['code']
+                )
+                for chunk in item.chunks
+            ]
+            await write_queue.put(item)
+
+    async def batcher():
+        # Chunks of several files per model call
+        batch, batch_chunks, running = [], 0, n_jobs
+        while running:
+            item = await chunk_queue.get()
+            if item is _END:
+                running -= 1
+                continue
+            batch.append(item)
+            batch_chunks += len(item.chunks)
+            if batch_chunks >= embed_batch_size:
+                await embed(batch)
+                batch, batch_chunks = [], 0
+        if batch:
+            await embed(batch)
+        await write_queue.put(_END)
+
+    async def writer():
+        chunk_repo = CodeChunkRepository(engine)
+        while (item := await write_queue.get()) is not _END:
+            if bulk_loader is not None:
+                # A failed COPY loses chunks of many files: abort the run
+                file_done(item.file_path, item.content_hash, bulk_loader.buffer(item.chunks))
+                if bulk_loader.full:
+                    await bulk_loader.flush()
+                    await checkpoints.flush()  # after the COPY that carried their chunks
+                continue
+            try:
+                async with engine.begin() as conn:
+                    await chunk_repo.add_batch(item.chunks, connection=conn)
+                file_done(item.file_path, item.content_hash, len(item.chunks))
+            except Exception as e:
+                file_done(item.file_path, item.content_hash, error=str(e))
+            if checkpoints.full:
+                await checkpoints.flush()
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(scanner()), asyncio.create_task(batcher()), asyncio.create_task(writer())]
+    tasks += [asyncio.create_task(chunker()) for _ in range(n_jobs)]
+    completed = False
+    try:
+        # A failing stage would leave the others blocked on full/empty queues
+        done, unfinished = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+        for task in done:
+            task.result()
+        completed = True
+    finally:
+        pbar.close()
+        if bulk_loader is not None:
+            await bulk_loader.close(flush=completed)
+        run = await finish_indexing_run(checkpoints, repository, completed, chunks_durable=bulk_loader is None)
+        await refresh_repository_stats(repository, engine)
+        await invalidate_repository_caches(repository)
+        embedding_service.force_memory_cleanup()
+        if should_dispose:
+            await engine.dispose()
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "total_files": len(files),
+        "skipped_files": skipped,
+        "success_files": stats["success_files"],
+        "error_files": stats["error_files"],
+        "total_chunks": stats["total_chunks"],
+        "errors": errors,
+        "files_per_second": round(len(pending) / elapsed, 1) if elapsed else 0.0,
+        "chunks_per_second": round(stats["total_chunks"] / elapsed, 1) if elapsed else 0.0,
+        "run": run,
+    }
+    if bulk_loader is not None:
+        result["bulk_load"] = bulk_loader.stats.to_dict()
+    return result
+
+
+# Worker-count entry point (n_jobs chunkers)
+run_parallel_pipeline = run_streaming_pipeline
 
 
 def parse_args():
@@ -337,6 +762,54 @@ def parse_args():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent chunkers in the streaming pipeline (default: 4)"
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=64,
+        help="Chunks per embedding model call, across files (default: 64)"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=16,
+        help="Files buffered between pipeline stages; bounds memory (default: 16)"
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Process one file at a time, one embedding call per chunk (legacy mode)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep the existing index and skip files already indexed with the same content "
+             "(continues an interrupted run; also works as an incremental reindex)"
+    )
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Write chunks with binary COPY, batched across files (initial imports)"
+    )
+    parser.add_argument(
+        "--defer-indexes",
+        choices=["auto", "always", "never"],
+        default="auto",
+        help="With --bulk-load: drop the code_chunks HNSW indexes during the load and rebuild them after "
+             "(auto: once HNSW_DEFER_ROW_THRESHOLD chunks are loaded). Vector search is slow for ALL "
+             "repositories meanwhile"
+    )
+    parser.add_argument(
+        "--maintenance-workers",
+        type=int,
+        default=None,
+        help="Parallel workers for the HNSW rebuild (default: HNSW_MAINTENANCE_WORKERS or 4)"
+    )
     return parser.parse_args()
 
 
@@ -810,18 +1283,40 @@ async def main():
     db_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
     engine = create_async_engine(db_url, echo=False)
 
-    # Run sequential indexing pipeline
-    print("\n🐌 Running in SEQUENTIAL mode")
-    stats = await run_streaming_pipeline_sequential(
-        directory, repository, verbose=args.verbose, engine=engine
+    if args.defer_indexes != "auto" and not args.bulk_load:
+        print("❌ --defer-indexes requires --bulk-load")
+        sys.exit(1)
+
+    # Cache invalidation reaches the API and MCP server through Redis
+    redis_client = await connect_cache_redis()
+
+    load_options = dict(
+        resume=args.resume,
+        bulk_load=args.bulk_load,
+        defer_indexes={"auto": None, "always": True, "never": False}[args.defer_indexes],
+        maintenance_workers=args.maintenance_workers
     )
+    if args.sequential:
+        print("\n🐌 Running in SEQUENTIAL mode" + (" (bulk load)" if args.bulk_load else ""))
+        stats = await run_streaming_pipeline_sequential(
+            directory, repository, verbose=args.verbose, engine=engine, **load_options
+        )
+    else:
+        print(f"\n🚀 Running STREAMING pipeline ({args.workers} chunkers)" + (" (bulk load)" if args.bulk_load else ""))
+        stats = await run_streaming_pipeline(
+            directory, repository, verbose=args.verbose, engine=engine,
+            n_jobs=args.workers, embed_batch_size=args.embed_batch_size,
+            queue_size=args.queue_size, **load_options
+        )
 
     # Run Phase 4: Graph Construction
-    if stats['success_files'] > 0:
+    if stats['success_files'] > 0 or stats['skipped_files'] > 0:
         graph_stats = await build_graph_phase(repository, engine)
         stats['graph'] = graph_stats
 
     await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
 
     elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -830,9 +1325,23 @@ async def main():
     print("✅ INDEXING COMPLETE")
     print("=" * 80)
     print(f"   - Total files: {stats['total_files']}")
+    if stats['skipped_files']:
+        print(f"   - Skipped (already indexed): {stats['skipped_files']}")
     print(f"   - Success: {stats['success_files']} ({stats['success_files']*100//stats['total_files'] if stats['total_files'] > 0 else 0}%)")
     print(f"   - Errors: {stats['error_files']}")
     print(f"   - Total chunks: {stats['total_chunks']}")
+    if 'chunks_per_second' in stats:
+        print(f"   - Throughput: {stats['files_per_second']:.1f} files/s, {stats['chunks_per_second']:.1f} chunks/s")
+    if stats['run'] and stats['run']['resumes']:
+        run = stats['run']
+        print(f"   - Whole run ({run['resumes']} resumes): {run['processed_files']} files, {run['chunks']} chunks, "
+              f"{run['files_per_second']:.1f} files/s over {run['active_seconds']:.0f}s")
+    if 'bulk_load' in stats:
+        bulk = stats['bulk_load']
+        print(f"   - COPY: {bulk['chunks']} chunks in {bulk['copies']} batches, "
+              f"{bulk['chunks_per_second']:.0f} chunks/s")
+        if bulk['deferred_indexes']:
+            print(f"   - HNSW rebuild: {len(bulk['deferred_indexes'])} indexes in {bulk['index_seconds']:.1f}s")
     if 'graph' in stats:
         print(f"   - Graph nodes: {stats['graph'].get('total_nodes', 0)}")
         print(f"   - Graph edges: {stats['graph'].get('total_edges', 0)}")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Build the reduced-dimension (Matryoshka) HNSW indexes for two-stage search.
+
+For every embedding column enabled in EMBEDDING_MRL_DIM / EMBEDDING_MRL_CODE_DIM
+(or --dim / --code-dim), creates, with CREATE INDEX CONCURRENTLY (no write lock):
+
+    idx_<table>_<column>_mrl<dim> ON <table>
+        USING hnsw ((subvector(<column>, 1, <dim>)::halfvec(<dim>)) halfvec_cosine_ops)
+
+The index is over an expression of the existing halfvec column, so no data
+has to be rewritten and new rows are indexed automatically. Once the
+reduced indexes serve all searches, --drop-full-indexes removes the 768D
+HNSW indexes (the full vectors stay; rescoring reads them by id). Without
+those indexes, searches with EMBEDDING_MRL_* disabled fall back to
+sequential scans: drop them only after enabling two-stage search.
+
+Reports index sizes before/after.
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/matryoshka_backfill.py --dim 256 --dry-run
+    docker compose exec api python scripts/matryoshka_backfill.py --dim 256
+    docker compose exec api python scripts/matryoshka_backfill.py --dim 256 --drop-full-indexes
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import asyncpg
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.matryoshka_search import (
+    FULL_DIMENSION,
+    MRL_COLUMNS,
+    mrl_index_name,
+    truncated_expression,
+)
+from services.two_stage_search import (
+    FULL_INDEXES,
+    build_coarse_index,
+    coarse_index_ddl,
+    database_dsn,
+    fmt_bytes,
+    index_size,
+)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Create Matryoshka reduced-dimension HNSW indexes")
+    parser.add_argument("--dim", type=int, default=int(os.getenv("EMBEDDING_MRL_DIM", "0")),
+                        help="Coarse dimension for TEXT columns (0 = skip)")
+    parser.add_argument("--code-dim", type=int, default=int(os.getenv("EMBEDDING_MRL_CODE_DIM", "0")),
+                        help="Coarse dimension for CODE columns (0 = skip)")
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=128)
+    parser.add_argument("--drop-full-indexes", action="store_true",
+                        help="Drop the 768D HNSW indexes of the converted columns")
+    parser.add_argument("--dry-run", action="store_true", help="Print the DDL only")
+    args = parser.parse_args()
+
+    targets = []
+    for (table, column), domain in MRL_COLUMNS.items():
+        dim = args.dim if domain == "TEXT" else args.code_dim
+        if dim <= 0:
+            continue
+        if dim >= FULL_DIMENSION:
+            print(f"Skipping {table}.{column}: dim {dim} is not below {FULL_DIMENSION}")
+            continue
+        targets.append((table, column, dim))
+
+    if not targets:
+        print("No dimension configured (--dim / --code-dim or EMBEDDING_MRL_DIM) - nothing to do")
+        return
+
+    conn = await asyncpg.connect(database_dsn())
+
+    try:
+        for table, column, dim in targets:
+            name = mrl_index_name(table, column, dim)
+            full_name = FULL_INDEXES[(table, column)]
+            create_sql = coarse_index_ddl(
+                name, table, truncated_expression(column, dim), "halfvec_cosine_ops", args.m, args.ef_construction
+            )
+            print(f"\n{table}.{column} -> {dim}D")
+            print(f"  {create_sql}")
+            if args.drop_full_indexes:
+                print(f"  DROP INDEX CONCURRENTLY IF EXISTS {full_name}")
+            if args.dry_run:
+                continue
+
+            full_before = await index_size(conn, full_name)
+            if not await build_coarse_index(conn, name, create_sql):
+                continue
+            reduced = await index_size(conn, name)
+
+            if args.drop_full_indexes:
+                await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {full_name}")
+
+            saved = (
+                f" ({100 * (1 - reduced / full_before):.0f}% smaller)"
+                if full_before and reduced else ""
+            )
+            print(f"  ✓ {name}: {fmt_bytes(reduced)} vs {full_name}: {fmt_bytes(full_before)}{saved}")
+
+        if not args.dry_run:
+            for table in sorted({t for t, _, _ in targets}):
+                await conn.execute(f"ANALYZE {table}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
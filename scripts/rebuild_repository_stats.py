@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialised dashboard statistics (repository_stats).
+
+The indexing and graph pipelines refresh a repository's row whenever they
+write to it. Run this after writing code_chunks / nodes / edges outside
+those pipelines (manual SQL, restores, old workers) to repair drift: every
+file and repository row is recomputed and rows of vanished repositories
+are dropped. Only one rebuild runs at a time (advisory lock, shared with
+the rebuild the API runs on its first start after the migration).
+
+Usage (inside Docker container):
+    docker compose exec api python scripts/rebuild_repository_stats.py
+    docker compose exec api python scripts/rebuild_repository_stats.py --repository MnemoLite
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "api"))
+sys.path.insert(0, "/app")
+
+from services.repository_stats_service import RepositoryStatsService
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Rebuild repository_stats from code_chunks, nodes and edges")
+    parser.add_argument("--repository", default=None, help="Only refresh this repository (default: all)")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL", "postgresql+asyncpg://mnemo:mnemopass@db:5432/mnemolite")
+    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url, echo=False)
+
+    try:
+        stats = RepositoryStatsService(engine)
+        if args.repository is not None:
+            if not await stats.refresh(args.repository):
+                print(f"✗ Failed to refresh '{args.repository}' (see logs)")
+                sys.exit(1)
+        else:
+            refreshed = await stats.rebuild_all()
+            if refreshed is None:
+                print("✗ Another rebuild is running (advisory lock held)")
+                sys.exit(1)
+            print(f"Refreshed {refreshed} repositories")
+
+        print(f"\n{'repository':<32}{'files':>8}{'chunks':>9}{'functions':>11}{'nodes':>8}{'edges':>8}")
+        for row in await stats.list_stats():
+            if args.repository is not None and row["repository"] != args.repository:
+                continue
+            print(f"{(row['repository'] or '<none>')[:31]:<32}{row['file_count']:>8}{row['chunk_count']:>9}"
+                  f"{row['function_count']:>11}{row['node_count']:>8}{row['edge_count']:>8}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,6 +13,10 @@ Usage (inside Docker container):
 
     # Limit for testing:
     docker compose exec api python scripts/reindex_memories_e5.py --limit 100
+
+Rewriting at least HNSW_DEFER_ROW_THRESHOLD embeddings drops the memories
+HNSW indexes for the run and rebuilds them at the end in one parallel build
+(--defer-indexes always/never overrides).
 """
 
 import asyncio
@@ -24,10 +28,12 @@ import argparse
 sys.path.insert(0, '/app')
 
 
-async def reindex_memories(dry_run: bool = False, limit: int = None, batch_size: int = 32):
+async def reindex_memories(dry_run: bool = False, limit: int = None, batch_size: int = 32,
+                           defer_indexes: str = "auto"):
     """Re-generate embeddings for all memories using current EMBEDDING_MODEL."""
     from sqlalchemy.ext.asyncio import create_async_engine
     from sqlalchemy import text
+    from services.hnsw_index_maintenance import HnswIndexMaintenance
     from services.sentence_transformer_embedding_service import (
         SentenceTransformerEmbeddingService,
         TextType,
@@ -76,68 +82,80 @@ async def reindex_memories(dry_run: bool = False, limit: int = None, batch_size:
 
     start_time = time.time()
 
-    while processed < total_to_process:
-        # Fetch batch
-        async with engine.begin() as conn:
-            result = await conn.execute(text("""
-                SELECT id, title, content
-                FROM memories
-                WHERE deleted_at IS NULL
-                ORDER BY created_at
-                LIMIT :batch_size OFFSET :offset
-            """), {"batch_size": batch_size, "offset": offset})
-            rows = result.fetchall()
-
-        if not rows:
-            break
-
-        # Generate embeddings for batch
-        texts = []
-        ids = []
-        for row in rows:
-            memory_id, title, content = row
-            # Build embedding source from title + content
-            text_for_embedding = f"{title or ''}\n\n{content or ''}"[:8000]  # Limit length
-            if text_for_embedding.strip():
-                texts.append(text_for_embedding)
-                ids.append(str(memory_id))
-
-        if texts:
-            try:
-                # Batch encode with DOCUMENT type (passage: prefix for E5)
-                embeddings = await service.generate_embeddings_batch(
-                    texts,
-                    text_type=TextType.DOCUMENT
-                )
-
-                # Update database
-                async with engine.begin() as conn:
-                    for memory_id, embedding in zip(ids, embeddings):
-                        await conn.execute(text("""
-                            UPDATE memories
-                            SET embedding = :embedding
-                            WHERE id = :id
-                        """), {
-                            "id": memory_id,
-                            "embedding": str(embedding)
-                        })
-
-                processed += len(texts)
-
-            except Exception as e:
-                print(f"\n  ERROR: {e}")
-                errors += len(texts)
-                processed += len(texts)
-
-        offset += batch_size
-
-        # Progress
-        elapsed = time.time() - start_time
-        rate = processed / elapsed if elapsed > 0 else 0
-        eta = (total_to_process - processed) / rate if rate > 0 else 0
-
-        print(f"\r  Progress: {processed}/{total_to_process} ({processed*100/total_to_process:.1f}%) "
-              f"| Rate: {rate:.1f}/s | ETA: {eta/60:.1f}min", end="", flush=True)
+    maintenance = HnswIndexMaintenance.from_engine(engine)
+    deferred = []
+    if defer_indexes == "always" or (defer_indexes == "auto" and maintenance.should_defer(total_to_process)):
+        deferred = await maintenance.drop("memories")
+        print(f"Deferred HNSW indexes: {', '.join(i.name for i in deferred) or 'none'}")
+
+    try:
+        while processed < total_to_process:
+            # Fetch batch
+            async with engine.begin() as conn:
+                result = await conn.execute(text("""
+                    SELECT id, title, content
+                    FROM memories
+                    WHERE deleted_at IS NULL
+                    ORDER BY created_at
+                    LIMIT :batch_size OFFSET :offset
+                """), {"batch_size": batch_size, "offset": offset})
+                rows = result.fetchall()
+
+            if not rows:
+                break
+
+            # Generate embeddings for batch
+            texts = []
+            ids = []
+            for row in rows:
+                memory_id, title, content = row
+                # Build embedding source from title + content
+                text_for_embedding = f"{title or ''}\n\n{content or ''}"[:8000]  # Limit length
+                if text_for_embedding.strip():
+                    texts.append(text_for_embedding)
+                    ids.append(str(memory_id))
+
+            if texts:
+                try:
+                    # Batch encode with DOCUMENT type (passage: prefix for E5)
+                    embeddings = await service.generate_embeddings_batch(
+                        texts,
+                        text_type=TextType.DOCUMENT
+                    )
+
+                    # Update database
+                    async with engine.begin() as conn:
+                        for memory_id, embedding in zip(ids, embeddings):
+                            await conn.execute(text("""
+                                UPDATE memories
+                                SET embedding = :embedding
+                                WHERE id = :id
+                            """), {
+                                "id": memory_id,
+                                "embedding": str(embedding)
+                            })
+
+                    processed += len(texts)
+
+                except Exception as e:
+                    print(f"\n  ERROR: {e}")
+                    errors += len(texts)
+                    processed += len(texts)
+
+            offset += batch_size
+
+            # Progress
+            elapsed = time.time() - start_time
+            rate = processed / elapsed if elapsed > 0 else 0
+            eta = (total_to_process - processed) / rate if rate > 0 else 0
+
+            print(f"\r  Progress: {processed}/{total_to_process} ({processed*100/total_to_process:.1f}%) "
+                  f"| Rate: {rate:.1f}/s | ETA: {eta/60:.1f}min", end="", flush=True)
+    finally:
+        if deferred:
+            print("\n\nRebuilding HNSW indexes...")
+            for build in await maintenance.build(deferred, operation="reembed"):
+                print(f"  {build.index}: {build.seconds:.1f}s, {(build.size_bytes or 0) / 1024 / 1024:.1f} MB")
 
     elapsed = time.time() - start_time
 
@@ -155,12 +173,16 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show counts only")
     parser.add_argument("--limit", type=int, help="Limit number of memories to process")
     parser.add_argument("--batch-size", type=int, default=32, help="Batch size (default: 32)")
+    parser.add_argument("--defer-indexes", choices=["auto", "always", "never"], default="auto",
+                        help="Drop the memories HNSW indexes during the run and rebuild them after "
+                             "(auto: from HNSW_DEFER_ROW_THRESHOLD memories)")
     args = parser.parse_args()
 
     asyncio.run(reindex_memories(
         dry_run=args.dry_run,
         limit=args.limit,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        defer_indexes=args.defer_indexes
     ))
 
 
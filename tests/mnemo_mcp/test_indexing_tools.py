@@ -1,7 +1,8 @@
 """
 Tests for MCP Indexing Tools (EPIC-23 Story 23.5).
 
-Tests IndexProjectTool and ReindexFileTool for project indexing and file re-indexing.
+Tests IndexProjectTool, IndexMarkdownWorkspaceTool (queued jobs), ReindexFileTool
+and GetIndexingStatusTool.
 """
 
 from datetime import datetime
@@ -10,7 +11,12 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from mnemo_mcp.tools.indexing_tools import IndexProjectTool, ReindexFileTool
+from mnemo_mcp.tools.indexing_tools import (
+    GetIndexingStatusTool,
+    IndexMarkdownWorkspaceTool,
+    IndexProjectTool,
+    ReindexFileTool,
+)
 
 
 # ============================================================================
@@ -35,30 +41,25 @@ class TestIndexProjectTool:
         assert "index" in desc.lower()
         assert "project" in desc.lower()
 
+    def _jobs(self, status="pending"):
+        jobs = MagicMock()
+        jobs.submit = AsyncMock(return_value={
+            "job_id": "job-1", "total_files": 2, "total_batches": 1, "status": status,
+        })
+        return jobs
+
     @pytest.mark.asyncio
-    async def test_index_project_success(self, tmp_path):
-        """Test successful project indexing."""
-        # Create test project
+    async def test_index_project_queues_a_job(self, tmp_path):
+        """Test indexing is queued in the batch pipeline, not run in the call."""
         (tmp_path / "main.py").write_text("print('hello')")
         (tmp_path / "utils.py").write_text("def util(): pass")
+        (tmp_path / "notes.bin").write_text("unsupported")
 
-        # Mock services
         mock_indexing_service = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.repository = "test-repo"
-        mock_result.indexed_files = 2
-        mock_result.indexed_chunks = 5
-        mock_result.indexed_nodes = 3
-        mock_result.indexed_edges = 2
-        mock_result.failed_files = 0
-        mock_result.processing_time_ms = 100.0
-        mock_result.errors = []
-
-        mock_indexing_service.index_repository = AsyncMock(return_value=mock_result)
-
+        jobs = self._jobs()
         self.tool._services = {
             "code_indexing_service": mock_indexing_service,
-            "redis": None  # Test without Redis
+            "indexing_jobs": jobs,
         }
 
         result = await self.tool.execute(
@@ -68,14 +69,18 @@ class TestIndexProjectTool:
         )
 
         assert result["success"] is True
-        assert result["repository"] == "test-repo"
-        assert result["indexed_files"] == 2
-        assert result["indexed_chunks"] == 5
-        assert mock_indexing_service.index_repository.called
+        assert result["job_id"] == "job-1"
+        assert result["status"] == "queued"
+        assert "get_indexing_status" in result["message"]
+        repository, files = jobs.submit.await_args.args
+        assert repository == "test-repo"
+        assert sorted(f.name for f in files) == ["main.py", "utils.py"]
+        assert jobs.submit.await_args.kwargs == {"kind": "code"}
+        assert not mock_indexing_service.index_repository.called
 
     @pytest.mark.asyncio
-    async def test_index_project_service_unavailable(self):
-        """Test indexing fails gracefully when service unavailable."""
+    async def test_index_project_queue_unavailable(self):
+        """Test indexing fails gracefully without the job queue (no Redis)."""
         self.tool._services = {}  # No services
 
         result = await self.tool.execute(
@@ -89,12 +94,8 @@ class TestIndexProjectTool:
     @pytest.mark.asyncio
     async def test_index_project_path_not_found(self):
         """Test indexing fails for nonexistent project path."""
-        mock_indexing_service = AsyncMock()
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": None
-        }
+        jobs = self._jobs()
+        self.tool._services = {"indexing_jobs": jobs}
 
         result = await self.tool.execute(
             project_path="/nonexistent/path",
@@ -103,145 +104,13 @@ class TestIndexProjectTool:
 
         assert result["success"] is False
         assert "not found" in result["message"].lower()
+        assert not jobs.submit.called
 
     @pytest.mark.asyncio
-    async def test_index_project_elicitation_yes(self, tmp_path):
-        """Test indexing proceeds for large project (>100 files).
-
-        Note: Elicitation was removed (FastMCP API changed). Code now logs
-        a warning and proceeds without confirmation for large projects.
-        """
-        # Create >100 files to trigger large-project warning
-        for i in range(101):
-            (tmp_path / f"file{i}.py").write_text(f"# File {i}")
-
-        mock_indexing_service = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.repository = "test-repo"
-        mock_result.indexed_files = 101
-        mock_result.indexed_chunks = 101
-        mock_result.indexed_nodes = 101
-        mock_result.indexed_edges = 0
-        mock_result.failed_files = 0
-        mock_result.processing_time_ms = 500.0
-        mock_result.errors = []
-
-        mock_indexing_service.index_repository = AsyncMock(return_value=mock_result)
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": None
-        }
-
-        result = await self.tool.execute(
-            project_path=str(tmp_path),
-            repository="test-repo",
-            include_gitignored=False,
-            ctx=None
-        )
-
-        assert result["success"] is True
-        assert result["indexed_files"] == 101
-        assert mock_indexing_service.index_repository.called
-
-    @pytest.mark.asyncio
-    async def test_index_project_elicitation_no(self, tmp_path):
-        """Test large project indexing proceeds without elicitation.
-
-        Note: Elicitation was removed (FastMCP API changed). Code now logs
-        a warning and proceeds without confirmation for large projects.
-        """
-        # Create >100 files
-        for i in range(101):
-            (tmp_path / f"file{i}.py").write_text(f"# File {i}")
-
-        mock_indexing_service = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.repository = "test-repo"
-        mock_result.indexed_files = 101
-        mock_result.indexed_chunks = 101
-        mock_result.indexed_nodes = 101
-        mock_result.indexed_edges = 0
-        mock_result.failed_files = 0
-        mock_result.processing_time_ms = 500.0
-        mock_result.errors = []
-
-        mock_indexing_service.index_repository = AsyncMock(return_value=mock_result)
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": None
-        }
-
-        result = await self.tool.execute(
-            project_path=str(tmp_path),
-            repository="test-repo",
-            include_gitignored=False,
-            ctx=None
-        )
-
-        # Code proceeds without elicitation (no cancellation)
-        assert result["success"] is True
-        assert result["indexed_files"] == 101
-        assert mock_indexing_service.index_repository.called
-
-    @pytest.mark.asyncio
-    async def test_index_project_with_redis_lock(self, tmp_path):
-        """Test indexing acquires and releases Redis distributed lock."""
-        (tmp_path / "main.py").write_text("# Python")
-
-        # Mock Redis
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock(return_value=True)  # Lock acquired
-        mock_redis.delete = AsyncMock()
-
-        mock_indexing_service = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.repository = "test-repo"
-        mock_result.indexed_files = 1
-        mock_result.indexed_chunks = 1
-        mock_result.indexed_nodes = 1
-        mock_result.indexed_edges = 0
-        mock_result.failed_files = 0
-        mock_result.processing_time_ms = 50.0
-        mock_result.errors = []
-
-        mock_indexing_service.index_repository = AsyncMock(return_value=mock_result)
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": mock_redis
-        }
-
-        result = await self.tool.execute(
-            project_path=str(tmp_path),
-            repository="test-repo"
-        )
-
-        assert result["success"] is True
-        # Verify lock was acquired (first call should be for the lock)
-        assert mock_redis.set.called
-        first_call = mock_redis.set.call_args_list[0]
-        assert "indexing:lock:test-repo" == first_call[0][0]  # First arg of first call
-
-        # Verify lock was released
-        assert mock_redis.delete.called
-
-    @pytest.mark.asyncio
-    async def test_index_project_lock_already_held(self, tmp_path):
-        """Test indexing fails when lock already held (concurrent indexing)."""
+    async def test_index_project_already_running(self, tmp_path):
+        """Test a running job of the repository is reported, not duplicated."""
         (tmp_path / "main.py").write_text("# Python")
-
-        # Mock Redis - lock acquisition fails
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock(return_value=False)  # Lock NOT acquired
-
-        mock_indexing_service = AsyncMock()
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": mock_redis
-        }
+        self.tool._services = {"indexing_jobs": self._jobs(status="already_running")}
 
         result = await self.tool.execute(
             project_path=str(tmp_path),
@@ -249,96 +118,65 @@ class TestIndexProjectTool:
         )
 
         assert result["success"] is False
+        assert result["job_id"] == "job-1"
         assert "already in progress" in result["message"].lower()
-        assert not mock_indexing_service.index_repository.called
-
-    @pytest.mark.asyncio
-    async def test_index_project_redis_unavailable(self, tmp_path):
-        """Test indexing continues when Redis unavailable (graceful degradation)."""
-        (tmp_path / "main.py").write_text("# Python")
-
-        # Mock Redis that raises exception
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock(side_effect=Exception("Redis connection error"))
-
-        mock_indexing_service = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.repository = "test-repo"
-        mock_result.indexed_files = 1
-        mock_result.indexed_chunks = 1
-        mock_result.indexed_nodes = 1
-        mock_result.indexed_edges = 0
-        mock_result.failed_files = 0
-        mock_result.processing_time_ms = 50.0
-        mock_result.errors = []
-
-        mock_indexing_service.index_repository = AsyncMock(return_value=mock_result)
-
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": mock_redis
-        }
 
-        result = await self.tool.execute(
-            project_path=str(tmp_path),
-            repository="test-repo"
-        )
 
-        # Should succeed despite Redis error
-        assert result["success"] is True
-        assert mock_indexing_service.index_repository.called
+class TestIndexMarkdownWorkspaceTool:
+    """Test IndexMarkdownWorkspaceTool."""
 
     @pytest.mark.asyncio
-    async def test_index_project_progress_reporting(self, tmp_path):
-        """Test indexing reports progress via MCP context."""
-        (tmp_path / "file1.py").write_text("# Python")
-        (tmp_path / "file2.py").write_text("# Python")
-
-        mock_ctx = AsyncMock()
-        mock_ctx.report_progress = AsyncMock()
+    async def test_markdown_job_and_stale_sections(self, tmp_path):
+        """Test .md files are queued as a markdown job that prunes removed files."""
+        (tmp_path / "KERNEL.md").write_text("## Kernel")
+        (tmp_path / "HUGE.md").write_text("x" * 4096)
+        (tmp_path / "main.py").write_text("# Python")
 
-        mock_indexing_service = AsyncMock()
+        jobs = MagicMock()
+        jobs.submit = AsyncMock(return_value={
+            "job_id": "job-2", "total_files": 1, "total_batches": 1, "status": "pending",
+        })
+        engine = MagicMock()
 
-        # Capture progress callback
-        progress_callback = None
+        tool = IndexMarkdownWorkspaceTool()
+        tool._services = {"indexing_jobs": jobs, "engine": engine}
 
-        async def capture_callback(*args, **kwargs):
-            nonlocal progress_callback
-            progress_callback = kwargs.get("progress_callback")
+        result = await tool.execute(ctx=None, root_path=str(tmp_path), repository="expanse", max_file_size_kb=1)
 
-            # Simulate some progress reports
-            if progress_callback:
-                await progress_callback(1, 2, "Indexing file 1")
-                await progress_callback(2, 2, "Indexing file 2")
+        assert result["success"] is True and result["job_id"] == "job-2"
+        assert result["scanned"] == 1 and result["skipped_large"] == 1
+        assert [f.name for f in jobs.submit.await_args.args[1]] == ["KERNEL.md"]
+        # Removed files are pruned by the job, not by the tool
+        assert jobs.submit.await_args.kwargs == {"kind": "markdown", "replace": True}
+        engine.begin.assert_not_called()
 
-            mock_result = MagicMock()
-            mock_result.repository = "test-repo"
-            mock_result.indexed_files = 2
-            mock_result.indexed_chunks = 2
-            mock_result.indexed_nodes = 2
-            mock_result.indexed_edges = 0
-            mock_result.failed_files = 0
-            mock_result.processing_time_ms = 100.0
-            mock_result.errors = []
-            return mock_result
 
-        mock_indexing_service.index_repository = capture_callback
+class TestGetIndexingStatusTool:
+    """Test GetIndexingStatusTool."""
 
-        self.tool._services = {
-            "code_indexing_service": mock_indexing_service,
-            "redis": None
-        }
-
-        result = await self.tool.execute(
-            project_path=str(tmp_path),
-            repository="test-repo",
-            ctx=mock_ctx
-        )
-
-        assert result["success"] is True
-        # Progress should have been reported
-        # Note: Due to throttling, not all calls may go through
-        assert progress_callback is not None
+    @pytest.mark.asyncio
+    async def test_follow_reports_progress_until_the_job_ends(self, monkeypatch):
+        """Test follow_seconds streams progress of a running job."""
+        import mnemo_mcp.tools.indexing_tools as tools_module
+
+        states = iter([
+            {"job_id": "job-1", "status": "in_progress", "total_files": 80,
+             "indexed_files": 40, "failed_files": 0, "progress": 0.5},
+            {"job_id": "job-1", "status": "completed", "total_files": 80,
+             "indexed_files": 79, "failed_files": 1, "progress": 1.0},
+        ])
+        monkeypatch.setattr(tools_module, "read_indexing_status", AsyncMock(side_effect=lambda *a: next(states)))
+        monkeypatch.setattr(tools_module.asyncio, "sleep", AsyncMock())
+        ctx = AsyncMock()
+
+        tool = GetIndexingStatusTool()
+        tool._services = {"redis": AsyncMock(), "engine": None}
+        result = await tool.execute(repository="repo", follow_seconds=10, ctx=ctx)
+
+        assert result["status"] == "completed"
+        assert result["job_id"] == "job-1" and result["failed_files"] == 1
+        ctx.report_progress.assert_awaited_once()
+        assert ctx.report_progress.await_args.kwargs["progress"] == 0.5
 
 
 # ============================================================================
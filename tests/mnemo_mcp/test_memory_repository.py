@@ -474,6 +474,99 @@ class TestMemoryRepositoryListMemories:
         assert memories[0].memory_type == MemoryType.DECISION
 
 
+class TestMemoryRepositoryListMemoriesPage:
+    """Tests for list_memories_page (keyset pagination)."""
+
+    @staticmethod
+    def _rows(n):
+        now = datetime.now(timezone.utc)
+        return [
+            MockRow({
+                "id": uuid.uuid4(),
+                "title": f"Memory {i}",
+                "content": f"Content {i}",
+                "created_at": now,
+                "updated_at": now,
+                "memory_type": "note",
+                "tags": "{python}",
+                "author": "Claude",
+                "project_id": None,
+                "embedding_model": "nomic-embed-text-v1.5",
+                "related_chunks": "{}",
+                "resource_links": "[]",
+                "deleted_at": None
+            })
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_page_fetches_one_extra_row(self, repository, mock_engine):
+        """limit + 1 rows fetched, extra row yields a next cursor."""
+        mock_conn = AsyncMock()
+        mock_count_result = MagicMock()
+        mock_count_result.fetchone.return_value = [42]
+        mock_data_result = MagicMock()
+        mock_data_result.fetchall.return_value = self._rows(4)
+        mock_conn.execute = AsyncMock(side_effect=[mock_count_result, mock_data_result])
+        mock_engine.begin.return_value = AsyncContextManagerMock(mock_conn)
+
+        memories, next_cursor, total = await repository.list_memories_page(limit=3)
+
+        assert len(memories) == 3
+        assert total == 42
+        assert next_cursor is not None
+        sql, params = mock_conn.execute.call_args_list[1].args
+        assert "ORDER BY created_at DESC, id DESC" in str(sql)
+        assert "OFFSET" not in str(sql)
+        assert params["limit_plus_one"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_without_count(self, repository, mock_engine):
+        """Cursor adds the keyset predicate; count_mode=none skips COUNT(*)."""
+        from utils.keyset_pagination import encode_cursor
+
+        mock_conn = AsyncMock()
+        mock_data_result = MagicMock()
+        mock_data_result.fetchall.return_value = self._rows(2)
+        mock_conn.execute = AsyncMock(return_value=mock_data_result)
+        mock_engine.begin.return_value = AsyncContextManagerMock(mock_conn)
+
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+        memories, next_cursor, total = await repository.list_memories_page(
+            limit=3, cursor=cursor, count_mode="none"
+        )
+
+        assert len(memories) == 2
+        assert next_cursor is None
+        assert total is None
+        mock_conn.execute.assert_awaited_once()
+        sql, params = mock_conn.execute.call_args.args
+        assert "(created_at, id) < (:cursor_created_at, CAST(:cursor_id AS uuid))" in str(sql)
+        assert "cursor_id" in params
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_uses_planner(self, repository, mock_engine):
+        """count_mode=estimated runs EXPLAIN instead of COUNT(*)."""
+        mock_conn = AsyncMock()
+        mock_explain_result = MagicMock()
+        mock_explain_result.scalar.return_value = '[{"Plan": {"Plan Rows": 12000}}]'
+        mock_data_result = MagicMock()
+        mock_data_result.fetchall.return_value = self._rows(1)
+        mock_conn.execute = AsyncMock(side_effect=[mock_explain_result, mock_data_result])
+        mock_engine.begin.return_value = AsyncContextManagerMock(mock_conn)
+
+        _, _, total = await repository.list_memories_page(limit=3, count_mode="estimated")
+
+        assert total == 12000
+        assert "EXPLAIN" in str(mock_conn.execute.call_args_list[0].args[0])
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self, repository, mock_engine):
+        """Malformed cursors surface as ValueError, not RepositoryError."""
+        with pytest.raises(ValueError):
+            await repository.list_memories_page(limit=3, cursor="not-a-cursor")
+
+
 class TestMemoryRepositorySearchByVector:
     """Tests for search_by_vector method."""
 
@@ -607,3 +607,48 @@ class TestSearchMemoryTool:
             assert "tags" in m
             assert "created_at" in m
             assert "highlights" in m
+
+
+class TestSearchMemoryRedisCache:
+    """The memsearch:* Redis cache is keyed on the write generation."""
+
+    @pytest.mark.asyncio
+    async def test_write_changes_the_cache_key(
+        self, mock_ctx, mock_memory_repository, mock_redis, monkeypatch
+    ):
+        from mnemo_mcp.tools import memory_tools
+        from services.caches.memory_search_cache import MemorySearchCache
+
+        cache = MemorySearchCache()
+        monkeypatch.setattr(memory_tools, "get_memory_search_cache", lambda: cache)
+        mock_memory_repository.search_by_tags.return_value = ([_make_mock_memory()], 1)
+        mock_redis.get.return_value = None
+        tool = SearchMemoryTool()
+        tool.inject_services({"memory_repository": mock_memory_repository, "redis": mock_redis})
+
+        await tool.execute(ctx=mock_ctx, query="sys:core")
+        await cache.invalidate()  # a memory write
+        await tool.execute(ctx=mock_ctx, query="sys:core")
+
+        keys = [call.args[0] for call in mock_redis.get.call_args_list]
+        assert len(keys) == 2 and keys[0] != keys[1]
+
+    @pytest.mark.asyncio
+    async def test_no_generation_bypasses_the_cache(
+        self, mock_ctx, mock_memory_repository, mock_redis, monkeypatch
+    ):
+        from mnemo_mcp.tools import memory_tools
+        from services.caches.memory_search_cache import MemorySearchCache
+
+        monkeypatch.setattr(
+            memory_tools, "get_memory_search_cache", lambda: MemorySearchCache(enabled=False)
+        )
+        mock_memory_repository.search_by_tags.return_value = ([_make_mock_memory()], 1)
+        tool = SearchMemoryTool()
+        tool.inject_services({"memory_repository": mock_memory_repository, "redis": mock_redis})
+
+        result = await tool.execute(ctx=mock_ctx, query="sys:core")
+
+        assert len(result["memories"]) == 1
+        mock_redis.get.assert_not_called()
+        mock_redis.setex.assert_not_called()
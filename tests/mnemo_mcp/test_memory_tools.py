@@ -69,6 +69,42 @@ def sample_memory():
     )
 
 
+@pytest.fixture
+def search_cache(monkeypatch):
+    """Process-wide memory search cache, isolated per test."""
+    from mnemo_mcp.tools import memory_tools
+    from services.caches.memory_search_cache import MemorySearchCache
+
+    cache = MemorySearchCache()
+    monkeypatch.setattr(memory_tools, "get_memory_search_cache", lambda: cache)
+    return cache
+
+
+class TestSearchCacheInvalidation:
+    """Memory writes retire cached search results of the written project."""
+
+    @pytest.mark.asyncio
+    async def test_write_and_soft_delete_bump_project_generation(
+        self, mock_ctx, mock_memory_repository, sample_memory, search_cache
+    ):
+        sample_memory.project_id = uuid.uuid4()
+        mock_memory_repository.create.return_value = sample_memory
+        mock_memory_repository.get_by_id.return_value = sample_memory
+        mock_memory_repository.soft_delete.return_value = True
+        services = {"memory_repository": mock_memory_repository}
+        write_tool, delete_tool = WriteMemoryTool(), DeleteMemoryTool()
+        write_tool.inject_services(services)
+        delete_tool.inject_services(services)
+
+        before = await search_cache.generation(sample_memory.project_id)
+        await write_tool.execute(ctx=mock_ctx, title="Test Memory", content="Test content")
+        after_write = await search_cache.generation(sample_memory.project_id)
+        await delete_tool.execute(ctx=mock_ctx, id=str(sample_memory.id))
+
+        assert before != after_write
+        assert await search_cache.generation(sample_memory.project_id) != after_write
+
+
 class TestWriteMemoryTool:
     """Tests for WriteMemoryTool."""
 
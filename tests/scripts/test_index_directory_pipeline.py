@@ -0,0 +1,252 @@
+"""
+Unit tests for the bounded streaming pipeline of scripts/index_directory.py.
+
+Chunking, embeddings and the database are faked; the tests check the
+stage wiring: batching across files, per-file errors, backpressure.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.code_chunk_models import ChunkType, CodeChunk
+from scripts import index_directory
+
+
+class FakeChunkingService:
+    def __init__(self, max_workers=4, metadata_service=None):
+        pass
+
+    async def chunk_code(self, source_code, language, file_path):
+        if "broken" in file_path:
+            raise ValueError("parse error")
+        if "empty" in file_path:
+            return []
+        await asyncio.sleep(0)
+        return [
+            CodeChunk(file_path=file_path, language=language, chunk_type=ChunkType.FUNCTION,
+                      name=f"f{i}", source_code=f"function f{i}() {{}}", start_line=i, end_line=i)
+            for i in range(2)
+        ]
+
+
+class FakeEmbeddingService:
+    calls = []
+
+    def __init__(self):
+        pass
+
+    async def generate_embeddings_batch(self, texts, domain=None, show_progress_bar=True):
+        FakeEmbeddingService.calls.append(len(texts))
+        await asyncio.sleep(0)
+        return [{"code": [0.1] * 768} for _ in texts]
+
+    def force_memory_cleanup(self):
+        pass
+
+
+class FakeCheckpoints:
+    """Files named done*.ts are already indexed."""
+    instances = []
+    full = False
+
+    def __init__(self, engine):
+        self.records, self.flushes, self.finished = [], 0, None
+        self.start_run = AsyncMock()
+        self.clear = AsyncMock()
+        self.purge_unfinished = AsyncMock(return_value=0)
+        FakeCheckpoints.instances.append(self)
+
+    async def pending_files(self, repository, files):
+        completed = [f for f in files if f.name.startswith("done")]
+        return [(f, "hash") for f in files if f not in completed], completed
+
+    def record(self, repository, file_path, content_hash, chunks=0, error=None):
+        self.records.append((file_path.name, chunks, error))
+
+    async def flush(self):
+        self.flushes += 1
+
+    async def finish_run(self, repository, status="completed"):
+        self.finished = status
+
+    async def get_run(self, repository):
+        return None
+
+
+@pytest.fixture
+def pipeline(monkeypatch, tmp_path):
+    import db.repositories.code_chunk_repository as repo_module
+    import services.code_chunking_service as chunking_module
+    import services.dual_embedding_service as embedding_module
+    import services.indexing_checkpoint_service as checkpoint_module
+    import services.metadata_extractor_service as metadata_module
+
+    FakeEmbeddingService.calls = []
+    FakeCheckpoints.instances = []
+    written = []
+
+    class FakeRepository:
+        def __init__(self, engine, connection=None):
+            pass
+
+        async def add_batch(self, chunks, connection=None):
+            written.append([c.name for c in chunks])
+            return len(chunks)
+
+    monkeypatch.setattr(chunking_module, "CodeChunkingService", FakeChunkingService)
+    monkeypatch.setattr(embedding_module, "DualEmbeddingService", FakeEmbeddingService)
+    monkeypatch.setattr(metadata_module, "get_metadata_extractor_service", lambda: None)
+    monkeypatch.setattr(repo_module, "CodeChunkRepository", FakeRepository)
+    monkeypatch.setattr(checkpoint_module, "IndexingCheckpointService", FakeCheckpoints)
+    monkeypatch.setattr(index_directory, "cleanup_repository", AsyncMock())
+    monkeypatch.setattr(index_directory, "refresh_repository_stats", AsyncMock())
+    monkeypatch.setattr(index_directory, "invalidate_repository_caches", AsyncMock())
+
+    engine = MagicMock()
+    engine.begin.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+    engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+    return tmp_path, engine, written
+
+
+class TestStreamingPipeline:
+
+    @pytest.mark.asyncio
+    async def test_files_flow_through_all_stages(self, pipeline):
+        directory, engine, written = pipeline
+        for i in range(10):
+            (directory / f"file{i}.ts").write_text(f"export function f{i}() {{}}")
+
+        stats = await index_directory.run_streaming_pipeline(
+            directory, "repo", engine=engine, n_jobs=3, embed_batch_size=5, queue_size=2
+        )
+
+        assert stats["success_files"] == 10 and stats["error_files"] == 0
+        assert stats["total_chunks"] == 20
+        assert len(written) == 10  # one transaction per file
+        # Chunks of several files per model call
+        assert sum(FakeEmbeddingService.calls) == 20
+        assert max(FakeEmbeddingService.calls) > 2
+        assert stats["chunks_per_second"] > 0
+        index_directory.refresh_repository_stats.assert_awaited_once_with("repo", engine)
+        index_directory.invalidate_repository_caches.assert_awaited_once_with("repo")
+
+    @pytest.mark.asyncio
+    async def test_throughput_counts_the_files_of_the_run(self, pipeline, monkeypatch):
+        import time
+
+        directory, engine, _ = pipeline
+        for name in ("done1.ts", "todo1.ts", "todo2.ts", "todo3.ts", "todo4.ts"):
+            (directory / name).write_text("export function f() {}")
+        clock = iter([100.0])
+        monkeypatch.setattr(time, "perf_counter", lambda: next(clock, 102.0))  # 2s run
+
+        stats = await index_directory.run_streaming_pipeline(directory, "repo", engine=engine, resume=True)
+
+        # 4 files indexed (the checkpointed one is skipped), 8 chunks
+        assert stats["files_per_second"] == 2.0
+        assert stats["chunks_per_second"] == 4.0
+
+    @pytest.mark.asyncio
+    async def test_file_errors_do_not_stop_the_pipeline(self, pipeline):
+        directory, engine, written = pipeline
+        (directory / "good.ts").write_text("export function good() {}")
+        (directory / "broken.ts").write_text("{{{")
+        (directory / "empty.ts").write_text("// nothing")
+
+        stats = await index_directory.run_parallel_pipeline(directory, "repo", n_jobs=2, engine=engine)
+
+        assert stats["total_files"] == 3
+        assert stats["success_files"] == 2  # no chunks is not an error
+        assert stats["error_files"] == 1
+        assert stats["errors"][0]["error"] == "parse error"
+        assert stats["total_chunks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_a_failing_stage_aborts_instead_of_hanging(self, pipeline, monkeypatch):
+        directory, engine, _ = pipeline
+        for i in range(20):
+            (directory / f"file{i}.ts").write_text("export function f() {}")
+        progress = MagicMock()
+        progress.return_value.update.side_effect = RuntimeError("progress bar broke")
+        monkeypatch.setattr(index_directory, "tqdm", progress)
+
+        with pytest.raises(RuntimeError, match="progress bar broke"):
+            await asyncio.wait_for(
+                index_directory.run_streaming_pipeline(directory, "repo", engine=engine, n_jobs=2, queue_size=1),
+                timeout=5,
+            )
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_checkpointed_files(self, pipeline):
+        directory, engine, written = pipeline
+        for name in ("done1.ts", "done2.ts", "todo1.ts", "todo2.ts"):
+            (directory / name).write_text("export function f() {}")
+
+        stats = await index_directory.run_streaming_pipeline(directory, "repo", engine=engine, resume=True)
+
+        checkpoints = FakeCheckpoints.instances[0]
+        assert stats["skipped_files"] == 2 and stats["success_files"] == 2
+        assert len(written) == 2
+        assert sorted(checkpoints.records) == [("todo1.ts", 2, None), ("todo2.ts", 2, None)]
+        # Graph rebuilt from the kept chunks, unfinished files purged
+        index_directory.cleanup_repository.assert_awaited_once_with("repo", engine, keep_chunks=True)
+        assert [f.name for f in checkpoints.purge_unfinished.await_args.args[1]] == ["done1.ts", "done2.ts"]
+        checkpoints.clear.assert_not_awaited()
+        assert checkpoints.flushes and checkpoints.finished == "completed"
+
+    @pytest.mark.asyncio
+    async def test_fresh_run_clears_checkpoints(self, pipeline):
+        directory, engine, _ = pipeline
+        (directory / "done1.ts").write_text("export function f() {}")
+
+        stats = await index_directory.run_streaming_pipeline_sequential(directory, "repo", engine=engine)
+
+        checkpoints = FakeCheckpoints.instances[0]
+        assert stats["skipped_files"] == 0
+        checkpoints.clear.assert_awaited_once_with("repo")
+        index_directory.cleanup_repository.assert_awaited_once_with("repo", engine)
+        index_directory.refresh_repository_stats.assert_awaited_once_with("repo", engine)
+
+
+class TestCacheInvalidation:
+
+    @pytest.mark.asyncio
+    async def test_generations_are_shared_through_redis(self, monkeypatch):
+        import redis.asyncio as redis
+        from services.caches.invalidation_bus import get_invalidation_bus
+        from services.caches.repository_generations import get_repository_generations
+
+        client = AsyncMock()
+        monkeypatch.setattr(redis, "from_url", MagicMock(return_value=client))
+        generations, bus = get_repository_generations(), get_invalidation_bus()
+        monkeypatch.setattr(generations, "redis", generations.redis)
+        monkeypatch.setattr(bus, "redis", bus.redis)
+
+        assert await index_directory.connect_cache_redis() is client
+        # Bumps of the CLI reach the API and MCP server caches
+        assert generations.redis is client and bus.redis is client
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_keeps_local_generations(self, monkeypatch):
+        import redis.asyncio as redis
+
+        client = AsyncMock()
+        client.ping.side_effect = ConnectionError("refused")
+        monkeypatch.setattr(redis, "from_url", MagicMock(return_value=client))
+
+        assert await index_directory.connect_cache_redis() is None
+        client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_bumps_the_generation(self, monkeypatch):
+        invalidate = AsyncMock()
+        monkeypatch.setattr(index_directory, "invalidate_repository_caches", invalidate)
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await index_directory.cleanup_repository("repo", engine, keep_chunks=True)
+
+        invalidate.assert_awaited_once_with("repo")
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the service unit tests.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_engine():
+    """
+    Factory for a mocked AsyncEngine whose begin() and connect() both yield
+    the same AsyncMock connection; returns (engine, conn).
+
+    By default every execute() returns one result with `fetchall()` -> `rows`
+    and `scalar()` -> `scalar`; pass `execute` to dispatch per statement.
+    """
+    def factory(rows=(), scalar=None, execute=None):
+        conn = AsyncMock()
+        if execute is None:
+            result = MagicMock()
+            result.fetchall.return_value = list(rows)
+            result.scalar.return_value = scalar
+            conn.execute = AsyncMock(return_value=result)
+        else:
+            conn.execute = AsyncMock(side_effect=execute)
+        engine = MagicMock()
+        for method in ("begin", "connect"):
+            getattr(engine, method).return_value.__aenter__ = AsyncMock(return_value=conn)
+            getattr(engine, method).return_value.__aexit__ = AsyncMock(return_value=None)
+        return engine, conn
+
+    return factory
@@ -0,0 +1,242 @@
+"""
+Unit tests for the LSP process pool (fake clients, no language server).
+"""
+
+import asyncio
+
+import pytest
+
+from services.lsp import LSPProcessPool, PooledLSPClient, lsp_workspace_affinity, LSPError
+
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+        self.returncode = None
+
+
+class FakeClient:
+    started = 0
+
+    def __init__(self):
+        FakeClient.started += 1
+        self.process = None
+        self.shutdown_called = False
+        self.calls = 0
+
+    async def start(self):
+        self.process = FakeProcess(pid=1000 + FakeClient.started)
+
+    async def shutdown(self):
+        self.shutdown_called = True
+        self.process = None
+
+    def is_alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def hover_many(self, file_path, source_code, positions, timeout=3.0):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [f"{self.process.pid}"] * len(positions)
+
+
+@pytest.fixture
+def pool():
+    return LSPProcessPool(FakeClient, name="fake", max_size=3, max_rss_mb=0)
+
+
+async def _scaled(pool):
+    """Wait for the servers started in the background."""
+    await asyncio.gather(*pool._scale_ups)
+
+
+async def test_idle_pool_reuses_one_server(pool):
+    client = PooledLSPClient(pool)
+
+    for _ in range(3):
+        await client.hover_many("/a.py", "", [(0, 0)])
+
+    assert pool.get_stats()["size"] == 1
+
+
+async def test_concurrent_load_scales_to_max_size(pool):
+    client = PooledLSPClient(pool)
+
+    await asyncio.gather(*(client.hover_many("/a.py", "", [(0, 0)]) for _ in range(6)))
+    await _scaled(pool)
+
+    stats = pool.get_stats()
+    assert stats["size"] == 3
+    assert all(s["in_flight"] == 0 for s in stats["servers"])
+    # The next burst is spread over every server
+    results = await asyncio.gather(*(client.hover_many("/a.py", "", [(0, 0)]) for _ in range(6)))
+    assert len({r[0] for r in results}) == 3
+
+
+async def test_scale_up_only_past_the_in_flight_threshold():
+    pool = LSPProcessPool(FakeClient, name="fake", max_size=3, max_rss_mb=0, scale_up_in_flight=2)
+
+    async with pool.lease() as first, pool.lease() as second:
+        # One lease in flight is below the threshold: shared server
+        assert second is first
+        assert pool.get_stats()["size"] == 1
+        async with pool.lease() as third:
+            # Served by the running server while the new one starts
+            assert third is first
+            await _scaled(pool)
+            assert pool.get_stats()["size"] == 2
+            async with pool.lease() as fourth:
+                assert fourth is not first
+
+
+class SlowStartClient(FakeClient):
+    release = None
+
+    async def start(self):
+        await SlowStartClient.release.wait()
+        await super().start()
+
+
+async def test_scale_up_does_not_make_the_caller_wait_for_the_start():
+    SlowStartClient.release = asyncio.Event()
+    SlowStartClient.release.set()
+    pool = LSPProcessPool(SlowStartClient, name="fake", max_size=2, max_rss_mb=0, scale_up_in_flight=1)
+    await pool.start(initial_size=1)
+
+    SlowStartClient.release.clear()
+    async with pool.lease() as busy:
+        # Triggers a start, served by the running server right away
+        async with pool.lease() as second:
+            assert second is busy
+            assert pool.get_stats()["starting"] == 1
+    # The pool lock is free while the second server starts
+    async with pool.lease() as idle:
+        assert idle is busy
+
+    SlowStartClient.release.set()
+    await _scaled(pool)
+    assert pool.get_stats()["size"] == 2 and pool.get_stats()["starting"] == 0
+
+
+async def test_callers_wait_for_the_first_server_instead_of_starting_one_each():
+    SlowStartClient.release = asyncio.Event()
+    pool = LSPProcessPool(SlowStartClient, name="fake", max_size=3, max_rss_mb=0, scale_up_in_flight=2)
+    leases = [asyncio.create_task(pool.lease().__aenter__()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    assert pool.get_stats()["starting"] == 1
+
+    SlowStartClient.release.set()
+    first, second = await asyncio.gather(*leases)
+
+    assert first is second
+    assert pool.get_stats()["size"] == 1
+
+
+async def test_shutdown_while_a_server_starts():
+    SlowStartClient.release = asyncio.Event()
+    pool = LSPProcessPool(SlowStartClient, name="fake", max_size=1, max_rss_mb=0)
+    lease = asyncio.create_task(pool.lease().__aenter__())
+    await asyncio.sleep(0.01)
+
+    await pool.shutdown()
+    SlowStartClient.release.set()
+
+    with pytest.raises(LSPError):
+        await lease
+    assert pool.get_stats()["size"] == 0
+
+
+async def test_workspace_affinity():
+    pool = LSPProcessPool(FakeClient, name="fake", max_size=3, max_rss_mb=0, scale_up_in_flight=1)
+    await pool.start(initial_size=2)
+    async with pool.lease("repo-a") as first:
+        # Busy server: a different repository goes elsewhere
+        async with pool.lease("repo-b") as other:
+            assert other is not first
+
+    async with pool.lease("repo-a") as again_a, pool.lease("repo-b") as again_b:
+        assert again_a is first
+        assert again_b is other
+
+    with lsp_workspace_affinity("repo-b"):
+        async with pool.lease() as from_context:
+            assert from_context is other
+
+
+async def test_affinity_yields_to_least_loaded_when_overloaded():
+    pool = LSPProcessPool(FakeClient, name="fake", max_size=2, max_rss_mb=0, affinity_slack=0,
+                          scale_up_in_flight=1)
+    await pool.start(initial_size=2)
+    async with pool.lease("repo-a") as first:
+        async with pool.lease("repo-b"):
+            pass
+        # repo-a's server is busy and slack is 0: dispatch to the idle one
+        async with pool.lease("repo-a") as second:
+            assert second is not first
+
+
+async def test_dead_server_is_replaced(pool):
+    async with pool.lease() as client:
+        pass
+    client.process.returncode = 1
+
+    async with pool.lease() as replacement:
+        assert replacement is not client
+
+    assert pool.get_stats()["recycled"] == 1
+
+
+async def test_repeated_failures_recycle_server():
+    pool = LSPProcessPool(FakeClient, name="fake", max_size=1, max_rss_mb=0, max_consecutive_failures=2)
+    for _ in range(2):
+        with pytest.raises(LSPError):
+            async with pool.lease() as client:
+                raise LSPError("boom")
+
+    assert client.shutdown_called
+    assert pool.get_stats()["size"] == 0
+
+
+async def test_memory_ceiling_recycles_after_drain(monkeypatch):
+    pool = LSPProcessPool(FakeClient, name="fake", max_size=2, max_rss_mb=100, memory_check_interval=1)
+    monkeypatch.setattr(LSPProcessPool, "_rss_mb", staticmethod(lambda client: 500.0))
+
+    async with pool.lease() as client:
+        pass
+
+    assert client.shutdown_called
+    assert pool.recycled == 1
+
+
+async def test_shutdown_rejects_new_leases(pool):
+    async with pool.lease() as client:
+        pass
+    await pool.shutdown()
+
+    assert client.shutdown_called
+    assert not PooledLSPClient(pool).is_alive()
+    with pytest.raises(LSPError):
+        async with pool.lease():
+            pass
+
+
+async def test_shutdown_waits_for_background_starts():
+    SlowStartClient.release = asyncio.Event()
+    SlowStartClient.release.set()
+    pool = LSPProcessPool(SlowStartClient, name="fake", max_size=2, max_rss_mb=0, scale_up_in_flight=1)
+    await pool.start(initial_size=1)
+
+    SlowStartClient.release.clear()
+    async with pool.lease():
+        async with pool.lease():
+            pass
+    shutdown = asyncio.create_task(pool.shutdown())
+    await asyncio.sleep(0.01)
+    assert not shutdown.done()
+
+    SlowStartClient.release.set()
+    await shutdown
+    assert pool.get_stats()["size"] == 0 and not pool._scale_ups
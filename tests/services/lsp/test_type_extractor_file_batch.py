@@ -0,0 +1,164 @@
+"""
+Unit tests for per-file LSP type extraction (pipelined hovers, per-file cache).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from services.lsp import PyrightLSPClient, TypeExtractorService, LSPResponse
+from services.lsp.typescript_lsp_client import TypeScriptLSPClient
+from services.lsp.lsp_errors import LSPTimeoutError
+from services.caches import RedisCache
+from models.code_chunk_models import CodeChunk, ChunkType
+
+
+pytestmark = pytest.mark.anyio
+
+
+PY_SOURCE = "def add(a: int, b: int) -> int:\n    return a + b\n\ndef name() -> str:\n    return 'x'\n"
+TS_SOURCE = "function getUser(id: string): User {\n  return db.get(id);\n}\n"
+
+
+def _chunk(name, start_line, language="python", file_path="/app/m.py"):
+    return CodeChunk(
+        file_path=file_path,
+        language=language,
+        chunk_type=ChunkType.FUNCTION,
+        name=name,
+        source_code="...",
+        start_line=start_line,
+        end_line=start_line + 1,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def pyright():
+    client = AsyncMock(spec=PyrightLSPClient)
+    client.hover_many = AsyncMock(return_value=[
+        "(function) add: (a: int, b: int) -> int",
+        "(function) name: () -> str",
+    ])
+    return client
+
+
+async def test_file_extraction_issues_one_pipelined_call(pyright):
+    extractor = TypeExtractorService(lsp_client=pyright)
+    chunks = [_chunk("add", 0), _chunk("name", 3)]
+
+    results = await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, chunks)
+
+    pyright.hover_many.assert_awaited_once()
+    assert pyright.hover_many.call_args.kwargs["positions"] == [(0, 4), (3, 4)]
+    pyright.hover.assert_not_called()
+    assert results[0]["return_type"] == "int"
+    assert results[0]["param_types"] == {"a": "int", "b": "int"}
+    assert results[1]["return_type"] == "str"
+
+
+async def test_unchanged_file_served_from_file_cache(pyright):
+    extractor = TypeExtractorService(lsp_client=pyright)
+    chunks = [_chunk("add", 0), _chunk("name", 3)]
+
+    await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, chunks)
+    results = await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, chunks)
+
+    pyright.hover_many.assert_awaited_once()
+    assert results[1]["signature"] == "name: () -> str"
+
+
+async def test_redis_stores_one_key_per_file(pyright):
+    cache = AsyncMock(spec=RedisCache)
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    extractor = TypeExtractorService(lsp_client=pyright, redis_cache=cache)
+
+    await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, [_chunk("add", 0), _chunk("name", 3)])
+
+    cache.get.assert_awaited_once()
+    cache.set.assert_awaited_once()
+    key, value = cache.set.call_args.args
+    assert key.startswith("lsp:type:file:")
+    assert set(value) == {"0", "3"}
+
+
+async def test_redis_hit_skips_lsp(pyright):
+    cache = AsyncMock(spec=RedisCache)
+    cache.get = AsyncMock(return_value={
+        "0": {"return_type": "int", "param_types": {}, "signature": "add() -> int"},
+    })
+    extractor = TypeExtractorService(lsp_client=pyright, redis_cache=cache)
+
+    results = await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, [_chunk("add", 0)])
+
+    pyright.hover_many.assert_not_called()
+    assert results[0]["return_type"] == "int"
+
+
+async def test_missing_hover_is_empty_and_not_cached(pyright):
+    pyright.hover_many.return_value = [None, "(function) name: () -> str"]
+    extractor = TypeExtractorService(lsp_client=pyright)
+    chunks = [_chunk("add", 0), _chunk("name", 3)]
+
+    results = await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, chunks)
+    assert results[0] == {"return_type": None, "param_types": {}, "signature": None}
+
+    pyright.hover_many.return_value = ["(function) add: (a: int, b: int) -> int"]
+    await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, chunks)
+    # Only the line without a cached result is queried again
+    assert pyright.hover_many.call_args.kwargs["positions"] == [(0, 4)]
+
+
+async def test_typescript_lines_and_language_id():
+    client = AsyncMock(spec=TypeScriptLSPClient)
+    client.hover_many = AsyncMock(return_value=["function getUser(id: string): User"])
+    extractor = TypeExtractorService(typescript_lsp_client=client)
+
+    results = await extractor.extract_file_type_metadata(
+        "/app/user.tsx", TS_SOURCE, [_chunk("getUser", 1, "typescript", "/app/user.tsx")]
+    )
+
+    kwargs = client.hover_many.call_args.kwargs
+    assert kwargs["positions"] == [(0, 9)]
+    assert kwargs["language_id"] == "typescriptreact"
+    assert results[0]["return_type"] == "User"
+
+
+async def test_client_error_degrades_to_empty(pyright):
+    pyright.hover_many.side_effect = RuntimeError("server gone")
+    extractor = TypeExtractorService(lsp_client=pyright)
+
+    results = await extractor.extract_file_type_metadata("/app/m.py", PY_SOURCE, [_chunk("add", 0)])
+
+    assert results == [{"return_type": None, "param_types": {}, "signature": None}]
+
+
+async def test_hover_many_opens_document_once_and_pipelines():
+    client = PyrightLSPClient()
+    client.initialized = True
+    client._open_document = AsyncMock()
+    client._close_document = AsyncMock()
+    in_flight = 0
+    peak = 0
+
+    async def send_request(method, params, timeout=5.0):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        line = params["position"]["line"]
+        if line == 2:
+            raise LSPTimeoutError("timeout")
+        return LSPResponse(id=str(line), result={"contents": {"kind": "plaintext", "value": f"line {line}"}})
+
+    client._send_request = send_request
+
+    texts = await client.hover_many("/app/m.py", PY_SOURCE, [(0, 4), (2, 0), (3, 4)])
+
+    assert texts == ["line 0", None, "line 3"]
+    assert peak == 3
+    client._open_document.assert_awaited_once()
+    client._close_document.assert_awaited_once()
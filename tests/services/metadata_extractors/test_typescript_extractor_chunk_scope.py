@@ -0,0 +1,103 @@
+"""
+Unit tests for chunk-scoped TypeScript/JavaScript metadata.
+
+Chunks are mapped to their own tree-sitter node (by byte range), imports are
+extracted once per file and calls only come from the chunk's subtree.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from tree_sitter_language_pack import get_parser
+
+from services.metadata_extractor_service import MetadataExtractorService
+from services.metadata_extractors.typescript_extractor import TypeScriptMetadataExtractor
+
+SOURCE = """import { Repo } from './repo'
+import * as fmt from 'date-fns'
+
+export function loadUser(id: string) {
+    const user = fetchUser(id)
+    return normalise(user)
+}
+
+export class UserService {
+    constructor(private repo: Repo) {}
+
+    async save(user) {
+        if (user.dirty) {
+            await this.repo.persist(user)
+        }
+        return fmt.format(new Date(), 'yyyy')
+    }
+}
+
+const a = computeA()
+const b = computeB()
+"""
+
+
+def _chunk(name, start_line, end_line):
+    return SimpleNamespace(name=name, start_line=start_line, end_line=end_line)
+
+
+@pytest.fixture
+def ts_extractor():
+    """Create TypeScriptMetadataExtractor instance."""
+    return TypeScriptMetadataExtractor()
+
+
+@pytest.fixture
+def tree():
+    """Parse SOURCE as TypeScript."""
+    return get_parser("typescript").parse(SOURCE.encode("utf-8"))
+
+
+def test_chunk_nodes_map_to_declarations(ts_extractor, tree):
+    """Line ranges resolve to the declaration node, export wrapper unwrapped."""
+    mapped = ts_extractor.chunk_nodes(tree, SOURCE, [(4, 7), (12, 17), (None, None)])
+
+    (function_node, function_range), (method_node, _), (root, no_range) = mapped
+    assert function_node.type == "function_declaration"
+    assert SOURCE.encode()[function_range[0]:function_range[1]].startswith(b"export function")
+    assert method_node.type == "method_definition"
+    assert root == tree.root_node and no_range is None
+
+
+@pytest.mark.asyncio
+async def test_calls_are_scoped_to_the_chunk(ts_extractor, tree):
+    """A chunk's calls come from its subtree, not the whole file."""
+    [(node, byte_range)] = ts_extractor.chunk_nodes(tree, SOURCE, [(4, 7)])
+
+    metadata = await ts_extractor.extract_metadata(SOURCE, node, tree, byte_range=byte_range)
+
+    assert sorted(metadata["calls"]) == ["fetchUser", "normalise"]
+    assert metadata["lsp_type"] == "function"
+    assert metadata["complexity"]["lines_of_code"] == 4
+
+
+@pytest.mark.asyncio
+async def test_multi_statement_chunk_restricted_by_byte_range(ts_extractor, tree):
+    """Chunks of several sibling statements only get calls within their lines."""
+    [(node, byte_range)] = ts_extractor.chunk_nodes(tree, SOURCE, [(20, 21)])
+
+    calls = await ts_extractor.extract_calls(node, SOURCE, byte_range)
+
+    assert node.type == "program"
+    assert sorted(calls) == ["computeA", "computeB"]
+
+
+@pytest.mark.asyncio
+async def test_service_shares_file_imports():
+    """extract_typescript_chunks_metadata: same imports everywhere, scoped calls."""
+    service = MetadataExtractorService()
+    tree = get_parser("typescript").parse(SOURCE.encode("utf-8"))
+    chunks = [_chunk("loadUser", 4, 7), _chunk("save", 12, 17)]
+
+    load_user, save = await service.extract_typescript_chunks_metadata(SOURCE, tree, chunks, "typescript")
+
+    assert load_user["imports"] == save["imports"]
+    assert "./repo.Repo" in save["imports"]
+    assert "persist" not in str(load_user["calls"])
+    assert "fetchUser" not in save["calls"]
+    assert [c["call_name"] for c in load_user["call_contexts"]] == ["fetchUser", "normalise"]
@@ -0,0 +1,117 @@
+"""Tests for the binary-quantised prefilter (Hamming ANN + halfvec rescoring)."""
+
+import pytest
+
+from services.binary_prefilter import (
+    BinaryPrefilter,
+    BinaryPrefilterConfig,
+    binary_expression,
+    binary_index_name,
+)
+from services.hybrid_memory_search_service import HybridMemorySearchService
+from services.matryoshka_search import MatryoshkaConfig, MatryoshkaSearch
+from services.query_understanding_service import QueryKeywords
+from services.vector_search_service import VectorSearchService
+
+
+def _binary(**kwargs):
+    return BinaryPrefilter(BinaryPrefilterConfig(mode="binary", **kwargs))
+
+
+class TestBinaryPrefilter:
+    """Config, SQL shape and telemetry."""
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("VECTOR_SEARCH_PREFILTER", raising=False)
+        assert BinaryPrefilter().enabled is False
+
+    def test_from_env_and_unknown_mode(self, monkeypatch):
+        monkeypatch.setenv("VECTOR_SEARCH_PREFILTER", "binary")
+        monkeypatch.setenv("VECTOR_BINARY_OVERSAMPLE", "20")
+        config = BinaryPrefilterConfig.from_env()
+        assert config.mode == "binary"
+        assert config.oversample == 20.0
+
+        monkeypatch.setenv("VECTOR_SEARCH_PREFILTER", "ivf")
+        assert BinaryPrefilterConfig.from_env().mode == "off"
+
+    def test_candidate_limit(self):
+        prefilter = _binary(oversample=10, min_candidates=100)
+        assert prefilter.candidate_limit(5) == 100
+        assert prefilter.candidate_limit(30) == 300
+
+    def test_coarse_sql_uses_hamming_on_index_expression(self):
+        sql = _binary().coarse_candidates_sql("code_chunks", "embedding_code_half", [0.1] * 768, "TRUE")
+
+        expression = binary_expression("embedding_code_half")
+        assert expression == "(binary_quantize(embedding_code_half)::bit(768))"
+        assert f"ORDER BY {expression} <~> binary_quantize(" in sql
+        assert "LIMIT :bq_candidate_limit" in sql
+        assert binary_index_name("code_chunks", "embedding_code_half") == "idx_code_chunks_embedding_code_half_bq"
+
+    def test_unknown_column_rejected(self):
+        with pytest.raises(ValueError):
+            _binary().coarse_candidates_sql("memories", "embedding", [0.1] * 768, "TRUE")
+
+    def test_record_tracks_depth(self):
+        prefilter = _binary()
+        prefilter.record(10, 100, [3, 40])
+        prefilter.record(10, 100, [90])
+        stats = prefilter.stats()
+        assert stats["queries"] == 2
+        assert stats["avg_depth_ratio"] == pytest.approx(0.65)
+        assert stats["max_depth_ratio"] == pytest.approx(0.9)
+
+
+class TestBinaryPrefilterServices:
+    """Services use the Hamming prefilter ahead of Matryoshka when enabled."""
+
+    @pytest.mark.asyncio
+    async def test_code_search_prefers_binary_over_matryoshka(self, make_engine):
+        engine, conn = make_engine([])
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256))
+        service = VectorSearchService(engine, matryoshka=mrl, binary_prefilter=_binary(oversample=10))
+
+        await service.search([0.1] * 768, embedding_domain="CODE", limit=20)
+
+        sql, params = conn.execute.call_args.args
+        assert "binary_quantize(embedding_code_half)" in str(sql)
+        assert "bq_c USING (id)" in str(sql)
+        assert "subvector" not in str(sql)
+        assert params["bq_candidate_limit"] == 200
+
+    @pytest.mark.asyncio
+    async def test_memory_vector_search_records_depth(self, make_engine):
+        row = ("m1", "t", "c", "note", [], "2026-01-01", None, 0.9, 42)
+        engine, conn = make_engine([row])
+        prefilter = _binary(min_candidates=100)
+        service = HybridMemorySearchService(
+            engine=engine, binary_prefilter=prefilter,
+            matryoshka=MatryoshkaSearch(MatryoshkaConfig()),
+        )
+
+        results, _ = await service._vector_search([0.1] * 768, None, limit=10)
+
+        assert len(results) == 1
+        assert "binary_quantize(embedding_half)" in str(conn.execute.call_args.args[0])
+        assert prefilter.stats()["max_depth_ratio"] == pytest.approx(0.42)
+
+    @pytest.mark.asyncio
+    async def test_sql_fusion_vector_cte_uses_prefilter(self, make_engine):
+        engine, conn = make_engine([])
+        service = HybridMemorySearchService(
+            engine=engine, default_enable_decay=False, binary_prefilter=_binary(),
+            matryoshka=MatryoshkaSearch(MatryoshkaConfig()),
+        )
+
+        await service.search(
+            query="redis cache",
+            embedding=[0.1] * 768,
+            keywords=QueryKeywords(hl_keywords=[], ll_keywords=["redis"]),
+            enable_reranking=False,
+            fusion_mode="sql",
+        )
+
+        sql, params = conn.execute.call_args.args
+        assert "binary_quantize(embedding_half)" in str(sql)
+        assert "bq_candidate_limit" in params
@@ -0,0 +1,132 @@
+"""
+Unit tests for the binary COPY bulk loader of code chunks.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from models.code_chunk_models import CodeChunkCreate
+from services import code_chunk_bulk_loader
+from services.code_chunk_bulk_loader import COPY_COLUMNS, CodeChunkBulkLoader, chunk_record
+from services.hnsw_index_maintenance import HnswIndexMaintenance
+
+
+def _chunk(name="f", **values):
+    data = {
+        "file_path": "src/a.py", "language": "python", "chunk_type": "function",
+        "name": name, "source_code": f"def {name}(): pass", "start_line": 1, "end_line": 1,
+        "repository": "repo", "metadata": {"calls": []}, "embedding_code": [0.1] * 768,
+    }
+    data.update(values)
+    return CodeChunkCreate(**data)
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[
+        {"tablename": "code_chunks", "indexname": name, "size_bytes": 1024, "valid": True,
+         "indexdef": f"CREATE INDEX {name} ON public.code_chunks USING hnsw (...)"}
+        for name in ("idx_code_emb_code_half", "idx_code_emb_text_half")
+    ])
+    conn.fetchval = AsyncMock(return_value=2048)
+    monkeypatch.setattr(code_chunk_bulk_loader.asyncpg, "connect", AsyncMock(return_value=conn))
+    monkeypatch.setattr(code_chunk_bulk_loader, "register_vector", AsyncMock())
+    return conn
+
+
+def _executed(conn, prefix=""):
+    return [c.args[0] for c in conn.execute.call_args_list if c.args[0].startswith(prefix)]
+
+
+def _maintenance(**kwargs):
+    return HnswIndexMaintenance("postgresql://db/x", **kwargs)
+
+
+class TestRecords:
+
+    def test_record_matches_copy_columns(self):
+        indexed_at = datetime.now(timezone.utc)
+        record = dict(zip(COPY_COLUMNS, chunk_record(
+            _chunk(metadata={"last_modified": "2026-01-02T03:04:05Z"}), indexed_at
+        )))
+
+        assert isinstance(record["id"], uuid.UUID)
+        assert record["chunk_type"] == "function"
+        assert record["embedding_code"] == record["embedding_code_half"]
+        assert record["embedding_text"] is None and record["embedding_text_half"] is None
+        assert json.loads(record["metadata"]) == {"last_modified": "2026-01-02T03:04:05Z"}
+        assert record["last_modified"] == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert record["indexed_at"] is indexed_at
+
+    def test_wrong_dimension_is_rejected(self):
+        with pytest.raises(ValueError):
+            chunk_record(_chunk(embedding_code=[0.1] * 3), datetime.now(timezone.utc))
+
+
+class TestBulkLoader:
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_copied_across_files_in_batches(self, conn):
+        loader = CodeChunkBulkLoader("postgresql+asyncpg://u:p@db/x", flush_size=3, defer_indexes=False)
+        async with loader:
+            await loader.add([_chunk("a"), _chunk("b")])
+            assert conn.copy_records_to_table.await_count == 0  # buffered across files
+            await loader.add([_chunk("c"), _chunk("d")])
+            await loader.add([_chunk("e")])
+
+        assert code_chunk_bulk_loader.asyncpg.connect.await_args.args[0] == "postgresql://u:p@db/x"
+        copies = conn.copy_records_to_table.await_args_list
+        assert [len(c.kwargs["records"]) for c in copies] == [4, 1]
+        assert copies[0].args[0] == "code_chunks"
+        assert copies[0].kwargs["columns"] == list(COPY_COLUMNS)
+        assert loader.stats.chunks == 5 and loader.stats.copies == 2
+        assert loader.stats.to_dict()["chunks_per_second"] > 0
+        assert not _executed(conn, "DROP INDEX")
+        conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deferred_indexes_are_rebuilt_with_parallel_workers(self, conn):
+        loader = CodeChunkBulkLoader("postgresql://db/x", defer_indexes=True,
+                                     maintenance=_maintenance(parallel_workers=6, maintenance_work_mem="2GB"))
+        async with loader:
+            await loader.add([_chunk()])
+
+        assert _executed(conn, "DROP INDEX") == ['DROP INDEX IF EXISTS "idx_code_emb_code_half"',
+                                                 'DROP INDEX IF EXISTS "idx_code_emb_text_half"']
+        assert _executed(conn, "SET") == ["SET maintenance_work_mem = '2GB'",
+                                          "SET max_parallel_maintenance_workers = 6"]
+        creates = _executed(conn, "CREATE INDEX")
+        assert [sql.split()[2] for sql in creates] == ["idx_code_emb_code_half", "idx_code_emb_text_half"]
+        assert loader.stats.deferred_indexes == ["idx_code_emb_code_half", "idx_code_emb_text_half"]
+        assert len(_executed(conn, "\n    INSERT INTO hnsw_index_builds")) == 2
+
+    @pytest.mark.asyncio
+    async def test_indexes_are_deferred_once_the_row_threshold_is_reached(self, conn):
+        loader = CodeChunkBulkLoader("postgresql://db/x", flush_size=2,
+                                     maintenance=_maintenance(defer_row_threshold=3))
+        async with loader:
+            await loader.add([_chunk("a"), _chunk("b")])
+            assert not _executed(conn, "DROP INDEX")  # 2 rows: incremental inserts
+            await loader.add([_chunk("c"), _chunk("d")])
+            assert len(_executed(conn, "DROP INDEX")) == 2
+
+        assert len(_executed(conn, "CREATE INDEX")) == 2
+        assert loader.stats.chunks == 4
+
+    @pytest.mark.asyncio
+    async def test_indexes_are_rebuilt_when_the_load_fails(self, conn):
+        conn.copy_records_to_table.side_effect = RuntimeError("COPY failed")
+        loader = CodeChunkBulkLoader("postgresql://db/x", flush_size=1, defer_indexes=True,
+                                     maintenance=_maintenance())
+
+        with pytest.raises(RuntimeError):
+            async with loader:
+                await loader.add([_chunk()])
+
+        assert len(_executed(conn, "CREATE INDEX")) == 2
+        conn.close.assert_awaited_once()
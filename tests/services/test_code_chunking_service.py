@@ -369,3 +369,30 @@ def valid_function(x, y):
     # Metadata should be present (even if partial)
     # This test mainly ensures no exceptions are raised
     assert isinstance(chunk.metadata, dict)
+
+
+# Test 21: Waiting for an executor slot does not count against the parse timeout
+
+@pytest.mark.asyncio
+async def test_slot_wait_is_not_part_of_the_parse_timeout(chunking_service, monkeypatch):
+    """Test that only the parse itself is timed, not the queue for a slot."""
+    from contextlib import asynccontextmanager
+
+    import services.code_chunking_service as chunking_module
+
+    class BusyScheduler:
+        @asynccontextmanager
+        async def slot(self, resource):
+            await asyncio.sleep(0.3)  # other parses hold every slot
+            yield
+
+    monkeypatch.setattr(chunking_module, "get_resource_scheduler", lambda: BusyScheduler())
+    monkeypatch.setattr(chunking_module, "get_timeout", lambda operation: 0.2)
+
+    chunks = await chunking_service.chunk_code(
+        source_code="def f(x):\n    return x\n",
+        language="python",
+        file_path="test.py"
+    )
+
+    assert [chunk.name for chunk in chunks] == ["f"]
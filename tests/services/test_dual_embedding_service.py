@@ -17,6 +17,7 @@ import numpy as np
 from services.dual_embedding_service import (
     DualEmbeddingService,
     EmbeddingDomain,
+    plan_token_batches,
 )
 
 
@@ -413,3 +414,126 @@ def test_get_stats(dual_service):
     assert stats["device"] == "cpu"
     assert stats["text_model_loaded"] is False
     assert stats["code_model_loaded"] is False
+
+
+# ============================================================================
+# Test: Inference backends
+# ============================================================================
+
+def test_backend_defaults_to_torch(dual_service):
+    """Default backend is fp32 torch and is reported in stats."""
+    assert dual_service.backend == "torch"
+    assert dual_service.get_stats()["backend"] == "torch"
+
+
+def test_backend_from_env():
+    """EMBEDDING_BACKEND selects the backend."""
+    with patch.dict("os.environ", {"EMBEDDING_BACKEND": "onnx-int8"}):
+        service = DualEmbeddingService(dimension=768, device="cpu")
+    assert service.backend == "onnx-int8"
+
+
+def test_invalid_backend_rejected():
+    """Unknown backends fail fast."""
+    with pytest.raises(ValueError, match="EMBEDDING_BACKEND"):
+        DualEmbeddingService(dimension=768, device="cpu", backend="tensorrt")
+
+
+def test_quantized_backend_is_cpu_only():
+    """Quantised backends fall back to torch on accelerators."""
+    service = DualEmbeddingService(dimension=768, device="cuda", backend="torch-int8")
+    assert service.backend == "torch"
+
+
+def test_torch_int8_backend_quantizes_linear_layers(mock_sentence_transformer):
+    """torch-int8 applies dynamic int8 quantisation to the loaded model."""
+    service = DualEmbeddingService(dimension=768, device="cpu", backend="torch-int8")
+    quantized = Mock()
+    quantized.encode = Mock(return_value=np.random.rand(768))
+
+    with patch("services.dual_embedding_service.SentenceTransformer", return_value=mock_sentence_transformer), \
+         patch("torch.ao.quantization.quantize_dynamic", return_value=quantized) as quantize:
+        model = service._load_text_model_sync()
+
+    assert model is quantized
+    assert quantize.call_args[0][0] is mock_sentence_transformer
+    assert service.loaded_backends == {"text": "torch-int8"}
+
+
+def test_onnx_backend_falls_back_to_torch(mock_sentence_transformer):
+    """If the ONNX model cannot be built, fp32 torch is used."""
+    service = DualEmbeddingService(dimension=768, device="cpu", backend="onnx-int8")
+
+    with patch.object(service, "_build_onnx_model", side_effect=ImportError("optimum not installed")), \
+         patch("services.dual_embedding_service.SentenceTransformer", return_value=mock_sentence_transformer):
+        model = service._load_code_model_sync()
+
+    assert model is mock_sentence_transformer
+    # The configured backend is kept; the stats report what actually loaded
+    assert service.backend == "onnx-int8"
+    assert service.loaded_backends == {"code": "torch"}
+    assert service.get_stats()["loaded_backends"] == {"code": "torch"}
+
+
+# ============================================================================
+# Test: Token-budget batching
+# ============================================================================
+
+class _LengthModel:
+    """Fake model: one token per word, embedding = [token count, position in call]."""
+
+    max_seq_length = 512
+
+    def __init__(self):
+        self.calls = []
+
+    def tokenizer(self, texts, **kwargs):
+        return {"input_ids": [t.split() for t in texts]}
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        return np.array([[len(t.split()), i] for i, t in enumerate(texts)], dtype=np.float32)
+
+
+def test_plan_token_batches_respects_budget():
+    """Every index is planned once and padded size stays under budget."""
+    lengths = [5, 200, 12, 7, 180, 3, 40, 90]
+    batches = plan_token_batches(lengths, max_tokens=256, max_batch_size=8)
+
+    assert sorted(i for b in batches for i in b) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) * max(lengths[i] for i in batch) <= 256 or len(batch) == 1
+
+
+def test_plan_token_batches_oversized_sequence_alone():
+    """A sequence longer than the budget is encoded on its own."""
+    batches = plan_token_batches([1000, 4, 4], max_tokens=100)
+    assert batches[0] == [0]
+    assert batches[1] == [1, 2]
+
+
+def test_batch_encode_buckets_and_restores_order(dual_service):
+    """Short texts are batched apart from long ones; rows keep input order."""
+    dual_service.max_batch_tokens = 64
+    model = _LengthModel()
+    texts = ["word " * 60, "a b", "c d e", "word " * 50, "f"]
+
+    embeddings = dual_service._encode_batch_with_no_grad(model, texts, show_progress_bar=False)
+
+    assert [row[0] for row in embeddings] == [60, 2, 3, 50, 1]
+    assert len(model.calls) > 1
+    assert all(len(call) == 1 for call in model.calls if any(len(t.split()) >= 50 for t in call))
+    assert dual_service.get_stats()["padding_efficiency"] > 0.5
+
+
+def test_batch_encode_without_tokenizer_uses_single_call(dual_service, mock_sentence_transformer):
+    """Models without a usable tokenizer keep the single encode call."""
+    mock_sentence_transformer.tokenizer = Mock(side_effect=TypeError("no tokenizer"))
+    mock_sentence_transformer.encode = Mock(return_value=np.random.rand(3, 768))
+
+    embeddings = dual_service._encode_batch_with_no_grad(
+        mock_sentence_transformer, ["a", "b", "c"], show_progress_bar=False
+    )
+
+    assert embeddings.shape == (3, 768)
+    assert mock_sentence_transformer.encode.call_count == 1
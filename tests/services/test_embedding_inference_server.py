@@ -0,0 +1,149 @@
+"""Tests for the embedding inference sidecar and its remote client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
+from services.embedding_inference_server import EmbeddingBatchScheduler, create_app
+from services.remote_embedding_service import (
+    RemoteDualEmbeddingService,
+    create_dual_embedding_service,
+)
+
+
+class RecordingService:
+    """Stand-in model: records each encode call, returns index-tagged vectors."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def generate_embeddings_batch(self, texts, domain=EmbeddingDomain.TEXT, show_progress_bar=True):
+        self.calls.append((list(texts), domain))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        key = "code" if domain == EmbeddingDomain.CODE else "text"
+        return [{key: [float(len(t))]} for t in texts]
+
+    def get_stats(self):
+        return {"text_model_loaded": True}
+
+
+class TestScheduler:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_encode_call(self):
+        service = RecordingService()
+        scheduler = EmbeddingBatchScheduler(service, max_batch_texts=16, max_wait_ms=10)
+
+        results = await asyncio.gather(*(
+            scheduler.submit([f"q{i}" * (i + 1)], client="api") for i in range(5)
+        ))
+
+        assert len(service.calls) == 1
+        assert len(service.calls[0][0]) == 5
+        assert [r[0]["text"][0] for r in results] == [2.0 * (i + 1) for i in range(5)]
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_is_sliced_and_interactive_jumps_the_queue(self):
+        service = RecordingService(delay=0.01)
+        scheduler = EmbeddingBatchScheduler(service, max_batch_texts=4, max_wait_ms=0)
+
+        bulk = asyncio.create_task(
+            scheduler.submit([f"doc{i}" for i in range(12)], priority="bulk", client="indexer")
+        )
+        await asyncio.sleep(0.005)  # first bulk slice is encoding
+        interactive = await scheduler.submit(["query"], priority="interactive", client="api")
+        bulk_result = await bulk
+
+        assert interactive == [{"text": [5.0]}]
+        assert len(bulk_result) == 12
+        # Interactive ran right after the first bulk slice, not after all three
+        assert [texts for texts, _ in service.calls][1] == ["query"]
+        assert all(len(texts) <= 4 for texts, _ in service.calls)
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_domains_are_not_mixed_in_a_batch(self):
+        service = RecordingService()
+        scheduler = EmbeddingBatchScheduler(service, max_batch_texts=16, max_wait_ms=10)
+
+        text, code = await asyncio.gather(
+            scheduler.submit(["hello"], domain=EmbeddingDomain.TEXT),
+            scheduler.submit(["def f(): pass"], domain=EmbeddingDomain.CODE),
+        )
+
+        assert len(service.calls) == 2
+        assert "text" in text[0] and "code" in code[0]
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_metrics_per_client_and_lane(self):
+        service = RecordingService()
+        scheduler = EmbeddingBatchScheduler(service, max_batch_texts=8, max_wait_ms=0)
+
+        await scheduler.submit(["a", "b"], client="api")
+        await scheduler.submit(["c", "d", "e"], priority="bulk", client="indexer")
+
+        metrics = scheduler.get_metrics()
+        assert metrics["clients"]["api"]["texts"] == 2
+        assert metrics["clients"]["indexer"]["texts"] == 3
+        assert metrics["lanes"]["interactive"]["texts"] == 2
+        assert metrics["lanes"]["bulk"]["batches"] == 1
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_priority_rejected(self):
+        scheduler = EmbeddingBatchScheduler(RecordingService())
+        with pytest.raises(ValueError):
+            await scheduler.submit(["x"], priority="urgent")
+
+
+class TestRemoteClient:
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_sidecar_app(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_MODE", "mock")
+        scheduler = EmbeddingBatchScheduler(DualEmbeddingService(dimension=768), max_wait_ms=0)
+        remote = RemoteDualEmbeddingService(
+            url="http://sidecar",
+            client_name="mcp",
+            transport=httpx.ASGITransport(app=create_app(scheduler)),
+        )
+
+        batch = await remote.generate_embeddings_batch(
+            ["a", "b"], domain=EmbeddingDomain.HYBRID
+        )
+        legacy = await remote.generate_embedding_legacy("hello")
+        await remote.preload_models()
+        metrics = await remote.get_sidecar_metrics()
+
+        assert len(batch) == 2 and set(batch[0]) == {"text", "code"}
+        assert len(legacy) == 768
+        assert metrics["clients"]["mcp"]["requests"] == 2
+        await remote.close()
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_sidecar_raises_runtime_error(self):
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        remote = RemoteDualEmbeddingService(
+            url="http://sidecar", transport=httpx.MockTransport(refuse)
+        )
+        with pytest.raises(RuntimeError):
+            await remote.generate_embedding("hello")
+
+    def test_factory_selects_remote_only_when_configured(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_MODE", "mock")
+        monkeypatch.delenv("EMBEDDING_SIDECAR_URL", raising=False)
+        assert isinstance(create_dual_embedding_service(), DualEmbeddingService)
+
+        monkeypatch.setenv("EMBEDDING_SIDECAR_URL", "unix:///tmp/embed.sock")
+        remote = create_dual_embedding_service(priority="bulk", client_name="indexer")
+        assert isinstance(remote, RemoteDualEmbeddingService)
+        assert remote.priority == "bulk"
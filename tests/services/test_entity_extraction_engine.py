@@ -0,0 +1,194 @@
+"""Tests for off-loop, batched GLiNER entity extraction."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.entity_extraction_engine import EntityExtractionEngine
+from services.gliner_service import GLiNERService, merge_spans, split_windows
+
+
+def _gliner(window_chars=1500, overlap_chars=200) -> GLiNERService:
+    service = GLiNERService(
+        model_path="/test/path", window_chars=window_chars, overlap_chars=overlap_chars
+    )
+    service._load_attempted = True
+    service.model = MagicMock()
+    return service
+
+
+class TestWindowing:
+
+    def test_short_text_is_one_window(self):
+        assert split_windows("We use Redis", 100, 20) == [(0, "We use Redis")]
+
+    def test_windows_cover_text_with_overlap(self):
+        text = " ".join(f"word{i}" for i in range(200))
+        windows = split_windows(text, 200, 50)
+
+        assert len(windows) > 1
+        for offset, window in windows:
+            assert text[offset:offset + len(window)] == window
+            assert len(window) <= 200
+        # Consecutive windows overlap and the last one reaches the end
+        for (o1, w1), (o2, _) in zip(windows, windows[1:]):
+            assert o2 < o1 + len(w1)
+        last_offset, last = windows[-1]
+        assert last_offset + len(last) == len(text)
+
+    def test_merge_spans_keeps_best_overlapping_span(self):
+        merged = merge_spans([
+            {"text": "Redis", "label": "technology", "start": 10, "end": 15, "score": 0.7},
+            {"text": "Redis", "label": "technology", "start": 10, "end": 15, "score": 0.9},
+            {"text": "Redis cache", "label": "concept", "start": 10, "end": 21, "score": 0.6},
+            {"text": "Kafka", "label": "technology", "start": 30, "end": 35, "score": 0.8},
+        ])
+
+        assert [(e["label"], e["score"]) for e in merged] == [
+            ("technology", 0.9), ("concept", 0.6), ("technology", 0.8),
+        ]
+
+
+class TestBatchExtraction:
+
+    def test_windows_of_all_texts_share_one_forward_pass(self):
+        service = _gliner(window_chars=60, overlap_chars=20)
+        long_text = "Intro text about things. " * 4 + "We deploy Redis here."
+        redis_at = long_text.index("Redis")
+
+        def batch_predict(texts, labels):
+            out = []
+            for t in texts:
+                i = t.find("Redis")
+                out.append([] if i < 0 else [
+                    {"text": "Redis", "label": "technology", "start": i, "end": i + 5, "score": 0.9}
+                ])
+            return out
+
+        service.model.batch_predict_entities.side_effect = batch_predict
+
+        results = service.extract_entities_batch([long_text, "Redis and Kafka"])
+
+        service.model.batch_predict_entities.assert_called_once()
+        assert len(service.model.batch_predict_entities.call_args.args[0]) > 2
+        assert results[0] == [{"name": "Redis", "type": "technology", "start": redis_at, "end": redis_at + 5}]
+        assert results[1][0]["start"] == 0
+
+    def test_no_model_returns_empty_lists(self):
+        service = GLiNERService(model_path="/nonexistent")
+        service._load_attempted = True
+
+        assert service.extract_entities_batch(["a", "b"]) == [[], []]
+
+
+class TestEntityExtractionEngine:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched_off_loop(self):
+        gliner = MagicMock()
+        calls = []
+
+        def extract_batch(texts):
+            calls.append(list(texts))
+            return [[{"name": t, "type": "concept"}] for t in texts]
+
+        gliner.extract_entities_batch.side_effect = extract_batch
+        engine = EntityExtractionEngine(gliner, max_batch_size=8, max_wait_ms=50)
+
+        results = await asyncio.gather(*(engine.extract(f"text {i}") for i in range(5)))
+
+        assert [r[0]["name"] for r in results] == [f"text {i}" for i in range(5)]
+        assert calls == [[f"text {i}" for i in range(5)]]
+        stats = engine.get_stats()
+        assert stats["batches"] == 1
+        assert stats["texts_processed"] == 5
+        assert stats["avg_batch_size"] == 5
+        assert stats["queue_depth"] == 0
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self):
+        gliner = MagicMock()
+        gliner.extract_entities_batch.side_effect = lambda texts: [[] for _ in texts]
+        engine = EntityExtractionEngine(gliner, max_batch_size=2, max_wait_ms=50)
+
+        await asyncio.gather(*(engine.extract("x") for _ in range(5)))
+
+        assert [len(c.args[0]) for c in gliner.extract_entities_batch.call_args_list] == [2, 2, 1]
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_resolves_to_empty(self):
+        gliner = MagicMock()
+        gliner.extract_entities_batch.side_effect = RuntimeError("boom")
+        engine = EntityExtractionEngine(gliner, max_wait_ms=0)
+
+        assert await engine.extract("x") == []
+        assert engine.get_stats()["failures"] == 1
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_in_flight_and_queued_requests(self):
+        release = threading.Event()
+        gliner = MagicMock()
+        gliner.extract_entities_batch.side_effect = lambda texts: release.wait(5) and [[] for _ in texts]
+        engine = EntityExtractionEngine(gliner, max_batch_size=1, max_wait_ms=0)
+
+        requests = [asyncio.create_task(engine.extract(t)) for t in ("in flight", "queued")]
+        await asyncio.sleep(0.05)
+        await engine.close()
+        release.set()
+
+        for request in requests:
+            with pytest.raises(RuntimeError, match="stopped"):
+                await request
+        assert engine.get_stats()["failures"] == 2
+
+    @pytest.mark.asyncio
+    async def test_new_loop_stops_the_batcher_of_a_live_loop(self):
+        started, release = threading.Event(), threading.Event()
+        gliner = MagicMock()
+
+        def extract_batch(texts):
+            started.set()
+            release.wait(5)
+            return [[{"name": t, "type": "concept"}] for t in texts]
+
+        gliner.extract_entities_batch.side_effect = extract_batch
+        engine = EntityExtractionEngine(gliner, max_wait_ms=0)
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever)
+        thread.start()
+        try:
+            old_request = asyncio.run_coroutine_threadsafe(engine.extract("old"), old_loop)
+            assert started.wait(5)
+
+            new_request = asyncio.create_task(engine.extract("new"))
+            await asyncio.sleep(0.05)
+            with pytest.raises(RuntimeError, match="stopped"):
+                old_request.result(timeout=5)
+            release.set()
+
+            assert (await new_request)[0]["name"] == "new"
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(5)
+            old_loop.close()
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_extraction_service_uses_engine(self):
+        from services.entity_extraction_service import EntityExtractionService
+
+        extraction_engine = MagicMock()
+        extraction_engine.extract = AsyncMock(return_value=[{"name": "Redis", "type": "technology"}])
+        service = EntityExtractionService(
+            engine=MagicMock(), gliner_service=MagicMock(), extraction_engine=extraction_engine,
+        )
+        service._save_to_db = AsyncMock(return_value=True)
+
+        assert await service.extract_entities("id", "Title", "Body", "note", []) is True
+        extraction_engine.extract.assert_awaited_once_with("Title\n\nBody")
+        service.gliner_service.extract_entities.assert_not_called()
@@ -0,0 +1,243 @@
+"""Tests for the filtered ANN planner (pgvector iterative scans + exact fallback)."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.filtered_ann_planner import (
+    FilteredANNConfig,
+    FilteredANNPlan,
+    FilteredANNPlanner,
+)
+
+
+def _result(scalar=None, rows=None):
+    """Build a mock SQLAlchemy result."""
+    result = MagicMock()
+    result.scalar.return_value = scalar
+    result.fetchall.return_value = rows or []
+    return result
+
+
+class _Savepoint:
+    """conn.begin_nested() stand-in: awaitable and async context manager."""
+
+    def __init__(self):
+        self.rollback = AsyncMock()
+        self.exited_with = []
+
+    def __await__(self):
+        yield from []
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.exited_with.append(exc_type)
+        return False
+
+
+def _mock_conn(bounded_count, reltuples, plan_rows=None):
+    """Connection answering count / reltuples / EXPLAIN, then SET LOCAL."""
+    conn = AsyncMock()
+    conn.savepoint = _Savepoint()
+    conn.begin_nested = MagicMock(return_value=conn.savepoint)
+    responses = [_result(bounded_count), _result(reltuples)]
+    if plan_rows is not None:
+        responses.append(_result(json.dumps([{"Plan": {"Plan Rows": plan_rows}}])))
+    conn.execute = AsyncMock(side_effect=responses + [_result()] * 10)
+    return conn
+
+
+def _executed_sql(conn):
+    return [str(call.args[0]) for call in conn.execute.call_args_list]
+
+
+class TestFilteredANNPlanner:
+    """Strategy selection and SET LOCAL application."""
+
+    @pytest.mark.asyncio
+    async def test_small_partition_uses_exact_scan(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(exact_scan_threshold=2000))
+        conn = _mock_conn(bounded_count=150, reltuples=100000)
+
+        plan = await planner.plan(conn, "memories", "project_id = :project_id", {"project_id": "p"}, limit=50)
+
+        assert plan.strategy == "exact"
+        assert plan.estimated_rows == 150
+        assert plan.selectivity == pytest.approx(0.0015)
+
+        await planner.apply(conn, plan)
+        assert "SET LOCAL enable_indexscan = off" in _executed_sql(conn)
+
+    @pytest.mark.asyncio
+    async def test_selective_filter_uses_iterative_scan_with_scaled_ef(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(exact_scan_threshold=2000))
+        conn = _mock_conn(bounded_count=2001, reltuples=100000, plan_rows=10000)
+
+        plan = await planner.plan(conn, "code_chunks", "repository = :repository", {"repository": "r"}, limit=50)
+
+        assert plan.strategy == "iterative"
+        assert plan.selectivity == pytest.approx(0.1)
+        assert plan.ef_search == 500  # 50 / 0.1
+        assert plan.max_scan_tuples == 20000  # pgvector default floor
+
+        await planner.apply(conn, plan)
+        executed = _executed_sql(conn)
+        assert "SET LOCAL hnsw.ef_search = 500" in executed
+        assert "SET LOCAL hnsw.iterative_scan = 'relaxed_order'" in executed
+        assert "SET LOCAL hnsw.max_scan_tuples = 20000" in executed
+
+    @pytest.mark.asyncio
+    async def test_off_mode_keeps_defaults_without_queries(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(mode="off"))
+        conn = AsyncMock()
+
+        plan = await planner.plan(conn, "memories", "TRUE", {}, limit=10, base_ef_search=100)
+
+        assert plan.strategy == "hnsw"
+        assert plan.ef_search == 100
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_estimation_failure_falls_back_to_hnsw(self):
+        planner = FilteredANNPlanner(FilteredANNConfig())
+        conn = _mock_conn(0, 0)
+        conn.execute = AsyncMock(side_effect=Exception("boom"))
+
+        plan = await planner.plan(conn, "memories", "TRUE", {}, limit=10)
+
+        assert plan.strategy == "hnsw"
+        # The probe failed inside the savepoint, which rolls it back
+        assert conn.savepoint.exited_with == [Exception]
+
+    @pytest.mark.asyncio
+    async def test_filtered_size_is_cached_per_filter(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(exact_scan_threshold=2000))
+        conn = _mock_conn(bounded_count=150, reltuples=100000)
+        where = "project_id = :project_id"
+
+        first = await planner.plan(conn, "memories", where, {"project_id": "p", "embedding": "[1]"}, limit=50)
+        probes = conn.execute.await_count
+        again = await planner.plan(conn, "memories", where, {"project_id": "p", "embedding": "[2]"}, limit=50)
+
+        assert (again.strategy, again.estimated_rows) == (first.strategy, first.estimated_rows)
+        assert conn.execute.await_count == probes  # no COUNT round trip
+        await planner.plan(conn, "memories", where, {"project_id": "other"}, limit=50)
+        assert conn.execute.await_count > probes
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_table(self):
+        planner = FilteredANNPlanner(FilteredANNConfig())
+        with pytest.raises(ValueError):
+            await planner.plan(AsyncMock(), "events; DROP TABLE x", "TRUE", {}, limit=10)
+
+    def test_ef_search_is_clamped(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(max_ef_search=1000))
+
+        assert planner.ef_search_for(1.0, limit=10, base_ef_search=100) == 100
+        assert planner.ef_search_for(0.0001, limit=50, base_ef_search=100) == 1000
+
+    def test_max_scan_tuples_is_clamped(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(max_scan_tuples=50000))
+
+        assert planner.max_scan_tuples_for(0.5, limit=10) == 20000
+        assert planner.max_scan_tuples_for(0.0001, limit=50) == 50000
+
+
+class TestFilteredANNTelemetry:
+    """Recall sampling and aggregated stats."""
+
+    @pytest.mark.asyncio
+    async def test_measure_recall_against_exact_scan(self):
+        planner = FilteredANNPlanner(FilteredANNConfig())
+        conn = _mock_conn(0, 0)
+        conn.execute = AsyncMock(side_effect=[
+            _result(),  # SET LOCAL enable_indexscan = off
+            _result(rows=[("a",), ("b",), ("c",), ("d",)]),
+        ])
+
+        recall = await planner.measure_recall(conn, MagicMock(), {}, ["a", "b", "x"])
+
+        assert recall == pytest.approx(0.5)
+        # SET LOCAL is undone with the savepoint
+        conn.savepoint.rollback.assert_awaited_once()
+
+    def test_exact_plans_are_never_sampled(self):
+        planner = FilteredANNPlanner(FilteredANNConfig(recall_sample_rate=1.0))
+        plan = FilteredANNPlan(table="memories", strategy="exact", ef_search=100, limit=10)
+
+        assert planner.should_sample_recall(plan) is False
+
+    def test_record_aggregates_by_strategy(self):
+        planner = FilteredANNPlanner(FilteredANNConfig())
+        plan = FilteredANNPlan(
+            table="memories", strategy="iterative", ef_search=400, limit=10, estimated_rows=5000,
+        )
+
+        planner.record(plan, returned=10, latency_ms=4.0, recall=1.0)
+        planner.record(plan, returned=6, latency_ms=8.0, recall=0.8)
+
+        stats = planner.stats()["iterative"]
+        assert stats["queries"] == 2
+        assert stats["avg_latency_ms"] == 6.0
+        assert stats["underfilled"] == 1
+        assert stats["avg_recall"] == pytest.approx(0.9)
+
+
+class TestHybridMemoryVectorSearchPlanning:
+    """HybridMemorySearchService._vector_search routes filtered queries to the planner."""
+
+    @pytest.mark.asyncio
+    async def test_filtered_vector_search_applies_plan(self):
+        from mnemo_mcp.models.memory_models import MemoryFilters
+        from services.hybrid_memory_search_service import HybridMemorySearchService
+
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value=_result(rows=[]))
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        planner = MagicMock()
+        planner.enabled = True
+        planner.plan = AsyncMock(return_value=FilteredANNPlan(
+            table="memories", strategy="exact", ef_search=100, limit=20,
+        ))
+        planner.apply = AsyncMock()
+        planner.should_sample_recall.return_value = False
+
+        service = HybridMemorySearchService(engine=engine, ann_planner=planner)
+        results, _ = await service._vector_search(
+            embedding=[0.1] * 768,
+            filters=MemoryFilters(tags=["sys:core"]),
+            limit=20,
+        )
+
+        assert results == []
+        planner.plan.assert_awaited_once()
+        assert planner.plan.call_args.args[1] == "memories"
+        planner.apply.assert_awaited_once()
+        planner.record.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_vector_search_skips_planner(self):
+        from services.hybrid_memory_search_service import HybridMemorySearchService
+
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value=_result(rows=[]))
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        planner = MagicMock()
+        planner.enabled = True
+        planner.plan = AsyncMock()
+
+        service = HybridMemorySearchService(engine=engine, ann_planner=planner)
+        await service._vector_search(embedding=[0.1] * 768, filters=None, limit=20)
+
+        planner.plan.assert_not_called()
+        assert "SET LOCAL hnsw.ef_search = 100" in _executed_sql(conn)
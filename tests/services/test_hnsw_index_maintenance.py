@@ -0,0 +1,111 @@
+"""
+Unit tests for HNSW index maintenance (deferred builds, concurrent swaps).
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services import hnsw_index_maintenance
+from services.hnsw_index_maintenance import HnswIndex, HnswIndexMaintenance
+
+DEFINITION = (
+    "CREATE INDEX idx_memories_embedding_half ON public.memories "
+    "USING hnsw (embedding_half halfvec_cosine_ops) WITH (m='16', ef_construction='128')"
+)
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[
+        {"tablename": "memories", "indexname": "idx_memories_embedding_half",
+         "indexdef": DEFINITION, "size_bytes": 4096, "valid": True},
+    ])
+    conn.fetchval = AsyncMock(return_value=1000)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    conn.transaction = MagicMock(return_value=transaction)
+    monkeypatch.setattr(hnsw_index_maintenance.asyncpg, "connect", AsyncMock(return_value=conn))
+    return conn
+
+
+def _executed(conn, prefix=""):
+    return [c.args[0] for c in conn.execute.call_args_list if c.args[0].strip().startswith(prefix)]
+
+
+def _index():
+    return HnswIndex(table="memories", name="idx_memories_embedding_half", definition=DEFINITION)
+
+
+class TestHnswIndexMaintenance:
+
+    @pytest.mark.asyncio
+    async def test_list_indexes_defaults_to_both_tables(self, conn):
+        indexes = await HnswIndexMaintenance("postgresql+asyncpg://db/x").list_indexes()
+
+        assert conn.fetch.await_args.args[1] == ["memories", "code_chunks"]
+        assert indexes[0].name == "idx_memories_embedding_half" and indexes[0].size_bytes == 4096
+        conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_drop_then_build_with_tuned_settings(self, conn):
+        maintenance = HnswIndexMaintenance("postgresql://db/x", maintenance_work_mem="2GB", parallel_workers=8)
+
+        dropped = await maintenance.drop("memories")
+        builds = await maintenance.build(dropped, operation="reembed")
+
+        assert _executed(conn, "DROP INDEX") == ['DROP INDEX IF EXISTS "idx_memories_embedding_half"']
+        assert _executed(conn, "SET") == ["SET maintenance_work_mem = '2GB'",
+                                          "SET max_parallel_maintenance_workers = 8"]
+        assert _executed(conn, "CREATE INDEX") == [DEFINITION]
+        assert builds[0].status == "completed" and builds[0].size_bytes == 1000
+        record = next(c.args for c in conn.execute.call_args_list if "hnsw_index_builds" in c.args[0])
+        assert record[1:5] == ("memories", "idx_memories_embedding_half", "reembed", "completed")
+        assert record[8:10] == ("2GB", 8)
+
+    @pytest.mark.asyncio
+    async def test_build_attempts_every_index_and_raises_the_failure(self, conn):
+        async def execute(sql, *args):
+            if sql.startswith("CREATE INDEX idx_a"):
+                raise RuntimeError("out of memory")
+        conn.execute.side_effect = execute
+        indexes = [HnswIndex("memories", name, DEFINITION.replace("idx_memories_embedding_half", name))
+                   for name in ("idx_a", "idx_b")]
+
+        with pytest.raises(RuntimeError, match="idx_a"):
+            await HnswIndexMaintenance("postgresql://db/x").build(indexes)
+
+        assert len(_executed(conn, "CREATE INDEX")) == 2
+
+    @pytest.mark.asyncio
+    async def test_swap_builds_concurrently_then_renames(self, conn):
+        build = await HnswIndexMaintenance("postgresql://db/x").swap(_index())
+
+        assert build.status == "completed" and build.operation == "swap"
+        create = _executed(conn, "CREATE INDEX")[0]
+        assert create.startswith('CREATE INDEX CONCURRENTLY "idx_memories_embedding_half_rebuild" ON public.memories')
+        assert create.endswith("WITH (m='16', ef_construction='128')")
+        assert _executed(conn, "ALTER INDEX") == [
+            'ALTER INDEX "idx_memories_embedding_half_rebuild" RENAME TO "idx_memories_embedding_half"'
+        ]
+        assert _executed(conn, "DROP INDEX IF EXISTS") == ['DROP INDEX IF EXISTS "idx_memories_embedding_half"']
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrent_build_keeps_the_old_index(self, conn):
+        conn.fetchval = AsyncMock(side_effect=lambda sql, *args: False if "indisvalid" in sql else 1)
+
+        build = await HnswIndexMaintenance("postgresql://db/x").swap(_index())
+
+        assert build.status == "failed"
+        assert not _executed(conn, "ALTER INDEX")
+        assert _executed(conn, "DROP INDEX CONCURRENTLY")[-1] == \
+            'DROP INDEX CONCURRENTLY IF EXISTS "idx_memories_embedding_half_rebuild"'
+
+    def test_should_defer_threshold(self):
+        assert HnswIndexMaintenance("postgresql://db/x", defer_row_threshold=100).should_defer(100)
+        assert not HnswIndexMaintenance("postgresql://db/x", defer_row_threshold=100).should_defer(99)
+        assert not HnswIndexMaintenance("postgresql://db/x", defer_row_threshold=0).should_defer(10 ** 9)
+        with pytest.raises(ValueError):
+            HnswIndexMaintenance("postgresql://db/x", maintenance_work_mem="1GB'; DROP TABLE x; --")
@@ -0,0 +1,106 @@
+"""Tests for the lean lexical/vector projection in HybridMemorySearchService."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.hybrid_memory_search_service import (
+    HybridMemorySearchService,
+    MemorySearchResult,
+)
+
+
+def _candidate(memory_id: str, rank: int, preview: str = "preview") -> MemorySearchResult:
+    r = MemorySearchResult(
+        memory_id=memory_id,
+        title=f"title {memory_id}",
+        content_preview=preview,
+        memory_type="note",
+        tags=[],
+        created_at="2026-01-01T00:00:00+00:00",
+        trgm_score=1.0 / rank,
+    )
+    r.rank = rank
+    return r
+
+
+def _service(**kwargs) -> HybridMemorySearchService:
+    service = HybridMemorySearchService(
+        engine=MagicMock(), default_enable_decay=False, **kwargs
+    )
+    candidates = [_candidate(f"m{i}", i) for i in range(1, 11)]
+    service._lexical_search = AsyncMock(return_value=(candidates, 1.0))
+    service._hydrate_content = AsyncMock(
+        side_effect=lambda ids: {i: f"full content of {i}" for i in ids}
+    )
+    return service
+
+
+class TestLeanProjection:
+
+    @pytest.mark.asyncio
+    async def test_candidate_queries_fetch_bounded_previews(self):
+        conn = AsyncMock()
+        result = MagicMock()
+        result.fetchall.return_value = []
+        conn.execute = AsyncMock(return_value=result)
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        service = HybridMemorySearchService(engine=engine, preview_chars=200)
+        await service._lexical_search(query="redis", filters=None, limit=10)
+
+        sql, params = conn.execute.call_args.args
+        assert "LEFT(content, :preview_chars)" in str(sql)
+        assert "content as content_preview" not in str(sql)
+        assert params["preview_chars"] == 200
+
+    @pytest.mark.asyncio
+    async def test_rerank_hydrates_only_rerank_pool(self):
+        service = _service()
+        service.reranker = MagicMock()
+        service.reranker.rerank_with_ids = AsyncMock(
+            side_effect=lambda query, documents, top_k: [
+                (doc_id, 1.0, doc) for doc_id, doc in documents
+            ]
+        )
+
+        response = await service.search(
+            query="redis", enable_vector=False, limit=3, rerank_pool_size=5,
+        )
+
+        service._hydrate_content.assert_awaited_once()
+        hydrated_ids = service._hydrate_content.call_args.args[0]
+        assert len(hydrated_ids) == 5
+        documents = service.reranker.rerank_with_ids.call_args.kwargs["documents"]
+        assert documents[0][1].startswith("full content of")
+        assert response.metadata.hydrated_count == 5
+        # Content is not attached unless requested
+        assert all(r.content is None for r in response.results)
+
+    @pytest.mark.asyncio
+    async def test_include_content_hydrates_final_page(self):
+        service = _service()
+
+        response = await service.search(
+            query="redis", enable_vector=False, enable_reranking=False,
+            limit=3, include_content=True,
+        )
+
+        hydrated_ids = service._hydrate_content.call_args.args[0]
+        assert hydrated_ids == [r.memory_id for r in response.results]
+        assert response.results[0].content == f"full content of {response.results[0].memory_id}"
+
+    @pytest.mark.asyncio
+    async def test_content_bytes_metric(self):
+        service = _service()
+
+        response = await service.search(
+            query="redis", enable_vector=False, enable_reranking=False, limit=3,
+        )
+
+        # 10 candidates x len("preview"), nothing hydrated
+        assert response.metadata.content_bytes_fetched == 10 * len("preview")
+        assert response.metadata.hydrated_count == 0
+        service._hydrate_content.assert_not_awaited()
@@ -0,0 +1,250 @@
+"""Tests for the single-statement (SQL-side RRF) hybrid memory search mode."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.hybrid_memory_search_service import HybridMemorySearchService, MemorySearchResult
+from services.query_understanding_service import QueryKeywords
+
+
+def _row(memory_id, rrf, lexical_rank=None, vector_rank=None, entity_rank=None, tag_rank=None,
+         weights=(0.5, 0.5, None, None)):
+    return (
+        memory_id, f"title {memory_id}", "preview", "note", "{a,b}",
+        "2026-01-01 00:00:00+00", None, rrf,
+        lexical_rank, vector_rank, entity_rank, tag_rank,
+        0.9 if lexical_rank else None, 0.8 if vector_rank else None,
+        *weights,
+    )
+
+
+class TestSqlFusion:
+
+    @pytest.mark.asyncio
+    async def test_single_statement_with_all_generators(self, make_engine):
+        engine, conn = make_engine([])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        await service.search(
+            query="redis cache",
+            embedding=[0.1] * 768,
+            keywords=QueryKeywords(hl_keywords=[], ll_keywords=["redis"]),
+            enable_reranking=False,
+            fusion_mode="sql",
+        )
+
+        engine.begin.assert_called_once()
+        sql, params = conn.execute.call_args.args
+        sql = str(sql)
+        for cte in ("lexical_candidates", "vector_candidates", "entity_candidates", "tag_candidates"):
+            assert f"{cte} AS (" in sql
+        assert "SUM(w.weight / (:rrf_k + rnk))" in sql
+        assert "weight / SUM(weight) OVER ()" in sql
+        assert "LIMIT :fetch_limit" in sql
+        assert params["fetch_limit"] == 10
+        assert (params["lexical_weight"], params["vector_weight"]) == (0.5, 0.5)
+        # HNSW tuning runs in the same transaction as the search statement
+        executed = [str(c.args[0]) for c in conn.execute.call_args_list]
+        assert "SET LOCAL hnsw.ef_search = 100" in executed
+
+    @pytest.mark.asyncio
+    async def test_rows_map_to_fused_results_with_method_ranks(self, make_engine):
+        engine, _ = make_engine([
+            _row("m1", 0.02, lexical_rank=1, vector_rank=2),
+            _row("m2", 0.01, vector_rank=1),
+        ])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        response = await service.search(
+            query="redis", embedding=[0.1] * 768, enable_reranking=False, fusion_mode="sql",
+        )
+
+        assert [r.memory_id for r in response.results] == ["m1", "m2"]
+        first = response.results[0]
+        assert first.rrf_score == pytest.approx(0.02)
+        assert first.lexical_score == pytest.approx(0.9)
+        assert first.vector_similarity == pytest.approx(0.8)
+        assert first.contribution["lexical"] == pytest.approx(0.5 / 61)
+        assert first.tags == ["a", "b"]
+        assert response.metadata.fusion_mode == "sql"
+        assert response.metadata.connections_used == 1
+        assert response.metadata.lexical_count == 1
+        assert response.metadata.vector_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lexical_only_skips_vector_cte_and_hnsw_settings(self, make_engine):
+        engine, conn = make_engine([])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        await service.search(query="redis", enable_vector=False, enable_reranking=False, fusion_mode="sql")
+
+        conn.execute.assert_awaited_once()
+        sql = str(conn.execute.call_args.args[0])
+        assert "vector_candidates" not in sql
+        assert "lexical_candidates" in sql
+
+    @pytest.mark.asyncio
+    async def test_python_mode_reports_one_connection_per_generator(self, make_engine):
+        engine, _ = make_engine([])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        response = await service.search(
+            query="redis", embedding=[0.1] * 768, enable_reranking=False,
+        )
+
+        assert response.metadata.fusion_mode == "python"
+        assert response.metadata.connections_used == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_fusion_mode(self):
+        service = HybridMemorySearchService(engine=MagicMock())
+
+        with pytest.raises(ValueError):
+            await service.search(query="redis", enable_vector=False, fusion_mode="gpu")
+
+        with pytest.raises(ValueError):
+            HybridMemorySearchService(engine=MagicMock(), default_fusion_mode="gpu")
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_falls_back_to_python_fusion(self, make_engine):
+        engine, conn = make_engine([])
+        conn.execute.side_effect = RuntimeError("function similarity does not exist")
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+        service._lexical_search = AsyncMock(return_value=(_candidates(["a", "b"]), 1.0))
+
+        response = await service.search(query="redis", enable_vector=False, enable_reranking=False, fusion_mode="sql")
+
+        assert [r.memory_id for r in response.results] == ["a", "b"]
+        service._lexical_search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_generators_returns_empty_without_a_statement(self, make_engine):
+        engine, conn = make_engine([])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        response = await service.search(
+            # Vector requested without an embedding: nothing left to run
+            query="redis", enable_lexical=False, embedding=None,
+            enable_reranking=False, fusion_mode="sql",
+        )
+
+        assert response.results == []
+        conn.execute.assert_not_called()
+
+
+def _candidates(ids, similarity=None):
+    results = []
+    for rank, memory_id in enumerate(ids, start=1):
+        r = MemorySearchResult(
+            memory_id=memory_id, title=f"title {memory_id}", content_preview="preview",
+            memory_type="note", tags=[], created_at="2026-01-01 00:00:00+00",
+            similarity_score=similarity,
+        )
+        r.rank = rank
+        results.append(r)
+    return results
+
+
+def _fused_rows(lists, k, fetch_limit, lexical_weight=0.5, vector_weight=0.5):
+    """
+    What the fused CTE returns: SUM(weight / (k + rnk)) per id, ordered by
+    score, then lexical/vector/entity/tag rank NULLS LAST.
+    """
+    methods = ("lexical", "vector", "entity", "tag")
+    weights = HybridMemorySearchService._fusion_weights(
+        lexical_weight, vector_weight, [m for m in methods if lists.get(m)]
+    )
+    ranks = {}
+    for method in methods:
+        for rank, memory_id in enumerate(lists.get(method, []), start=1):
+            ranks.setdefault(memory_id, {})[method] = rank
+
+    def score(memory_id):
+        return sum(weights[m] / (k + r) for m, r in ranks[memory_id].items())
+
+    big = float("inf")
+    ordered = sorted(ranks, key=lambda i: (-score(i), *(ranks[i].get(m, big) for m in methods)))
+    return [
+        _row(i, score(i), *(ranks[i].get(m) for m in methods), weights=tuple(weights.get(m) for m in methods))
+        for i in ordered[:fetch_limit]
+    ]
+
+
+class TestFusionParity:
+    """Python and SQL fusion rank the same candidates identically."""
+
+    @pytest.mark.asyncio
+    async def test_same_ranking_in_both_modes(self, make_engine):
+        lists = {
+            "lexical": ["a", "b", "c", "d"],
+            "vector": ["c", "e", "a", "f"],
+            "entity": ["f", "b"],
+            "tag": ["g", "d"],
+        }
+        keywords = QueryKeywords(hl_keywords=[], ll_keywords=["redis"])
+        search_args = dict(
+            query="redis", embedding=[0.1] * 768, keywords=keywords,
+            enable_reranking=False, limit=7,
+        )
+
+        python_service = HybridMemorySearchService(engine=MagicMock(), default_enable_decay=False)
+        python_service._lexical_search = AsyncMock(return_value=(_candidates(lists["lexical"]), 1.0))
+        python_service._vector_search = AsyncMock(return_value=(_candidates(lists["vector"], 0.9), 1.0))
+        python_service._entity_search = AsyncMock(return_value=(_candidates(lists["entity"]), 1.0))
+        python_service._tag_search = AsyncMock(return_value=(_candidates(lists["tag"]), 1.0))
+        python_response = await python_service.search(**search_args, fusion_mode="python")
+
+        engine, conn = make_engine([])
+        sql_service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+        k = sql_service.fusion.k
+        conn.execute.return_value.fetchall.return_value = _fused_rows(lists, k, fetch_limit=10)
+        sql_response = await sql_service.search(**search_args, fusion_mode="sql")
+
+        sql = str(conn.execute.call_args.args[0])
+        assert "SUM(w.weight / (:rrf_k + rnk))" in sql
+        assert "f.lexical_rank NULLS LAST, f.vector_rank NULLS LAST" in sql
+        python_ranking = [(r.memory_id, round(r.rrf_score, 12)) for r in python_response.results]
+        sql_ranking = [(r.memory_id, round(r.rrf_score, 12)) for r in sql_response.results]
+        assert python_ranking == sql_ranking
+        assert len(python_ranking) == 7
+
+
+class TestFusionWeights:
+    """lexical_weight / vector_weight change the fused order in both modes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("weights, first", [((0.9, 0.1), "a"), ((0.1, 0.9), "b")])
+    async def test_weights_change_the_python_ranking(self, weights, first):
+        service = HybridMemorySearchService(engine=MagicMock(), default_enable_decay=False)
+        service._lexical_search = AsyncMock(return_value=(_candidates(["a", "b"]), 1.0))
+        service._vector_search = AsyncMock(return_value=(_candidates(["b", "a"], 0.9), 1.0))
+
+        response = await service.search(
+            query="redis", embedding=[0.1] * 768, enable_reranking=False,
+            lexical_weight=weights[0], vector_weight=weights[1],
+        )
+
+        assert response.results[0].memory_id == first
+
+    def test_side_generators_weigh_less_next_to_lexical_and_vector(self):
+        weights = HybridMemorySearchService._fusion_weights(0.5, 0.5, ["lexical", "vector", "tag"])
+        assert weights == pytest.approx({"lexical": 0.5 / 1.15, "vector": 0.5 / 1.15, "tag": 0.15 / 1.15})
+
+        weights = HybridMemorySearchService._fusion_weights(0.5, 0.5, ["lexical", "entity"])
+        assert weights == pytest.approx({"lexical": 0.5 / 0.8, "entity": 0.3 / 0.8})
+
+    @pytest.mark.asyncio
+    async def test_weights_are_bound_in_the_sql_statement(self, make_engine):
+        engine, conn = make_engine([])
+        service = HybridMemorySearchService(engine=engine, default_enable_decay=False)
+
+        await service.search(
+            query="redis", embedding=[0.1] * 768, enable_reranking=False, fusion_mode="sql",
+            lexical_weight=0.8, vector_weight=0.2,
+        )
+
+        sql, params = conn.execute.call_args.args
+        assert (params["lexical_weight"], params["vector_weight"]) == (0.8, 0.2)
+        assert "SELECT 'lexical' AS method, CAST(:lexical_weight AS double precision) AS weight" in str(sql)
+        assert "JOIN weights w USING (method)" in str(sql)
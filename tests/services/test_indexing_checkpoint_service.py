@@ -0,0 +1,151 @@
+"""
+Unit tests for durable per-file indexing checkpoints and run counters.
+"""
+
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.indexing_checkpoint_service import IndexingCheckpointService, IndexingRun, file_hash
+
+
+def _queries(rows=(), run=None, fail=False):
+    """Statement handler: checkpoint SELECT returns `rows`, run SELECT `run`."""
+
+    async def execute(statement, params=None):
+        if fail:
+            raise RuntimeError("relation does not exist")
+        sql = str(statement)
+        result = MagicMock()
+        if "FROM indexing_checkpoints c" in sql:
+            result.__iter__.return_value = iter([SimpleNamespace(**r) for r in rows])
+        elif "FROM indexing_runs" in sql:
+            result.mappings.return_value.first.return_value = run
+        return result
+
+    return execute
+
+
+def _executed(conn, fragment):
+    return [c for c in conn.execute.call_args_list if fragment in str(c.args[0])]
+
+
+def _run(**values):
+    data = {"repository": "repo", "run_id": "job-1", "source": "batch", "status": "running"}
+    data.update(values)
+    return data
+
+
+class TestPendingFiles:
+
+    @pytest.mark.asyncio
+    async def test_completed_files_with_the_same_content_are_skipped(self, make_engine, tmp_path):
+        same, changed, new = (tmp_path / name for name in ("same.ts", "changed.ts", "new.ts"))
+        for path in (same, changed, new):
+            path.write_text(f"// {path.name}")
+        engine, _ = make_engine(execute=_queries(rows=[
+            {"file_path": str(same), "content_hash": file_hash(same), "before_run": True},
+            {"file_path": str(changed), "content_hash": "stale", "before_run": True},
+        ]))
+        service = IndexingCheckpointService(engine)
+
+        pending, completed = await service.pending_files("repo", [same, changed, new])
+
+        assert completed == [same]
+        assert pending == [(changed, file_hash(changed)), (new, file_hash(new))]
+        assert service._skipped["repo"] == 1
+
+    @pytest.mark.asyncio
+    async def test_files_of_the_current_run_are_not_counted_as_skipped(self, make_engine, tmp_path):
+        path = tmp_path / "a.ts"
+        path.write_text("x")
+        engine, _ = make_engine(execute=_queries(rows=[{"file_path": str(path), "content_hash": file_hash(path), "before_run": False}]))
+        service = IndexingCheckpointService(engine)
+
+        _, completed = await service.pending_files("repo", [path])
+
+        assert completed == [path]
+        assert service._skipped["repo"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unreadable_checkpoints_leave_every_file_pending(self, make_engine, tmp_path):
+        path = tmp_path / "a.ts"
+        path.write_text("x")
+        engine, _ = make_engine(execute=_queries(fail=True))
+
+        pending, completed = await IndexingCheckpointService(engine).pending_files("repo", [path])
+
+        assert pending == [(path, hashlib.md5(b"x").hexdigest())] and completed == []
+
+
+class TestCheckpointWrites:
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_checkpoints_and_counters_together(self, make_engine):
+        engine, conn = make_engine(execute=_queries())
+        service = IndexingCheckpointService(engine, flush_size=2)
+        service._skipped["repo"] = 3
+
+        service.record("repo", "src/a.ts", "h1", chunks=4)
+        assert not service.full
+        service.record("repo", "src/b.ts", "h2", error="parse error")
+        assert service.full
+        assert await service.flush()
+
+        upsert = _executed(conn, "INSERT INTO indexing_checkpoints")[0].args[1]
+        assert [(r["file_path"], r["status"]) for r in upsert] == [("src/a.ts", "completed"), ("src/b.ts", "failed")]
+        counters = _executed(conn, "UPDATE indexing_runs")[0].args[1][0]
+        assert (counters["processed"], counters["failed"], counters["skipped"], counters["chunks"]) == (1, 1, 3, 4)
+        assert engine.begin.call_count == 1
+        assert not service.full
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_the_records(self, make_engine):
+        engine, _ = make_engine(execute=_queries(fail=True))
+        service = IndexingCheckpointService(engine)
+        service.record("repo", "src/a.ts", "h1", chunks=1)
+
+        assert not await service.flush()
+        assert len(service._buffer) == 1
+
+    @pytest.mark.asyncio
+    async def test_purge_keeps_only_completed_files(self, make_engine):
+        engine, conn = make_engine(execute=_queries())
+
+        await IndexingCheckpointService(engine).purge_unfinished("repo", ["src/a.ts"])
+
+        params = _executed(conn, "DELETE FROM code_chunks")[0].args[1]
+        assert params == {"repository": "repo", "paths": ["src/a.ts"]}
+
+
+class TestRuns:
+
+    @pytest.mark.asyncio
+    async def test_unfinished_run_of_the_same_job_continues(self, make_engine):
+        engine, conn = make_engine(execute=_queries(run=_run()))
+
+        run = await IndexingCheckpointService(engine).start_run("repo", 100, source="batch", run_id="job-1")
+
+        assert _executed(conn, "resumes = resumes + 1")
+        assert not _executed(conn, "INSERT INTO indexing_runs")
+        assert isinstance(run, IndexingRun)
+
+    @pytest.mark.asyncio
+    async def test_new_job_or_completed_run_starts_from_zero(self, make_engine):
+        for previous, kwargs in ((_run(), {"run_id": "job-2"}), (_run(status="completed"), {"resume": True})):
+            engine, conn = make_engine(execute=_queries(run=previous))
+
+            await IndexingCheckpointService(engine).start_run("repo", 100, **kwargs)
+
+            assert _executed(conn, "INSERT INTO indexing_runs")
+            assert not _executed(conn, "resumes = resumes + 1")
+
+    def test_throughput_accumulates_across_resumes(self):
+        run = IndexingRun(**_run(total_files=100, processed_files=40, skipped_files=10,
+                                 chunks=400, active_seconds=20.0, resumes=2))
+
+        data = run.to_dict()
+        assert data["files_per_second"] == 2.0 and data["chunks_per_second"] == 20.0
+        assert data["remaining_files"] == 50
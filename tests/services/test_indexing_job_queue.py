@@ -0,0 +1,114 @@
+"""
+Unit tests for the MCP indexing job queue (batch pipeline submission).
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ResponseError
+
+import services.indexing_job_queue as job_queue
+from services.indexing_job_queue import IndexingJobQueue, read_indexing_status
+
+
+def _redis(job=None, legacy=None):
+    """Redis whose status key holds a batch hash `job` or a legacy JSON string."""
+    client = AsyncMock()
+    if legacy is not None:
+        client.get.return_value = json.dumps(legacy)
+    else:
+        client.get.side_effect = ResponseError("WRONGTYPE") if job else None
+        client.get.return_value = None
+    client.hgetall.return_value = job or {}
+    return client
+
+
+@pytest.fixture
+def popen(monkeypatch, tmp_path):
+    monkeypatch.setattr(job_queue, "_consumers", {})
+    monkeypatch.setenv("INDEXING_CONSUMER_LOG_DIR", str(tmp_path))
+    process = MagicMock(pid=4242)
+    process.poll.return_value = None
+    factory = MagicMock(return_value=process)
+    monkeypatch.setattr(job_queue.subprocess, "Popen", factory)
+    return factory, process
+
+
+class TestReadIndexingStatus:
+
+    @pytest.mark.asyncio
+    async def test_batch_hash_is_normalized(self):
+        client = _redis(job={
+            "job_id": "job-1", "kind": "markdown", "status": "processing", "total_files": "80",
+            "processed_files": "30", "failed_files": "10", "current_batch": "1", "total_batches": "2",
+            "started_at": "2026-10-19T10:00:00", "completed_at": "",
+        })
+
+        status = await read_indexing_status(client, "repo")
+
+        assert status["status"] == "in_progress" and status["kind"] == "markdown"
+        assert (status["indexed_files"], status["failed_files"], status["progress"]) == (30, 10, 0.5)
+        assert status["completed_at"] is None
+        client.hgetall.assert_awaited_once_with("indexing:status:repo")
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_status_and_missing_key(self):
+        legacy = {"status": "completed", "total_files": 3, "indexed_files": 3}
+
+        assert await read_indexing_status(_redis(legacy=legacy), "repo") == legacy
+        assert await read_indexing_status(_redis(), "repo") is None
+
+
+class TestSubmit:
+
+    @pytest.mark.asyncio
+    async def test_job_is_enqueued_and_one_consumer_started(self, popen, monkeypatch):
+        factory, process = popen
+        enqueue = AsyncMock(return_value={"job_id": "job-1", "total_files": 2, "total_batches": 1, "status": "pending"})
+        monkeypatch.setattr(job_queue.BatchIndexingProducer, "enqueue_files", enqueue)
+        client = _redis(job={"job_id": "job-1", "status": "processing", "total_files": "2"})
+        client.set.side_effect = [True, None, True]  # lock claimed, held by the consumer, released
+        queue = IndexingJobQueue(client, redis_url="redis://r:6379/0", db_url="postgresql+asyncpg://db")
+        files = [Path("/src/a.py"), Path("/src/b.py")]
+
+        job = await queue.submit("repo", files)
+        again = await queue.submit("repo", files)
+
+        assert job["job_id"] == "job-1"
+        assert client.set.await_args_list[0].args[0] == "indexing:consumer:repo"
+        assert client.set.await_args_list[0].kwargs == {"nx": True, "ex": 60}
+        assert enqueue.await_args.args == ("repo", files)
+        assert enqueue.await_args.kwargs == {"kind": "code", "replace": False}
+        command = factory.call_args.args[0]
+        assert command[-4:] == ["--repository", "repo", "--redis-url", "redis://r:6379/0"]
+        assert factory.call_args.kwargs["env"]["DATABASE_URL"] == "postgresql+asyncpg://db"
+        # Consumer lock held (also by a consumer another server started):
+        # the job is reported, nothing enqueued
+        assert again["status"] == "already_running" and again["job_id"] == "job-1"
+        assert enqueue.await_count == 1 and factory.call_count == 1
+
+        process.poll.return_value = 0  # consumer drained the stream and exited
+        await queue.submit("repo", files)
+        assert factory.call_count == 2
+        assert job_queue._consumers["repo"] is process  # the exited one was reaped
+
+    @pytest.mark.asyncio
+    async def test_lock_is_released_when_the_job_cannot_be_enqueued(self, popen, monkeypatch):
+        factory, _ = popen
+        monkeypatch.setattr(job_queue.BatchIndexingProducer, "enqueue_files",
+                            AsyncMock(side_effect=ConnectionError("redis down")))
+        client = _redis()
+        client.set.return_value = True
+
+        with pytest.raises(ConnectionError):
+            await IndexingJobQueue(client, redis_url="redis://r").submit("repo", [Path("/src/a.py")])
+
+        client.delete.assert_awaited_once_with("indexing:consumer:repo")
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_is_rejected(self, popen):
+        with pytest.raises(ValueError):
+            await IndexingJobQueue(_redis(), redis_url="redis://r").submit("repo", [], kind="pdf")
@@ -0,0 +1,172 @@
+"""Tests for cross-process L1 invalidation over the invalidation bus."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.caches.code_chunk_cache import CodeChunkCache
+from services.caches.invalidation_bus import InvalidationBus, LocalInvalidationHub
+from services.caches.memory_search_cache import MemorySearchCache
+from services.caches.repository_generations import RepositoryGenerations
+from services.simple_memory_cache import SimpleMemoryCache
+
+
+def _processes(n=2):
+    hub = LocalInvalidationHub()
+    return [InvalidationBus(hub=hub) for _ in range(n)]
+
+
+def _chunk_caches():
+    api_bus, mcp_bus = _processes()
+    api, mcp = CodeChunkCache(invalidation_bus=api_bus), CodeChunkCache(invalidation_bus=mcp_bus)
+    for cache in (api, mcp):
+        cache.put("repo/a.py", "a = 1", [{"source_code": "a = 1"}])
+        cache.put("repo/b.py", "b = 1", [{"source_code": "b = 1"}])
+        cache.put("other/c.py", "c = 1", [{"source_code": "c = 1"}])
+    return api, mcp
+
+
+class TestCodeChunkCacheCoherence:
+
+    def test_key_invalidation_reaches_other_process(self):
+        api, mcp = _chunk_caches()
+
+        mcp.invalidate("repo/a.py")
+
+        assert api.get("repo/a.py", "a = 1") is None
+        assert api.get("repo/b.py", "b = 1") is not None
+
+    def test_prefix_and_clear_reach_other_process(self):
+        api, mcp = _chunk_caches()
+
+        api.invalidate_by_prefix("repo/")
+        assert sorted(mcp.cache) == ["other/c.py"]
+
+        api.clear()
+        assert mcp.stats()["entries"] == 0
+
+    def test_remote_invalidation_is_not_echoed(self):
+        api_bus, mcp_bus = _processes()
+        CodeChunkCache(invalidation_bus=api_bus)
+        mcp = CodeChunkCache(invalidation_bus=mcp_bus)
+
+        mcp.invalidate("repo/a.py")
+
+        assert mcp_bus.published == 1
+        assert api_bus.published == 0
+        assert (api_bus.received, mcp_bus.received) == (1, 0)
+
+
+class TestGenerationAndSimpleCacheCoherence:
+
+    @pytest.mark.asyncio
+    async def test_generation_bump_reaches_other_process(self):
+        api_bus, mcp_bus = _processes()
+        api = RepositoryGenerations(invalidation_bus=api_bus)
+        mcp = RepositoryGenerations(invalidation_bus=mcp_bus)
+        before = await api.generation("repo")
+
+        await mcp.bump("repo")
+
+        assert await api.generation("repo") != before
+        assert await api.generation("repo") == await mcp.generation("repo")
+
+    @pytest.mark.asyncio
+    async def test_memory_search_bump_reaches_other_process(self):
+        api_bus, mcp_bus = _processes()
+        api = MemorySearchCache(invalidation_bus=api_bus)
+        mcp = MemorySearchCache(invalidation_bus=mcp_bus)
+        before = await api.generation("p1")
+
+        await mcp.invalidate("p1")
+
+        assert await api.generation("p1") != before
+
+    @pytest.mark.asyncio
+    async def test_simple_cache_remove_and_clear(self):
+        api_bus, mcp_bus = _processes()
+        api = SimpleMemoryCache(name="event", invalidation_bus=api_bus)
+        mcp = SimpleMemoryCache(name="event", invalidation_bus=mcp_bus)
+        other = SimpleMemoryCache(name="graph", invalidation_bus=mcp_bus)
+        for cache in (api, mcp, other):
+            await cache.set("k1", 1)
+            await cache.set("k2", 2)
+
+        await mcp.remove("k1")
+        assert await api.get("k1") is None
+        assert await api.get("k2") == 2
+
+        await mcp.clear()
+        assert await api.get("k2") is None
+        assert await other.get("k2") == 2  # different cache name
+
+
+class _FakePubSub:
+    def __init__(self, messages, fail=False):
+        self.messages = messages
+        self.fail = fail
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        if self.fail:
+            raise ConnectionError("connection reset")
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class TestRedisTransport:
+
+    @pytest.mark.asyncio
+    async def test_publish_goes_to_channel(self):
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+        bus = InvalidationBus(redis_client=redis)
+
+        await bus.publish("code_chunks", "prefix", "repo/")
+
+        channel, payload = redis.publish.call_args.args
+        assert channel == "mnemo:l1:invalidate"
+        assert json.loads(payload)["value"] == "repo/"
+
+    @pytest.mark.asyncio
+    async def test_sync_invalidation_publishes_in_background(self):
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+        bus = InvalidationBus(redis_client=redis)
+        cache = CodeChunkCache(invalidation_bus=bus)
+
+        cache.invalidate("repo/a.py")
+        await bus.stop()  # flushes pending publishes
+
+        redis.publish.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_listener_applies_messages_and_resyncs_after_reconnect(self):
+        remote = json.dumps({"origin": "other", "cache": "code_chunks", "kind": "key", "value": "repo/a.py"})
+        redis = MagicMock()
+        redis.pubsub.side_effect = [
+            _FakePubSub([], fail=True),
+            _FakePubSub([{"type": "message", "data": remote.encode()}]),
+        ]
+        bus = InvalidationBus(redis_client=redis, reconnect_delay=0)
+        cache = CodeChunkCache(invalidation_bus=bus)
+        cache.put("other/c.py", "c = 1", [])
+
+        await bus.start()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await bus.stop()
+
+        # Reconnect after the failure cleared L1; the message was then applied
+        assert bus.resyncs == 1
+        assert bus.received == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_without_transport_nothing_is_published(self):
+        bus = InvalidationBus()
+        CodeChunkCache(invalidation_bus=bus).invalidate("repo/a.py")
+        assert bus.published == 0
@@ -0,0 +1,140 @@
+"""Tests for Matryoshka two-stage vector search (truncated-dim ANN + full rescoring)."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.filtered_ann_planner import FilteredANNConfig, FilteredANNPlan, FilteredANNPlanner
+from services.hybrid_memory_search_service import HybridMemorySearchService
+from services.matryoshka_search import (
+    MatryoshkaConfig,
+    MatryoshkaSearch,
+    mrl_index_name,
+    truncate_embedding,
+    truncated_expression,
+)
+from services.vector_search_service import VectorSearchService
+from mnemo_mcp.models.memory_models import MemoryFilters
+
+
+def _search_sql(conn):
+    """SQL of the last statement (the search; SET LOCALs come first)."""
+    return str(conn.execute.call_args.args[0])
+
+
+class TestMatryoshkaSearch:
+    """Config, SQL shape and adaptive oversampling."""
+
+    def test_disabled_by_default_and_full_dim_is_not_reduced(self):
+        assert MatryoshkaSearch(MatryoshkaConfig()).dim_for("TEXT") == 0
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=768, code_dim=256))
+        assert mrl.dim_for("TEXT") == 0
+        assert mrl.dim_for("CODE") == 256
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_MRL_DIM", "256")
+        monkeypatch.setenv("EMBEDDING_MRL_OVERSAMPLE", "3")
+        monkeypatch.setenv("EMBEDDING_MRL_ADAPTIVE", "false")
+
+        config = MatryoshkaConfig.from_env()
+
+        assert (config.text_dim, config.code_dim) == (256, 0)
+        assert config.oversample == 3.0
+        assert config.adaptive is False
+
+    def test_candidate_limit_has_floor(self):
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256, oversample=4, min_candidates=50))
+        assert mrl.candidate_limit(10) == 50
+        assert mrl.candidate_limit(100) == 400
+
+    def test_coarse_sql_orders_by_index_expression(self):
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256))
+
+        sql = mrl.coarse_candidates_sql("memories", "embedding_half", 256, [0.1] * 768, "deleted_at IS NULL")
+
+        expression = truncated_expression("embedding_half", 256)
+        assert expression == "(subvector(embedding_half, 1, 256)::halfvec(256))"
+        assert f"ORDER BY {expression} <=>" in sql
+        assert "::halfvec(256)" in sql
+        assert "LIMIT :mrl_candidate_limit" in sql
+        assert "coarse_rank" in sql
+        assert mrl_index_name("memories", "embedding_half", 256) == "idx_memories_embedding_half_mrl256"
+
+    def test_unknown_column_and_bad_dim_rejected(self):
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256))
+        with pytest.raises(ValueError):
+            mrl.coarse_candidates_sql("memories", "embedding", 256, [0.1] * 768, "TRUE")
+        with pytest.raises(ValueError):
+            truncate_embedding([0.1] * 768, 1024)
+
+    def test_deep_results_grow_oversample_shallow_decay(self):
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256, oversample=4, min_oversample=2, max_oversample=8))
+
+        mrl.record(10, 50, [1, 2, 48])
+        assert mrl.oversample == 6.0
+        mrl.record(10, 60, [1, 2, 55])
+        assert mrl.oversample == 8.0  # capped
+
+        mrl.record(10, 80, [1, 2, 3])
+        assert mrl.oversample == pytest.approx(7.6)
+        assert mrl.stats()["oversample_increases"] == 2
+
+    def test_non_adaptive_keeps_oversample(self):
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256, oversample=4, adaptive=False))
+        mrl.record(10, 50, [50])
+        assert mrl.oversample == 4.0
+        assert mrl.stats()["avg_depth_ratio"] == 1.0
+
+
+class TestTwoStageServices:
+    """Search services switch to the two-stage query when a dim is configured."""
+
+    @pytest.mark.asyncio
+    async def test_code_search_uses_two_stage_query(self, make_engine):
+        engine, conn = make_engine([])
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256, oversample=4, min_candidates=0))
+        service = VectorSearchService(engine, matryoshka=mrl)
+
+        await service.search([0.1] * 768, embedding_domain="TEXT", limit=20)
+
+        sql, params = conn.execute.call_args.args
+        assert "subvector(embedding_text_half, 1, 256)" in str(sql)
+        assert "mrl_c USING (id)" in str(sql)
+        assert params["mrl_candidate_limit"] == 80
+
+    @pytest.mark.asyncio
+    async def test_code_search_single_stage_when_domain_disabled(self, make_engine):
+        engine, conn = make_engine([])
+        service = VectorSearchService(engine, matryoshka=MatryoshkaSearch(MatryoshkaConfig(text_dim=256)))
+
+        await service.search([0.1] * 768, embedding_domain="CODE", limit=20)
+
+        assert "subvector" not in _search_sql(conn)
+
+    @pytest.mark.asyncio
+    async def test_memory_vector_search_records_coarse_ranks(self, make_engine):
+        row = ("m1", "t", "c", "note", [], "2026-01-01", None, 0.9, 70)
+        engine, conn = make_engine([row])
+        mrl = MatryoshkaSearch(MatryoshkaConfig(text_dim=256, oversample=4, min_candidates=0))
+        service = HybridMemorySearchService(engine=engine, matryoshka=mrl)
+
+        results, _ = await service._vector_search([0.1] * 768, None, limit=20)
+
+        assert len(results) == 1
+        assert "subvector(embedding_half, 1, 256)" in _search_sql(conn)
+        assert mrl.oversample == 6.0  # rank 70 of 80 candidates → deep
+
+    @pytest.mark.asyncio
+    async def test_memory_vector_search_skips_two_stage_on_exact_plan(self, make_engine):
+        engine, conn = make_engine([])
+        planner = FilteredANNPlanner(FilteredANNConfig())
+        planner.plan = AsyncMock(return_value=FilteredANNPlan(table="memories", strategy="exact", ef_search=100, limit=10))
+        planner.apply = AsyncMock()
+        service = HybridMemorySearchService(
+            engine=engine, ann_planner=planner,
+            matryoshka=MatryoshkaSearch(MatryoshkaConfig(text_dim=256)),
+        )
+
+        await service._vector_search([0.1] * 768, MemoryFilters(memory_type="note"), limit=10)
+
+        assert "subvector" not in _search_sql(conn)
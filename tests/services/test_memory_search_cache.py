@@ -0,0 +1,162 @@
+"""Tests for the write-aware hybrid memory search result cache."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mnemo_mcp.models.memory_models import MemoryFilters
+from services.caches.memory_search_cache import MemorySearchCache
+from services.hybrid_memory_search_service import (
+    HybridMemorySearchService,
+    MemorySearchResult,
+)
+
+
+def _candidate(memory_id: str, rank: int) -> MemorySearchResult:
+    r = MemorySearchResult(
+        memory_id=memory_id,
+        title=f"title {memory_id}",
+        content_preview="preview",
+        memory_type="note",
+        tags=[],
+        created_at="2026-01-01T00:00:00+00:00",
+        trgm_score=1.0 / rank,
+    )
+    r.rank = rank
+    return r
+
+
+def _service(cache: MemorySearchCache) -> HybridMemorySearchService:
+    service = HybridMemorySearchService(
+        engine=MagicMock(),
+        default_enable_decay=False,
+        default_enable_reranking=False,
+        result_cache=cache,
+    )
+    service._lexical_search = AsyncMock(
+        return_value=([_candidate(f"m{i}", i) for i in range(1, 6)], 1.0)
+    )
+    return service
+
+
+class TestMemorySearchCache:
+
+    @pytest.mark.asyncio
+    async def test_write_to_project_changes_only_its_generation(self):
+        cache = MemorySearchCache()
+        project_a, project_b = uuid.uuid4(), uuid.uuid4()
+        gen_a, gen_b, gen_all = (
+            await cache.generation(project_a),
+            await cache.generation(project_b),
+            await cache.generation(None),
+        )
+
+        await cache.invalidate(project_a)
+
+        assert await cache.generation(project_a) != gen_a
+        assert await cache.generation(project_b) == gen_b
+        assert await cache.generation(None) != gen_all
+
+    @pytest.mark.asyncio
+    async def test_unknown_scope_invalidates_everything(self):
+        cache = MemorySearchCache()
+        project = uuid.uuid4()
+        gen_project = await cache.generation(project)
+
+        await cache.invalidate(unknown_scope=True)
+
+        assert await cache.generation(project) != gen_project
+
+    @pytest.mark.asyncio
+    async def test_redis_read_failure_bypasses_cache(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        cache = MemorySearchCache(redis_client=redis)
+
+        assert await cache.generation(None) is None
+        assert cache.get_stats()["bypasses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_generations_read_from_redis(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(return_value=["2", None])
+        cache = MemorySearchCache(redis_client=redis)
+
+        assert await cache.generation(uuid.uuid4()) == "2.0.0.0"
+
+    def test_lru_eviction_and_copy_on_read(self):
+        cache = MemorySearchCache(max_entries=2)
+        cache.set("a", {"v": [1]})
+        cache.set("b", {"v": [2]})
+        cache.get("a")["v"].append(99)  # caller mutation must not leak
+        cache.set("c", {"v": [3]})
+
+        assert cache.get("a") == {"v": [1]}
+        assert cache.get("b") is None  # least recently used
+
+
+class TestHybridSearchResultCaching:
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self):
+        service = _service(MemorySearchCache())
+
+        first = await service.search(query="redis  cache", enable_vector=False, limit=3)
+        second = await service.search(query="redis cache", enable_vector=False, limit=3)
+
+        assert service._lexical_search.await_count == 1
+        assert first.metadata.cache_hit is False
+        assert second.metadata.cache_hit is True
+        assert [r.memory_id for r in second.results] == [r.memory_id for r in first.results]
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_miss(self):
+        service = _service(MemorySearchCache())
+
+        await service.search(query="redis", enable_vector=False, limit=3)
+        await service.search(query="redis", enable_vector=False, limit=4)
+        await service.search(
+            query="redis", enable_vector=False, limit=3,
+            filters=MemoryFilters(tags=["sys:core"]),
+        )
+
+        assert service._lexical_search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_project_scoped_results(self):
+        cache = MemorySearchCache()
+        service = _service(cache)
+        project = uuid.uuid4()
+        filters = MemoryFilters(project_id=project)
+
+        await service.search(query="redis", enable_vector=False, filters=filters)
+        await cache.invalidate(uuid.uuid4())  # other project
+        await service.search(query="redis", enable_vector=False, filters=filters)
+        assert service._lexical_search.await_count == 1
+
+        await cache.invalidate(project)
+        response = await service.search(query="redis", enable_vector=False, filters=filters)
+        assert service._lexical_search.await_count == 2
+        assert response.metadata.cache_hit is False
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self):
+        service = _service(None)
+
+        await service.search(query="redis", enable_vector=False)
+        await service.search(query="redis", enable_vector=False)
+
+        assert service._lexical_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_bus_publish_does_not_fail_the_write():
+    bus = MagicMock()
+    bus.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+    cache = MemorySearchCache(invalidation_bus=bus)
+    before = await cache.generation()
+
+    await cache.invalidate()
+
+    assert await cache.generation() != before
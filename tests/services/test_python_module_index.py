@@ -0,0 +1,124 @@
+"""
+Unit tests for single-pass Python metadata extraction (PythonModuleIndex).
+
+The index must produce the same metadata as the per-node ast extractor
+while resolving chunks by name and line range.
+"""
+
+import ast
+from types import SimpleNamespace
+
+import pytest
+
+from services.metadata_extractor_service import MetadataExtractorService
+from services.python_module_index import PythonModuleIndex, split_source_lines
+
+SOURCE = '''"""Module docstring."""
+import os
+from typing import List as L
+from pathlib import Path
+
+
+class Reader:
+    """Reads files."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def read(self, names: L[str]) -> list:
+        """Read all."""
+        out = []
+        for name in names:
+            if os.path.exists(name):
+                out.append(open(name).read())
+        return out
+
+
+class Writer(Reader):
+    def __init__(self, root):
+        super().__init__(root)
+        self.handle = os.open(root, 0)
+
+
+async def main():
+    def helper():
+        return Path.cwd()
+    return helper()
+'''
+
+
+@pytest.fixture
+def metadata_service():
+    """Get MetadataExtractorService instance."""
+    return MetadataExtractorService()
+
+
+def _definitions(tree):
+    return [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))]
+
+
+@pytest.mark.asyncio
+async def test_metadata_matches_per_node_extractor(metadata_service):
+    """Every definition and the module root get identical metadata."""
+    index = PythonModuleIndex(SOURCE)
+
+    for node in _definitions(index.tree) + [index.tree]:
+        expected = await metadata_service._extract_python_metadata(SOURCE, node, index.tree)
+        assert index.metadata(node) == expected, getattr(node, "name", "<module>")
+
+
+def test_source_segment_matches_ast():
+    """Segments and line splitting mimic ast.get_source_segment."""
+    source = "x = 1\r\ndef f():\r\n    return 'é'\f\rclass C: pass\n"
+    index = PythonModuleIndex(source)
+
+    assert split_source_lines(source) == ast._splitlines_no_ff(source)
+    for node in ast.walk(index.tree):
+        assert index.source_segment(node) == ast.get_source_segment(source, node)
+
+
+def test_find_resolves_duplicate_names_by_line_range():
+    """Two __init__ methods: the chunk's line range picks the right one."""
+    index = PythonModuleIndex(SOURCE)
+
+    writer_init = index.find("__init__", 23, 25)
+    assert writer_init.lineno == 23
+    assert index.find("__init__", 10, 11).lineno == 10
+    assert index.find("__init__").lineno == 10  # no range: first in traversal order
+    assert index.find("missing", 1, 5) is None
+
+
+def test_nested_definitions_attribute_to_enclosing_scopes():
+    """Calls and imports inside a nested def also belong to the outer def."""
+    index = PythonModuleIndex(SOURCE)
+
+    main = index.metadata(index.find("main", 28, 31))
+    helper = index.metadata(index.find("helper", 29, 30))
+
+    assert helper["calls"] == ["Path.cwd"]
+    assert main["calls"] == ["Path.cwd", "helper"]
+    assert main["imports"] == ["pathlib.Path"]
+
+
+@pytest.mark.asyncio
+async def test_extract_python_chunks_metadata(metadata_service):
+    """Chunks are matched by name and line range, unknown names get module metadata."""
+    chunks = [
+        SimpleNamespace(name="read", start_line=13, end_line=19),
+        SimpleNamespace(name="__init__", start_line=23, end_line=25),
+        SimpleNamespace(name="<module>", start_line=1, end_line=4),
+    ]
+
+    results = await metadata_service.extract_python_chunks_metadata(SOURCE, chunks)
+
+    assert results[0]["returns"] == "list"
+    assert results[0]["imports"] == ["os", "typing.List"]
+    assert results[1]["calls"] == ["__init__", "os.open", "super"]  # Writer.__init__, not Reader's
+    assert results[2]["docstring"] == "Module docstring."
+
+
+@pytest.mark.asyncio
+async def test_extract_python_chunks_metadata_syntax_error(metadata_service):
+    """Unparseable modules raise SyntaxError for the caller's fallback."""
+    with pytest.raises(SyntaxError):
+        await metadata_service.extract_python_chunks_metadata("def broken(:\n", [])
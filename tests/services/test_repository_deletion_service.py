@@ -0,0 +1,179 @@
+"""
+Unit tests for background, batched repository deletion.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.repository_deletion_service import RepositoryDeletionService
+
+
+def _queries(counts, deleted_batches, jobs=None):
+    """
+    Statement handler: COUNTs return `counts`, DELETE batches `deleted_batches`
+    rowcounts; repository_deletion_jobs statements go to the `jobs` dict.
+    """
+    counts, deleted_batches = list(counts), list(deleted_batches)
+    jobs = {} if jobs is None else jobs
+
+    def active(repository):
+        return [j for j in jobs.values() if j["repository"] == repository and j["status"] in ("pending", "running")]
+
+    async def execute(statement, params=None):
+        result = MagicMock()
+        sql = str(statement)
+        rows = []
+        if "repository_deletion_jobs" in sql:
+            if sql.lstrip().startswith("INSERT") and not active(params["repository"]):
+                jobs[params["job_id"]] = rows_added = {
+                    "job_id": params["job_id"], "repository": params["repository"],
+                    "status": "pending", "phase": "pending", "totals": "{}", "deleted": "{}",
+                    "batches": 0, "error": None, "created_at": None, "finished_at": None,
+                }
+                rows = [rows_added]
+            elif "SET status" in sql:
+                jobs[params["job_id"]].update(
+                    {k: params[k] for k in ("status", "phase", "totals", "deleted", "batches", "error")}
+                )
+            elif sql.lstrip().startswith("SELECT") and "job_id = :job_id" in sql:
+                rows = [jobs[params["job_id"]]] if params["job_id"] in jobs else []
+            elif sql.lstrip().startswith("SELECT") and params:
+                rows = active(params["repository"])
+            elif sql.lstrip().startswith("SELECT"):
+                rows = [j for j in jobs.values() if "status IN" not in sql or j["status"] in ("pending", "running")]
+            result.mappings.return_value.first.return_value = rows[0] if rows else None
+            result.mappings.return_value.all.return_value = rows
+        elif "SELECT COUNT(*)" in sql and "DELETE" not in sql:
+            result.scalar.return_value = counts.pop(0)
+        else:
+            result.rowcount = deleted_batches.pop(0)
+        return result
+
+    return execute
+
+
+def _service(engine, batch_size=2):
+    generations = MagicMock()
+    generations.bump = AsyncMock()
+    stats = MagicMock()
+    stats.remove = AsyncMock()
+    checkpoints = MagicMock()
+    checkpoints.clear = AsyncMock()
+    return RepositoryDeletionService(engine, batch_size=batch_size, pause_seconds=0,
+                                     generations=generations, repository_stats=stats,
+                                     checkpoints=checkpoints)
+
+
+class TestRepositoryDeletion:
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches_until_a_short_batch(self, make_engine):
+        # counts: edges, nodes, chunks; batches: source edges 2+1,
+        # target edges 0, nodes 2+0, chunks 2+2+1
+        engine, conn = make_engine(execute=_queries([3, 2, 5], [2, 1, 0, 2, 0, 2, 2, 1]))
+        service = _service(engine)
+
+        job = await service.start("repo")
+        job = await service.wait(job.job_id)
+
+        assert job.status == "completed"
+        assert job.deleted == {"edges": 3, "nodes": 2, "chunks": 5}
+        assert job.batches == 8
+        assert job.to_dict()["percentage"] == 100
+        deletes = [c for c in conn.execute.call_args_list
+                   if "DELETE" in str(c.args[0]) and "repository_deletion_jobs" not in str(c.args[0])]
+        assert all(c.args[1] == {"repository": "repo", "batch_size": 2} for c in deletes)
+        assert "FROM code_chunks" in str(deletes[-1].args[0])  # chunks go last
+
+    @pytest.mark.asyncio
+    async def test_start_hides_repository_and_reuses_running_job(self, make_engine):
+        engine, _ = make_engine(execute=_queries([0, 0, 0], [0, 0, 0, 0]))
+        service = _service(engine)
+
+        first = await service.start("repo")
+        second = await service.start("repo")
+
+        assert first is second
+        assert await service.deleting() == {"repo"}
+        service.repository_stats.remove.assert_awaited_with("repo")
+        service.generations.bump.assert_awaited_with("repo")
+        service.checkpoints.clear.assert_awaited_with("repo")
+
+        await service.wait(first.job_id)
+        assert await service.deleting() == set()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_on_the_job(self, make_engine):
+        engine, conn = make_engine(execute=_queries([10, 0, 0], []))
+        service = _service(engine)
+
+        job = await service.wait((await service.start("repo")).job_id)
+
+        assert job.status == "failed"
+        assert job.phase == "edges_by_source"
+        assert job.error
+        assert (await service.get_job(job.job_id)).to_dict()["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_progress_while_running(self, make_engine):
+        engine, conn = make_engine(execute=_queries([0, 0, 4], [0, 0, 0, 2, 2, 0]))
+        service = _service(engine)
+        service.pause_seconds = 0.05
+
+        job = await service.start("repo")
+        for _ in range(100):
+            if job.deleted["chunks"]:
+                break
+            await asyncio.sleep(0.005)
+
+        progress = job.to_dict()
+        assert progress["status"] == "running" and progress["phase"] == "chunks"
+        assert progress["percentage"] == 50
+        await service.wait(job.job_id)
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_shared_through_the_table(self, make_engine):
+        jobs = {}
+        engine, _ = make_engine(execute=_queries([0, 0, 2], [0, 0, 0, 2, 0], jobs=jobs))
+        service = _service(engine)
+        job = await service.start("repo")
+
+        # Another process sees the running job and does not start a second one
+        other = _service(make_engine(execute=_queries([], [], jobs=jobs))[0])
+        assert await other.deleting() == {"repo"}
+        assert (await other.start("repo")).job_id == job.job_id
+
+        await service.wait(job.job_id)
+        assert jobs[job.job_id]["status"] == "completed"
+        assert json.loads(jobs[job.job_id]["deleted"]) == {"edges": 0, "nodes": 0, "chunks": 2}
+        finished = await other.get_job(job.job_id)
+        assert finished.status == "completed" and finished.deleted["chunks"] == 2
+        assert await other.deleting() == set()
+
+    @pytest.mark.asyncio
+    async def test_stale_job_is_resumed_with_its_progress(self, make_engine):
+        stale = {
+            "job_id": "old", "repository": "repo", "status": "running", "phase": "chunks",
+            "totals": '{"chunks": 5}', "deleted": '{"chunks": 3}', "batches": 2,
+            "error": None, "created_at": None, "finished_at": None,
+        }
+        engine, conn = make_engine(execute=_queries([0, 0, 2], [0, 0, 0, 2, 0], jobs={"old": stale}))
+        claim = conn.execute.side_effect
+
+        async def execute(statement, params=None):
+            if "make_interval(secs => :stale_seconds)" in str(statement):
+                result = MagicMock()
+                result.mappings.return_value.first.return_value = stale
+                return result
+            return await claim(statement, params)
+
+        conn.execute.side_effect = execute
+        service = _service(engine)
+
+        job = await service.wait((await service.start("repo")).job_id)
+
+        assert job.job_id == "old" and job.status == "completed"
+        assert job.deleted["chunks"] == 5 and job.totals["chunks"] == 5
@@ -0,0 +1,160 @@
+"""Tests for generation-based invalidation of the code search caches."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.caches import cache_keys
+from services.caches.repository_generations import RepositoryGenerations
+from services.hybrid_code_search_service import HybridCodeSearchService, SearchFilters
+from services.lexical_search_service import LexicalSearchResult
+
+
+class _DictCache:
+    """Minimal async RedisCache stand-in."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds=300):
+        self.data[key] = value
+        self.ttls[key] = ttl_seconds
+        return True
+
+
+def _service(generations: RepositoryGenerations, cache: _DictCache) -> HybridCodeSearchService:
+    lexical = MagicMock()
+    lexical.search = AsyncMock(return_value=[
+        LexicalSearchResult(
+            chunk_id="c1", similarity_score=0.9, source_code="def f(): pass", name="f",
+            language="python", chunk_type="function", file_path="a.py", metadata={}, rank=1,
+        )
+    ])
+    return HybridCodeSearchService(
+        engine=MagicMock(),
+        lexical_service=lexical,
+        vector_service=MagicMock(),
+        redis_cache=cache,
+        default_enable_reranking=False,
+        generations=generations,
+    )
+
+
+class TestRepositoryGenerations:
+
+    @pytest.mark.asyncio
+    async def test_bump_changes_repository_and_unscoped_generations(self):
+        generations = RepositoryGenerations()
+        gen_a, gen_b, gen_all = (
+            await generations.generation("a"),
+            await generations.generation("b"),
+            await generations.generation(None),
+        )
+
+        await generations.bump("a")
+
+        assert await generations.generation("a") != gen_a
+        assert await generations.generation("b") == gen_b
+        assert await generations.generation(None) != gen_all
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_changes_every_scope(self):
+        generations = RepositoryGenerations()
+        before = [await generations.generation(r) for r in ("a", "b", None)]
+
+        await generations.invalidate_all()
+
+        after = [await generations.generation(r) for r in ("a", "b", None)]
+        assert all(x != y for x, y in zip(before, after))
+
+    @pytest.mark.asyncio
+    async def test_shared_generations_and_read_failure(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(return_value=["1", "5"])
+        generations = RepositoryGenerations(redis_client=redis)
+        generations._on_invalidation("generation", ["a"])  # bump seen on the bus
+        # Shared token: Redis counters only, identical in every process
+        assert await generations.generation("a") == "1.5"
+
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        generations = RepositoryGenerations(redis_client=redis)
+        assert await generations.generation("a") is None
+        assert generations.get_stats()["bypasses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_bump_is_retried_and_bypasses_until_it_lands(self):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[ConnectionError("down"), ConnectionError("down"), None])
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.mget = AsyncMock(return_value=["0", "3"])
+        generations = RepositoryGenerations(redis_client=redis)
+
+        await generations.bump("a")
+        assert await generations.generation("a") is None  # retry failed
+        assert await generations.generation("a") == "0.3"  # retry landed
+
+        assert pipe.execute.await_count == 3
+        assert generations.get_stats()["unsynced_scopes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bump_increments_in_one_pipeline(self):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+
+        await RepositoryGenerations(redis_client=redis).bump("a")
+
+        assert [c.args for c in pipe.incrby.call_args_list] == [("repogen:*", 1), ("repogen:a", 1)]
+        pipe.execute.assert_awaited_once()
+
+    def test_keys_embed_generation(self):
+        assert cache_keys.search_result_key("q", generation="0.1") != cache_keys.search_result_key("q", generation="0.2")
+        assert cache_keys.graph_traversal_key("node", generation="0.3").startswith("graph:0.3:")
+        assert cache_keys.code_chunk_key("a.py", "f" * 32) == f"chunks:a.py:{'f' * 16}"
+
+
+class TestCodeSearchCacheInvalidation:
+
+    @pytest.mark.asyncio
+    async def test_reindex_bump_invalidates_cached_search(self):
+        generations, cache = RepositoryGenerations(), _DictCache()
+        service = _service(generations, cache)
+        filters = SearchFilters(repository="repo")
+
+        await service.search("query", filters=filters, enable_vector=False)
+        await service.search("query", filters=filters, enable_vector=False)
+        assert service.lexical.search.await_count == 1  # second served from cache
+        assert set(cache.ttls.values()) == {service.cache_ttl_seconds}
+
+        await generations.bump("repo")
+        await service.search("query", filters=filters, enable_vector=False)
+        assert service.lexical.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_other_repository_bump_keeps_cache(self):
+        generations, cache = RepositoryGenerations(), _DictCache()
+        service = _service(generations, cache)
+        filters = SearchFilters(repository="repo")
+
+        await service.search("query", filters=filters, enable_vector=False)
+        await generations.bump("other")
+        await service.search("query", filters=filters, enable_vector=False)
+
+        assert service.lexical.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unreadable_generation_bypasses_cache(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        cache = _DictCache()
+        service = _service(RepositoryGenerations(redis_client=redis), cache)
+
+        await service.search("query", enable_vector=False)
+
+        assert cache.data == {}
@@ -0,0 +1,194 @@
+"""
+Unit tests for the materialised repository statistics (repository_stats).
+
+Refreshes are scoped to one repository and never raise; readers merge the
+per-repository rows into the dashboard figures.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.repository_stats_service import RepositoryStatsService
+
+
+def _row(repository, **values):
+    row = {
+        "repository": repository, "file_count": 0, "chunk_count": 0, "function_count": 0,
+        "chunks_by_language": {}, "chunks_by_type": {}, "complexity_sum": 0.0,
+        "complexity_count": 0, "complexity_histogram": {}, "top_complex": [],
+        "lsp_with_return_type": 0, "lsp_with_signature": 0, "lsp_with_params": 0,
+        "first_indexed_at": None, "last_indexed_at": None, "node_count": 0, "edge_count": 0,
+        "nodes_by_type": {}, "edges_by_type": {},
+    }
+    row.update(values)
+    return row
+
+
+def _sql(conn, call=0):
+    return str(conn.execute.call_args_list[call].args[0])
+
+
+class TestRefresh:
+
+    @pytest.mark.asyncio
+    async def test_refresh_chunks_is_scoped_to_the_repository(self, make_engine):
+        engine, conn = make_engine()
+
+        assert await RepositoryStatsService(engine).refresh_chunks("repo") is True
+
+        assert "DELETE FROM repository_file_stats WHERE repository = :repository" in _sql(conn)
+        sql = _sql(conn, 1)
+        assert "WHERE repository = :repository" in sql and "file_path = ANY" not in sql
+        assert "ON CONFLICT (repository, file_path) DO UPDATE" in sql
+        assert conn.execute.call_args_list[1].args[1] == {"repository": "repo"}
+        # Repository row rolled up from the file rows, no chunk scan
+        rollup = _sql(conn, 2)
+        assert "FROM repository_file_stats" in rollup and "code_chunks" not in rollup
+        assert "ON CONFLICT (repository) DO UPDATE" in rollup
+        assert "DELETE FROM repository_stats" in _sql(conn, 3)  # prune empty rows
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_recomputes_only_the_touched_files(self, make_engine):
+        engine, conn = make_engine(scalar=True)  # the repository already has file rows
+
+        await RepositoryStatsService(engine).refresh_chunks("repo", ["b.py", "a.py", "a.py"])
+
+        params = {"repository": "repo", "file_paths": ["a.py", "b.py"]}
+        assert "AND file_path = ANY(:file_paths)" in _sql(conn, 1)
+        assert conn.execute.call_args_list[1].args[1] == params
+        assert "repository = :repository AND file_path = ANY(:file_paths)" in _sql(conn, 2)
+        assert conn.execute.call_args_list[2].args[1] == params
+        assert "FROM repository_file_stats" in _sql(conn, 3)
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_without_file_rows_recomputes_every_file(self, make_engine):
+        engine, conn = make_engine(scalar=False)  # rows predating repository_file_stats
+
+        await RepositoryStatsService(engine).refresh_chunks("repo", ["a.py"])
+
+        assert "file_path = ANY" not in _sql(conn, 2)
+        assert conn.execute.call_args_list[2].args[1] == {"repository": "repo"}
+
+    @pytest.mark.asyncio
+    async def test_chunks_without_repository_use_the_empty_key(self, make_engine):
+        engine, conn = make_engine()
+
+        await RepositoryStatsService(engine).refresh_chunks(None)
+
+        assert "WHERE repository IS NULL" in _sql(conn, 1)
+        assert conn.execute.call_args_list[1].args[1] == {"repository": ""}
+
+    @pytest.mark.asyncio
+    async def test_refresh_graph_counts_nodes_and_edges(self, make_engine):
+        engine, conn = make_engine()
+
+        await RepositoryStatsService(engine).refresh_graph("repo")
+
+        sql = _sql(conn)
+        assert "FROM nodes" in sql and "JOIN nodes n ON e.source_node_id = n.node_id" in sql
+        assert "graph_refreshed_at = EXCLUDED.graph_refreshed_at" in sql
+
+    @pytest.mark.asyncio
+    async def test_failures_are_logged_not_raised(self, make_engine):
+        engine, conn = make_engine()
+        conn.execute.side_effect = RuntimeError("relation repository_stats does not exist")
+        stats = RepositoryStatsService(engine)
+
+        assert await stats.refresh("repo") is False
+        assert await stats.remove("repo") is False
+
+    @pytest.mark.asyncio
+    async def test_rebuild_all_drops_vanished_repositories(self, make_engine):
+        engine, conn = make_engine(rows=[("b",), ("a",), ("",)], scalar=True)
+
+        assert await RepositoryStatsService(engine).rebuild_all() == 3
+
+        assert "pg_try_advisory_lock" in _sql(conn)
+        # Repositories being deleted are not brought back
+        assert "EXCEPT" in _sql(conn, 1) and "FROM repository_deletion_jobs" in _sql(conn, 1)
+        assert conn.execute.call_args_list[2].args[1] == {"repositories": ["", "a", "b"]}
+        assert "repository_file_stats" in _sql(conn, 2) and "repository_stats" in _sql(conn, 3)
+        refreshed = [c.args[1] for c in conn.execute.call_args_list[4:] if "INSERT" in str(c.args[0])]
+        assert {"repository": "a"} in refreshed and {"repository": "b"} in refreshed
+        assert "pg_advisory_unlock" in _sql(conn, -1)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_all_skips_when_another_rebuild_holds_the_lock(self, make_engine):
+        engine, conn = make_engine(rows=[("a",)], scalar=False)
+
+        assert await RepositoryStatsService(engine).rebuild_all() is None
+
+        conn.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_built_only_rebuilds_without_file_rows(self, make_engine):
+        engine, conn = make_engine(scalar=False)
+        stats = RepositoryStatsService(engine)
+        stats.rebuild_all = AsyncMock(return_value=2)
+
+        assert await stats.ensure_built() is None
+        stats.rebuild_all.assert_not_awaited()
+
+        conn.execute.return_value.scalar.return_value = True
+        assert await stats.ensure_built() == 2
+        stats.rebuild_all.assert_awaited_once_with()
+
+
+class TestRead:
+
+    @pytest.mark.asyncio
+    async def test_json_columns_are_decoded(self, make_engine):
+        row = MagicMock()
+        row._mapping = _row("repo", chunks_by_language='{"python": 3}', top_complex=None)
+        engine, _ = make_engine(rows=[row])
+
+        stats = await RepositoryStatsService(engine).get("repo")
+
+        assert stats["chunks_by_language"] == {"python": 3}
+        assert stats["top_complex"] == []
+
+    @pytest.mark.asyncio
+    async def test_empty_table_is_not_rebuilt_on_read(self, make_engine):
+        engine, conn = make_engine(rows=[], scalar=True)
+
+        assert await RepositoryStatsService(engine).list_stats() == []
+
+        conn.execute.assert_awaited_once()
+
+    def test_summarise_merges_repositories(self):
+        older = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        newer = datetime(2026, 6, 1, tzinfo=timezone.utc)
+        rows = [
+            _row("a", file_count=2, chunk_count=10, function_count=4,
+                 chunks_by_language={"python": 10}, complexity_sum=12.0, complexity_count=4,
+                 complexity_histogram={"1": 2, "5": 2}, lsp_with_return_type=3,
+                 top_complex=[{"name": "f", "complexity": 5}], last_indexed_at=older, first_indexed_at=older),
+            _row("b", file_count=1, chunk_count=5, function_count=2,
+                 chunks_by_language={"python": 1, "typescript": 4}, complexity_sum=8.0, complexity_count=2,
+                 complexity_histogram={"5": 1, "3": 1}, lsp_with_return_type=1,
+                 top_complex=[{"name": "g", "complexity": 7}], last_indexed_at=newer, first_indexed_at=newer),
+            _row("", chunk_count=1, file_count=1),
+        ]
+
+        summary = RepositoryStatsService.summarise(rows)
+
+        assert summary["total_repositories"] == 2  # unassigned chunks are not a repository
+        assert summary["total_files"] == 4
+        assert summary["total_functions"] == 6
+        assert summary["avg_complexity"] == pytest.approx(20.0 / 6)
+        assert summary["language_distribution"][0] == {"language": "python", "count": 11}
+        assert summary["complexity_distribution"] == [
+            {"complexity": 1, "count": 2}, {"complexity": 3, "count": 1}, {"complexity": 5, "count": 3},
+        ]
+        assert [f["name"] for f in summary["top_complex_functions"]] == ["g", "f"]
+        assert (summary["first_indexed_at"], summary["last_indexed_at"]) == (older, newer)
+        assert [r["repository"] for r in RepositoryStatsService.repositories(rows)] == ["a", "b"]
+
+    def test_summarise_empty(self):
+        summary = RepositoryStatsService.summarise([])
+
+        assert summary["total_repositories"] == 0
+        assert summary["avg_complexity"] == 0.0
+        assert summary["top_complex_functions"] == []
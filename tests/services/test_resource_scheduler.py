@@ -0,0 +1,127 @@
+"""
+Unit tests for priority scheduling between interactive and background work.
+"""
+
+import asyncio
+
+import pytest
+
+from services.resource_scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    PrioritySlots,
+    ResourceScheduler,
+    background_work,
+    current_work_class,
+)
+
+
+async def _hold(slots, cls, order, release):
+    async with slots.slot(cls):
+        order.append(cls)
+        await release.wait()
+
+
+class TestWorkClass:
+
+    @pytest.mark.asyncio
+    async def test_background_tag_is_scoped_and_inherited_by_tasks(self):
+        assert current_work_class() == INTERACTIVE
+        with background_work():
+            assert await asyncio.create_task(asyncio.sleep(0, current_work_class())) == BACKGROUND
+        assert current_work_class() == INTERACTIVE
+
+
+class TestPrioritySlots:
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiters_are_served_first(self):
+        slots = PrioritySlots("embedding", capacity=1)
+        order, release = [], asyncio.Event()
+        holder = asyncio.create_task(_hold(slots, BACKGROUND, order, release))
+        await asyncio.sleep(0)
+        # Background queued before interactive
+        waiters = [asyncio.create_task(_hold(slots, cls, order, release)) for cls in (BACKGROUND, INTERACTIVE)]
+        await asyncio.sleep(0)
+        assert slots.get_metrics()["classes"][BACKGROUND]["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == [BACKGROUND, INTERACTIVE, BACKGROUND]
+
+    @pytest.mark.asyncio
+    async def test_background_cap_leaves_slots_for_interactive_work(self):
+        slots = PrioritySlots("db", capacity=3, background_limit=1)
+        order, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(_hold(slots, BACKGROUND, order, release)) for _ in range(2)]
+        tasks += [asyncio.create_task(_hold(slots, INTERACTIVE, order, release)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        metrics = slots.get_metrics()["classes"]
+        assert metrics[BACKGROUND]["active"] == 1 and metrics[BACKGROUND]["waiting"] == 1
+        assert metrics[INTERACTIVE]["active"] == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert slots.acquired == {INTERACTIVE: 2, BACKGROUND: 2}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        slots = PrioritySlots("executor", capacity=1)
+        order, release = [], asyncio.Event()
+        holder = asyncio.create_task(_hold(slots, INTERACTIVE, order, release))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_hold(slots, INTERACTIVE, order, release))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+
+        async with slots.slot(BACKGROUND):
+            pass
+        assert slots.get_metrics()["classes"][INTERACTIVE]["active"] == 0
+
+
+class TestAdaptiveShare:
+
+    def _scheduler(self):
+        scheduler = ResourceScheduler(embedding_slots=4, db_slots=20, executor_slots=8,
+                                      latency_target_ms=100, max_background_share=0.75,
+                                      min_background_share=0.1)
+        scheduler._last_adjust = -10.0
+        return scheduler
+
+    def test_slow_interactive_p95_throttles_background_work(self):
+        scheduler = self._scheduler()
+        assert scheduler.resources["db"].background_limit == 15
+
+        for _ in range(20):
+            scheduler.record_latency(0.3, "search_code")
+
+        assert scheduler.background_share == 0.375
+        assert scheduler.resources["db"].background_limit == 7
+        assert scheduler.resources["embedding"].background_limit == 1
+        assert scheduler.throttle_events == 1
+
+    def test_share_recovers_while_p95_is_under_target(self):
+        scheduler = self._scheduler()
+        scheduler.background_share = 0.1
+
+        for _ in range(20):
+            scheduler.record_latency(0.01, "search_code")
+
+        assert scheduler.background_share == pytest.approx(0.15)
+        assert scheduler.get_metrics()["resources"]["db"]["background_limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_only_interactive_operations_feed_the_p95(self):
+        scheduler = self._scheduler()
+
+        async with scheduler.observe("search_code"):
+            pass
+        with background_work():
+            async with scheduler.observe("search_code"):
+                pass
+
+        assert len(scheduler._latencies) == 1
@@ -0,0 +1,48 @@
+"""Tests for the shared base of two-stage (coarse ANN + rescoring) vector search."""
+
+import pytest
+
+from services.binary_prefilter import BinaryPrefilter, BinaryPrefilterConfig
+from services.matryoshka_search import MatryoshkaConfig, MatryoshkaSearch
+from services.two_stage_search import TwoStageConfig, TwoStageSearch, coarse_index_ddl, fmt_bytes
+
+
+class TestTwoStageSearch:
+
+    def test_pool_env_defaults_come_from_each_config(self, monkeypatch):
+        for name in ("EMBEDDING_MRL_OVERSAMPLE", "EMBEDDING_MRL_MIN_CANDIDATES",
+                     "VECTOR_BINARY_OVERSAMPLE", "VECTOR_BINARY_MIN_CANDIDATES"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("VECTOR_BINARY_MIN_CANDIDATES", "200")
+
+        mrl, binary = MatryoshkaConfig.from_env(), BinaryPrefilterConfig.from_env()
+
+        assert (mrl.oversample, mrl.min_candidates) == (4.0, 50)
+        assert (binary.oversample, binary.min_candidates) == (10.0, 200)
+
+    def test_record_ignores_pools_not_wider_than_the_result(self):
+        search = TwoStageSearch(TwoStageConfig())
+        search.record(10, 10, [10])
+        search.record(10, 40, [10, 30])
+
+        stats = search.stats()
+        assert stats["queries"] == 2
+        assert stats["avg_depth_ratio"] == pytest.approx(0.375)
+        assert stats["max_depth_ratio"] == pytest.approx(0.75)
+
+    def test_both_paths_share_the_coarse_subquery_shape(self):
+        mrl_sql = MatryoshkaSearch(MatryoshkaConfig(text_dim=256)).coarse_candidates_sql(
+            "memories", "embedding_half", 256, [0.1] * 768, "TRUE")
+        bq_sql = BinaryPrefilter(BinaryPrefilterConfig(mode="binary")).coarse_candidates_sql(
+            "memories", "embedding_half", [0.1] * 768, "TRUE")
+
+        for sql in (mrl_sql, bq_sql):
+            assert "ROW_NUMBER() OVER (ORDER BY coarse_distance, id) AS coarse_rank" in sql
+
+    def test_index_script_helpers(self):
+        assert coarse_index_ddl("idx", "memories", "(expr)", "bit_hamming_ops", 16, 64) == (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx ON memories "
+            "USING hnsw ((expr) bit_hamming_ops) WITH (m = 16, ef_construction = 64)"
+        )
+        assert fmt_bytes(None) == "-"
+        assert fmt_bytes(3 * 1024 * 1024) == "3.0 MB"
@@ -1052,8 +1052,11 @@ class TestConsumptionTracking:
         from services.hybrid_memory_search_service import HybridMemorySearchService
         lex_source = inspect.getsource(HybridMemorySearchService._lexical_search)
         vec_source = inspect.getsource(HybridMemorySearchService._vector_search)
-        assert "consumed_at" in lex_source
-        assert "consumed_at" in vec_source
+        filter_source = inspect.getsource(HybridMemorySearchService._filter_clauses)
+        # Every generator builds its WHERE clauses with _filter_clauses
+        assert "_filter_clauses(filters, params" in lex_source
+        assert "_filter_clauses(filters, params" in vec_source
+        assert "consumed_at" in filter_source
 
     def test_migration_exists(self):
         """Consumption tracking migration must exist."""
@@ -41,3 +41,95 @@ def test_classify_error_subprocess():
     error_type = consumer._classify_error(error)
 
     assert error_type == ErrorType.SUBPROCESS_CRASH
+
+
+@pytest.mark.asyncio
+async def test_markdown_job_completes_without_graph_construction(monkeypatch):
+    """Markdown jobs are marked completed; only code jobs build the graph."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    import services.batch_indexing_consumer as consumer_module
+
+    generations = MagicMock(bump=AsyncMock())
+    monkeypatch.setattr(consumer_module, "get_repository_generations", lambda: generations)
+    consumer = BatchIndexingConsumer()
+    consumer.redis_client = AsyncMock()
+    consumer.redis_client.xreadgroup.return_value = []
+    consumer.redis_client.hgetall.return_value = {"kind": "markdown", "status": "processing"}
+    consumer._check_pending_messages = AsyncMock(return_value=[])
+    consumer._trigger_graph_construction = AsyncMock()
+    consumer._update_status = AsyncMock()
+    checkpoints = AsyncMock()
+    checkpoints.get_run.return_value = None
+
+    await consumer._consume("docs", "indexing:jobs:docs", "indexing:status:docs", None, None, checkpoints)
+
+    consumer._trigger_graph_construction.assert_not_awaited()
+    assert consumer._update_status.await_args.args[1]["status"] == "completed"
+    checkpoints.finish_run.assert_awaited_once_with("docs", "completed")
+    # New sections: cached search results of the repository are dropped
+    generations.bump.assert_awaited_once_with("docs")
+
+
+@pytest.mark.asyncio
+async def test_consumer_holds_the_repository_lock_while_running():
+    """The consumer lock is refreshed while processing and released on exit."""
+    import asyncio
+    import os
+    from unittest.mock import AsyncMock
+
+    consumer = BatchIndexingConsumer()
+    consumer.redis_client = AsyncMock()
+    consumer.redis_client.get.return_value = f"consumer:{os.getpid()}"
+
+    async def process(*args):
+        await asyncio.sleep(0)  # heartbeat task runs
+        lock = consumer.redis_client.set.await_args
+        assert lock.args == ("indexing:consumer:repo", f"consumer:{os.getpid()}")
+        assert lock.kwargs == {"ex": BatchIndexingConsumer.CONSUMER_LOCK_TTL}
+        return {"status": "completed"}
+
+    consumer._process_locked = process
+
+    assert (await consumer.process_repository("repo"))["status"] == "completed"
+    consumer.redis_client.delete.assert_awaited_once_with("indexing:consumer:repo")
+
+
+@pytest.mark.asyncio
+async def test_prune_message_removes_chunks_and_checkpoints(monkeypatch):
+    """The prune message of a replacing job deletes gone files, then refreshes their stats."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    import services.batch_indexing_consumer as consumer_module
+
+    generations = MagicMock(bump=AsyncMock())
+    monkeypatch.setattr(consumer_module, "get_repository_generations", lambda: generations)
+    stats = MagicMock(refresh_chunks=AsyncMock())
+    monkeypatch.setattr(consumer_module, "RepositoryStatsService", lambda engine: stats)
+
+    conn = AsyncMock()
+    conn.execute.return_value = [MagicMock(file_path="/docs/old.md"), MagicMock(file_path="/docs/old.md")]
+    engine = MagicMock()
+    engine.begin.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    consumer = BatchIndexingConsumer()
+    consumer.redis_client = AsyncMock()
+    prune = {"action": "prune", "kind": "markdown", "files": "/docs/a.md,/docs/b.md"}
+    consumer.redis_client.xreadgroup.side_effect = [[("stream", [("1-0", prune)])], []]
+    consumer.redis_client.hgetall.return_value = {"kind": "markdown"}
+    consumer._check_pending_messages = AsyncMock(return_value=[])
+    consumer._update_status = AsyncMock()
+    checkpoints = AsyncMock()
+    checkpoints.get_run.return_value = None
+
+    await consumer._consume("docs", "indexing:jobs:docs", "indexing:status:docs", None, engine, checkpoints)
+
+    # Chunks and checkpoints in the same transaction: a restored file is indexed again
+    sql = [str(call.args[0]) for call in conn.execute.await_args_list]
+    assert "DELETE FROM code_chunks" in sql[0] and "DELETE FROM indexing_checkpoints" in sql[1]
+    assert engine.begin.call_count == 1
+    assert conn.execute.await_args.args[1] == {"repo": "docs", "paths": ["/docs/a.md", "/docs/b.md"]}
+    consumer.redis_client.xack.assert_awaited_once_with("indexing:jobs:docs", "indexing-workers", "1-0")
+    stats.refresh_chunks.assert_awaited_once_with("docs", {"/docs/old.md"})
+    generations.bump.assert_awaited_once_with("docs")
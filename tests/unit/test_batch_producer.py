@@ -63,3 +63,21 @@ def test_scan_files_sorts_alphabetically():
         assert files[0].name == "alpha.ts"
         assert files[1].name == "beta.ts"
         assert files[2].name == "zebra.ts"
+
+
+@pytest.mark.asyncio
+async def test_replacing_job_ends_with_a_prune_message():
+    """Test a replacing job lists the files to keep in a last prune message."""
+    from unittest.mock import AsyncMock
+
+    client = AsyncMock()
+    producer = BatchIndexingProducer(redis_client=client)
+    producer.BATCH_SIZE = 2
+    files = [Path(f"/docs/{name}.md") for name in ("a", "b", "c")]
+
+    job = await producer.enqueue_files("docs", files, kind="markdown", replace=True)
+
+    messages = [call.args[1] for call in client.xadd.await_args_list]
+    assert job["total_batches"] == 2 and len(messages) == 3
+    assert "action" not in messages[0] and messages[-1]["action"] == "prune"
+    assert messages[-1]["files"] == "/docs/a.md,/docs/b.md,/docs/c.md"
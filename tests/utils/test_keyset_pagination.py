@@ -0,0 +1,45 @@
+"""Tests for keyset pagination helpers."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.keyset_pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, str(row_id))
+
+
+@pytest.mark.parametrize("cursor", ["", "garbage", encode_cursor("not-a-date", uuid.uuid4())])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_keyset_condition_binds_params():
+    row_id = uuid.uuid4()
+    params = {}
+
+    condition = keyset_condition(
+        encode_cursor(datetime(2026, 3, 1, tzinfo=timezone.utc), row_id),
+        params,
+        created_column="m.created_at",
+        id_column="m.id",
+    )
+
+    assert condition == "(m.created_at, m.id) < (:cursor_created_at, CAST(:cursor_id AS uuid))"
+    assert params["cursor_id"] == str(row_id)
+    assert params["cursor_created_at"].year == 2026
@@ -24,9 +24,12 @@ from sqlalchemy.ext.asyncio import create_async_engine
 # Add api to path
 sys.path.insert(0, "/app")
 
-from services.dual_embedding_service import DualEmbeddingService, EmbeddingDomain
+from services.dual_embedding_service import EmbeddingDomain
+from services.remote_embedding_service import create_dual_embedding_service
 from services.code_chunking_service import CodeChunkingService
+from services.code_indexing_service import LANGUAGE_BY_EXTENSION
 from services.indexing_error_service import IndexingErrorService
+from services.indexing_checkpoint_service import IndexingCheckpointService
 from models.indexing_error_models import IndexingErrorCreate
 
 
@@ -67,7 +70,7 @@ async def log_file_error(
         print(f"Failed to log error: {log_err}", file=sys.stderr)
 
 
-async def process_batch(repository: str, db_url: str, files: list) -> dict:
+async def process_batch(repository: str, db_url: str, files: list, kind: str = "code") -> dict:
     """
     Process batch of files atomically.
 
@@ -75,13 +78,19 @@ async def process_batch(repository: str, db_url: str, files: list) -> dict:
         repository: Repository name
         db_url: Database connection URL
         files: List of file paths to process
+        kind: "code" (AST chunks + CODE embeddings) or "markdown"
+              (## sections + TEXT embeddings, index_markdown_workspace jobs)
+
+    Files already indexed with the same content (per-file checkpoints) are
+    skipped and counted as successes, so a retried batch continues where
+    the previous attempt stopped.
 
     Returns:
-        {"success_count": 38, "error_count": 2}
+        {"success_count": 38, "error_count": 2, "skipped_count": 0}
     """
     # Load services (in this subprocess only)
     print(f"Loading embedding models...", file=sys.stderr)
-    embedding_service = DualEmbeddingService()
+    embedding_service = create_dual_embedding_service(priority="bulk", client_name="batch-worker")
 
     # EPIC-26: Inject metadata extractor service for TypeScript/JavaScript metadata extraction
     print(f"Initializing metadata extractor...", file=sys.stderr)
@@ -97,15 +106,20 @@ async def process_batch(repository: str, db_url: str, files: list) -> dict:
     # Initialize error tracking service
     error_service = IndexingErrorService(engine)
 
+    # Written after every file: a killed subprocess loses at most one file
+    checkpoints = IndexingCheckpointService(engine, flush_size=1)
+
     success_count = 0
     error_count = 0
 
     try:
-        print(f"Processing {len(files)} files...", file=sys.stderr)
-
-        for file_path_str in files:
-            file_path = Path(file_path_str)
+        pending, completed = await checkpoints.pending_files(repository, [Path(f) for f in files])
+        success_count += len(completed)
+        if completed:
+            print(f"Skipping {len(completed)} files already indexed", file=sys.stderr)
+        print(f"Processing {len(pending)} files...", file=sys.stderr)
 
+        for file_path, content_hash in pending:
             try:
                 # Process file atomically (chunking + embeddings + persist)
                 result = await process_file_atomically(
@@ -113,15 +127,18 @@ async def process_batch(repository: str, db_url: str, files: list) -> dict:
                     repository,
                     chunking_service,
                     embedding_service,
-                    engine
+                    engine,
+                    kind
                 )
 
                 if result.get("success", False):
                     success_count += 1
+                    checkpoints.record(repository, file_path, content_hash, chunks=result.get("chunks", 0))
                     print(f"✓ {file_path.name}", file=sys.stderr)
                 else:
                     error_count += 1
                     error_msg = result.get('error', 'unknown')
+                    checkpoints.record(repository, file_path, content_hash, error=error_msg)
                     print(f"✗ {file_path.name}: {error_msg}", file=sys.stderr)
 
                     # Log error to database
@@ -138,6 +155,7 @@ async def process_batch(repository: str, db_url: str, files: list) -> dict:
                 error_count += 1
                 error_msg = str(e)
                 error_traceback = traceback.format_exc()
+                checkpoints.record(repository, file_path, content_hash, error=error_msg)
                 print(f"✗ {file_path.name}: {error_msg}", file=sys.stderr)
 
                 # Log unexpected error to database (classify as chunking_error by default)
@@ -151,7 +169,11 @@ async def process_batch(repository: str, db_url: str, files: list) -> dict:
                     error_traceback
                 )
 
-        return {"success_count": success_count, "error_count": error_count}
+            await checkpoints.flush()
+
+        # Skip counter of a batch that was already complete
+        await checkpoints.flush()
+        return {"success_count": success_count, "error_count": error_count, "skipped_count": len(completed)}
 
     finally:
         # Cleanup
@@ -166,7 +188,8 @@ async def process_file_atomically(
     repository: str,
     chunking_service,
     embedding_service,
-    engine
+    engine,
+    kind: str = "code"
 ):
     """
     Process 1 file: chunking + embeddings + persist.
@@ -182,7 +205,10 @@ async def process_file_atomically(
         content = file_path.read_text(encoding="utf-8")
 
         # Determine language
-        language = "typescript" if file_path.suffix == ".ts" else "javascript"
+        if kind == "markdown":
+            language = "markdown"
+        else:
+            language = LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower(), "javascript")
 
         # Chunk code (with metadata extraction via injected metadata_service)
         chunks = await chunking_service.chunk_code(
@@ -202,11 +228,18 @@ async def process_file_atomically(
         # Generate embeddings for all chunks
         chunk_creates = []
         for chunk in chunks:
-            # Generate CODE embedding
-            embedding_result = await embedding_service.generate_embedding(
-                chunk.source_code,
-                domain=EmbeddingDomain.CODE
-            )
+            if kind == "markdown":
+                # Markdown sections are searched as text: heading + start of the section
+                embedding_result = await embedding_service.generate_embedding(
+                    f"{chunk.name}\n{chunk.source_code[:500]}",
+                    domain=EmbeddingDomain.TEXT
+                )
+            else:
+                # Generate CODE embedding
+                embedding_result = await embedding_service.generate_embedding(
+                    chunk.source_code,
+                    domain=EmbeddingDomain.CODE
+                )
 
             # Create chunk model with embedding
             chunk_create = CodeChunkCreate(
@@ -219,8 +252,8 @@ async def process_file_atomically(
                 end_line=chunk.end_line,
                 repository=repository,
                 metadata=chunk.metadata,  # Already contains calls, imports from chunking
-                embedding_text=None,
-                embedding_code=embedding_result['code']
+                embedding_text=embedding_result.get('text'),
+                embedding_code=embedding_result.get('code')
             )
 
             chunk_creates.append(chunk_create)
@@ -274,13 +307,14 @@ def main():
     parser.add_argument("--repository", required=True, help="Repository name")
     parser.add_argument("--db-url", required=True, help="Database URL")
     parser.add_argument("--files", required=True, help="Comma-separated file paths")
+    parser.add_argument("--kind", choices=["code", "markdown"], default="code", help="Job kind")
     args = parser.parse_args()
 
     # Parse files
     files = args.files.split(",")
 
     # Process batch
-    result = asyncio.run(process_batch(args.repository, args.db_url, files))
+    result = asyncio.run(process_batch(args.repository, args.db_url, files, args.kind))
 
     # Print result as JSON (last line of stdout)
     print(json.dumps(result))
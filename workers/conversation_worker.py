@@ -23,6 +23,9 @@ from opentelemetry.sdk.resources import Resource
 
 logger = structlog.get_logger(__name__)
 
+# Redis counters of the memory search cache generations (api: MemorySearchCache)
+MEMORY_SEARCH_GENERATION_PREFIX = "memsearch:gen:"
+
 # Global tracer and metrics
 tracer = None
 messages_processed_counter = None
@@ -237,6 +240,24 @@ class ConversationWorker:
         logger.info("worker_stopping")
         self._running = False
 
+    def _invalidate_memory_search(self, project_id) -> None:
+        """
+        Bump the memory search cache generations after a memory write.
+
+        Entities and auto tags feed entity and tag search. The API and MCP
+        caches read their generations from Redis (MemorySearchCache in
+        api/services/caches/memory_search_cache.py), so bumping the shared
+        counters is enough to retire their cached results.
+        """
+        scopes = ["*"] + ([str(project_id)] if project_id else [])
+        try:
+            pipe = self.redis.pipeline()
+            for scope in scopes:
+                pipe.incr(MEMORY_SEARCH_GENERATION_PREFIX + scope)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("memory_search_invalidation_failed", error=str(e))
+
     async def _process_entity_extraction(self, data: dict) -> bool:
         """Process entity extraction using GLiNER directly."""
         try:
@@ -280,18 +301,22 @@ class ConversationWorker:
             db_url = os.getenv("DATABASE_URL", "postgresql+psycopg2://mnemo:mnemopass@db:5432/mnemolite")
             engine = create_engine(db_url)
             with engine.begin() as conn:
-                conn.execute(sql_text("""
+                row = conn.execute(sql_text("""
                     UPDATE memories
                     SET entities = :entities,
                         concepts = :concepts,
                         auto_tags = :auto_tags
                     WHERE id = :memory_id
+                    RETURNING project_id
                 """), {
                     "memory_id": data["memory_id"],
                     "entities": _json.dumps(entities),
                     "concepts": _json.dumps(concepts),
                     "auto_tags": _json.dumps(auto_tags),
-                })
+                }).fetchone()
+
+            if row is not None:
+                self._invalidate_memory_search(row[0])
 
             logger.info(
                 "entity_extraction_completed",